@@ -7,13 +7,16 @@ Provides unified LLM access, token tracking, and cost aggregation.
 
 from __future__ import annotations
 
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Generic, TypeVar
 
 from pydantic import BaseModel
 
+from procedurewriter.llm.cost_tracker import record_llm_call
 from procedurewriter.llm.providers import LLMProvider, LLMResponse, get_default_model
+from procedurewriter.metrics import observe_llm_call
 
 
 class AgentInput(BaseModel):
@@ -84,6 +87,16 @@ class BaseAgent(ABC, Generic[InputT, OutputT]):
         self._model = model or get_default_model(llm.provider_type)
         self._stats = AgentStats()
 
+    @property
+    def provider(self) -> str:
+        """Name of the LLM provider this agent calls."""
+        return str(getattr(self._llm.provider_type, "value", "unknown"))
+
+    @property
+    def model(self) -> str:
+        """Model this agent calls."""
+        return self._model
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -120,13 +133,32 @@ class BaseAgent(ABC, Generic[InputT, OutputT]):
         Returns:
             LLMResponse with content and usage
         """
-        response = self._llm.chat_completion(
-            messages=messages,
-            model=self._model,
-            temperature=temperature,
-            max_tokens=max_tokens,
+        # Lazy import: procedurewriter.pipeline imports the agents package
+        from procedurewriter.pipeline.profiler import profile_section
+
+        start = time.perf_counter()
+        with profile_section("llm:call", agent=self.name, model=self._model) as span:
+            response = self._llm.chat_completion(
+                messages=messages,
+                model=self._model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+            span.update(
+                input_tokens=response.input_tokens,
+                output_tokens=response.output_tokens,
+                cost_usd=response.cost_usd,
+            )
+        observe_llm_call(
+            provider=getattr(self._llm.provider_type, "value", "unknown"),
+            model=response.model,
+            agent=self.name,
+            duration_s=time.perf_counter() - start,
+            input_tokens=response.input_tokens,
+            output_tokens=response.output_tokens,
         )
         self._stats.add_response(response)
+        record_llm_call(response, operation=self.name, agent=self.name)
         return response
 
     def get_stats(self) -> AgentStats:
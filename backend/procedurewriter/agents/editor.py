@@ -16,17 +16,7 @@ from typing import TYPE_CHECKING
 
 from procedurewriter.agents.base import AgentResult, BaseAgent
 from procedurewriter.agents.models import EditorInput, EditorOutput, EditSuggestion
-
-# Import provider-specific exceptions with fallbacks
-try:
-    from openai import APIError as OpenAIError
-except ImportError:
-    OpenAIError = type(None)  # type: ignore[misc,assignment]
-
-try:
-    from anthropic import APIError as AnthropicError
-except ImportError:
-    AnthropicError = type(None)  # type: ignore[misc,assignment]
+from procedurewriter.llm.providers import provider_api_errors
 
 if TYPE_CHECKING:
     pass
@@ -136,7 +126,7 @@ class EditorAgent(BaseAgent[EditorInput, EditorOutput]):
                 danish_quality_notes=danish_notes,
             )
 
-        except (OpenAIError, AnthropicError, OSError, json.JSONDecodeError, KeyError, AttributeError, TypeError) as e:
+        except provider_api_errors(OSError, json.JSONDecodeError, KeyError, AttributeError, TypeError) as e:
             # LLM API, network, or response parsing errors - return failure output
             import logging
             logging.getLogger(__name__).error(f"Editor failed: {e}")
@@ -33,18 +33,9 @@ from procedurewriter.agents.paradox_resolver import ParadoxResolverAgent
 from procedurewriter.agents.researcher import ResearcherAgent
 from procedurewriter.agents.validator import ValidatorAgent
 from procedurewriter.agents.writer import WriterAgent
+from procedurewriter.llm.providers import provider_api_errors
 from procedurewriter.pipeline.events import EventEmitter, EventType
-
-# Import provider-specific exceptions with fallbacks
-try:
-    from openai import APIError as OpenAIError
-except ImportError:
-    OpenAIError = type(None)  # type: ignore[misc,assignment]
-
-try:
-    from anthropic import APIError as AnthropicError
-except ImportError:
-    AnthropicError = type(None)  # type: ignore[misc,assignment]
+from procedurewriter.pipeline.profiler import profile_section
 
 if TYPE_CHECKING:
     from procedurewriter.llm.providers import LLMProvider
@@ -120,6 +111,11 @@ class AgentOrchestrator:
         if self._emitter:
             self._emitter.emit(event_type, data)
 
+    def _run_agent(self, agent: Any, agent_input: Any) -> Any:
+        """Execute an agent inside a trace span."""
+        with profile_section(f"agent:{agent.name}"):
+            return agent.execute(agent_input)
+
     def run(
         self,
         input_data: PipelineInput,
@@ -153,7 +149,8 @@ class AgentOrchestrator:
             else:
                 self._emit(EventType.AGENT_START, {"agent": "Researcher"})
                 logger.info("Running Researcher agent...")
-                research_result = self._researcher.execute(
+                research_result = self._run_agent(
+                    self._researcher,
                     ResearcherInput(
                         procedure_title=input_data.procedure_title,
                         context=input_data.context,
@@ -195,7 +192,8 @@ class AgentOrchestrator:
             # Paradox resolution (international evidence vs Danish guidelines)
             if current_sources:
                 self._emit(EventType.AGENT_START, {"agent": "ParadoxResolver"})
-                paradox_result = self._paradox.execute(
+                paradox_result = self._run_agent(
+                    self._paradox,
                     ParadoxResolverInput(
                         procedure_title=input_data.procedure_title,
                         context=input_data.context,
@@ -245,7 +243,8 @@ class AgentOrchestrator:
                         + adaptation_note
                     ).strip()
 
-                writer_result = self._writer.execute(
+                writer_result = self._run_agent(
+                    self._writer,
                     WriterInput(
                         procedure_title=input_data.procedure_title,
                         context=input_data.context,
@@ -287,7 +286,8 @@ class AgentOrchestrator:
                         if chunk_idx > 0:
                             logger.info(f"Validating chunk {chunk_idx + 1}/{len(claim_chunks)}")
 
-                        validator_result = self._validator.execute(
+                        validator_result = self._run_agent(
+                            self._validator,
                             ValidatorInput(
                                 procedure_title=input_data.procedure_title,
                                 claims=claims,
@@ -312,7 +312,8 @@ class AgentOrchestrator:
                 # Step 4: Edit content
                 self._emit(EventType.AGENT_START, {"agent": "Editor"})
                 logger.info("Running Editor agent...")
-                editor_result = self._editor.execute(
+                editor_result = self._run_agent(
+                    self._editor,
                     EditorInput(
                         procedure_title=input_data.procedure_title,
                         content_markdown=current_content,
@@ -333,7 +334,8 @@ class AgentOrchestrator:
                 # Step 5: Quality check
                 self._emit(EventType.AGENT_START, {"agent": "Quality"})
                 logger.info("Running Quality agent...")
-                quality_result = self._quality.execute(
+                quality_result = self._run_agent(
+                    self._quality,
                     QualityInput(
                         procedure_title=input_data.procedure_title,
                         content_markdown=current_content,
@@ -418,7 +420,7 @@ class AgentOrchestrator:
                 quality_loop_stop_reason=stop_reason,
             )
 
-        except (OpenAIError, AnthropicError, OSError, KeyError, AttributeError, TypeError) as e:
+        except provider_api_errors(OSError, KeyError, AttributeError, TypeError) as e:
             # LLM API, network, or response parsing errors - return failure output
             logger.error(f"Pipeline failed: {e}")
             self._emit(EventType.ERROR, {
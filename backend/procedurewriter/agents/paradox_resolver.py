@@ -8,17 +8,7 @@ import logging
 
 from procedurewriter.agents.base import AgentResult, BaseAgent
 from procedurewriter.agents.models import ParadoxResolverInput, ParadoxResolverOutput, SourceReference
-
-# Import provider-specific exceptions with fallbacks
-try:
-    from openai import APIError as OpenAIError
-except ImportError:
-    OpenAIError = type(None)  # type: ignore[misc,assignment]
-
-try:
-    from anthropic import APIError as AnthropicError
-except ImportError:
-    AnthropicError = type(None)  # type: ignore[misc,assignment]
+from procedurewriter.llm.providers import provider_api_errors
 
 logger = logging.getLogger(__name__)
 
@@ -90,7 +80,7 @@ class ParadoxResolverAgent(BaseAgent[ParadoxResolverInput, ParadoxResolverOutput
                     compared_sources=compared_ids,
                 )
 
-        except (OpenAIError, AnthropicError, OSError, KeyError, AttributeError, TypeError) as e:
+        except provider_api_errors(OSError, KeyError, AttributeError, TypeError) as e:
             logger.error(f"ParadoxResolver failed: {e}")
             output = ParadoxResolverOutput(
                 success=False,
@@ -16,18 +16,7 @@ from typing import TYPE_CHECKING
 
 from procedurewriter.agents.base import AgentResult, BaseAgent
 from procedurewriter.agents.models import QualityCriterion, QualityInput, QualityOutput
-
-# Import provider-specific exceptions with fallbacks for when SDK not installed
-# This allows catching API errors without importing the full SDK
-try:
-    from openai import APIError as OpenAIError
-except ImportError:
-    OpenAIError = type(None)  # type: ignore[misc,assignment]
-
-try:
-    from anthropic import APIError as AnthropicError
-except ImportError:
-    AnthropicError = type(None)  # type: ignore[misc,assignment]
+from procedurewriter.llm.providers import provider_api_errors
 
 if TYPE_CHECKING:
     pass
@@ -229,7 +218,7 @@ class QualityAgent(BaseAgent[QualityInput, QualityOutput]):
                         max_parse_retries + 1, e
                     )
 
-            except (OpenAIError, AnthropicError, OSError) as e:
+            except provider_api_errors(OSError) as e:
                 # LLM API or network errors - return failure output
                 # OSError covers: ConnectionError, TimeoutError, etc.
                 logger.error("LLM/network error during quality evaluation: %s", e)
@@ -20,18 +20,9 @@ from typing import TYPE_CHECKING, Any
 
 from procedurewriter.agents.base import AgentResult, BaseAgent
 from procedurewriter.agents.models import ResearcherInput, ResearcherOutput, SourceReference
+from procedurewriter.llm.providers import provider_api_errors
 
 # Import provider-specific exceptions with fallbacks
-try:
-    from openai import APIError as OpenAIError
-except ImportError:
-    OpenAIError = type(None)  # type: ignore[misc,assignment]
-
-try:
-    from anthropic import APIError as AnthropicError
-except ImportError:
-    AnthropicError = type(None)  # type: ignore[misc,assignment]
-
 try:
     from httpx import HTTPStatusError
 except ImportError:
@@ -272,7 +263,7 @@ class ResearcherAgent(BaseAgent[ResearcherInput, ResearcherOutput]):
 
             logger.info(f"Research complete: {len(all_sources)} total sources")
 
-        except (OpenAIError, AnthropicError, HTTPStatusError, OSError) as e:
+        except provider_api_errors(HTTPStatusError, OSError) as e:
             # LLM API, HTTP, or network errors - return failure output
             logger.error(f"Research failed with LLM/network error: {e}")
             output = ResearcherOutput(
@@ -0,0 +1,45 @@
+"""Offline performance benchmarks.
+
+This module provides:
+- Synthetic Danish guideline corpora (corpus)
+- Replay of recorded LLM/HTTP fixtures through the production caches (replay)
+- The offline end-to-end benchmark harness (harness)
+- Micro-benchmarks for text hot paths with regression checks (micro)
+
+CLI: ``python scripts/benchmark.py --offline --size small`` and
+``python scripts/microbench.py run|compare|check``
+"""
+
+from procedurewriter.bench.corpus import CORPUS_SIZES, CorpusSpec, generate_library
+from procedurewriter.bench.harness import BenchmarkConfig, StageResult, run_offline_benchmark
+from procedurewriter.bench.micro import (
+    MICRO_BENCHMARKS,
+    check_scaling,
+    compare_reports,
+    run_micro_benchmarks,
+)
+from procedurewriter.bench.replay import (
+    LLMReplayMissError,
+    ReplayLLMProvider,
+    replay_http_client,
+    replay_llm_client,
+    synthetic_pubmed_transport,
+)
+
+__all__ = [
+    "CORPUS_SIZES",
+    "CorpusSpec",
+    "generate_library",
+    "BenchmarkConfig",
+    "StageResult",
+    "run_offline_benchmark",
+    "MICRO_BENCHMARKS",
+    "check_scaling",
+    "compare_reports",
+    "run_micro_benchmarks",
+    "LLMReplayMissError",
+    "ReplayLLMProvider",
+    "replay_http_client",
+    "replay_llm_client",
+    "synthetic_pubmed_transport",
+]
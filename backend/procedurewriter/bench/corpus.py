@@ -0,0 +1,243 @@
+"""Synthetic Danish guideline corpora for offline benchmarks.
+
+Documents are assembled from clinical sentence templates with a seeded RNG,
+so a given CorpusSpec always produces byte-identical text. Snippet counts
+follow from the chunking in retrieve.build_snippets (~900 chars per chunk).
+"""
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from pathlib import Path
+
+from procedurewriter.db import LibrarySourceRow
+from procedurewriter.pipeline.hashing import sha256_bytes, sha256_text
+from procedurewriter.pipeline.types import Snippet
+
+# Fixed timestamp so generated rows (and everything derived from them) are stable
+CORPUS_CREATED_AT_UTC = "2025-01-01T00:00:00+00:00"
+
+PROCEDURES: tuple[str, ...] = (
+    "Anlæggelse af perifert venekateter",
+    "Blodprøvetagning",
+    "Anlæggelse af pleuradræn",
+    "Lumbalpunktur",
+    "Arteriepunktur",
+    "Anlæggelse af blærekateter",
+    "Nasogastrisk sonde",
+    "Akut intubation",
+)
+
+SECTION_HEADINGS: tuple[str, ...] = (
+    "Indikationer",
+    "Kontraindikationer",
+    "Udstyr og Forberedelse",
+    "Procedure (trin-for-trin)",
+    "Monitorering",
+    "Komplikationer",
+)
+
+_SUBJECTS = (
+    "Patienten",
+    "Sygeplejersken",
+    "Lægen",
+    "Den ansvarlige læge",
+    "Teamet",
+    "Operatøren",
+)
+_ACTIONS = (
+    "vurderer indikationen for",
+    "informerer patienten om",
+    "dokumenterer",
+    "observerer",
+    "forbereder udstyr til",
+    "monitorerer komplikationer ved",
+    "sikrer samtykke til",
+    "planlægger",
+)
+_OBJECTS = (
+    "proceduren",
+    "indgrebet",
+    "punkturen",
+    "anlæggelsen",
+    "behandlingen",
+    "kateteret",
+)
+_DETAILS = (
+    "inden proceduren påbegyndes",
+    "efter lokal instruks",
+    "hver 15. minut de første 2 timer",
+    "ved tegn på infektion",
+    "hos børn under 12 år",
+    "ved INR over 1,5",
+    "med steril teknik",
+    "under ultralydsvejledning",
+    "hos patienter i antikoagulansbehandling",
+    "ved mistanke om sepsis",
+)
+_DRUGS = ("lidocain", "paracetamol", "morfin", "ondansetron", "cefuroxim", "adrenalin")
+_SAFETY = (
+    "Ved blødning afbrydes proceduren og der gives direkte kompression.",
+    "Kontakt bagvagt ved saturation under 92 %.",
+    "Stop proceduren ved mistanke om pneumothorax.",
+    "Ved allergisk reaktion gives adrenalin 0,5 mg i.m.",
+    "Observer for vasovagal reaktion efter indgrebet.",
+)
+
+
+@dataclass(frozen=True)
+class CorpusSpec:
+    """Size and seed of a synthetic guideline library."""
+
+    documents: int
+    paragraphs_per_document: int = 28
+    sentences_per_paragraph: int = 4
+    seed: int = 1234
+
+
+# ~10 snippets per document: 1k-100k snippets across the presets
+CORPUS_SIZES: dict[str, CorpusSpec] = {
+    "tiny": CorpusSpec(documents=10),
+    "small": CorpusSpec(documents=100),
+    "medium": CorpusSpec(documents=1_000),
+    "large": CorpusSpec(documents=10_000),
+}
+
+
+def generate_sentence(rng: random.Random) -> str:
+    """Generate one Danish clinical sentence."""
+    kind = rng.random()
+    if kind < 0.15:
+        return rng.choice(_SAFETY)
+    if kind < 0.35:
+        drug = rng.choice(_DRUGS)
+        dose = rng.choice((1, 2, 5, 10, 20, 50, 100, 500, 1000))
+        minutes = rng.choice((5, 10, 15, 30))
+        return f"Giv {drug} {dose} mg i.v. over {minutes} minutter {rng.choice(_DETAILS)}."
+    return (
+        f"{rng.choice(_SUBJECTS)} {rng.choice(_ACTIONS)} {rng.choice(_OBJECTS)} "
+        f"{rng.choice(_DETAILS)}."
+    )
+
+
+def generate_document(
+    rng: random.Random,
+    *,
+    title: str,
+    paragraphs: int,
+    sentences_per_paragraph: int,
+) -> str:
+    """Generate a guideline document with section headings and paragraphs."""
+    lines: list[str] = [title, ""]
+    for i in range(paragraphs):
+        if i % 4 == 0:
+            lines.append(SECTION_HEADINGS[(i // 4) % len(SECTION_HEADINGS)])
+        lines.append(" ".join(generate_sentence(rng) for _ in range(sentences_per_paragraph)))
+        lines.append("")
+    return "\n".join(lines).strip() + "\n"
+
+
+def generate_library(root: Path, spec: CorpusSpec) -> list[LibrarySourceRow]:
+    """
+    Write a synthetic guideline library to ``root``.
+
+    Args:
+        root: Directory for the raw/normalized document files
+        spec: Corpus size and seed
+
+    Returns:
+        Library rows in the shape run_pipeline() accepts as library_sources
+    """
+    rng = random.Random(spec.seed)
+    raw_dir = root / "raw"
+    norm_dir = root / "normalized"
+    raw_dir.mkdir(parents=True, exist_ok=True)
+    norm_dir.mkdir(parents=True, exist_ok=True)
+
+    rows: list[LibrarySourceRow] = []
+    for i in range(spec.documents):
+        procedure = PROCEDURES[i % len(PROCEDURES)]
+        title = f"{procedure} - regional retningslinje {i + 1}"
+        text = generate_document(
+            rng,
+            title=title,
+            paragraphs=spec.paragraphs_per_document,
+            sentences_per_paragraph=spec.sentences_per_paragraph,
+        )
+        raw = text.encode("utf-8")
+        source_id = f"LIB{i:06d}"
+        raw_path = raw_dir / f"{source_id}.txt"
+        norm_path = norm_dir / f"{source_id}.txt"
+        raw_path.write_bytes(raw)
+        norm_path.write_text(text, encoding="utf-8")
+        rows.append(
+            LibrarySourceRow(
+                source_id=source_id,
+                created_at_utc=CORPUS_CREATED_AT_UTC,
+                kind="library",
+                url=None,
+                title=title,
+                raw_path=str(raw_path),
+                normalized_path=str(norm_path),
+                raw_sha256=sha256_bytes(raw),
+                normalized_sha256=sha256_text(text),
+                meta={"year": 2020 + i % 5},
+            )
+        )
+    return rows
+
+
+def generate_snippets(count: int, *, seed: int = 1234, per_source: int = 10) -> list[Snippet]:
+    """Generate ``count`` snippets of ~4 sentences, ``per_source`` per source id."""
+    rng = random.Random(seed)
+    return [
+        Snippet(
+            source_id=f"SRC{i // per_source + 1:04d}",
+            text=" ".join(generate_sentence(rng) for _ in range(4)),
+            location={"chunk": i % per_source},
+        )
+        for i in range(count)
+    ]
+
+
+def generate_procedure_markdown(
+    lines: int,
+    *,
+    seed: int = 1234,
+    sources: int = 12,
+    lines_per_section: int = 8,
+) -> str:
+    """
+    Generate a cited procedure draft in the writer's markdown shape.
+
+    Args:
+        lines: Number of content lines (bullets, numbered steps, sentences)
+        seed: RNG seed
+        sources: Number of distinct SRC ids to cite
+        lines_per_section: Content lines under each ``##`` heading
+
+    Returns:
+        Markdown with one or two ``[S:<id>]`` citations per line
+    """
+    rng = random.Random(seed)
+    out: list[str] = ["# Procedure: Anlæggelse af pleuradræn", ""]
+    step = 1
+    for i in range(lines):
+        if i % lines_per_section == 0:
+            if i:
+                out.append("")
+            out.append(f"## {SECTION_HEADINGS[(i // lines_per_section) % len(SECTION_HEADINGS)]}")
+            step = 1
+        cites = " ".join(
+            f"[S:SRC{rng.randrange(sources) + 1:04d}]" for _ in range(rng.choice((1, 1, 2)))
+        )
+        text = f"{generate_sentence(rng)} {cites}"
+        form = (i // lines_per_section) % 3
+        if form == 0:
+            out.append(f"- {text}")
+        elif form == 1:
+            out.append(f"{step}. {text}")
+            step += 1
+        else:
+            out.append(text)
+    return "\n".join(out).strip() + "\n"
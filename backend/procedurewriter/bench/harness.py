@@ -0,0 +1,332 @@
+"""Offline end-to-end benchmark over a synthetic guideline library.
+
+Drives the pipeline's hot paths in run order (library ingestion, snippet
+building, BM25 retrieval, PubMed parsing, sectioned LLM writing, citation
+validation, evidence report, DOCX rendering) with LLM and HTTP traffic
+replayed from recorded fixtures. Each stage reports wall and CPU time, the
+process RSS high-water mark and allocation counts; the JSON report is
+stable enough to diff between commits.
+
+run_pipeline() itself is not used: its non-dummy path requires live source
+discovery and source-requirement gates that cannot be replayed without a
+full recording of every external service.
+"""
+from __future__ import annotations
+
+import gc
+import platform
+import shutil
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from procedurewriter.bench.corpus import CorpusSpec, generate_library
+from procedurewriter.bench.replay import (
+    LLMReplayMissError,
+    replay_http_client,
+    replay_llm_client,
+    synthetic_pubmed_transport,
+)
+from procedurewriter.config_store import load_yaml
+from procedurewriter.db import LibrarySourceRow
+from procedurewriter.llm.providers import LLMProvider, llm_client_override
+from procedurewriter.pipeline.citations import validate_citations
+from procedurewriter.pipeline.docx_writer import write_procedure_docx
+from procedurewriter.pipeline.evidence import build_evidence_report
+from procedurewriter.pipeline.evidence_hierarchy import EvidenceHierarchy
+from procedurewriter.pipeline.profiler import TRACE_FILENAME, profile_section, run_trace
+from procedurewriter.pipeline.pubmed import PubMedClient
+from procedurewriter.pipeline.retrieve import build_snippets, retrieve
+from procedurewriter.pipeline.sources import make_source_id, write_source_files
+from procedurewriter.pipeline.types import SourceRecord
+from procedurewriter.pipeline.writer import write_procedure_markdown
+from procedurewriter.settings import Settings
+
+REPORT_SCHEMA_VERSION = 1
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+
+def peak_rss_bytes() -> int | None:
+    """Process RSS high-water mark in bytes (None where unsupported)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return int(peak if sys.platform == "darwin" else peak * 1024)
+
+
+@dataclass
+class StageResult:
+    """Measurements for one benchmark stage."""
+
+    name: str
+    wall_ms: float = 0.0
+    cpu_ms: float = 0.0
+    peak_rss_bytes: int | None = None
+    allocated_blocks: int = 0
+    gc_collections: int = 0
+    traced_peak_bytes: int | None = None
+    info: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class BenchmarkConfig:
+    """Inputs for run_offline_benchmark()."""
+
+    spec: CorpusSpec
+    fixtures_dir: Path
+    work_dir: Path
+    procedure: str = "Anlæggelse af pleuradræn"
+    context: str | None = "Voksen patient på akutmodtagelse"
+    iterations: int = 1
+    top_k: int = 20
+    record: bool = False
+    upstream_llm: LLMProvider | None = None
+    live_http: bool = False
+    trace_allocations: bool = False
+    settings: Settings = field(default_factory=Settings)
+
+
+def _gc_collections() -> int:
+    return sum(s["collections"] for s in gc.get_stats())
+
+
+@contextmanager
+def _measure(
+    results: list[StageResult], name: str, *, trace_allocations: bool
+) -> Generator[StageResult, None, None]:
+    result = StageResult(name=name)
+    if trace_allocations:
+        tracemalloc.reset_peak()
+    blocks = sys.getallocatedblocks()
+    collections = _gc_collections()
+    cpu = time.process_time()
+    wall = time.perf_counter()
+    with profile_section(f"bench:{name}"):
+        yield result
+    result.wall_ms = round((time.perf_counter() - wall) * 1000, 3)
+    result.cpu_ms = round((time.process_time() - cpu) * 1000, 3)
+    result.allocated_blocks = sys.getallocatedblocks() - blocks
+    result.gc_collections = _gc_collections() - collections
+    result.peak_rss_bytes = peak_rss_bytes()
+    if trace_allocations:
+        result.traced_peak_bytes = tracemalloc.get_traced_memory()[1]
+    results.append(result)
+
+
+def _ingest_library(
+    rows: list[LibrarySourceRow],
+    *,
+    run_dir: Path,
+    evidence_hierarchy: EvidenceHierarchy,
+) -> list[SourceRecord]:
+    # Mirrors the library-source loop at the start of run_pipeline()
+    sources: list[SourceRecord] = []
+    for n, lib in enumerate(rows, start=1):
+        source_id = make_source_id(n)
+        raw_path = Path(lib.raw_path)
+        written = write_source_files(
+            run_dir=run_dir,
+            source_id=source_id,
+            raw_bytes=raw_path.read_bytes(),
+            raw_suffix=raw_path.suffix or ".bin",
+            normalized_text=Path(lib.normalized_path).read_text(encoding="utf-8"),
+        )
+        level = evidence_hierarchy.classify_source(url=lib.url, kind="library", title=lib.title)
+        year = lib.meta.get("year")
+        sources.append(
+            SourceRecord(
+                source_id=source_id,
+                fetched_at_utc=lib.created_at_utc,
+                kind=lib.kind,
+                title=lib.title,
+                year=year if isinstance(year, int) else None,
+                url=lib.url,
+                doi=None,
+                pmid=None,
+                raw_path=str(written.raw_path),
+                normalized_path=str(written.normalized_path),
+                raw_sha256=written.raw_sha256,
+                normalized_sha256=written.normalized_sha256,
+                extraction_notes=None,
+                terms_licence_note=None,
+                extra={
+                    "evidence_level": level.level_id,
+                    "evidence_badge": level.badge,
+                    "evidence_priority": level.priority,
+                    "full_text_available": True,
+                },
+            )
+        )
+    return sources
+
+
+def _run_iteration(
+    config: BenchmarkConfig,
+    rows: list[LibrarySourceRow],
+    *,
+    run_dir: Path,
+    author_guide: dict[str, Any],
+    evidence_hierarchy: EvidenceHierarchy,
+) -> tuple[list[StageResult], dict[str, Any]]:
+    results: list[StageResult] = []
+    trace = config.trace_allocations
+    llm, backing = replay_llm_client(
+        config.fixtures_dir, record=config.record, upstream=config.upstream_llm
+    )
+    transport = None if config.live_http or not config.record else synthetic_pubmed_transport()
+    http = replay_http_client(config.fixtures_dir, record=config.record, transport=transport)
+    try:
+        with _measure(results, "ingest", trace_allocations=trace) as stage:
+            sources = _ingest_library(rows, run_dir=run_dir, evidence_hierarchy=evidence_hierarchy)
+            stage.info["sources"] = len(sources)
+
+        with _measure(results, "snippets", trace_allocations=trace) as stage:
+            snippets = build_snippets(sources)
+            stage.info["snippets"] = len(snippets)
+
+        query = " ".join(x for x in (config.procedure, config.context) if x)
+        with _measure(results, "retrieve", trace_allocations=trace) as stage:
+            retrieved = retrieve(query, snippets, top_k=config.top_k, prefer_embeddings=False)
+            stage.info["retrieved"] = len(retrieved)
+
+        with _measure(results, "pubmed", trace_allocations=trace) as stage:
+            pubmed = PubMedClient(http, tool=config.settings.ncbi_tool, email=None)
+            pmids, _ = pubmed.search(config.procedure)
+            articles, _ = pubmed.fetch(pmids) if pmids else ([], None)
+            stage.info["articles"] = len(articles)
+
+        with _measure(results, "write", trace_allocations=trace) as stage:
+            with llm_client_override(llm):
+                markdown = write_procedure_markdown(
+                    procedure=config.procedure,
+                    context=config.context,
+                    author_guide=author_guide,
+                    snippets=retrieved,
+                    sources=sources,
+                    dummy_mode=False,
+                    use_llm=True,
+                    llm_model=config.settings.llm_model,
+                    citation_strict_mode=False,
+                )
+            # The writer falls back to a template on LLM errors, so a replay
+            # miss would silently benchmark the wrong code path
+            if backing.misses and not config.record:
+                raise LLMReplayMissError(
+                    f"{backing.misses} LLM request(s) missing from {config.fixtures_dir}; "
+                    "record fixtures for this corpus first"
+                )
+            stage.info["markdown_chars"] = len(markdown)
+
+        with _measure(results, "citations", trace_allocations=trace):
+            validate_citations(markdown, valid_source_ids={s.source_id for s in sources})
+
+        with _measure(results, "evidence", trace_allocations=trace) as stage:
+            report = build_evidence_report(markdown, snippets=snippets)
+            stage.info["sentences"] = len(report.get("sentences", []))
+
+        with _measure(results, "docx", trace_allocations=trace):
+            write_procedure_docx(
+                markdown_text=markdown,
+                sources=sources,
+                output_path=run_dir / "Procedure.docx",
+                run_id=run_dir.name,
+                manifest_hash="0" * 64,
+            )
+    finally:
+        http.close()
+
+    cache_stats = llm.get_cache_stats()
+    return results, {
+        "llm": {
+            "cache_hits": cache_stats.get("hits", 0),
+            "cache_misses": cache_stats.get("misses", 0),
+            "recorded": backing.misses if config.record else 0,
+        },
+    }
+
+
+def _summarize(iterations: list[list[StageResult]]) -> dict[str, dict[str, float]]:
+    summary: dict[str, dict[str, float]] = {}
+    for name in [r.name for r in iterations[0]]:
+        walls = [r.wall_ms for it in iterations for r in it if r.name == name]
+        summary[name] = {
+            "median_ms": round(statistics.median(walls), 3),
+            "min_ms": round(min(walls), 3),
+            "max_ms": round(max(walls), 3),
+        }
+    return summary
+
+
+def run_offline_benchmark(config: BenchmarkConfig) -> dict[str, Any]:
+    """
+    Run the offline benchmark and return a JSON-serialisable report.
+
+    Args:
+        config: Corpus, fixtures and run options
+
+    Returns:
+        Report with per-iteration stage results and a per-stage summary
+
+    Raises:
+        LLMReplayMissError: In replay mode, if a request is not in the fixtures
+        httpx.ConnectError: In replay mode, if an HTTP request is not in the fixtures
+    """
+    config.work_dir.mkdir(parents=True, exist_ok=True)
+    setup_start = time.perf_counter()
+    rows = generate_library(config.work_dir / "library", config.spec)
+    author_guide = load_yaml(config.settings.author_guide_path)
+    evidence_hierarchy = EvidenceHierarchy.from_config(config.settings.evidence_hierarchy_path)
+    setup_ms = round((time.perf_counter() - setup_start) * 1000, 3)
+
+    if config.trace_allocations:
+        tracemalloc.start()
+    iterations: list[list[StageResult]] = []
+    extra: dict[str, Any] = {}
+    try:
+        for i in range(config.iterations):
+            run_dir = config.work_dir / f"run{i}"
+            shutil.rmtree(run_dir, ignore_errors=True)
+            for sub in ("raw", "normalized"):
+                (run_dir / sub).mkdir(parents=True, exist_ok=True)
+            with run_trace(run_dir / TRACE_FILENAME, name="benchmark", iteration=i):
+                results, extra = _run_iteration(
+                    config,
+                    rows,
+                    run_dir=run_dir,
+                    author_guide=author_guide,
+                    evidence_hierarchy=evidence_hierarchy,
+                )
+            iterations.append(results)
+    finally:
+        if config.trace_allocations:
+            tracemalloc.stop()
+
+    return {
+        "schema_version": REPORT_SCHEMA_VERSION,
+        "created_at_utc": datetime.now(UTC).replace(microsecond=0).isoformat(),
+        "mode": "record" if config.record else "replay",
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "corpus": asdict(config.spec),
+        "setup_ms": setup_ms,
+        "peak_rss_bytes": peak_rss_bytes(),
+        "summary": _summarize(iterations),
+        "iterations": [[asdict(r) for r in it] for it in iterations],
+        **extra,
+    }
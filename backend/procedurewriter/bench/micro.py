@@ -0,0 +1,314 @@
+"""Micro-benchmarks for the CPU-bound text hot paths.
+
+Each benchmark times one function on generated Danish procedure corpora at
+several sizes. Two checks guard against regressions:
+
+- compare_reports(): per benchmark and size, fail when the median time grew
+  by more than a threshold percentage against a stored baseline report.
+- check_scaling(): within one report, fail when time grows faster than the
+  benchmark's allowed exponent between the smallest and largest size (e.g.
+  a linear function that turned quadratic). This needs no baseline, so it
+  also works across machines.
+
+CLI: ``python scripts/microbench.py run|compare|check``
+"""
+from __future__ import annotations
+
+import math
+import platform
+import statistics
+import tempfile
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from procedurewriter.bench.corpus import generate_procedure_markdown, generate_snippets
+
+REPORT_SCHEMA_VERSION = 1
+
+# A setup function builds the inputs for one size and returns the timed call
+SetupFn = Callable[[int], Callable[[], object]]
+
+
+@dataclass(frozen=True)
+class MicroBenchmark:
+    """A registered micro-benchmark."""
+
+    name: str
+    setup: SetupFn
+    sizes: tuple[int, ...]
+    # Allowed growth exponent between the smallest and largest size
+    max_exponent: float = 1.4
+
+
+MICRO_BENCHMARKS: dict[str, MicroBenchmark] = {}
+
+
+def micro_benchmark(
+    name: str, *, sizes: tuple[int, ...], max_exponent: float = 1.4
+) -> Callable[[SetupFn], SetupFn]:
+    """Register ``setup`` as a micro-benchmark."""
+
+    def decorator(setup: SetupFn) -> SetupFn:
+        if name in MICRO_BENCHMARKS:
+            raise ValueError(f"Micro-benchmark {name} already registered")
+        MICRO_BENCHMARKS[name] = MicroBenchmark(name, setup, sizes, max_exponent)
+        return setup
+
+    return decorator
+
+
+_QUERY = "Anlæggelse af pleuradræn voksen patient komplikationer"
+
+
+@micro_benchmark("retrieve.bm25", sizes=(500, 2_000, 8_000))
+def _bench_retrieve_bm25(size: int) -> Callable[[], object]:
+    from procedurewriter.pipeline.retrieve import _retrieve_bm25
+
+    snippets = generate_snippets(size)
+    return lambda: _retrieve_bm25(_QUERY, snippets, top_k=20)
+
+
+@micro_benchmark("evidence.bm25_index", sizes=(500, 2_000, 8_000))
+def _bench_evidence_index(size: int) -> Callable[[], object]:
+    from procedurewriter.pipeline.evidence import _Bm25Index
+
+    snippets = generate_snippets(size)
+    queries = [line for line in generate_procedure_markdown(20).splitlines() if line[:1] == "-"]
+
+    def run() -> object:
+        index = _Bm25Index(snippets)
+        return [index.best_match(q, source_id=None) for q in queries]
+
+    return run
+
+
+@micro_benchmark("text_units.iter_cited_sentences", sizes=(200, 800, 3_200))
+def _bench_iter_cited_sentences(size: int) -> Callable[[], object]:
+    from procedurewriter.pipeline.text_units import iter_cited_sentences
+
+    markdown = generate_procedure_markdown(size)
+    return lambda: list(iter_cited_sentences(markdown))
+
+
+@micro_benchmark("gps.classify_sentence_type", sizes=(200, 800, 3_200))
+def _bench_classify_sentence_type(size: int) -> Callable[[], object]:
+    from procedurewriter.pipeline.gps import classify_sentence_type
+
+    sentences = [s.text for s in generate_snippets(size, per_source=1)]
+    return lambda: [classify_sentence_type(s) for s in sentences]
+
+
+@micro_benchmark("claims.extract", sizes=(200, 800, 3_200))
+def _bench_claim_extract(size: int) -> Callable[[], object]:
+    from procedurewriter.claims.extractor import ClaimExtractor
+
+    markdown = generate_procedure_markdown(size)
+    extractor = ClaimExtractor(run_id="bench")
+    return lambda: extractor.extract(markdown)
+
+
+# Templated lines share most tokens, so many pairs survive the candidate
+# prefilter and get scored; growth is super-linear by construction here
+@micro_benchmark("deduplication.detect_duplicates", sizes=(100, 400, 1_600), max_exponent=1.8)
+def _bench_detect_duplicates(size: int) -> Callable[[], object]:
+    from procedurewriter.pipeline.deduplication import RepetitionDetector
+
+    lines = [
+        line.lstrip("-0123456789. ")
+        for line in generate_procedure_markdown(size).splitlines()
+        if line and not line.startswith("#")
+    ]
+    detector = RepetitionDetector()
+    return lambda: detector.detect_duplicates(lines)
+
+
+@micro_benchmark("content_generalizer.generalize", sizes=(200, 800, 3_200))
+def _bench_generalize(size: int) -> Callable[[], object]:
+    from procedurewriter.pipeline.content_generalizer import ContentGeneralizer
+
+    markdown = generate_procedure_markdown(size)
+    generalizer = ContentGeneralizer()
+    return lambda: generalizer.generalize(markdown)
+
+
+@micro_benchmark("snippet_classifier.classify_batch", sizes=(200, 800, 3_200))
+def _bench_classify_batch(size: int) -> Callable[[], object]:
+    from procedurewriter.pipeline.snippet_classifier import SnippetClassifier
+
+    texts = [s.text for s in generate_snippets(size)]
+    classifier = SnippetClassifier()
+    return lambda: classifier.classify_batch(texts)
+
+
+@micro_benchmark("docx_writer.write_procedure_docx", sizes=(40, 160, 640))
+def _bench_write_docx(size: int) -> Callable[[], object]:
+    from procedurewriter.pipeline.docx_writer import write_procedure_docx
+
+    markdown = generate_procedure_markdown(size)
+
+    def run() -> object:
+        # Creating the directory costs the same at every size, so it does not
+        # skew the scaling check
+        with tempfile.TemporaryDirectory(prefix="pw-microbench-") as tmp:
+            output = Path(tmp) / "Procedure.docx"
+            write_procedure_docx(
+                markdown_text=markdown,
+                sources=[],
+                output_path=output,
+                run_id="bench",
+                manifest_hash="0" * 64,
+            )
+            return output.stat().st_size
+
+    return run
+
+
+def time_callable(
+    fn: Callable[[], object], *, repeat: int = 5, min_time_s: float = 0.05
+) -> dict[str, float]:
+    """
+    Time ``fn`` like timeit: calibrate loops to ``min_time_s``, then repeat.
+
+    Returns:
+        Per-call median/min seconds plus the loop count per repeat
+    """
+    fn()  # warm-up (imports, regex compilation, caches)
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time_s or loops >= 1_000_000:
+            break
+        loops *= 2 if elapsed <= 0 else max(2, min(10, math.ceil(min_time_s / elapsed)))
+
+    samples = [elapsed / loops]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        samples.append((time.perf_counter() - start) / loops)
+    return {
+        "median_s": statistics.median(samples),
+        "min_s": min(samples),
+        "loops": loops,
+    }
+
+
+def run_micro_benchmarks(
+    names: Iterable[str] | None = None,
+    *,
+    quick: bool = False,
+    repeat: int = 5,
+    min_time_s: float = 0.05,
+) -> dict[str, Any]:
+    """
+    Run registered micro-benchmarks.
+
+    Args:
+        names: Benchmarks to run (default: all)
+        quick: Only the two smallest sizes
+        repeat: Timed repeats per size
+        min_time_s: Minimum duration of one repeat
+
+    Returns:
+        Report ``{"benchmarks": {name: {"max_exponent": x, "sizes": {size: timing}}}}``
+
+    Raises:
+        KeyError: If a name is not registered
+    """
+    selected = [MICRO_BENCHMARKS[n] for n in names] if names else list(MICRO_BENCHMARKS.values())
+    benchmarks: dict[str, Any] = {}
+    for bench in selected:
+        sizes = bench.sizes[:2] if quick else bench.sizes
+        results: dict[str, dict[str, float]] = {}
+        for size in sizes:
+            results[str(size)] = time_callable(
+                bench.setup(size), repeat=repeat, min_time_s=min_time_s
+            )
+        benchmarks[bench.name] = {"max_exponent": bench.max_exponent, "sizes": results}
+    return {
+        "schema_version": REPORT_SCHEMA_VERSION,
+        "created_at_utc": datetime.now(UTC).replace(microsecond=0).isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "benchmarks": benchmarks,
+    }
+
+
+@dataclass(frozen=True)
+class Regression:
+    """A benchmark that failed a regression check."""
+
+    name: str
+    size: str | None
+    detail: str
+
+
+def compare_reports(
+    baseline: dict[str, Any], current: dict[str, Any], *, threshold_pct: float = 20.0
+) -> list[Regression]:
+    """
+    Compare median times per benchmark and size against a baseline report.
+
+    Benchmarks or sizes missing from either report are skipped.
+
+    Returns:
+        Regressions slower than the baseline by more than ``threshold_pct``
+    """
+    regressions: list[Regression] = []
+    for name, entry in current.get("benchmarks", {}).items():
+        base_sizes = baseline.get("benchmarks", {}).get(name, {}).get("sizes", {})
+        for size, timing in entry["sizes"].items():
+            base = base_sizes.get(size)
+            if not base or base["median_s"] <= 0:
+                continue
+            change_pct = (timing["median_s"] / base["median_s"] - 1.0) * 100.0
+            if change_pct > threshold_pct:
+                regressions.append(
+                    Regression(
+                        name=name,
+                        size=size,
+                        detail=(
+                            f"{change_pct:+.1f}% ({base['median_s'] * 1000:.3f}ms -> "
+                            f"{timing['median_s'] * 1000:.3f}ms, threshold {threshold_pct:.0f}%)"
+                        ),
+                    )
+                )
+    return regressions
+
+
+def scaling_exponent(timings: dict[str, dict[str, float]]) -> float | None:
+    """Empirical growth exponent between the smallest and largest size."""
+    if len(timings) < 2:
+        return None
+    sizes = sorted(timings, key=int)
+    n0, n1 = int(sizes[0]), int(sizes[-1])
+    t0, t1 = timings[sizes[0]]["min_s"], timings[sizes[-1]]["min_s"]
+    if t0 <= 0 or t1 <= 0 or n1 <= n0:
+        return None
+    return math.log(t1 / t0) / math.log(n1 / n0)
+
+
+def check_scaling(report: dict[str, Any]) -> list[Regression]:
+    """Find benchmarks that grow faster than their allowed exponent."""
+    regressions: list[Regression] = []
+    for name, entry in report.get("benchmarks", {}).items():
+        exponent = scaling_exponent(entry["sizes"])
+        if exponent is not None and exponent > entry["max_exponent"]:
+            regressions.append(
+                Regression(
+                    name=name,
+                    size=None,
+                    detail=f"time grows as n^{exponent:.2f} (allowed n^{entry['max_exponent']:.2f})",
+                )
+            )
+    return regressions
@@ -0,0 +1,193 @@
+"""Recorded LLM and HTTP fixtures for offline benchmark runs.
+
+A fixtures directory uses the same layouts as the production caches, so a
+copy of a real ``data/cache`` (plus an LLM cache) can be replayed as-is:
+
+    <fixtures>/llm/cache.db     LLMCache (CachedLLMProvider)
+    <fixtures>/http/*.bin|json  CachedHttpClient cache
+
+In replay mode every request must be served from the fixtures; nothing
+touches the network. In record mode, misses are answered by an upstream
+provider/transport (live services, or deterministic synthetic responses)
+and written to the fixtures.
+"""
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+from pathlib import Path
+from urllib.parse import parse_qs
+from xml.sax.saxutils import escape
+
+import httpx
+
+from procedurewriter.bench.corpus import generate_sentence
+from procedurewriter.llm.cached_provider import CachedLLMProvider
+from procedurewriter.llm.providers import LLMProvider, LLMProviderType, LLMResponse
+from procedurewriter.pipeline.fetcher import CachedHttpClient
+
+_SNIPPET_LINE = re.compile(r"^- \[S:([^\]]+)\][^)]*\)\s*(.+)$", re.MULTILINE)
+_SOURCE_ID = re.compile(r"\[S:([^\]]+)\]")
+
+
+class LLMReplayMissError(RuntimeError):
+    """Raised when a replayed LLM request is not in the fixtures."""
+
+
+class ReplayLLMProvider(LLMProvider):
+    """
+    Backing provider for CachedLLMProvider during benchmarks.
+
+    It is only reached on a cache miss. In replay mode the miss is counted
+    and raised; in record mode it is answered by ``upstream`` (a live
+    provider) or, without one, by a deterministic synthetic response.
+    """
+
+    def __init__(self, *, record: bool = False, upstream: LLMProvider | None = None) -> None:
+        self._record = record
+        self._upstream = upstream
+        self.misses = 0
+
+    def chat_completion(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float = 0.2,
+        max_tokens: int | None = None,
+        timeout: float = 60.0,
+    ) -> LLMResponse:
+        self.misses += 1
+        if not self._record:
+            raise LLMReplayMissError(
+                f"No recorded LLM response for model={model} (record fixtures first)"
+            )
+        if self._upstream is not None:
+            return self._upstream.chat_completion(messages, model, temperature, max_tokens, timeout)
+        return synthesize_response(messages, model)
+
+    def is_available(self) -> bool:
+        return True
+
+    @property
+    def provider_type(self) -> LLMProviderType:
+        # Recordings are attributed to the provider that produced them
+        if self._upstream is not None:
+            return self._upstream.provider_type
+        return LLMProviderType.OPENAI
+
+
+def synthesize_response(messages: list[dict[str, str]], model: str) -> LLMResponse:
+    """
+    Build a deterministic response from the prompt.
+
+    Echoes the first sentence of up to four prompt snippets as bullets with
+    their ``[S:<id>]`` tags, so citation validation passes downstream.
+    """
+    prompt = "\n".join(m.get("content", "") for m in messages)
+    lines: list[str] = []
+    for source_id, text in _SNIPPET_LINE.findall(prompt)[:4]:
+        sentence = text.split(". ")[0].rstrip(".")
+        lines.append(f"- {sentence}. [S:{source_id}]")
+    if not lines:
+        ids = _SOURCE_ID.findall(prompt)
+        tag = f" [S:{ids[0]}]" if ids else ""
+        lines.append(f"Ingen yderligere bemærkninger.{tag}")
+    content = "\n".join(lines)
+    input_tokens = len(prompt) // 4
+    output_tokens = len(content) // 4
+    return LLMResponse(
+        content=content,
+        model=model,
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        total_tokens=input_tokens + output_tokens,
+    )
+
+
+def replay_llm_client(
+    fixtures_dir: Path,
+    *,
+    record: bool = False,
+    upstream: LLMProvider | None = None,
+) -> tuple[CachedLLMProvider, ReplayLLMProvider]:
+    """
+    Create an LLM client that replays ``fixtures_dir/llm``.
+
+    Returns:
+        (client, backing provider); the provider's ``misses`` counts requests
+        that were not in the fixtures.
+    """
+    backing = ReplayLLMProvider(record=record, upstream=upstream)
+    return CachedLLMProvider(backing, cache_dir=fixtures_dir / "llm"), backing
+
+
+def replay_http_client(
+    fixtures_dir: Path,
+    *,
+    record: bool = False,
+    transport: httpx.BaseTransport | None = None,
+) -> CachedHttpClient:
+    """
+    Create an HTTP client that replays ``fixtures_dir/http``.
+
+    In record mode, misses go to ``transport`` (the network when None);
+    polite per-host throttling only applies to the network.
+    """
+    if transport is None:
+        return CachedHttpClient(cache_dir=fixtures_dir, offline=not record)
+    return CachedHttpClient(
+        cache_dir=fixtures_dir,
+        offline=not record,
+        transport=transport,
+        sleep_fn=lambda _s: None,
+    )
+
+
+def _pmids_for(term: str, count: int) -> list[str]:
+    digest = int(hashlib.sha256(term.encode("utf-8")).hexdigest()[:8], 16)
+    return [str(30_000_000 + (digest + i * 7919) % 9_000_000) for i in range(count)]
+
+
+def _pubmed_article_xml(pmid: str) -> str:
+    rng = random.Random(int(pmid))
+    abstract = " ".join(generate_sentence(rng) for _ in range(6))
+    year = 2015 + rng.randrange(10)
+    return (
+        "<PubmedArticle><MedlineCitation><PMID>"
+        f"{pmid}</PMID><Article><Journal><Title>Ugeskrift for Læger</Title>"
+        f"<JournalIssue><PubDate><Year>{year}</Year></PubDate></JournalIssue></Journal>"
+        f"<ArticleTitle>Systematisk review {pmid}</ArticleTitle>"
+        f"<Abstract><AbstractText>{escape(abstract)}</AbstractText></Abstract>"
+        "<PublicationTypeList><PublicationType>Systematic Review</PublicationType>"
+        "</PublicationTypeList></Article></MedlineCitation><PubmedData><ArticleIdList>"
+        f'<ArticleId IdType="doi">10.1000/bench.{pmid}</ArticleId>'
+        "</ArticleIdList></PubmedData></PubmedArticle>"
+    )
+
+
+def synthetic_pubmed_transport() -> httpx.MockTransport:
+    """Deterministic E-utilities esearch/efetch responses for recording fixtures."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        params = parse_qs(request.url.query.decode("utf-8"))
+        path = request.url.path
+        if path.endswith("/esearch.fcgi"):
+            term = params.get("term", [""])[0]
+            retmax = int(params.get("retmax", ["8"])[0])
+            ids = "".join(f"<Id>{pmid}</Id>" for pmid in _pmids_for(term, retmax))
+            body = f"<eSearchResult><IdList>{ids}</IdList></eSearchResult>"
+        elif path.endswith("/efetch.fcgi"):
+            pmids = [p for p in params.get("id", [""])[0].split(",") if p]
+            articles = "".join(_pubmed_article_xml(pmid) for pmid in pmids)
+            body = f"<PubmedArticleSet>{articles}</PubmedArticleSet>"
+        else:
+            return httpx.Response(404, request=request)
+        return httpx.Response(
+            200,
+            content=body.encode("utf-8"),
+            headers={"Content-Type": "text/xml; charset=utf-8"},
+            request=request,
+        )
+
+    return httpx.MockTransport(handler)
@@ -6,13 +6,16 @@ similarity.
 
 The binder:
 1. Takes claims and evidence chunks as input
-2. Scores each claim-chunk pair based on keyword overlap and/or embeddings
-3. Creates ClaimEvidenceLink objects for matches above threshold
-4. Tracks unbound claims for review
+2. Indexes chunk keywords once in an inverted index (keyword -> chunks)
+3. Scores each claim against the chunks sharing at least one keyword
+   and/or by embedding similarity
+4. Creates ClaimEvidenceLink objects for the top matches above threshold
+5. Tracks unbound claims for review
 """
 
 from __future__ import annotations
 
+import heapq
 import logging
 import math
 import re
@@ -70,6 +73,49 @@ STOP_WORDS: set[str] = {
 # Minimum word length to consider as keyword
 MIN_WORD_LENGTH = 2
 
+# Words, numbers, and common medical patterns like "500mg"
+_KEYWORD_PATTERN = re.compile(r"[a-zA-ZæøåÆØÅμ]+|\d+(?:[.,]\d+)?")
+
+
+class ChunkKeywordIndex:
+    """Inverted index from keyword to the chunks containing it.
+
+    Keyword sets are computed once per chunk, so scoring a claim only touches
+    the chunks that share at least one keyword with it instead of re-tokenising
+    every chunk for every claim.
+
+    Attributes:
+        chunk_keywords: Keyword set per chunk, in the order chunks were given.
+    """
+
+    def __init__(self, chunk_keywords: list[set[str]]) -> None:
+        """Build the index.
+
+        Args:
+            chunk_keywords: Keyword set for each chunk, by chunk position.
+        """
+        self.chunk_keywords = chunk_keywords
+        self._postings: dict[str, list[int]] = {}
+        for position, keywords in enumerate(chunk_keywords):
+            for keyword in keywords:
+                self._postings.setdefault(keyword, []).append(position)
+
+    def candidates(self, keywords: set[str]) -> list[int]:
+        """Return positions of chunks sharing at least one keyword.
+
+        Args:
+            keywords: Keywords to look up.
+
+        Returns:
+            Chunk positions in ascending (original chunk) order.
+        """
+        hits: set[int] = set()
+        for keyword in keywords:
+            postings = self._postings.get(keyword)
+            if postings:
+                hits.update(postings)
+        return sorted(hits)
+
 
 @dataclass
 class BindingResult:
@@ -176,14 +222,16 @@ class EvidenceBinder:
                 )
                 # Continue with empty embeddings - keyword binding will be used
 
+        chunk_embeddings = {
+            chunk.id: embeddings.get(f"chunk_{chunk.id}")
+            for chunk in chunks
+        }
+        index = self._build_index(chunks)
+
         for claim in claims:
             claim_embedding = embeddings.get(f"claim_{claim.id}")
-            chunk_embeddings = {
-                chunk.id: embeddings.get(f"chunk_{chunk.id}")
-                for chunk in chunks
-            }
             claim_links = self._bind_claim(
-                claim, chunks, claim_embedding, chunk_embeddings
+                claim, chunks, claim_embedding, chunk_embeddings, index
             )
             if claim_links:
                 links.extend(claim_links)
@@ -254,23 +302,37 @@ class EvidenceBinder:
                 f"Failed to generate embeddings for {len(texts)} texts: {e}"
             ) from e
 
+    def _build_index(self, chunks: list[EvidenceChunk]) -> ChunkKeywordIndex:
+        """Extract keywords for every chunk once and index them.
+
+        Args:
+            chunks: Evidence chunks to index.
+
+        Returns:
+            ChunkKeywordIndex over the chunks, by position.
+        """
+        return ChunkKeywordIndex([self._extract_keywords(chunk.text) for chunk in chunks])
+
     def _bind_claim(
         self,
         claim: Claim,
         chunks: list[EvidenceChunk],
         claim_embedding: list[float] | None = None,
         chunk_embeddings: dict | None = None,
+        index: ChunkKeywordIndex | None = None,
     ) -> list[ClaimEvidenceLink]:
         """Bind a single claim to evidence chunks.
 
         Uses semantic similarity (embeddings) when available, otherwise
-        falls back to keyword-based scoring.
+        falls back to keyword-based scoring of the chunks that share at
+        least one keyword with the claim.
 
         Args:
             claim: Claim to bind.
             chunks: Available evidence chunks.
             claim_embedding: Embedding for the claim (optional).
             chunk_embeddings: Dict mapping chunk IDs to embeddings (optional).
+            index: Keyword index over ``chunks`` (built on demand if omitted).
 
         Returns:
             List of ClaimEvidenceLink objects for this claim.
@@ -281,12 +343,11 @@ class EvidenceBinder:
         chunk_embeddings = chunk_embeddings or {}
         use_semantic = claim_embedding is not None and any(chunk_embeddings.values())
 
-        # Score each chunk
+        # Score candidate chunks
         scored_chunks: list[tuple[EvidenceChunk, float, BindingType]] = []
-        claim_keywords = self._extract_keywords(claim.text)
 
-        for chunk in chunks:
-            if use_semantic:
+        if use_semantic:
+            for chunk in chunks:
                 # Use semantic similarity as primary score
                 chunk_emb = chunk_embeddings.get(chunk.id)
                 if chunk_emb:
@@ -295,15 +356,33 @@ class EvidenceBinder:
                     score = max(0.0, min(1.0, semantic_score))
                     if score >= self.min_score:
                         scored_chunks.append((chunk, score, BindingType.SEMANTIC))
+        else:
+            if index is None:
+                index = self._build_index(chunks)
+            claim_keywords = self._extract_keywords(claim.text)
+            # Chunks without keyword overlap score 0.0, so with a positive
+            # threshold only chunks sharing a keyword can ever bind
+            if self.min_score > 0:
+                positions = index.candidates(claim_keywords)
             else:
-                # Use keyword-based scoring
-                score = self._calculate_score(claim, chunk, claim_keywords)
+                positions = list(range(len(chunks)))
+            claim_lower = claim.text.lower()
+            for position in positions:
+                chunk = chunks[position]
+                score = self._score_keywords(
+                    claim,
+                    claim_keywords,
+                    claim_lower,
+                    chunk,
+                    index.chunk_keywords[position],
+                )
                 if score >= self.min_score:
                     scored_chunks.append((chunk, score, BindingType.KEYWORD))
 
-        # Sort by score descending and take top N
-        scored_chunks.sort(key=lambda x: x[1], reverse=True)
-        top_chunks = scored_chunks[: self.max_links_per_claim]
+        # Take top N by score (ties keep chunk order, like a stable sort)
+        top_chunks = heapq.nlargest(
+            self.max_links_per_claim, scored_chunks, key=lambda x: x[1]
+        )
 
         # Create links
         links = []
@@ -339,11 +418,35 @@ class EvidenceBinder:
         Returns:
             Binding score between 0.0 and 1.0.
         """
-        if not claim_keywords:
-            return 0.0
+        return self._score_keywords(
+            claim,
+            claim_keywords,
+            claim.text.lower(),
+            chunk,
+            self._extract_keywords(chunk.text),
+        )
+
+    def _score_keywords(
+        self,
+        claim: Claim,
+        claim_keywords: set[str],
+        claim_lower: str,
+        chunk: EvidenceChunk,
+        chunk_keywords: set[str],
+    ) -> float:
+        """Score a claim-chunk pair from pre-extracted keywords.
 
-        chunk_keywords = self._extract_keywords(chunk.text)
-        if not chunk_keywords:
+        Args:
+            claim: The claim being bound.
+            claim_keywords: Pre-extracted claim keywords.
+            claim_lower: Lowercased claim text.
+            chunk: The evidence chunk to score.
+            chunk_keywords: Pre-extracted chunk keywords.
+
+        Returns:
+            Binding score between 0.0 and 1.0.
+        """
+        if not claim_keywords or not chunk_keywords:
             return 0.0
 
         # Calculate keyword overlap (modified Jaccard)
@@ -363,9 +466,7 @@ class EvidenceBinder:
                 score += 0.2  # Significant bonus for source match
 
         # Bonus for exact phrase match (substring)
-        claim_lower = claim.text.lower()
-        chunk_lower = chunk.text.lower()
-        if claim_lower in chunk_lower:
+        if claim_lower in chunk.text.lower():
             score += 0.1  # Bonus for exact match
 
         # Cap at 1.0
@@ -390,9 +491,7 @@ class EvidenceBinder:
         text_lower = text.lower()
 
         # Extract words (including numbers and units)
-        # Matches: words, numbers, and common medical patterns like "500mg"
-        word_pattern = re.compile(r"[a-zA-ZæøåÆØÅμ]+|\d+(?:[.,]\d+)?")
-        words = word_pattern.findall(text_lower)
+        words = _KEYWORD_PATTERN.findall(text_lower)
 
         # Filter out stop words and short words
         keywords = {
@@ -19,7 +19,9 @@ from typing import TYPE_CHECKING
 from procedurewriter.models.claims import Claim, ClaimType
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
+
+    _FamilyExtractor = Callable[[str, int, list[str]], list[Claim]]
 
 # Regex patterns for dose extraction
 DOSE_PATTERNS: list[re.Pattern[str]] = [
@@ -272,6 +274,27 @@ ALGORITHM_STEP_PATTERNS: list[re.Pattern[str]] = [
 # Pattern for source references [SRC001] or [S:SRC001]
 SOURCE_REF_PATTERN = re.compile(r"\[S?:?SRC(\d+)\]", re.IGNORECASE)
 
+# Cheap keyword prefilters, one per pattern family. Each is a necessary
+# condition for at least one pattern in its family to match, so a line (or a
+# whole text) that fails the prefilter can skip the full pattern set.
+DOSE_PREFILTER = re.compile(r"\d\s*(?:mg|g|mcg|μg|ml|IE|U)", re.IGNORECASE)
+THRESHOLD_PREFILTER = re.compile(
+    r"curb|crb|sat|spo2|sao2|temp|feber|alder|rf|respirationsfrekvens|bt|blodtryk",
+    re.IGNORECASE,
+)
+RECOMMENDATION_PREFILTER = re.compile(r"bør|skal|anbefale|tilrådes|indice", re.IGNORECASE)
+CONTRAINDICATION_PREFILTER = re.compile(r"ikke|aldrig|kontraindi|undgå", re.IGNORECASE)
+RED_FLAG_PREFILTER = re.compile(
+    r"advarsel|obs|nb|vigtigt|kritisk|livstruende|akut|mistanke|mistænkes|"
+    r"risiko|fare|henvis|tilkald|kontakt|øjeblikkelig|straks",
+    re.IGNORECASE,
+)
+ALGORITHM_STEP_PREFILTER = re.compile(
+    r"^(?:\d{1,2}|[A-Za-z])[.):]\s|trin|fase|del|"
+    r"første|andet|tredje|fjerde|femte|sjette|syvende|ottende|niende|tiende",
+    re.IGNORECASE | re.MULTILINE,
+)
+
 
 class ClaimExtractor:
     """Pattern-based extractor for medical claims.
@@ -290,12 +313,24 @@ class ClaimExtractor:
             run_id: Pipeline run ID for extracted claims. Defaults to empty string.
         """
         self.run_id = run_id
+        # Pattern families in output order, each guarded by its prefilter
+        self._families: list[tuple[re.Pattern[str], _FamilyExtractor]] = [
+            (DOSE_PREFILTER, self._extract_doses),
+            (THRESHOLD_PREFILTER, self._extract_thresholds),
+            (RECOMMENDATION_PREFILTER, self._extract_recommendations),
+            (CONTRAINDICATION_PREFILTER, self._extract_contraindications),
+            (RED_FLAG_PREFILTER, self._extract_red_flags),
+            (ALGORITHM_STEP_PREFILTER, self._extract_algorithm_steps),
+        ]
 
     def extract(self, text: str) -> list[Claim]:
         """Extract all claims from procedure text.
 
-        Processes text line by line, extracting dose and threshold claims.
+        Processes text line by line, running each claim family's patterns.
         Skips empty lines and markdown header lines (starting with #).
+        Families whose keyword prefilter does not match the whole text are
+        dropped up front, and the remaining ones only run on lines that
+        pass their prefilter.
 
         Args:
             text: Procedure text to extract claims from.
@@ -306,6 +341,14 @@ class ClaimExtractor:
         if not text or not text.strip():
             return []
 
+        families = [
+            (prefilter, extract_family)
+            for prefilter, extract_family in self._families
+            if prefilter.search(text)
+        ]
+        if not families:
+            return []
+
         claims: list[Claim] = []
 
         for line_num, line in enumerate(text.split("\n"), start=1):
@@ -314,28 +357,28 @@ class ClaimExtractor:
             if not stripped or stripped.startswith("#"):
                 continue
 
-            # Extract source refs from this line
-            source_refs = self._extract_source_refs(line)
-
-            # Extract doses
-            claims.extend(self._extract_doses(line, line_num, source_refs))
-
-            # Extract thresholds
-            claims.extend(self._extract_thresholds(line, line_num, source_refs))
+            # Source refs are only needed once a family is a candidate
+            source_refs: list[str] | None = None
 
-            # Extract recommendations
-            claims.extend(self._extract_recommendations(line, line_num, source_refs))
+            for prefilter, extract_family in families:
+                if not prefilter.search(line):
+                    continue
+                if source_refs is None:
+                    source_refs = self._extract_source_refs(line)
+                claims.extend(extract_family(line, line_num, source_refs))
 
-            # Extract contraindications
-            claims.extend(self._extract_contraindications(line, line_num, source_refs))
+        return claims
 
-            # Extract red flags
-            claims.extend(self._extract_red_flags(line, line_num, source_refs))
+    def extract_many(self, texts: Sequence[str]) -> list[list[Claim]]:
+        """Extract claims from several texts in one call.
 
-            # Extract algorithm steps
-            claims.extend(self._extract_algorithm_steps(line, line_num, source_refs))
+        Args:
+            texts: Procedure texts to extract claims from.
 
-        return claims
+        Returns:
+            One list of claims per input text, in input order.
+        """
+        return [self.extract(text) for text in texts]
 
     def extract_all(self, text: str) -> list[Claim]:
         """Alias for extract() method.
@@ -1,10 +1,19 @@
 from __future__ import annotations
 
+import threading
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, TypeVar
 
 import yaml
 
+from procedurewriter.pipeline.hashing import sha256_bytes
+
+T = TypeVar("T")
+
 
 def read_text(path: Path) -> str:
     return path.read_text(encoding="utf-8")
@@ -14,8 +23,170 @@ def write_text_validated_yaml(path: Path, text: str) -> None:
     yaml.safe_load(text)
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(text, encoding="utf-8")
+    # A same-size rewrite within the filesystem's mtime granularity would
+    # otherwise keep serving the old snapshot
+    config_registry.invalidate(path)
 
 
 def load_yaml(path: Path) -> dict[str, Any]:
-    loaded = yaml.safe_load(path.read_text(encoding="utf-8"))
-    return loaded if isinstance(loaded, dict) else {}
+    """Parse a YAML config into a dict the caller may modify.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    return config_registry.snapshot(path).to_dict()
+
+
+class UrlPrefixTrie:
+    """Matches URLs against allowlist prefixes in one pass over the URL."""
+
+    _END = ""  # Never a real edge: edges are single characters
+
+    def __init__(self, prefixes: Iterable[str]) -> None:
+        self.prefixes = tuple(dict.fromkeys(p for p in prefixes if p))
+        self._root: dict[str, Any] = {}
+        for prefix in self.prefixes:
+            node = self._root
+            for ch in prefix:
+                node = node.setdefault(ch, {})
+            node[self._END] = True
+
+    def matches(self, url: str) -> bool:
+        """Whether url starts with any of the prefixes."""
+        node = self._root
+        for ch in url:
+            if self._END in node:
+                return True
+            next_node = node.get(ch)
+            if next_node is None:
+                return False
+            node = next_node
+        return self._END in node
+
+    def __len__(self) -> int:
+        return len(self.prefixes)
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, MappingProxyType):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    if isinstance(value, frozenset):
+        return set(value)
+    return value
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """A parsed config file as it was at one (mtime, size).
+
+    The data is deeply read-only (mappings and tuples), so one snapshot is
+    shared by every run and request that reads the same file version.
+    """
+
+    path: Path
+    sha256: str
+    mtime_ns: int
+    size: int
+    data: Mapping[str, Any]
+
+    def to_dict(self) -> dict[str, Any]:
+        """A mutable deep copy of the data."""
+        thawed: dict[str, Any] = _thaw(self.data)
+        return thawed
+
+    @cached_property
+    def url_prefixes(self) -> UrlPrefixTrie:
+        """The allowlist's allowed_url_prefixes, compiled for matching."""
+        prefixes = self.data.get("allowed_url_prefixes")
+        if not isinstance(prefixes, tuple):
+            return UrlPrefixTrie(())
+        return UrlPrefixTrie(str(p).strip() for p in prefixes)
+
+
+class ConfigRegistry:
+    """Process-wide cache of parsed config files.
+
+    Each file is read, hashed and parsed once per version; a version is
+    identified by the file's (mtime, size), checked with one stat per lookup.
+    """
+
+    def __init__(self) -> None:
+        self._snapshots: dict[Path, ConfigSnapshot] = {}
+        self._derived: dict[tuple[Path, str], tuple[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def snapshot(self, path: Path) -> ConfigSnapshot:
+        """Return the current snapshot of a config file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        # Stat before reading: if the file changes in between, the snapshot
+        # is stored under the older key and simply re-read on the next lookup
+        stat = path.stat()
+        with self._lock:
+            cached = self._snapshots.get(path)
+        if cached is not None and (cached.mtime_ns, cached.size) == (stat.st_mtime_ns, stat.st_size):
+            return cached
+
+        raw = path.read_bytes()
+        loaded = yaml.safe_load(raw.decode("utf-8"))
+        snapshot = ConfigSnapshot(
+            path=path,
+            sha256=sha256_bytes(raw),
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            data=_freeze(loaded if isinstance(loaded, dict) else {}),
+        )
+        with self._lock:
+            self._snapshots[path] = snapshot
+        return snapshot
+
+    def derive(self, snapshot: ConfigSnapshot, name: str, build: Callable[[ConfigSnapshot], T]) -> T:
+        """Return an object built from a snapshot, built once per file version.
+
+        The object is shared between callers, so it must not be mutated.
+
+        Args:
+            snapshot: Snapshot the object is built from
+            name: Distinguishes several objects built from the same file
+            build: Builds the object from the snapshot
+        """
+        key = (snapshot.path, name)
+        with self._lock:
+            cached = self._derived.get(key)
+        if cached is not None and cached[0] == snapshot.sha256:
+            built: T = cached[1]
+            return built
+        built = build(snapshot)
+        with self._lock:
+            self._derived[key] = (snapshot.sha256, built)
+        return built
+
+    def invalidate(self, path: Path) -> None:
+        """Drop a file's cached snapshot and derived objects."""
+        with self._lock:
+            self._snapshots.pop(path, None)
+            for key in [k for k in self._derived if k[0] == path]:
+                del self._derived[key]
+
+    def clear(self) -> None:
+        """Drop everything cached."""
+        with self._lock:
+            self._snapshots.clear()
+            self._derived.clear()
+
+
+config_registry = ConfigRegistry()
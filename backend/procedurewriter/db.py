@@ -1,13 +1,25 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 import json
 import sqlite3
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
+
+from procedurewriter.pipeline.profiler import profile_section
+
+if TYPE_CHECKING:
+    from procedurewriter.models.claims import Claim
+    from procedurewriter.models.evidence import ClaimEvidenceLink, EvidenceChunk
+    from procedurewriter.models.gates import Gate
+    from procedurewriter.models.issues import Issue
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
 
 
 def utc_now_iso() -> str:
@@ -50,6 +62,24 @@ def _connect(db_path: Path) -> sqlite3.Connection:
     return conn
 
 
+def _db_write(table: str) -> Callable[[Callable[_P, _R]], Callable[_P, _R]]:
+    """Record calls of a write helper as ``db:write`` spans in the run trace.
+
+    Lock waits on the shared database show up in a run's trace next to the
+    stage that was blocked. A no-op outside a traced run.
+    """
+
+    def decorator(fn: Callable[_P, _R]) -> Callable[_P, _R]:
+        @functools.wraps(fn)
+        def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+            with profile_section("db:write", table=table, op=fn.__name__):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
 DEFAULT_TEMPLATES = [
     {
         "template_id": "emergency_standard",
@@ -227,6 +257,31 @@ def init_db(db_path: Path) -> None:
             )
             """
         )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_library_sources_raw_sha256 ON library_sources(raw_sha256)")
+
+        # Bulk library ingestion jobs (folders/ZIP archives), run by the worker
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS ingest_jobs (
+              job_id TEXT PRIMARY KEY,
+              created_at_utc TEXT NOT NULL,
+              updated_at_utc TEXT NOT NULL,
+              status TEXT NOT NULL,
+              input_path TEXT NOT NULL,
+              job_dir TEXT NOT NULL,
+              attempts INTEGER NOT NULL DEFAULT 0,
+              locked_by TEXT,
+              heartbeat_at_utc TEXT,
+              total INTEGER NOT NULL DEFAULT 0,
+              processed INTEGER NOT NULL DEFAULT 0,
+              added INTEGER NOT NULL DEFAULT 0,
+              duplicates INTEGER NOT NULL DEFAULT 0,
+              failed INTEGER NOT NULL DEFAULT 0,
+              error TEXT
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_ingest_jobs_status ON ingest_jobs(status)")
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS secrets (
@@ -310,6 +365,38 @@ def init_db(db_path: Path) -> None:
         conn.execute("CREATE INDEX IF NOT EXISTS idx_validation_run ON validation_results(run_id)")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_validation_protocol ON validation_results(protocol_id)")
 
+        # LLM protocol validation verdicts, keyed by model + content hashes
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS validation_cache (
+              cache_key TEXT PRIMARY KEY,
+              model TEXT NOT NULL,
+              created_at_utc TEXT NOT NULL,
+              result_json TEXT NOT NULL
+            )
+            """
+        )
+
+        # Expanded search terms and provider queries per procedure + context
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS query_plans (
+              plan_id TEXT PRIMARY KEY,
+              procedure TEXT NOT NULL,
+              procedure_key TEXT NOT NULL,
+              context TEXT,
+              context_sha256 TEXT NOT NULL,
+              expanded_terms_json TEXT NOT NULL,
+              queries_json TEXT NOT NULL,
+              model TEXT,
+              source TEXT NOT NULL,
+              created_at_utc TEXT NOT NULL,
+              updated_at_utc TEXT NOT NULL,
+              expires_at_utc TEXT
+            )
+            """
+        )
+
         # Meta-analysis runs table
         conn.execute(
             """
@@ -380,10 +467,14 @@ def init_db(db_path: Path) -> None:
                 embedding_vector_json TEXT,
                 metadata_json TEXT NOT NULL DEFAULT '{}',
                 created_at_utc TEXT NOT NULL,
+                embedding_vector_blob BLOB,
                 FOREIGN KEY (run_id) REFERENCES runs(run_id)
             )
             """
         )
+        # Packed float32 embeddings (migration for existing DBs)
+        with contextlib.suppress(sqlite3.OperationalError):
+            conn.execute("ALTER TABLE evidence_chunks ADD COLUMN embedding_vector_blob BLOB")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_chunks_run ON evidence_chunks(run_id)")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_chunks_source ON evidence_chunks(source_id)")
 
@@ -456,6 +547,25 @@ def init_db(db_path: Path) -> None:
         # END CLAIM SYSTEM TABLES
         # =================================================================
 
+        # Per-call LLM cost ledger (flushed by llm.cost_tracker.RunCostLedger)
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_calls (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                run_id TEXT NOT NULL,
+                created_at_utc TEXT NOT NULL,
+                model TEXT NOT NULL,
+                operation TEXT NOT NULL,
+                agent TEXT,
+                stage TEXT,
+                input_tokens INTEGER NOT NULL DEFAULT 0,
+                output_tokens INTEGER NOT NULL DEFAULT 0,
+                cost_usd REAL NOT NULL DEFAULT 0
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_calls_run ON llm_calls(run_id)")
+
         # Style profiles table for LLM-powered document formatting
         conn.execute(
             """
@@ -477,6 +587,7 @@ def init_db(db_path: Path) -> None:
         conn.execute("CREATE INDEX IF NOT EXISTS idx_style_profiles_default ON style_profiles(is_default)")
 
 
+@_db_write("secrets")
 def set_secret(db_path: Path, *, name: str, value: str) -> None:
     """Store a secret value encrypted in the database."""
     from procedurewriter.crypto import encrypt_value, is_encrypted
@@ -509,6 +620,7 @@ def get_secret(db_path: Path, *, name: str) -> str | None:
         return str(value)
 
 
+@_db_write("secrets")
 def delete_secret(db_path: Path, *, name: str) -> None:
     with _connect(db_path) as conn:
         conn.execute("DELETE FROM secrets WHERE name = ?", (name,))
@@ -569,6 +681,7 @@ def normalize_procedure_name(name: str) -> str:
     return normalized
 
 
+@_db_write("runs")
 def create_run(
     db_path: Path,
     *,
@@ -646,6 +759,7 @@ def create_run(
             raise
 
 
+@_db_write("runs")
 def update_run_status(
     db_path: Path,
     *,
@@ -747,6 +861,7 @@ def list_runs(db_path: Path, limit: int = 200) -> list[RunRow]:
     return [_row_to_run(r) for r in rows]
 
 
+@_db_write("runs")
 def enqueue_run(db_path: Path, *, run_id: str) -> None:
     """Re-queue a run for processing."""
     now = utc_now_iso()
@@ -766,6 +881,7 @@ def enqueue_run(db_path: Path, *, run_id: str) -> None:
         )
 
 
+@_db_write("runs")
 def claim_next_run(
     db_path: Path,
     *,
@@ -833,6 +949,14 @@ def claim_next_run(
             raise
 
 
+def count_queued_runs(db_path: Path) -> int:
+    """Return the number of runs waiting to be claimed."""
+    with _connect(db_path) as conn:
+        row = conn.execute("SELECT COUNT(*) FROM runs WHERE status = 'QUEUED'").fetchone()
+    return int(row[0])
+
+
+@_db_write("runs")
 def update_run_heartbeat(db_path: Path, *, run_id: str, worker_id: str) -> None:
     """Update heartbeat for a running job if the worker holds the lock."""
     now = utc_now_iso()
@@ -848,6 +972,7 @@ def update_run_heartbeat(db_path: Path, *, run_id: str, worker_id: str) -> None:
         )
 
 
+@_db_write("runs")
 def release_run_lock(db_path: Path, *, run_id: str) -> None:
     """Clear lock/heartbeat metadata for a run."""
     now = utc_now_iso()
@@ -865,6 +990,7 @@ def release_run_lock(db_path: Path, *, run_id: str) -> None:
         )
 
 
+@_db_write("runs")
 def mark_stale_runs(
     db_path: Path,
     *,
@@ -945,6 +1071,7 @@ def mark_stale_runs(
     return updated
 
 
+@_db_write("runs")
 def set_run_needs_ack(
     db_path: Path,
     *,
@@ -972,6 +1099,7 @@ def set_run_needs_ack(
         )
 
 
+@_db_write("runs")
 def acknowledge_run(
     db_path: Path,
     *,
@@ -995,6 +1123,7 @@ def acknowledge_run(
         )
 
 
+@_db_write("library_sources")
 def add_library_source(
     db_path: Path,
     *,
@@ -1172,6 +1301,7 @@ class MetaAnalysisRunRow:
     synthesis: dict[str, Any] | None
 
 
+@_db_write("meta_analysis_runs")
 def create_meta_analysis_run(
     db_path: Path,
     *,
@@ -1203,6 +1333,7 @@ def create_meta_analysis_run(
         )
 
 
+@_db_write("meta_analysis_runs")
 def update_meta_analysis_results(
     db_path: Path,
     *,
@@ -1313,6 +1444,7 @@ def list_meta_analysis_runs(db_path: Path, limit: int = 100) -> list[MetaAnalysi
 # =============================================================================
 
 
+@_db_write("style_profiles")
 def create_style_profile(
     db_path: Path,
     *,
@@ -1394,6 +1526,7 @@ def list_style_profiles(db_path: Path) -> list[dict[str, Any]]:
         return [_row_to_style_profile(row) for row in cursor.fetchall()]
 
 
+@_db_write("style_profiles")
 def update_style_profile(
     db_path: Path,
     profile_id: str,
@@ -1427,6 +1560,7 @@ def update_style_profile(
         return cursor.rowcount > 0
 
 
+@_db_write("style_profiles")
 def delete_style_profile(db_path: Path, profile_id: str) -> bool:
     """Delete a style profile. Returns True if deleted."""
     with _connect(db_path) as conn:
@@ -1450,6 +1584,7 @@ def get_default_style_profile(db_path: Path) -> dict[str, Any] | None:
         return _row_to_style_profile(row)
 
 
+@_db_write("style_profiles")
 def set_default_style_profile(db_path: Path, profile_id: str) -> None:
     """Set a profile as the default (unsets any existing default)."""
     with _connect(db_path) as conn:
@@ -1461,6 +1596,189 @@ def set_default_style_profile(db_path: Path, profile_id: str) -> None:
         conn.commit()
 
 
+# =============================================================================
+# Claim System Bulk Persistence
+# =============================================================================
+
+_INSERT_EVIDENCE_CHUNK_SQL = """
+    INSERT INTO evidence_chunks (
+        id, run_id, source_id, text, chunk_index, start_char, end_char,
+        embedding_vector_blob, metadata_json, created_at_utc
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_CLAIM_SQL = """
+    INSERT INTO claims (
+        id, run_id, claim_type, text, normalized_value, unit,
+        source_refs_json, line_number, confidence, created_at_utc
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_CLAIM_EVIDENCE_LINK_SQL = """
+    INSERT INTO claim_evidence_links (
+        id, claim_id, evidence_chunk_id, binding_type, binding_score, created_at_utc
+    ) VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_ISSUE_SQL = """
+    INSERT INTO issues (
+        id, run_id, code, severity, message, line_number, claim_id, source_id,
+        auto_detected, resolved, resolution_note, resolved_at_utc, created_at_utc
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_GATE_SQL = """
+    INSERT INTO gates (
+        id, run_id, gate_type, status, issues_checked, issues_failed,
+        message, created_at_utc, evaluated_at_utc
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def save_claim_system_records(
+    db_path: Path,
+    *,
+    chunks: Iterable[EvidenceChunk] = (),
+    claims: Iterable[Claim] = (),
+    links: Iterable[ClaimEvidenceLink] = (),
+    issues: Iterable[Issue] = (),
+    gates: Iterable[Gate] = (),
+) -> dict[str, int]:
+    """Persist claim system records for a run in a single transaction.
+
+    Rows are written with executemany in foreign-key order (chunks and claims
+    before the links and issues that reference them). Embeddings are stored
+    as packed float32 BLOBs rather than JSON text. If any insert fails the
+    whole batch is rolled back.
+
+    Args:
+        db_path: Path to the SQLite database
+        chunks: Evidence chunks to insert
+        claims: Claims to insert
+        links: Claim-evidence links to insert
+        issues: Issues to insert
+        gates: Gates to insert
+
+    Returns:
+        Number of rows inserted per table.
+    """
+    batches = [
+        ("evidence_chunks", _INSERT_EVIDENCE_CHUNK_SQL, [c.to_db_row(packed=True) for c in chunks]),
+        ("claims", _INSERT_CLAIM_SQL, [c.to_db_row() for c in claims]),
+        ("claim_evidence_links", _INSERT_CLAIM_EVIDENCE_LINK_SQL, [link.to_db_row() for link in links]),
+        ("issues", _INSERT_ISSUE_SQL, [i.to_db_row() for i in issues]),
+        ("gates", _INSERT_GATE_SQL, [g.to_db_row() for g in gates]),
+    ]
+    counts: dict[str, int] = {}
+    # The connection context manager commits on success and rolls back on error.
+    with (
+        profile_section(
+            "db:write",
+            table="claim_system",
+            op="save_claim_system_records",
+            rows=sum(len(rows) for _, _, rows in batches),
+        ),
+        _connect(db_path) as conn,
+    ):
+        for table, sql, rows in batches:
+            if rows:
+                conn.executemany(sql, rows)
+            counts[table] = len(rows)
+    return counts
+
+
+# =============================================================================
+# LLM Call Ledger
+# =============================================================================
+
+
+# (created_at_utc, model, operation, agent, stage, input_tokens, output_tokens, cost_usd)
+LLMCallRow = tuple[str, str, str, str | None, str | None, int, int, float]
+
+
+def insert_llm_calls(db_path: Path, run_id: str, rows: Iterable[LLMCallRow]) -> int:
+    """Append LLM call records for a run.
+
+    Args:
+        db_path: Path to the SQLite database
+        run_id: Run the calls belong to
+        rows: Call rows in llm_calls column order (after run_id)
+
+    Returns:
+        Number of rows inserted.
+    """
+    params = [(run_id, *row) for row in rows]
+    if not params:
+        return 0
+    with (
+        profile_section("db:write", table="llm_calls", op="insert_llm_calls", rows=len(params)),
+        _connect(db_path) as conn,
+    ):
+        conn.executemany(
+            """
+            INSERT INTO llm_calls (
+                run_id, created_at_utc, model, operation, agent, stage,
+                input_tokens, output_tokens, cost_usd
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            params,
+        )
+    return len(params)
+
+
+def _llm_cost_group(conn: sqlite3.Connection, run_id: str, column: str) -> dict[str, dict[str, Any]]:
+    cursor = conn.execute(
+        f"""
+        SELECT {column} AS k, COUNT(*), COALESCE(SUM(input_tokens), 0),
+               COALESCE(SUM(output_tokens), 0), COALESCE(SUM(cost_usd), 0)
+        FROM llm_calls
+        WHERE run_id = ? AND {column} IS NOT NULL
+        GROUP BY {column}
+        ORDER BY {column}
+        """,
+        (run_id,),
+    )
+    return {row[0]: _llm_cost_totals(row[1:]) for row in cursor.fetchall()}
+
+
+def _llm_cost_totals(row: tuple[Any, ...]) -> dict[str, Any]:
+    return {
+        "call_count": int(row[0]),
+        "input_tokens": int(row[1]),
+        "output_tokens": int(row[2]),
+        "cost_usd": round(float(row[3]), 6),
+    }
+
+
+def get_llm_cost_rollup(db_path: Path, run_id: str) -> dict[str, Any]:
+    """Aggregate persisted LLM calls for a run.
+
+    Args:
+        db_path: Path to the SQLite database
+        run_id: Run to aggregate
+
+    Returns:
+        Dict with run totals and per-agent, per-stage and per-model rollups.
+    """
+    with _connect(db_path) as conn:
+        totals = conn.execute(
+            """
+            SELECT COUNT(*), COALESCE(SUM(input_tokens), 0),
+                   COALESCE(SUM(output_tokens), 0), COALESCE(SUM(cost_usd), 0)
+            FROM llm_calls
+            WHERE run_id = ?
+            """,
+            (run_id,),
+        ).fetchone()
+        return {
+            "run_id": run_id,
+            "totals": _llm_cost_totals(tuple(totals)),
+            "by_agent": _llm_cost_group(conn, run_id, "agent"),
+            "by_stage": _llm_cost_group(conn, run_id, "stage"),
+            "by_model": _llm_cost_group(conn, run_id, "model"),
+        }
+
+
 # =============================================================================
 # Claim System Rollback Functions (Phase 1 - Migration Safety)
 # =============================================================================
@@ -0,0 +1,603 @@
+"""
+Bulk library ingestion jobs.
+
+Adds a whole folder or ZIP archive of PDFs, DOCX files and URL lists to the
+library in the background. Jobs are queued in SQLite and executed by the
+same worker loop as procedure runs. Each file is deduplicated against
+library_sources by raw sha256, files are extracted in parallel through the
+extraction service, and per-file progress is appended to the job's event
+log for the SSE endpoint.
+
+URLs are read from ``.url`` shortcut files and from ``urls.txt`` files (one
+URL per line, ``#`` comments allowed); they must match the source allowlist.
+
+NO MOCKS - All operations use real database.
+"""
+from __future__ import annotations
+
+import logging
+import shutil
+import sqlite3
+import tempfile
+import uuid
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from procedurewriter import config_store
+from procedurewriter.db import _connect, add_library_source, utc_now_iso
+from procedurewriter.file_utils import UnsafePathError, safe_path_within
+from procedurewriter.pipeline.events import EVENT_LOG_FILENAME, EventEmitter, EventLog, EventType
+from procedurewriter.pipeline.extraction import (
+    KIND_PDF,
+    ExtractionResult,
+    ExtractionService,
+    get_extraction_service,
+)
+from procedurewriter.pipeline.hashing import sha256_bytes, sha256_file, sha256_text
+from procedurewriter.pipeline.io import write_bytes, write_json, write_text
+from procedurewriter.pipeline.normalize import (
+    normalize_docx_blocks,
+    normalize_html,
+    normalize_pdf_pages,
+)
+from procedurewriter.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+STATUS_QUEUED = "QUEUED"
+STATUS_RUNNING = "RUNNING"
+STATUS_DONE = "DONE"
+STATUS_FAILED = "FAILED"
+TERMINAL_STATUSES = {STATUS_DONE, STATUS_FAILED}
+
+_URL_LIST_NAME = "urls.txt"
+_FILE_SUFFIXES = {".pdf", ".docx"}
+
+
+@dataclass
+class IngestJob:
+    """A queued or finished bulk ingestion job."""
+
+    job_id: str
+    created_at_utc: str
+    updated_at_utc: str
+    status: str
+    input_path: str  # Directory or ZIP archive to ingest
+    job_dir: str  # Holds the event log and extracted archive members
+    attempts: int = 0
+    locked_by: str | None = None
+    heartbeat_at_utc: str | None = None
+    total: int = 0
+    processed: int = 0
+    added: int = 0
+    duplicates: int = 0
+    failed: int = 0
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class IngestItem:
+    """One file or URL found in a job's input."""
+
+    name: str  # Path relative to the input root, or the URL
+    path: Path | None = None
+    url: str | None = None
+
+
+def _row_to_job(row: sqlite3.Row) -> IngestJob:
+    """Convert database row to IngestJob object."""
+    return IngestJob(
+        job_id=row["job_id"],
+        created_at_utc=row["created_at_utc"],
+        updated_at_utc=row["updated_at_utc"],
+        status=row["status"],
+        input_path=row["input_path"],
+        job_dir=row["job_dir"],
+        attempts=row["attempts"] or 0,
+        locked_by=row["locked_by"],
+        heartbeat_at_utc=row["heartbeat_at_utc"],
+        total=row["total"] or 0,
+        processed=row["processed"] or 0,
+        added=row["added"] or 0,
+        duplicates=row["duplicates"] or 0,
+        failed=row["failed"] or 0,
+        error=row["error"],
+    )
+
+
+# --- Job queue ---
+
+
+def create_ingest_job(
+    db_path: Path,
+    *,
+    input_path: Path,
+    job_dir: Path,
+    job_id: str | None = None,
+    locked_by: str | None = None,
+) -> IngestJob:
+    """Queue a job for a directory or ZIP archive.
+
+    With ``locked_by`` the job is created RUNNING and owned by that caller
+    (e.g. the CLI running it in-process), so no worker picks it up.
+    """
+    job_id = job_id or uuid.uuid4().hex
+    now = utc_now_iso()
+    status, heartbeat = (STATUS_RUNNING, now) if locked_by else (STATUS_QUEUED, None)
+    with _connect(db_path) as conn:
+        conn.execute(
+            """
+            INSERT INTO ingest_jobs(
+              job_id, created_at_utc, updated_at_utc, status, input_path, job_dir,
+              attempts, locked_by, heartbeat_at_utc
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (job_id, now, now, status, str(input_path), str(job_dir), 1 if locked_by else 0, locked_by, heartbeat),
+        )
+    job = get_ingest_job(db_path, job_id)
+    if job is None:
+        raise RuntimeError(f"Ingest job {job_id} was not stored")
+    return job
+
+
+def get_ingest_job(db_path: Path, job_id: str) -> IngestJob | None:
+    """Get a job by ID."""
+    with _connect(db_path) as conn:
+        row = conn.execute("SELECT * FROM ingest_jobs WHERE job_id = ?", (job_id,)).fetchone()
+    return _row_to_job(row) if row else None
+
+
+def list_ingest_jobs(db_path: Path, limit: int = 100) -> list[IngestJob]:
+    """List jobs, newest first."""
+    with _connect(db_path) as conn:
+        rows = conn.execute(
+            "SELECT * FROM ingest_jobs ORDER BY created_at_utc DESC LIMIT ?", (limit,)
+        ).fetchall()
+    return [_row_to_job(row) for row in rows]
+
+
+def claim_next_ingest_job(
+    db_path: Path,
+    *,
+    worker_id: str,
+    max_attempts: int = 3,
+    stale_after_s: int = 1800,
+) -> IngestJob | None:
+    """Claim the oldest queued job, or a running job whose worker went silent.
+
+    Uses BEGIN IMMEDIATE like claim_next_run, so two workers never claim
+    the same job. Stale jobs past max_attempts are marked FAILED.
+    """
+    now = utc_now_iso()
+    with _connect(db_path) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                """
+                UPDATE ingest_jobs
+                SET updated_at_utc = ?, status = ?, locked_by = NULL,
+                    error = 'Job marked failed due to stale worker lock.'
+                WHERE status = ? AND attempts >= ?
+                  AND (julianday(?) - julianday(heartbeat_at_utc)) * 86400 >= ?
+                """,
+                (now, STATUS_FAILED, STATUS_RUNNING, max_attempts, now, stale_after_s),
+            )
+            row = conn.execute(
+                """
+                SELECT * FROM ingest_jobs
+                WHERE attempts < ?
+                  AND (status = ?
+                       OR (status = ? AND (julianday(?) - julianday(heartbeat_at_utc)) * 86400 >= ?))
+                ORDER BY created_at_utc ASC
+                LIMIT 1
+                """,
+                (max_attempts, STATUS_QUEUED, STATUS_RUNNING, now, stale_after_s),
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            conn.execute(
+                """
+                UPDATE ingest_jobs
+                SET updated_at_utc = ?, status = ?, attempts = attempts + 1,
+                    locked_by = ?, heartbeat_at_utc = ?
+                WHERE job_id = ?
+                """,
+                (now, STATUS_RUNNING, worker_id, now, row["job_id"]),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    return get_ingest_job(db_path, row["job_id"])
+
+
+def update_ingest_job_progress(db_path: Path, job: IngestJob) -> None:
+    """Persist a job's counters; also serves as its heartbeat."""
+    now = utc_now_iso()
+    with _connect(db_path) as conn:
+        conn.execute(
+            """
+            UPDATE ingest_jobs
+            SET updated_at_utc = ?, heartbeat_at_utc = ?,
+                total = ?, processed = ?, added = ?, duplicates = ?, failed = ?
+            WHERE job_id = ?
+            """,
+            (now, now, job.total, job.processed, job.added, job.duplicates, job.failed, job.job_id),
+        )
+
+
+def update_ingest_job_heartbeat(db_path: Path, *, job_id: str, worker_id: str) -> None:
+    """Refresh the heartbeat of a job this worker still holds."""
+    with _connect(db_path) as conn:
+        conn.execute(
+            "UPDATE ingest_jobs SET heartbeat_at_utc = ? WHERE job_id = ? AND locked_by = ?",
+            (utc_now_iso(), job_id, worker_id),
+        )
+
+
+def finish_ingest_job(db_path: Path, job_id: str, *, status: str, error: str | None = None) -> None:
+    """Mark a job DONE or FAILED and release its lock."""
+    with _connect(db_path) as conn:
+        conn.execute(
+            """
+            UPDATE ingest_jobs
+            SET updated_at_utc = ?, status = ?, error = ?, locked_by = NULL, heartbeat_at_utc = NULL
+            WHERE job_id = ?
+            """,
+            (utc_now_iso(), status, error, job_id),
+        )
+
+
+def library_sources_by_sha256(db_path: Path) -> dict[str, str]:
+    """Map raw sha256 -> source_id for every library source."""
+    with _connect(db_path) as conn:
+        rows = conn.execute(
+            "SELECT raw_sha256, source_id FROM library_sources ORDER BY created_at_utc"
+        ).fetchall()
+    return {row["raw_sha256"]: row["source_id"] for row in rows}
+
+
+# --- Input collection ---
+
+
+def _extract_archive(archive: Path, dest: Path, *, max_bytes: int) -> None:
+    """Unpack a ZIP archive, refusing members outside dest and oversized archives."""
+    with zipfile.ZipFile(archive) as zf:
+        members = [m for m in zf.infolist() if not m.is_dir()]
+        if sum(m.file_size for m in members) > max_bytes:
+            raise ValueError(f"Archive expands to more than {max_bytes // (1024 * 1024)}MB")
+        dest.mkdir(parents=True, exist_ok=True)
+        for member in members:
+            try:
+                target = safe_path_within(dest / member.filename, root_dir=dest)
+            except UnsafePathError:
+                logger.warning("Skipping archive member outside target dir: %s", member.filename)
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with zf.open(member) as src, target.open("wb") as dst:
+                shutil.copyfileobj(src, dst)
+
+
+def _unpack_archive(archive: Path, dest: Path, *, max_bytes: int) -> None:
+    """Unpack into a temporary sibling of dest and rename it into place.
+
+    dest only appears once every member is written, so a worker that dies
+    mid-extract leaves a partial directory that the next attempt discards
+    instead of ingesting.
+    """
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    for stale in dest.parent.glob(f".{dest.name}-*"):
+        shutil.rmtree(stale, ignore_errors=True)
+    partial = Path(tempfile.mkdtemp(prefix=f".{dest.name}-", dir=dest.parent))
+    try:
+        _extract_archive(archive, partial, max_bytes=max_bytes)
+        partial.rename(dest)
+    except BaseException:
+        shutil.rmtree(partial, ignore_errors=True)
+        raise
+
+
+def _urls_in(path: Path) -> list[str]:
+    text = path.read_text(encoding="utf-8", errors="replace")
+    if path.suffix.lower() == ".url":
+        # Internet shortcut: an INI file with a URL= line
+        return [line.split("=", 1)[1].strip() for line in text.splitlines() if line.upper().startswith("URL=")][:1]
+    return [line.strip() for line in text.splitlines() if line.strip() and not line.strip().startswith("#")]
+
+
+def collect_ingest_items(input_path: Path, work_dir: Path, *, max_archive_bytes: int) -> list[IngestItem]:
+    """List the PDFs, DOCX files and URLs in a directory or ZIP archive.
+
+    Archives are unpacked into ``work_dir / "files"``, which only exists
+    once the unpack has completed. Hidden files and other file types are
+    ignored.
+
+    Raises:
+        ValueError: If the input is neither a directory nor a ZIP archive
+    """
+    if input_path.is_dir():
+        root = input_path
+    elif input_path.is_file() and zipfile.is_zipfile(input_path):
+        root = work_dir / "files"
+        if not root.exists():
+            _unpack_archive(input_path, root, max_bytes=max_archive_bytes)
+    else:
+        raise ValueError(f"Not a directory or ZIP archive: {input_path}")
+
+    items: list[IngestItem] = []
+    for path in sorted(root.rglob("*")):
+        rel = path.relative_to(root)
+        if not path.is_file() or any(part.startswith((".", "__MACOSX")) for part in rel.parts):
+            continue
+        suffix = path.suffix.lower()
+        if suffix in _FILE_SUFFIXES:
+            items.append(IngestItem(name=rel.as_posix(), path=path))
+        elif suffix == ".url" or path.name.lower() == _URL_LIST_NAME:
+            items.extend(IngestItem(name=url, url=url) for url in _urls_in(path))
+    return items
+
+
+# --- Execution ---
+
+
+def _store_file_source(settings: Settings, job_id: str, path: Path, result: ExtractionResult) -> str:
+    """Copy an extracted file into uploads and register it as a library source."""
+    source_id = f"LIB_{uuid.uuid4().hex}"
+    uploads = settings.uploads_dir
+    raw_path = uploads / f"{source_id}{path.suffix.lower()}"
+    raw_path.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(path, raw_path)
+
+    meta: dict[str, Any] = {"filename": path.name, "ingest_job_id": job_id}
+    if result.kind == KIND_PDF:
+        normalized_text = normalize_pdf_pages(result.pages)
+        pages_json_path = uploads / f"{source_id}_pages.json"
+        write_json(pages_json_path, [{"page": i + 1, "text": t} for i, t in enumerate(result.pages)])
+        meta.update(
+            pages_json=str(pages_json_path),
+            extraction_notes="PDF bulk ingest.",
+            terms_licence_note="Bruger-upload. Tjek rettigheder/fortrolighed.",
+        )
+    else:
+        normalized_text = normalize_docx_blocks(result.blocks)
+        blocks_json_path = uploads / f"{source_id}_blocks.json"
+        write_json(blocks_json_path, result.blocks)
+        meta.update(
+            blocks_json=str(blocks_json_path),
+            extraction_notes="DOCX bulk ingest.",
+            terms_licence_note="Local upload.",
+        )
+    normalized_path = uploads / f"{source_id}.txt"
+    write_text(normalized_path, normalized_text)
+
+    add_library_source(
+        settings.db_path,
+        source_id=source_id,
+        kind=result.kind,
+        url=None,
+        title=path.name,
+        raw_path=raw_path,
+        normalized_path=normalized_path,
+        raw_sha256=result.raw_sha256,
+        normalized_sha256=sha256_text(normalized_text),
+        meta=meta,
+    )
+    return source_id
+
+
+def _allowed_url_prefixes(settings: Settings) -> config_store.UrlPrefixTrie:
+    try:
+        return config_store.config_registry.snapshot(settings.allowlist_path).url_prefixes
+    except FileNotFoundError:
+        return config_store.UrlPrefixTrie(())
+
+
+class _JobProgress:
+    """Counts outcomes and streams one event per item to the job's log."""
+
+    def __init__(self, settings: Settings, job: IngestJob, emitter: EventEmitter) -> None:
+        self.settings = settings
+        self.job = job
+        self.emitter = emitter
+
+    def record(self, item: IngestItem, outcome: str, *, source_id: str | None = None, error: str | None = None) -> None:
+        job = self.job
+        job.processed += 1
+        if outcome == "added":
+            job.added += 1
+        elif outcome == "duplicate":
+            job.duplicates += 1
+        else:
+            job.failed += 1
+        self.emitter.emit(
+            EventType.PROGRESS,
+            {
+                "item": item.name,
+                "outcome": outcome,
+                "source_id": source_id,
+                "error": error,
+                "processed": job.processed,
+                "total": job.total,
+            },
+        )
+
+    def flush(self) -> None:
+        update_ingest_job_progress(self.settings.db_path, self.job)
+
+
+def _ingest_files(
+    settings: Settings,
+    files: list[tuple[IngestItem, Path]],
+    known: dict[str, str],
+    progress: _JobProgress,
+    extraction: ExtractionService,
+) -> None:
+    # Batches keep the pool busy while still streaming progress
+    batch_size = max(8, settings.extraction_max_workers * 4)
+    for start in range(0, len(files), batch_size):
+        to_extract: list[tuple[IngestItem, Path, str]] = []
+        repeats: list[tuple[IngestItem, str]] = []
+        batch_shas: set[str] = set()
+        for item, path in files[start : start + batch_size]:
+            try:
+                sha = sha256_file(path)
+            except OSError as e:
+                progress.record(item, "failed", error=str(e))
+                continue
+            if sha in known:
+                progress.record(item, "duplicate", source_id=known[sha])
+            elif sha in batch_shas:
+                repeats.append((item, sha))
+            else:
+                batch_shas.add(sha)
+                to_extract.append((item, path, sha))
+
+        results = extraction.extract_many(
+            [path for _, path, _ in to_extract],
+            [sha for _, _, sha in to_extract],
+        )
+        for (item, path, sha), result in zip(to_extract, results, strict=True):
+            if result.error:
+                progress.record(item, "failed", error=result.error)
+                continue
+            try:
+                source_id = _store_file_source(settings, progress.job.job_id, path, result)
+            except (OSError, sqlite3.Error) as e:
+                progress.record(item, "failed", error=str(e))
+                continue
+            known[sha] = source_id
+            progress.record(item, "added", source_id=source_id)
+
+        for item, sha in repeats:
+            if sha in known:
+                progress.record(item, "duplicate", source_id=known[sha])
+            else:
+                progress.record(item, "failed", error="Identical file in this job failed to ingest")
+        progress.flush()
+
+
+def _ingest_urls(
+    settings: Settings, urls: list[tuple[IngestItem, str]], known: dict[str, str], progress: _JobProgress
+) -> None:
+    from procedurewriter.pipeline.fetcher import CachedHttpClient
+
+    prefixes = _allowed_url_prefixes(settings)
+    http = CachedHttpClient(cache_dir=settings.cache_dir)
+    try:
+        for item, url in urls:
+            if not prefixes.matches(url):
+                progress.record(item, "failed", error="URL not allowed by allowlist")
+                continue
+            try:
+                resp = http.get(url)
+            except Exception as e:  # noqa: BLE001 - report per URL
+                progress.record(item, "failed", error=str(e))
+                continue
+            sha = sha256_bytes(resp.content)
+            if sha in known:
+                progress.record(item, "duplicate", source_id=known[sha])
+                continue
+
+            source_id = f"LIB_{uuid.uuid4().hex}"
+            raw_path = settings.uploads_dir / f"{source_id}.html"
+            write_bytes(raw_path, resp.content)
+            normalized_text = normalize_html(resp.content)
+            normalized_path = settings.uploads_dir / f"{source_id}.txt"
+            write_text(normalized_path, normalized_text)
+            add_library_source(
+                settings.db_path,
+                source_id=source_id,
+                kind="url",
+                url=url,
+                title=None,
+                raw_path=raw_path,
+                normalized_path=normalized_path,
+                raw_sha256=sha,
+                normalized_sha256=sha256_text(normalized_text),
+                meta={
+                    "final_url": resp.url,
+                    "fetched_at_utc": resp.fetched_at_utc,
+                    "cache_path": resp.cache_path,
+                    "ingest_job_id": progress.job.job_id,
+                    "extraction_notes": "URL bulk ingest.",
+                    "terms_licence_note": "Respektér source terms/licence. Ingen paywall scraping.",
+                },
+            )
+            known[sha] = source_id
+            progress.record(item, "added", source_id=source_id)
+            progress.flush()
+    finally:
+        http.close()
+
+
+def run_ingest_job(
+    settings: Settings,
+    job: IngestJob,
+    *,
+    extraction: ExtractionService | None = None,
+) -> IngestJob:
+    """Execute a claimed job to completion, streaming progress to its event log.
+
+    Per-file failures are counted and reported but do not fail the job; the
+    job fails only if its input cannot be read.
+
+    Args:
+        settings: Application settings (database, uploads, allowlist)
+        job: The job to run
+        extraction: Extraction service (default: the shared service)
+
+    Returns:
+        The job with final counters and status
+    """
+    job_dir = Path(job.job_dir)
+    emitter = EventEmitter(log=EventLog(job_dir / EVENT_LOG_FILENAME))
+    # A requeued job starts over; sources added by the earlier attempt are
+    # found again as duplicates
+    job.processed = job.added = job.duplicates = job.failed = 0
+    progress = _JobProgress(settings, job, emitter)
+    try:
+        items = collect_ingest_items(
+            Path(job.input_path),
+            job_dir,
+            max_archive_bytes=settings.bulk_ingest_max_archive_mb * 1024 * 1024,
+        )
+        job.total = len(items)
+        progress.flush()
+        emitter.emit(EventType.PROGRESS, {"message": f"Found {job.total} items", "total": job.total})
+
+        known = library_sources_by_sha256(settings.db_path)
+        _ingest_files(
+            settings,
+            [(i, i.path) for i in items if i.path is not None],
+            known,
+            progress,
+            extraction or get_extraction_service(),
+        )
+        _ingest_urls(settings, [(i, i.url) for i in items if i.url is not None], known, progress)
+    except Exception as e:  # noqa: BLE001 - recorded on the job
+        logger.exception("Ingest job %s failed", job.job_id)
+        progress.flush()
+        # Log before the status change so event streams see the final event
+        emitter.emit(EventType.ERROR, {"stage": "ingest", "error": str(e)})
+        finish_ingest_job(settings.db_path, job.job_id, status=STATUS_FAILED, error=str(e))
+        job.status, job.error = STATUS_FAILED, str(e)
+        return job
+
+    progress.flush()
+    emitter.emit(
+        EventType.COMPLETE,
+        {
+            "success": True,
+            "total": job.total,
+            "added": job.added,
+            "duplicates": job.duplicates,
+            "failed": job.failed,
+        },
+    )
+    finish_ingest_job(settings.db_path, job.job_id, status=STATUS_DONE)
+    job.status = STATUS_DONE
+    return job
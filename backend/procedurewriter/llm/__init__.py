@@ -32,8 +32,14 @@ from procedurewriter.llm.cost_tracker import (
     CostEntry,
     CostSummary,
     CostTracker,
+    LLMCallRecord,
+    RunCostLedger,
+    get_run_ledger,
     get_session_tracker,
+    record_llm_call,
     reset_session_tracker,
+    run_cost_scope,
+    set_cost_stage,
 )
 from procedurewriter.llm.providers import (
     DEFAULT_MODELS,
@@ -45,6 +51,8 @@ from procedurewriter.llm.providers import (
     OpenAIProvider,
     get_default_model,
     get_llm_client,
+    get_llm_client_override,
+    llm_client_override,
 )
 
 __all__ = [
@@ -56,6 +64,8 @@ __all__ = [
     "AnthropicProvider",
     "OllamaProvider",
     "get_llm_client",
+    "get_llm_client_override",
+    "llm_client_override",
     "get_default_model",
     "DEFAULT_MODELS",
     # Caching
@@ -66,6 +76,12 @@ __all__ = [
     "CostEntry",
     "CostSummary",
     "CostTracker",
+    "LLMCallRecord",
+    "RunCostLedger",
+    "get_run_ledger",
     "get_session_tracker",
+    "record_llm_call",
     "reset_session_tracker",
+    "run_cost_scope",
+    "set_cost_stage",
 ]
@@ -19,6 +19,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from procedurewriter.metrics import record_cache_lookup
+
 logger = logging.getLogger(__name__)
 
 
@@ -146,6 +148,7 @@ class LLMCache:
 
             if row is None:
                 self._stats.misses += 1
+                record_cache_lookup("llm", hit=False)
                 return None
 
             # R7-002: Update last_accessed for LRU tracking
@@ -156,6 +159,7 @@ class LLMCache:
             conn.commit()
 
         self._stats.hits += 1
+        record_cache_lookup("llm", hit=True)
         return json.loads(row[0])
 
     def set(self, key: str, response: dict[str, Any]) -> None:
@@ -2,17 +2,32 @@
 Cost Tracker - Tracks LLM usage and costs across operations.
 
 Provides session-level and persistent cost tracking for LLM API calls.
+
+Pipeline runs use run_cost_scope(), which binds a tracker and a
+RunCostLedger to the current context. Concurrent runs (one per worker
+thread) therefore never share totals, and every call is flushed in
+batches to the llm_calls table for per-agent/per-stage rollups.
 """
 
 from __future__ import annotations
 
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from procedurewriter.db import LLMCallRow
     from procedurewriter.llm.providers import LLMResponse
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class CostEntry:
@@ -48,6 +63,9 @@ class CostSummary:
         self.total_tokens += entry.total_tokens
         self.total_cost_usd += entry.cost_usd
         self.call_count += 1
+        # Run-scoped trackers keep totals only; calls are persisted by the ledger
+        if self.max_entries <= 0:
+            return
         self.entries.append(entry)
 
         # R7-012: Rotate oldest entries if over limit
@@ -55,7 +73,7 @@ class CostSummary:
             # Keep only the most recent entries
             self.entries = self.entries[-self.max_entries:]
 
-    def to_dict(self) -> dict:
+    def to_dict(self) -> dict[str, Any]:
         """Convert summary to dictionary."""
         return {
             "total_input_tokens": self.total_input_tokens,
@@ -81,8 +99,9 @@ class CostTracker:
         print(f"Total cost: ${summary.total_cost_usd:.4f}")
     """
 
-    def __init__(self):
-        self._summary = CostSummary()
+    def __init__(self, max_entries: int = 10000):
+        self._max_entries = max_entries
+        self._summary = CostSummary(max_entries=max_entries)
 
     def track(self, response: LLMResponse, operation: str = "unknown") -> CostEntry:
         """
@@ -105,6 +124,9 @@ class CostTracker:
             operation=operation,
         )
         self._summary.add_entry(entry)
+        ledger = _run_ledger.get()
+        if ledger is not None and _run_tracker.get() is self:
+            ledger.record(response, operation=operation)
         return entry
 
     def get_summary(self) -> CostSummary:
@@ -114,7 +136,7 @@ class CostTracker:
     def reset(self) -> CostSummary:
         """Reset tracker and return final summary."""
         final = self._summary
-        self._summary = CostSummary()
+        self._summary = CostSummary(max_entries=self._max_entries)
         return final
 
     @property
@@ -133,12 +155,225 @@ class CostTracker:
         return self._summary.call_count
 
 
+@dataclass(frozen=True)
+class LLMCallRecord:
+    """Compact per-call record persisted to the llm_calls table."""
+    timestamp: str
+    model: str
+    operation: str
+    agent: str | None
+    stage: str | None
+    input_tokens: int
+    output_tokens: int
+    cost_usd: float
+
+    def to_db_row(self) -> LLMCallRow:
+        """Return values in llm_calls column order (after run_id)."""
+        return (
+            self.timestamp,
+            self.model,
+            self.operation,
+            self.agent,
+            self.stage,
+            self.input_tokens,
+            self.output_tokens,
+            self.cost_usd,
+        )
+
+
+@dataclass
+class CostRollup:
+    """Running totals for a group of LLM calls."""
+    call_count: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: float = 0.0
+
+    def add(self, record: LLMCallRecord) -> None:
+        self.call_count += 1
+        self.input_tokens += record.input_tokens
+        self.output_tokens += record.output_tokens
+        self.cost_usd += record.cost_usd
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "call_count": self.call_count,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cost_usd": round(self.cost_usd, 6),
+        }
+
+
+class RunCostLedger:
+    """
+    Per-run LLM call ledger with O(1) running totals.
+
+    Every recorded call updates the run, agent and stage totals in place
+    and is buffered as an LLMCallRecord. Buffered records are written to
+    the llm_calls table every ``flush_every`` calls and on flush().
+
+    Thread-safe: agents may call the LLM from worker threads that inherit
+    the run's context (e.g. asyncio.to_thread).
+    """
+
+    def __init__(self, run_id: str, db_path: Path | None = None, flush_every: int = 50):
+        self.run_id = run_id
+        self.db_path = db_path
+        self.flush_every = max(1, flush_every)
+        self.stage: str | None = None
+        self._totals = CostRollup()
+        self._by_agent: dict[str, CostRollup] = {}
+        self._by_stage: dict[str, CostRollup] = {}
+        self._pending: list[LLMCallRecord] = []
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        response: LLMResponse,
+        operation: str = "unknown",
+        agent: str | None = None,
+    ) -> LLMCallRecord:
+        """
+        Record one LLM call.
+
+        Args:
+            response: LLM response with usage info
+            operation: Description of the operation
+            agent: Name of the agent that made the call, if any
+
+        Returns:
+            The compact record that will be persisted
+        """
+        record = LLMCallRecord(
+            timestamp=datetime.now(UTC).replace(microsecond=0).isoformat(),
+            model=response.model,
+            operation=operation,
+            agent=agent,
+            stage=self.stage,
+            input_tokens=response.input_tokens,
+            output_tokens=response.output_tokens,
+            cost_usd=response.cost_usd,
+        )
+        with self._lock:
+            self._totals.add(record)
+            if agent is not None:
+                self._by_agent.setdefault(agent, CostRollup()).add(record)
+            if record.stage is not None:
+                self._by_stage.setdefault(record.stage, CostRollup()).add(record)
+            self._pending.append(record)
+            should_flush = len(self._pending) >= self.flush_every
+        if should_flush:
+            self.flush()
+        return record
+
+    @property
+    def totals(self) -> CostRollup:
+        """Running totals for every call recorded in this run."""
+        return self._totals
+
+    def rollup(self) -> dict[str, Any]:
+        """Return run, per-agent and per-stage totals."""
+        with self._lock:
+            return {
+                "run_id": self.run_id,
+                "totals": self._totals.to_dict(),
+                "by_agent": {k: v.to_dict() for k, v in self._by_agent.items()},
+                "by_stage": {k: v.to_dict() for k, v in self._by_stage.items()},
+            }
+
+    def flush(self) -> int:
+        """
+        Persist buffered records to the llm_calls table.
+
+        Returns:
+            Number of records written (0 without a database)
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if not pending or self.db_path is None:
+            return 0
+
+        from procedurewriter.db import insert_llm_calls
+
+        try:
+            insert_llm_calls(self.db_path, self.run_id, [r.to_db_row() for r in pending])
+        except sqlite3.Error as e:
+            # Cost telemetry must never fail a run; totals remain in memory
+            logger.warning("Failed to persist %d LLM call records: %s", len(pending), e)
+            return 0
+        return len(pending)
+
+
+# Run-scoped tracker/ledger bound by run_cost_scope(); None outside a run
+_run_tracker: ContextVar[CostTracker | None] = ContextVar("run_cost_tracker", default=None)
+_run_ledger: ContextVar[RunCostLedger | None] = ContextVar("run_cost_ledger", default=None)
+
+
+@contextmanager
+def run_cost_scope(
+    run_id: str,
+    db_path: Path | None = None,
+    flush_every: int = 50,
+) -> Iterator[RunCostLedger]:
+    """
+    Bind a fresh cost tracker and ledger to the current context.
+
+    Inside the scope get_session_tracker() returns the run's own tracker,
+    so concurrent runs cannot reset or pollute each other's totals.
+    Buffered call records are flushed when the scope exits.
+
+    Args:
+        run_id: Run the costs belong to
+        db_path: Database for llm_calls records (None keeps totals in memory)
+        flush_every: Number of calls buffered between database writes
+
+    Yields:
+        The run's RunCostLedger
+    """
+    ledger = RunCostLedger(run_id, db_path=db_path, flush_every=flush_every)
+    tracker_token = _run_tracker.set(CostTracker(max_entries=0))
+    ledger_token = _run_ledger.set(ledger)
+    try:
+        yield ledger
+    finally:
+        ledger.flush()
+        _run_ledger.reset(ledger_token)
+        _run_tracker.reset(tracker_token)
+
+
+def get_run_ledger() -> RunCostLedger | None:
+    """Get the ledger of the current run scope, if any."""
+    return _run_ledger.get()
+
+
+def set_cost_stage(stage: str | None) -> None:
+    """Attribute subsequent LLM calls in the current run to ``stage``."""
+    ledger = _run_ledger.get()
+    if ledger is not None:
+        ledger.stage = stage
+
+
+def record_llm_call(
+    response: LLMResponse,
+    operation: str = "unknown",
+    agent: str | None = None,
+) -> LLMCallRecord | None:
+    """Record an LLM call in the current run's ledger (no-op outside a run)."""
+    ledger = _run_ledger.get()
+    if ledger is None:
+        return None
+    return ledger.record(response, operation=operation, agent=agent)
+
+
 # Global tracker for session-level costs
 _session_tracker: CostTracker | None = None
 
 
 def get_session_tracker() -> CostTracker:
-    """Get or create the global session tracker."""
+    """Get the current run's tracker, or the global session tracker."""
+    run_tracker = _run_tracker.get()
+    if run_tracker is not None:
+        return run_tracker
     global _session_tracker
     if _session_tracker is None:
         _session_tracker = CostTracker()
@@ -146,7 +381,13 @@ def get_session_tracker() -> CostTracker:
 
 
 def reset_session_tracker() -> CostSummary:
-    """Reset the global session tracker and return final summary."""
+    """Reset the session tracker and return final summary.
+
+    Inside run_cost_scope() only the run's own tracker is reset.
+    """
+    run_tracker = _run_tracker.get()
+    if run_tracker is not None:
+        return run_tracker.reset()
     global _session_tracker
     if _session_tracker is None:
         return CostSummary()
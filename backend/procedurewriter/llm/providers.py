@@ -18,7 +18,11 @@ Usage:
 
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -32,6 +36,22 @@ class LLMProviderType(str, Enum):
     OLLAMA = "ollama"
 
 
+def provider_api_errors(*extra: type[BaseException]) -> tuple[type[BaseException], ...]:
+    """
+    APIError classes of the provider SDKs imported so far, plus ``extra``.
+
+    For ``except provider_api_errors(OSError, ...)`` clauses: an SDK that was
+    never imported cannot have raised, so this avoids importing the OpenAI
+    and Anthropic SDKs (seconds of startup) just to name their exceptions.
+    """
+    errors: list[type[BaseException]] = []
+    for module_name in ("openai", "anthropic"):
+        error = getattr(sys.modules.get(module_name), "APIError", None)
+        if isinstance(error, type) and issubclass(error, Exception):
+            errors.append(error)
+    return (*errors, *extra)
+
+
 @dataclass
 class LLMResponse:
     """Unified response from any LLM provider."""
@@ -326,6 +346,36 @@ class OllamaProvider(LLMProvider):
         return LLMProviderType.OLLAMA
 
 
+# Client returned by get_llm_client() in the current context, if bound
+_client_override: ContextVar[LLMProvider | None] = ContextVar("llm_client_override", default=None)
+
+
+def get_llm_client_override() -> LLMProvider | None:
+    """Get the client bound by llm_client_override() in this context, if any."""
+    return _client_override.get()
+
+
+@contextmanager
+def llm_client_override(client: LLMProvider) -> Generator[LLMProvider, None, None]:
+    """
+    Make get_llm_client() return ``client`` within this context.
+
+    Used to replay recorded responses offline (benchmarks) through code
+    paths that construct their own client, such as the section writer.
+
+    Args:
+        client: Provider to hand out instead of a configured one
+
+    Yields:
+        The bound client
+    """
+    token = _client_override.set(client)
+    try:
+        yield client
+    finally:
+        _client_override.reset(token)
+
+
 def get_llm_client(
     provider: LLMProviderType | str | None = None,
     *,
@@ -356,6 +406,10 @@ def get_llm_client(
     """
     import os
 
+    override = _client_override.get()
+    if override is not None:
+        return override
+
     # Get from env if not provided
     if provider is None:
         provider = os.environ.get("PROCEDUREWRITER_LLM_PROVIDER", "openai")
@@ -15,16 +15,15 @@ from typing import Any
 from fastapi import FastAPI, Form, HTTPException, Request, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.concurrency import run_in_threadpool
-from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
-from slowapi import Limiter
 from slowapi.errors import RateLimitExceeded
-from slowapi.util import get_remote_address
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from procedurewriter import config_store
 from procedurewriter.db import (
     add_library_source,
+    count_queued_runs,
     create_run,
     delete_secret,
     get_run,
@@ -40,13 +39,18 @@ from procedurewriter.db import (
     set_secret,
 )
 from procedurewriter.file_utils import UnsafePathError, safe_path_within
+from procedurewriter.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, QUEUE_DEPTH, render_metrics
 from procedurewriter.ncbi_status import check_ncbi_status
 from procedurewriter.pipeline.events import get_emitter_if_exists
 from procedurewriter.pipeline.hashing import sha256_bytes, sha256_text
 from procedurewriter.pipeline.io import write_bytes, write_json, write_text
-from procedurewriter.pipeline.normalize import (
+from procedurewriter.pipeline.docx_render import shutdown_docx_render_service
+from procedurewriter.pipeline.extraction import (
     extract_docx_blocks,
     extract_pdf_pages,
+    shutdown_extraction_service,
+)
+from procedurewriter.pipeline.normalize import (
     normalize_docx_blocks,
     normalize_html,
     normalize_pdf_pages,
@@ -70,6 +74,7 @@ from procedurewriter.protocols import (
     validate_run_against_protocol,
     validate_run_against_protocol_llm,
 )
+from procedurewriter.rate_limit import limiter
 from procedurewriter.run_bundle import build_run_bundle_zip, read_run_manifest
 from procedurewriter.schemas import (
     ApiKeyInfo,
@@ -92,9 +97,6 @@ from procedurewriter.worker import run_worker
 
 logger = logging.getLogger(__name__)
 
-# R5-001: Rate limiting setup
-limiter = Limiter(key_func=get_remote_address)
-
 # R5-002: Request timeout (seconds)
 REQUEST_TIMEOUT_SECONDS = 300  # 5 minutes for LLM operations
 
@@ -128,6 +130,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         settings.runs_dir.mkdir(parents=True, exist_ok=True)
         settings.cache_dir.mkdir(parents=True, exist_ok=True)
         settings.uploads_dir.mkdir(parents=True, exist_ok=True)
+        settings.ingest_jobs_dir.mkdir(parents=True, exist_ok=True)
         (settings.resolved_data_dir / "index").mkdir(parents=True, exist_ok=True)
         init_db(settings.db_path)
         # Fail fast if encryption key is missing
@@ -166,6 +169,8 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
             with contextlib.suppress(asyncio.CancelledError):
                 await task
             logger.info("Worker task cancelled")
+        await run_in_threadpool(shutdown_extraction_service)
+        await run_in_threadpool(shutdown_docx_render_service)
         logger.info("Shutdown complete")
     except Exception as e:
         logger.error(f"Error during shutdown: {e}", exc_info=True)
@@ -213,6 +218,8 @@ app.add_middleware(TimeoutMiddleware)
 from procedurewriter.api.meta_analysis import router as meta_analysis_router
 from procedurewriter.routers import config as config_router
 from procedurewriter.routers import keys as keys_router
+from procedurewriter.routers import library_ingest as library_ingest_router
+from procedurewriter.routers import query_plans as query_plans_router
 from procedurewriter.routers import runs as runs_router
 from procedurewriter.routers import styles as styles_router
 from procedurewriter.routers import templates as templates_router
@@ -225,6 +232,8 @@ from procedurewriter.routers.keys import (
 app.include_router(meta_analysis_router)
 app.include_router(config_router.router)
 app.include_router(keys_router.router)
+app.include_router(library_ingest_router.router)
+app.include_router(query_plans_router.router)
 app.include_router(runs_router.router)
 app.include_router(styles_router.router)
 app.include_router(templates_router.router)
@@ -259,6 +268,20 @@ def health_check(request: Request) -> dict:
     return {"status": "healthy", "db": "ok"}
 
 
+@app.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    """Prometheus scrape endpoint (stage, LLM, HTTP, cache and queue telemetry).
+
+    Includes the metrics of standalone worker processes, which they export
+    as snapshots to the metrics directory.
+    """
+    # Keep exporting in-process metrics even if the DB is unavailable
+    with contextlib.suppress(sqlite3.Error):
+        QUEUE_DEPTH.set(count_queued_runs(settings.db_path))
+    content = render_metrics(settings.metrics_dir, max_age_s=settings.metrics_snapshot_max_age_s)
+    return Response(content=content, media_type=METRICS_CONTENT_TYPE)
+
+
 # Startup/shutdown now handled by lifespan context manager (R5-014, R5-015)
 
 
@@ -380,8 +403,10 @@ async def api_ingest_pdf(request: Request, file: UploadFile) -> IngestResponse:
     source_id = f"LIB_{uuid.uuid4().hex}"
     raw_path = settings.uploads_dir / f"{source_id}.pdf"
     write_bytes(raw_path, raw_bytes)
+    raw_sha256 = sha256_bytes(raw_bytes)
 
-    pages = await run_in_threadpool(extract_pdf_pages, raw_path)
+    # Re-uploads of the same file are served from the extraction cache
+    pages = await run_in_threadpool(extract_pdf_pages, raw_path, raw_sha256=raw_sha256)
     normalized_text = await run_in_threadpool(normalize_pdf_pages, pages)
     normalized_path = settings.uploads_dir / f"{source_id}.txt"
     write_text(normalized_path, normalized_text)
@@ -397,7 +422,7 @@ async def api_ingest_pdf(request: Request, file: UploadFile) -> IngestResponse:
         title=file.filename,
         raw_path=raw_path,
         normalized_path=normalized_path,
-        raw_sha256=sha256_bytes(raw_bytes),
+        raw_sha256=raw_sha256,
         normalized_sha256=sha256_text(normalized_text),
         meta={
             "filename": file.filename,
@@ -433,8 +458,9 @@ async def api_ingest_docx(request: Request, file: UploadFile) -> IngestResponse:
     source_id = f"LIB_{uuid.uuid4().hex}"
     raw_path = settings.uploads_dir / f"{source_id}.docx"
     write_bytes(raw_path, raw_bytes)
+    raw_sha256 = sha256_bytes(raw_bytes)
 
-    blocks = await run_in_threadpool(extract_docx_blocks, raw_path)
+    blocks = await run_in_threadpool(extract_docx_blocks, raw_path, raw_sha256=raw_sha256)
     normalized_text = await run_in_threadpool(normalize_docx_blocks, blocks)
     normalized_path = settings.uploads_dir / f"{source_id}.txt"
     write_text(normalized_path, normalized_text)
@@ -450,7 +476,7 @@ async def api_ingest_docx(request: Request, file: UploadFile) -> IngestResponse:
         title=file.filename,
         raw_path=raw_path,
         normalized_path=normalized_path,
-        raw_sha256=sha256_bytes(raw_bytes),
+        raw_sha256=raw_sha256,
         normalized_sha256=sha256_text(normalized_text),
         meta={
             "filename": file.filename,
@@ -475,9 +501,7 @@ def _fetch_url_sync(url: str, cache_dir: Path) -> Any:
 @app.post("/api/ingest/url", response_model=IngestResponse)
 @limiter.limit("5/minute")
 async def api_ingest_url(request: Request, req: IngestUrlRequest) -> IngestResponse:
-    allowlist = config_store.load_yaml(settings.allowlist_path)
-    prefixes = allowlist.get("allowed_url_prefixes", []) if isinstance(allowlist, dict) else []
-    if not any(req.url.startswith(str(p)) for p in prefixes):
+    if not config_store.config_registry.snapshot(settings.allowlist_path).url_prefixes.matches(req.url):
         raise HTTPException(status_code=400, detail="URL not allowed by allowlist")
 
     source_id = f"LIB_{uuid.uuid4().hex}"
@@ -0,0 +1,361 @@
+"""Process-wide telemetry exported in the Prometheus text format.
+
+A small, dependency-free metrics registry (counters, gauges, histograms)
+rendered by the ``/metrics`` endpoint. Unlike ``pipeline.profiler`` it is
+always on and thread-safe, so concurrent worker jobs can record into the
+same series.
+
+Instrumented:
+- pipeline stage durations (run_pipeline phases, PipelineOrchestrator)
+- LLM call latency and tokens per provider/model/agent
+- HTTP fetch latency per host (CachedHttpClient)
+- LLM and HTTP cache lookups (hit/miss)
+- queue depth and claim latency (worker / db.claim_next_run)
+
+A standalone worker process has its own registry. It periodically writes a
+snapshot of it to the metrics directory (write_metrics_snapshot), and the
+API's ``/metrics`` adds the snapshots of live workers to its own values.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import threading
+import time
+from collections.abc import Generator, Iterable, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; covers sub-millisecond cache reads up to multi-minute LLM stages
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0,
+)
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape_label_value(v)}"' for n, v in zip(names, values, strict=True)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, object]) -> tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {list(self.labelnames)}, got {sorted(labels)}"
+            )
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def _header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    def state(self) -> list[Any]:
+        """JSON-serializable values, for snapshots of this process's registry."""
+        raise NotImplementedError
+
+    def render(self, others: Sequence[list[Any]] = ()) -> list[str]:
+        """Render the values, adding those of other processes' snapshots."""
+        raise NotImplementedError
+
+
+class _ValueMetric(_Metric):
+    """One value per label set; other processes' values are added."""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def value(self, **labels: object) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def state(self) -> list[Any]:
+        with self._lock:
+            return [[list(key), value] for key, value in self._values.items()]
+
+    def render(self, others: Sequence[list[Any]] = ()) -> list[str]:
+        with self._lock:
+            values = dict(self._values)
+        for other in others:
+            for key, value in other:
+                k = tuple(key)
+                values[k] = values.get(k, 0.0) + float(value)
+        lines = self._header()
+        for key, value in sorted(values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Counter(_ValueMetric):
+    """Monotonically increasing value per label set."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(_ValueMetric):
+    """Point-in-time value per label set (summed across processes)."""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+
+class Histogram(_Metric):
+    """Cumulative bucketed distribution with sum and count."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [bucket counts..., +Inf count], sum
+        self._counts: dict[tuple[str, ...], list[int]] = {}
+        self._sums: dict[tuple[str, ...], float] = {}
+
+    def observe(self, value: float, **labels: object) -> None:
+        key = self._key(labels)
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+            counts[index] += 1
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    @contextmanager
+    def time(self, **labels: object) -> Generator[None, None, None]:
+        """Observe the wall-clock duration of a block (also on error)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: object) -> int:
+        return sum(self._counts.get(self._key(labels), ()))
+
+    def sum(self, **labels: object) -> float:
+        return self._sums.get(self._key(labels), 0.0)
+
+    def state(self) -> list[Any]:
+        with self._lock:
+            return [[list(key), list(counts), self._sums[key]] for key, counts in self._counts.items()]
+
+    def render(self, others: Sequence[list[Any]] = ()) -> list[str]:
+        with self._lock:
+            merged = {k: (list(v), self._sums[k]) for k, v in self._counts.items()}
+        for other in others:
+            for key, counts, total in other:
+                if len(counts) != len(self.buckets) + 1:
+                    continue  # Snapshot from a process with different buckets
+                k = tuple(key)
+                mine, mine_total = merged.get(k, ([0] * len(counts), 0.0))
+                merged[k] = ([a + int(b) for a, b in zip(mine, counts, strict=True)], mine_total + float(total))
+        lines = self._header()
+        for key, (counts, total) in sorted(merged.items()):
+            cumulative = 0
+            for bound, n in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += n
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}"
+                )
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+_M = TypeVar("_M", bound=_Metric)
+
+
+class MetricsRegistry:
+    """Holds metrics and renders them in registration order."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _M) -> _M:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def snapshot(self) -> dict[str, list[Any]]:
+        """Every metric's values, JSON-serializable."""
+        return {name: metric.state() for name, metric in list(self._metrics.items())}
+
+    def render(self, others: Sequence[dict[str, list[Any]]] = ()) -> str:
+        """Render all metrics, adding the values of other processes' snapshots."""
+        lines: list[str] = []
+        for name, metric in list(self._metrics.items()):
+            lines.extend(metric.render([o[name] for o in others if name in o]))
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+STAGE_DURATION = REGISTRY.register(
+    Histogram(
+        "procedurewriter_stage_duration_seconds",
+        "Pipeline stage execution time.",
+        ("stage", "outcome"),
+    )
+)
+LLM_CALL_DURATION = REGISTRY.register(
+    Histogram(
+        "procedurewriter_llm_call_duration_seconds",
+        "LLM chat completion latency.",
+        ("provider", "model", "agent"),
+    )
+)
+LLM_TOKENS = REGISTRY.register(
+    Counter(
+        "procedurewriter_llm_tokens_total",
+        "LLM tokens consumed.",
+        ("provider", "model", "agent", "direction"),
+    )
+)
+HTTP_FETCH_DURATION = REGISTRY.register(
+    Histogram(
+        "procedurewriter_http_fetch_duration_seconds",
+        "Network fetch latency per host (cache misses only, including retries).",
+        ("host",),
+    )
+)
+CACHE_REQUESTS = REGISTRY.register(
+    Counter(
+        "procedurewriter_cache_requests_total",
+        "Cache lookups by cache and result (hit/miss).",
+        ("cache", "result"),
+    )
+)
+QUEUE_DEPTH = REGISTRY.register(
+    Gauge("procedurewriter_queue_depth", "Runs waiting in the QUEUED state.")
+)
+QUEUE_CLAIM_DURATION = REGISTRY.register(
+    Histogram(
+        "procedurewriter_queue_claim_duration_seconds",
+        "Time spent in db.claim_next_run.",
+        ("outcome",),
+    )
+)
+QUEUE_WAIT = REGISTRY.register(
+    Histogram(
+        "procedurewriter_queue_wait_seconds",
+        "Time from run creation until a worker claimed it.",
+    )
+)
+
+
+def observe_llm_call(
+    *,
+    provider: str,
+    model: str,
+    agent: str,
+    duration_s: float,
+    input_tokens: int,
+    output_tokens: int,
+) -> None:
+    """Record latency and token usage for one LLM call."""
+    LLM_CALL_DURATION.observe(duration_s, provider=provider, model=model, agent=agent)
+    LLM_TOKENS.inc(input_tokens, provider=provider, model=model, agent=agent, direction="input")
+    LLM_TOKENS.inc(output_tokens, provider=provider, model=model, agent=agent, direction="output")
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    """Count a cache hit or miss for ``cache`` ("llm", "http", ...)."""
+    CACHE_REQUESTS.inc(cache=cache, result="hit" if hit else "miss")
+
+
+def write_metrics_snapshot(path: Path) -> None:
+    """Write this process's metric values to ``path`` (atomically)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(json.dumps(REGISTRY.snapshot()), encoding="utf-8")
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def load_metrics_snapshots(directory: Path, *, max_age_s: float) -> list[dict[str, list[Any]]]:
+    """Read other processes' snapshots from ``directory``.
+
+    Snapshots not refreshed within max_age_s belong to processes that are
+    gone; they are deleted rather than reported forever.
+    """
+    snapshots: list[dict[str, list[Any]]] = []
+    now = time.time()
+    for path in sorted(directory.glob("*.json")) if directory.is_dir() else []:
+        try:
+            if now - path.stat().st_mtime > max_age_s:
+                path.unlink(missing_ok=True)
+                continue
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning("Skipping metrics snapshot %s: %s", path.name, e)
+            continue
+        if isinstance(data, dict):
+            snapshots.append(data)
+    return snapshots
+
+
+def render_metrics(snapshot_dir: Path | None = None, *, max_age_s: float = 300.0) -> str:
+    """Render every registered metric in the Prometheus text format.
+
+    Args:
+        snapshot_dir: Directory of other processes' snapshots to add in
+        max_age_s: Snapshots older than this are dropped
+    """
+    others = load_metrics_snapshots(snapshot_dir, max_age_s=max_age_s) if snapshot_dir is not None else []
+    return REGISTRY.render(others)
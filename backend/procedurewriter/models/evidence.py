@@ -10,13 +10,60 @@ ClaimEvidenceLink: Links claims to evidence chunks with binding type and score.
 from __future__ import annotations
 
 import json
+import struct
+from collections.abc import Sequence
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Annotated, Any, Sequence
+from typing import Annotated, Any
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field, model_validator
 
+# Embeddings are stored as little-endian float32 so the on-disk layout does
+# not depend on the host byte order.
+_EMBEDDING_FORMAT = "<{}f"
+_EMBEDDING_ITEM_SIZE = 4
+
+
+def pack_embedding(vector: Sequence[float] | None) -> bytes | None:
+    """Pack an embedding vector into a float32 BLOB.
+
+    Args:
+        vector: Embedding values, or None.
+
+    Returns:
+        Packed bytes, or None for a missing/empty vector.
+    """
+    if not vector:
+        return None
+    return struct.pack(_EMBEDDING_FORMAT.format(len(vector)), *vector)
+
+
+def unpack_embedding(blob: bytes | memoryview) -> list[float]:
+    """Unpack a float32 BLOB produced by pack_embedding().
+
+    Args:
+        blob: Packed embedding bytes.
+
+    Returns:
+        Embedding values as Python floats.
+
+    Raises:
+        ValueError: If the blob length is not a multiple of 4 bytes.
+    """
+    if len(blob) % _EMBEDDING_ITEM_SIZE:
+        raise ValueError(f"Embedding blob length {len(blob)} is not a multiple of 4")
+    return list(struct.unpack(_EMBEDDING_FORMAT.format(len(blob) // _EMBEDDING_ITEM_SIZE), blob))
+
+
+def _decode_embedding(value: str | bytes | memoryview | None) -> list[float] | None:
+    """Decode an embedding column that may hold a BLOB or legacy JSON text."""
+    if not value:
+        return None
+    if isinstance(value, str):
+        return [float(x) for x in json.loads(value)]
+    return unpack_embedding(value)
+
 
 class BindingType(str, Enum):
     """Type of binding between a claim and evidence chunk."""
@@ -88,13 +135,23 @@ class EvidenceChunk(BaseModel):
             return self.end_char - self.start_char
         return None
 
-    def to_db_row(self) -> tuple:
+    def to_db_row(self, *, packed: bool = False) -> tuple:
         """Convert model to database row tuple.
 
+        Args:
+            packed: Store the embedding as a float32 BLOB (for the
+                embedding_vector_blob column) instead of JSON text.
+
         Returns tuple matching evidence_chunks table column order:
         (id, run_id, source_id, text, chunk_index, start_char, end_char,
          embedding_vector_json, metadata_json, created_at_utc)
+        With packed=True the eighth element is embedding_vector_blob.
         """
+        embedding: str | bytes | None
+        if packed:
+            embedding = pack_embedding(self.embedding_vector)
+        else:
+            embedding = json.dumps(self.embedding_vector) if self.embedding_vector else None
         return (
             str(self.id),
             self.run_id,
@@ -103,7 +160,7 @@ class EvidenceChunk(BaseModel):
             self.chunk_index,
             self.start_char,
             self.end_char,
-            json.dumps(self.embedding_vector) if self.embedding_vector else None,
+            embedding,
             json.dumps(self.metadata),
             self.created_at.isoformat(),
         )
@@ -116,6 +173,7 @@ class EvidenceChunk(BaseModel):
             row: Tuple/sequence in same order as to_db_row() output:
                 (id, run_id, source_id, text, chunk_index, start_char, end_char,
                  embedding_vector_json, metadata_json, created_at_utc)
+                The embedding element may be JSON text or a float32 BLOB.
 
         Returns:
             EvidenceChunk instance with all fields populated from DB row.
@@ -128,7 +186,7 @@ class EvidenceChunk(BaseModel):
             chunk_index=row[4],
             start_char=row[5],
             end_char=row[6],
-            embedding_vector=json.loads(row[7]) if row[7] else None,
+            embedding_vector=_decode_embedding(row[7]),
             metadata=json.loads(row[8]) if row[8] else {},
             created_at=datetime.fromisoformat(row[9]),
         )
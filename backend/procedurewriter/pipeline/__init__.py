@@ -1,3 +1,18 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
 __all__ = ["run_pipeline"]
 
-from procedurewriter.pipeline.run import run_pipeline
+if TYPE_CHECKING:
+    from procedurewriter.pipeline.run import run_pipeline
+
+
+def __getattr__(name: str) -> Any:
+    # run.py pulls in every stage, agent and LLM SDK; importing a leaf module
+    # such as pipeline.fetcher must not pay for that
+    if name == "run_pipeline":
+        from procedurewriter.pipeline.run import run_pipeline
+
+        return run_pipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,8 +8,10 @@ depth guidance, and surface anatomy information.
 from __future__ import annotations
 
 import re
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import Pattern
 
 
@@ -29,19 +31,83 @@ class AnatomicalLandmark:
     category: str = "general"  # thorax, spine, vascular, etc.
 
     def matches(self, text: str) -> bool:
-        """Check if this landmark is mentioned in text."""
-        text_lower = text.lower()
+        """Check if this landmark (name or any alias) is mentioned in text."""
+        return bool(landmark_matcher([self]).find(text))
 
-        # Check main name
-        if self.name.lower() in text_lower:
-            return True
 
-        # Check aliases
-        for alias in self.aliases:
-            if alias.lower() in text_lower:
-                return True
+# Character trie: each key is the next character, "" marks the end of a term
+_TrieNode = dict[str, "_TrieNode"]
 
-        return False
+
+def _trie_pattern(terms: Sequence[str]) -> str:
+    """Regex alternation of literal terms, factored into a character trie.
+
+    Each position only tries the branches for the next character, so the cost
+    grows with term length rather than with the number of terms.
+    """
+    trie: _TrieNode = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: _TrieNode) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # Greedy optional: prefer the longer term when a shorter one ends here
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class LandmarkMatcher:
+    """Finds every landmark of a set in one pass over the text.
+
+    Case-insensitive substring semantics, identical to checking each name and
+    alias with ``in`` on the lowercased text.
+    """
+
+    def __init__(self, terms_per_landmark: Sequence[Sequence[str]]) -> None:
+        owners: dict[str, set[int]] = {}
+        self._always: frozenset[int] = frozenset(
+            i for i, terms in enumerate(terms_per_landmark) if any(not t for t in terms)
+        )
+        for i, terms in enumerate(terms_per_landmark):
+            for term in terms:
+                if term:
+                    owners.setdefault(term.lower(), set()).add(i)
+
+        # The lookahead reports the longest term starting at each position, so
+        # credit it with the landmarks of every term that is a prefix of it
+        self._owners: dict[str, frozenset[int]] = {
+            term: frozenset(i for other, idx in owners.items() if term.startswith(other) for i in idx)
+            for term in owners
+        }
+        self._pattern = re.compile(f"(?=({_trie_pattern(list(owners))}))") if owners else None
+
+    def find(self, text: str) -> set[int]:
+        """Return the indices of landmarks mentioned in ``text``."""
+        found = set(self._always)
+        if self._pattern is None:
+            return found
+        for match in self._pattern.finditer(text.lower()):
+            found.update(self._owners[match.group(1)])
+        return found
+
+
+@lru_cache(maxsize=256)
+def _compile_landmark_matcher(terms_per_landmark: tuple[tuple[str, ...], ...]) -> LandmarkMatcher:
+    return LandmarkMatcher(terms_per_landmark)
+
+
+def landmark_matcher(landmarks: Sequence[AnatomicalLandmark]) -> LandmarkMatcher:
+    """Get the (cached) matcher for a list of landmarks."""
+    return _compile_landmark_matcher(
+        tuple((lm.name, *lm.aliases) for lm in landmarks)
+    )
 
 
 @dataclass
@@ -388,8 +454,9 @@ class AnatomicalValidator:
         found_landmarks: list[str] = []
         missing_landmarks: list[str] = []
 
-        for landmark in requirements.landmarks:
-            if landmark.matches(content):
+        found = landmark_matcher(requirements.landmarks).find(content)
+        for i, landmark in enumerate(requirements.landmarks):
+            if i in found:
                 found_landmarks.append(landmark.name)
             else:
                 missing_landmarks.append(landmark.name)
@@ -0,0 +1,325 @@
+"""Versioned checkpoint format for stage outputs.
+
+A checkpoint is a single zip file:
+
+- ``manifest.json``: the format version, stage, creation time, caller
+  metadata, the output's small fields and an index of its tables.
+- ``tables/<field>.jsonl``: one JSON line per item for each top-level list
+  of dataclasses or Pydantic models (sources, chunks, notes, claims), stored
+  deflate-compressed with a sha256 in the manifest.
+
+Tables are decoded only when requested, so inspecting a checkpoint or
+reading one table does not load the rest. Unlike pickle, loading never runs
+arbitrary code: dataclasses and models are rebuilt through their
+constructors, and a format version mismatch is reported instead of
+unpickling stale classes.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import importlib
+import json
+import os
+import zipfile
+from datetime import UTC, date, datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel
+
+CHECKPOINT_FORMAT = "procedurewriter-checkpoint"
+CHECKPOINT_FORMAT_VERSION = 1
+
+_MANIFEST = "manifest.json"
+_TYPE = "$t"
+_IMPORTABLE_PREFIX = "procedurewriter."
+
+
+class CheckpointError(Exception):
+    """Raised when a value cannot be checkpointed or a checkpoint is invalid."""
+
+
+def _class_path(cls: type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _resolve_class(path: str) -> type:
+    """Look up a class named in a checkpoint.
+
+    Only procedurewriter classes resolve, so a checkpoint can never import
+    or name arbitrary code.
+    """
+    module_name, _, qualname = path.partition(":")
+    if not module_name.startswith(_IMPORTABLE_PREFIX):
+        raise CheckpointError(f"Refusing to load checkpoint class {path} outside procedurewriter")
+    try:
+        obj: Any = importlib.import_module(module_name)
+        for part in qualname.split("."):
+            obj = getattr(obj, part)
+    except (ImportError, AttributeError) as e:
+        raise CheckpointError(f"Unknown checkpoint class {path}: {e}") from e
+    if not isinstance(obj, type):
+        raise CheckpointError(f"Checkpoint class {path} is not a class")
+    return obj
+
+
+def _resolve_model(path: str) -> type[BaseModel]:
+    cls = _resolve_class(path)
+    if not issubclass(cls, BaseModel):
+        raise CheckpointError(f"Checkpoint class {path} is not a Pydantic model")
+    return cls
+
+
+def _resolve_dataclass(path: str) -> type:
+    cls = _resolve_class(path)
+    if not dataclasses.is_dataclass(cls):
+        raise CheckpointError(f"Checkpoint class {path} is not a dataclass")
+    return cls
+
+
+def _resolve_enum(path: str) -> type[Enum]:
+    cls = _resolve_class(path)
+    if not issubclass(cls, Enum):
+        raise CheckpointError(f"Checkpoint class {path} is not an enum")
+    return cls
+
+
+def encode_value(value: Any) -> Any:
+    """Encode a value as JSON-compatible data, tagging non-JSON types."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Enum):
+        return {_TYPE: "enum", "c": _class_path(type(value)), "v": encode_value(value.value)}
+    if isinstance(value, list):
+        return [encode_value(v) for v in value]
+    if isinstance(value, tuple):
+        return {_TYPE: "tuple", "v": [encode_value(v) for v in value]}
+    if isinstance(value, (set, frozenset)):
+        return {_TYPE: "set", "v": [encode_value(v) for v in value]}
+    if isinstance(value, dict):
+        if all(isinstance(k, str) for k in value) and _TYPE not in value:
+            return {k: encode_value(v) for k, v in value.items()}
+        return {_TYPE: "dict", "v": [[encode_value(k), encode_value(v)] for k, v in value.items()]}
+    if isinstance(value, Path):
+        return {_TYPE: "path", "v": str(value)}
+    if isinstance(value, UUID):
+        return {_TYPE: "uuid", "v": str(value)}
+    if isinstance(value, datetime):
+        return {_TYPE: "datetime", "v": value.isoformat()}
+    if isinstance(value, date):
+        return {_TYPE: "date", "v": value.isoformat()}
+    if isinstance(value, BaseModel):
+        return {
+            _TYPE: "model",
+            "c": _class_path(type(value)),
+            "v": encode_value(value.model_dump(mode="python")),
+        }
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            _TYPE: "dataclass",
+            "c": _class_path(type(value)),
+            "v": {
+                f.name: encode_value(getattr(value, f.name))
+                for f in dataclasses.fields(value)
+                if f.init
+            },
+        }
+    raise CheckpointError(f"Cannot checkpoint value of type {type(value).__name__}")
+
+
+def decode_value(data: Any) -> Any:
+    """Inverse of encode_value.
+
+    Raises:
+        CheckpointError: If a class named in the data cannot be resolved
+        ValueError: If the data no longer fits its class (e.g. a Pydantic
+            ValidationError after a schema change)
+        TypeError: If a dataclass no longer accepts the stored fields
+    """
+    if isinstance(data, list):
+        return [decode_value(v) for v in data]
+    if not isinstance(data, dict):
+        return data
+    tag = data.get(_TYPE)
+    if tag is None:
+        return {k: decode_value(v) for k, v in data.items()}
+
+    raw: Any = data.get("v")
+    if tag == "tuple":
+        return tuple(decode_value(v) for v in raw)
+    if tag == "set":
+        return {decode_value(v) for v in raw}
+    if tag == "dict":
+        return {decode_value(k): decode_value(v) for k, v in raw}
+    if tag == "path":
+        return Path(raw)
+    if tag == "uuid":
+        return UUID(raw)
+    if tag == "datetime":
+        return datetime.fromisoformat(raw)
+    if tag == "date":
+        return date.fromisoformat(raw)
+    if tag == "enum":
+        return _resolve_enum(data["c"])(decode_value(raw))
+    if tag == "model":
+        return _resolve_model(data["c"]).model_validate(decode_value(raw))
+    if tag == "dataclass":
+        return _resolve_dataclass(data["c"])(**{k: decode_value(v) for k, v in raw.items()})
+    raise CheckpointError(f"Unknown checkpoint value tag {tag!r}")
+
+
+def _is_table(value: Any) -> bool:
+    """Top-level lists of records are stored as separate, lazily read tables."""
+    return (
+        isinstance(value, list)
+        and bool(value)
+        and all(
+            isinstance(v, BaseModel) or (dataclasses.is_dataclass(v) and not isinstance(v, type))
+            for v in value
+        )
+    )
+
+
+def write_checkpoint(
+    path: Path,
+    stage_name: str,
+    output: Any,
+    metadata: dict[str, Any] | None = None,
+) -> None:
+    """Write a stage output as a checkpoint file, atomically.
+
+    Args:
+        path: Destination file
+        stage_name: Stage that produced the output
+        output: A dataclass output (fields may hold models, paths, UUIDs, ...)
+        metadata: Extra JSON-compatible values stored in the manifest
+
+    Raises:
+        CheckpointError: If the output contains values that cannot be encoded
+        OSError: If the file cannot be written
+    """
+    if not dataclasses.is_dataclass(output) or isinstance(output, type):
+        raise CheckpointError(f"Checkpoint output must be a dataclass, got {type(output).__name__}")
+
+    fields: dict[str, Any] = {}
+    tables: dict[str, bytes] = {}
+    for f in dataclasses.fields(output):
+        if not f.init:
+            continue
+        value = getattr(output, f.name)
+        if _is_table(value):
+            lines = (json.dumps(encode_value(v), ensure_ascii=False) for v in value)
+            tables[f.name] = ("\n".join(lines) + "\n").encode("utf-8")
+        else:
+            fields[f.name] = encode_value(value)
+
+    manifest = {
+        "format": CHECKPOINT_FORMAT,
+        "version": CHECKPOINT_FORMAT_VERSION,
+        "stage": stage_name,
+        "created_at": datetime.now(UTC).isoformat(),
+        "metadata": metadata or {},
+        "output_class": _class_path(type(output)),
+        "fields": fields,
+        "tables": {
+            name: {"rows": blob.count(b"\n"), "sha256": hashlib.sha256(blob).hexdigest()}
+            for name, blob in tables.items()
+        },
+    }
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr(_MANIFEST, json.dumps(manifest, ensure_ascii=False))
+            for name, blob in tables.items():
+                zf.writestr(f"tables/{name}.jsonl", blob)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+class Checkpoint:
+    """An opened checkpoint; tables are read and verified on first access."""
+
+    def __init__(self, path: Path) -> None:
+        """Open a checkpoint and validate its manifest.
+
+        Raises:
+            CheckpointError: If the file is not a valid checkpoint of this version
+        """
+        self.path = path
+        try:
+            with zipfile.ZipFile(path) as zf:
+                manifest = json.loads(zf.read(_MANIFEST))
+        except (OSError, zipfile.BadZipFile, KeyError, ValueError) as e:
+            raise CheckpointError(f"Unreadable checkpoint {path.name}: {e}") from e
+
+        if manifest.get("format") != CHECKPOINT_FORMAT:
+            raise CheckpointError(f"{path.name} is not a checkpoint")
+        if manifest.get("version") != CHECKPOINT_FORMAT_VERSION:
+            raise CheckpointError(
+                f"{path.name} has checkpoint format version {manifest.get('version')}, "
+                f"expected {CHECKPOINT_FORMAT_VERSION}"
+            )
+        self._manifest: dict[str, Any] = manifest
+        self._tables: dict[str, list[Any]] = {}
+
+    @property
+    def stage(self) -> str:
+        return str(self._manifest["stage"])
+
+    @property
+    def created_at(self) -> str:
+        return str(self._manifest["created_at"])
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        return dict(self._manifest["metadata"])
+
+    @property
+    def table_rows(self) -> dict[str, int]:
+        """Row count per table, without reading the tables."""
+        return {name: info["rows"] for name, info in self._manifest["tables"].items()}
+
+    def table(self, name: str) -> list[Any]:
+        """Decode one table, verifying its checksum."""
+        if name not in self._tables:
+            info = self._manifest["tables"].get(name)
+            if info is None:
+                raise CheckpointError(f"{self.path.name} has no table {name!r}")
+            try:
+                with zipfile.ZipFile(self.path) as zf:
+                    blob = zf.read(f"tables/{name}.jsonl")
+            except (OSError, zipfile.BadZipFile, KeyError) as e:
+                raise CheckpointError(f"Unreadable table {name} in {self.path.name}: {e}") from e
+            if hashlib.sha256(blob).hexdigest() != info["sha256"]:
+                raise CheckpointError(f"Checksum mismatch for table {name} in {self.path.name}")
+            try:
+                self._tables[name] = [decode_value(json.loads(line)) for line in blob.splitlines()]
+            except (TypeError, ValueError) as e:
+                # ValueError covers malformed JSON, unknown enum values and
+                # Pydantic validation errors after a schema change
+                raise CheckpointError(f"Table {name} in {self.path.name} does not match its classes: {e}") from e
+        return self._tables[name]
+
+    def output(self) -> Any:
+        """Rebuild the full stage output."""
+        try:
+            kwargs = {name: decode_value(value) for name, value in self._manifest["fields"].items()}
+            for name in self._manifest["tables"]:
+                kwargs[name] = self.table(name)
+            return _resolve_dataclass(self._manifest["output_class"])(**kwargs)
+        except KeyError as e:
+            raise CheckpointError(f"Checkpoint {self.path.name} manifest is missing {e}") from e
+        except (TypeError, ValueError) as e:
+            raise CheckpointError(f"Checkpoint {self.path.name} does not match its class: {e}") from e
+
+
+def read_checkpoint(path: Path) -> Checkpoint:
+    """Open a checkpoint file (tables are read lazily)."""
+    return Checkpoint(path)
@@ -16,6 +16,10 @@ import re
 from dataclasses import dataclass, field
 from typing import Any
 
+# Turkish dotted/dotless I match "i" under re.IGNORECASE but do not lower()
+# to a plain "i", so map them before checking pattern literals
+_LITERAL_CASE_TABLE = str.maketrans({"İ": "i", "ı": "i"})
+
 
 @dataclass
 class GeneralizationStats:
@@ -42,14 +46,33 @@ class GeneralizationStats:
 
 @dataclass
 class ReplacementPattern:
-    """A pattern for detecting and replacing department-specific content."""
+    """A pattern for detecting and replacing department-specific content.
+
+    ``literals`` are lowercase substrings of which at least one must occur
+    in the text for the pattern to match; the pattern is skipped otherwise.
+    An empty tuple means the pattern always runs.
+    """
     pattern: str
     replacement: str
     category: str
     flags: int = re.IGNORECASE
+    literals: tuple[str, ...] = ()
+    _compiled: re.Pattern[str] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def compile(self) -> re.Pattern[str]:
+        if self._compiled is None:
+            self._compiled = re.compile(self.pattern, self.flags)
+        return self._compiled
 
-    def compile(self) -> re.Pattern:
-        return re.compile(self.pattern, self.flags)
+    def may_match(self, lowered: str) -> bool:
+        """Cheap check against lowercased text before running the regex."""
+        return not self.literals or any(lit in lowered for lit in self.literals)
+
+
+_HOSPITAL_LITERALS = (
+    "skejby", "odense", "aalborg", "herlev", "rigshospitalet",
+    "bispebjerg", "hvidovre", "gentofte", "hillerød",
+)
 
 
 class ContentGeneralizer:
@@ -70,6 +93,8 @@ class ContentGeneralizer:
         """
         self.use_lokal_markers = use_lokal_markers
         self.patterns = self._build_patterns()
+        for pattern_def in self.patterns:
+            pattern_def.compile()
         self.stats = GeneralizationStats()
 
     def _build_patterns(self) -> list[ReplacementPattern]:
@@ -83,17 +108,20 @@ class ContentGeneralizer:
                 pattern=r'\(?\s*tlf\.?\s*:?\s*\d{4,8}\s*\)?',
                 replacement=f' {lokal}' if lokal else '',
                 category="phone_numbers",
+                literals=("tlf",),
             ),
             ReplacementPattern(
                 pattern=r'\(?\s*telefon\s*:?\s*\d{4,8}\s*\)?',
                 replacement=f' {lokal}' if lokal else '',
                 category="phone_numbers",
+                literals=("telefon",),
             ),
             # Phone number in parentheses at end of sentence
             ReplacementPattern(
                 pattern=r'\s*\(\s*\d{4,8}\s*\)',
                 replacement='',
                 category="phone_numbers",
+                literals=("(",),
             ),
 
             # === ROOM REFERENCES ===
@@ -102,12 +130,14 @@ class ContentGeneralizer:
                 pattern=r'(?:på\s+)?stue\s+\d+',
                 replacement=f'{lokal}' if lokal else 'behandlingsrum',
                 category="room_references",
+                literals=("stue",),
             ),
             # "overfor stue 99" - remove entirely
             ReplacementPattern(
                 pattern=r'\s*\(?overfor\s+stue\s+\d+\)?',
                 replacement='',
                 category="room_references",
+                literals=("overfor",),
             ),
 
             # === LOCATION REFERENCES ===
@@ -116,23 +146,27 @@ class ContentGeneralizer:
                 pattern=r'ved\s+medicinsk\s+base\s*\([^)]*\)',
                 replacement='fra afdelingens udstyrsdepot',
                 category="location_references",
+                literals=("medicinsk",),
             ),
             # "ved medicinsk base"
             ReplacementPattern(
                 pattern=r'ved\s+medicinsk\s+base',
                 replacement='fra afdelingens udstyrsdepot',
                 category="location_references",
+                literals=("medicinsk",),
             ),
             # "pleura-procedurevogn ved medicinsk base"
             ReplacementPattern(
                 pattern=r'pleura-procedurevogn\s+ved\s+medicinsk\s+base\s*\([^)]*\)',
                 replacement='afdelingens pleura-procedurevogn',
                 category="location_references",
+                literals=("pleura-procedurevogn",),
             ),
             ReplacementPattern(
                 pattern=r'pleura-procedurevogn\s+ved\s+medicinsk\s+base',
                 replacement='afdelingens pleura-procedurevogn',
                 category="location_references",
+                literals=("pleura-procedurevogn",),
             ),
 
             # === HOSPITAL/DEPARTMENT REFERENCES ===
@@ -141,18 +175,21 @@ class ContentGeneralizer:
                 pattern=r'\s+i\s+(?:Skejby|Odense|Aalborg|Herlev|Rigshospitalet|Bispebjerg|Hvidovre|Gentofte|Hillerød)',
                 replacement='',
                 category="hospital_references",
+                literals=_HOSPITAL_LITERALS,
             ),
             # "på Herlev Hospital", "på Rigshospitalet"
             ReplacementPattern(
                 pattern=r'på\s+(?:Herlev|Bispebjerg|Hvidovre|Gentofte|Hillerød)\s*(?:Hospital|Sygehus)?',
                 replacement='på relevant afdeling',
                 category="hospital_references",
+                literals=_HOSPITAL_LITERALS,
             ),
             # "HEH", "HGH", "OUH" hospital abbreviations in parentheses
             ReplacementPattern(
                 pattern=r'\s*\(?\s*(?:HEH|HGH|OUH|AUH|RH|BBH|HVH)\s*\)?',
                 replacement='',
                 category="hospital_references",
+                literals=("heh", "hgh", "ouh", "auh", "rh", "bbh", "hvh"),
             ),
 
             # === IT SYSTEM REFERENCES ===
@@ -161,18 +198,21 @@ class ContentGeneralizer:
                 pattern=r'CASE-bestilling',
                 replacement='elektronisk bestilling',
                 category="system_references",
+                literals=("case-bestilling",),
             ),
             # "i EPIC", "via EPIC"
             ReplacementPattern(
                 pattern=r'(?:i|via)\s+EPIC',
                 replacement='i journalsystemet',
                 category="system_references",
+                literals=("epic",),
             ),
             # "i Sundhedsplatformen"
             ReplacementPattern(
                 pattern=r'(?:i|via)\s+Sundhedsplatformen',
                 replacement='i journalsystemet',
                 category="system_references",
+                literals=("sundhedsplatformen",),
             ),
 
             # === ROLE CLARIFICATIONS ===
@@ -192,6 +232,7 @@ class ContentGeneralizer:
                 replacement=' ',
                 category="cleanup",
                 flags=0,
+                literals=("  ",),
             ),
             # Remove space before punctuation
             ReplacementPattern(
@@ -206,6 +247,7 @@ class ContentGeneralizer:
                 replacement='',
                 category="cleanup",
                 flags=0,
+                literals=("(",),
             ),
         ]
 
@@ -223,15 +265,20 @@ class ContentGeneralizer:
         """
         self.stats = GeneralizationStats()
         result = content
+        lowered = result.translate(_LITERAL_CASE_TABLE).lower()
 
         for pattern_def in self.patterns:
-            compiled = pattern_def.compile()
+            # Skip patterns whose required literals are absent
+            if not pattern_def.may_match(lowered):
+                continue
 
-            # Count matches before replacement
-            matches = compiled.findall(result)
-            match_count = len(matches)
+            # Replace and count in a single pass
+            result, match_count = pattern_def.compile().subn(pattern_def.replacement, result)
+            if match_count == 0:
+                continue
+            lowered = result.translate(_LITERAL_CASE_TABLE).lower()
 
-            if match_count > 0 and pattern_def.category != "cleanup":
+            if pattern_def.category != "cleanup":
                 # Update stats by category
                 if pattern_def.category == "phone_numbers":
                     self.stats.phone_numbers += match_count
@@ -248,9 +295,6 @@ class ContentGeneralizer:
 
                 self.stats.total_replacements += match_count
 
-            # Apply replacement
-            result = compiled.sub(pattern_def.replacement, result)
-
         # Final cleanup - remove multiple [LOKAL] in same sentence
         if self.use_lokal_markers:
             result = self._deduplicate_lokal_markers(result)
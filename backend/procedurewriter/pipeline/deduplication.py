@@ -2,13 +2,38 @@
 
 Phase 2: Repetition Elimination
 Detects and removes semantically similar content across sections.
+
+Candidate pairs are generated with a sorted-token prefix filter for Jaccard
+similarity, so large inputs (e.g. all evidence notes of a run) are not
+compared pairwise. The semantic-keyword boost is applied as a post-filter;
+each text's prefix is sized for the largest boost it could receive, which
+keeps the filter exact.
 """
 
 from __future__ import annotations
 
+import math
 import re
 from collections import defaultdict
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Common Danish suffixes (order matters - longest first)
+_STEM_SUFFIXES = (
+    "erne", "ene", "en", "et", "er",  # Definite/plural forms
+    "ede", "te", "es", "s",  # Past tense, genitive
+)
+
+# Keyword categories that boost similarity when both texts contain one
+_CONTACT_KEYWORDS = frozenset({"ring", "kontakt", "tilkald"})
+_PROBLEM_KEYWORDS = frozenset({"komplikation", "problem"})
+_TARGET_KEYWORDS = frozenset({"bagvagt", "forvagt", "anæstesi"})
+
+# Guards ceil() against float noise such as 0.8 * 5 = 4.000000000000001
+_EPSILON = 1e-9
 
 
 @dataclass
@@ -70,40 +95,47 @@ class RepetitionDetector:
         if not texts:
             return []
 
-        # Normalize texts for comparison
+        # Normalize and tokenize each text once
         normalized = [self._normalize(t) for t in texts]
+        tokens = [self._tokenize(n) for n in normalized]
+        candidates = self._candidate_index(normalized, tokens, threshold)
 
         # Track which items have been grouped
         grouped: set[int] = set()
         groups: list[DuplicateGroup] = []
 
-        for i, norm_i in enumerate(normalized):
+        for i in range(len(texts)):
             if i in grouped:
                 continue
 
             # Find all items similar to this one
             similar_indices = [i]
-            similar_texts = [texts[i]]
 
-            for j, norm_j in enumerate(normalized):
+            for j in candidates(i):
                 if j <= i or j in grouped:
                     continue
 
-                similarity = self._calculate_similarity(norm_i, norm_j)
+                similarity = self._similarity_from_tokens(
+                    normalized[i], normalized[j], tokens[i], tokens[j]
+                )
                 if similarity >= threshold:
                     similar_indices.append(j)
-                    similar_texts.append(texts[j])
+
+            similar_texts = [texts[idx] for idx in similar_indices]
 
             # Mark all as grouped
             grouped.update(similar_indices)
 
             # Select canonical version (prefer longer, more specific)
-            canonical = self._select_canonical(similar_texts)
+            canonical = self._select_canonical(
+                similar_texts, [len(tokens[idx]) for idx in similar_indices]
+            )
 
             # Calculate average similarity within group
             if len(similar_texts) > 1:
-                avg_sim = self._calculate_group_similarity(
-                    [normalized[idx] for idx in similar_indices]
+                avg_sim = self._group_similarity_from_tokens(
+                    [normalized[idx] for idx in similar_indices],
+                    [tokens[idx] for idx in similar_indices],
                 )
             else:
                 avg_sim = 1.0
@@ -118,6 +150,69 @@ class RepetitionDetector:
 
         return groups
 
+    def _candidate_index(
+        self,
+        normalized: list[str],
+        tokens: list[set[str]],
+        threshold: float,
+    ) -> Callable[[int], list[int]]:
+        """Build a prefix-filter index and return a candidate lookup.
+
+        Tokens are ordered globally by ascending document frequency. If
+        Jaccard(x, y) >= t, the first ``|x| - ceil(t * |x|) + 1`` tokens of x
+        and the corresponding prefix of y share a token. Each text uses
+        ``t = threshold - max_boost`` so pairs that only qualify thanks to
+        the semantic-keyword boost are still found. Texts whose ``t`` is
+        not positive cannot be pruned and are compared with every text.
+        Identical normalized texts (similarity 1.0 even without tokens)
+        are always candidates for each other.
+
+        Args:
+            normalized: Normalized texts.
+            tokens: Token set per text.
+            threshold: Similarity threshold for grouping.
+
+        Returns:
+            Function mapping a text index to its candidate indices, ascending.
+        """
+        doc_freq: dict[str, int] = defaultdict(int)
+        for token_set in tokens:
+            for token in token_set:
+                doc_freq[token] += 1
+
+        postings: dict[str, list[int]] = defaultdict(list)
+        prefixes: list[list[str]] = []
+        unprunable: list[int] = []
+        by_text: dict[str, list[int]] = defaultdict(list)
+
+        for idx, token_set in enumerate(tokens):
+            by_text[normalized[idx]].append(idx)
+            min_jaccard = threshold - self._max_boost(token_set & self._semantic_keywords)
+            if min_jaccard <= 0:
+                unprunable.append(idx)
+                prefixes.append([])
+                continue
+            ordered = sorted(token_set, key=lambda tok: (doc_freq[tok], tok))
+            prefix_len = len(ordered) - math.ceil(min_jaccard * len(ordered) - _EPSILON) + 1
+            prefix = ordered[: max(prefix_len, 0)]
+            prefixes.append(prefix)
+            for token in prefix:
+                postings[token].append(idx)
+
+        all_indices = list(range(len(tokens)))
+        unprunable_set = set(unprunable)
+
+        def candidates(idx: int) -> list[int]:
+            if idx in unprunable_set:
+                return all_indices
+            found: set[int] = set(unprunable)
+            found.update(by_text[normalized[idx]])
+            for token in prefixes[idx]:
+                found.update(postings[token])
+            return sorted(found)
+
+        return candidates
+
     def deduplicate(
         self, texts: list[str], threshold: float = 0.8
     ) -> list[str]:
@@ -261,12 +356,7 @@ class RepetitionDetector:
 
         Removes common inflectional suffixes to normalize word forms.
         """
-        # Common Danish suffixes (order matters - longest first)
-        suffixes = [
-            "erne", "ene", "en", "et", "er",  # Definite/plural forms
-            "ede", "te", "es", "s",  # Past tense, genitive
-        ]
-        for suffix in suffixes:
+        for suffix in _STEM_SUFFIXES:
             if word.endswith(suffix) and len(word) - len(suffix) >= 3:
                 return word[:-len(suffix)]
         return word
@@ -280,8 +370,21 @@ class RepetitionDetector:
         if text1 == text2:
             return 1.0
 
-        tokens1 = self._tokenize(text1)
-        tokens2 = self._tokenize(text2)
+        return self._similarity_from_tokens(
+            text1, text2, self._tokenize(text1), self._tokenize(text2)
+        )
+
+    def _similarity_from_tokens(
+        self,
+        text1: str,
+        text2: str,
+        tokens1: set[str],
+        tokens2: set[str],
+    ) -> float:
+        """Calculate similarity from pre-tokenized normalized texts."""
+        # Exact match
+        if text1 == text2:
+            return 1.0
 
         if not tokens1 or not tokens2:
             return 0.0
@@ -298,16 +401,12 @@ class RepetitionDetector:
         shared_keywords = keywords1 & keywords2
 
         # Category-based boost (e.g., both about contacting, both about problems)
-        contact_keywords = {"ring", "kontakt", "tilkald"}
-        problem_keywords = {"komplikation", "problem"}
-        target_keywords = {"bagvagt", "forvagt", "anæstesi"}
-
-        has_contact1 = bool(keywords1 & contact_keywords)
-        has_contact2 = bool(keywords2 & contact_keywords)
-        has_problem1 = bool(keywords1 & problem_keywords)
-        has_problem2 = bool(keywords2 & problem_keywords)
-        has_target1 = bool(keywords1 & target_keywords)
-        has_target2 = bool(keywords2 & target_keywords)
+        has_contact1 = bool(keywords1 & _CONTACT_KEYWORDS)
+        has_contact2 = bool(keywords2 & _CONTACT_KEYWORDS)
+        has_problem1 = bool(keywords1 & _PROBLEM_KEYWORDS)
+        has_problem2 = bool(keywords2 & _PROBLEM_KEYWORDS)
+        has_target1 = bool(keywords1 & _TARGET_KEYWORDS)
+        has_target2 = bool(keywords2 & _TARGET_KEYWORDS)
 
         # Calculate total boost
         boost = 0.0
@@ -330,24 +429,55 @@ class RepetitionDetector:
 
         return min(1.0, jaccard + boost)
 
+    def _max_boost(self, keywords: set[str]) -> float:
+        """Upper bound on the boost a text with these semantic keywords can get.
+
+        Mirrors the boost in _similarity_from_tokens assuming the other text
+        shares every keyword and category.
+        """
+        boost = 0.0
+        if keywords:
+            boost += min(0.3, len(keywords) * 0.15)
+        if keywords & _CONTACT_KEYWORDS:
+            boost += 0.15
+        if keywords & _PROBLEM_KEYWORDS:
+            boost += 0.15
+        if keywords & _TARGET_KEYWORDS:
+            boost += 0.15
+        return boost
+
     def _calculate_group_similarity(self, normalized_texts: list[str]) -> float:
         """Calculate average pairwise similarity within a group."""
+        return self._group_similarity_from_tokens(
+            normalized_texts, [self._tokenize(t) for t in normalized_texts]
+        )
+
+    def _group_similarity_from_tokens(
+        self, normalized_texts: list[str], tokens: list[set[str]]
+    ) -> float:
+        """Calculate average pairwise similarity from pre-tokenized texts."""
         if len(normalized_texts) <= 1:
             return 1.0
 
         similarities = []
         for i, t1 in enumerate(normalized_texts):
-            for t2 in normalized_texts[i + 1:]:
-                similarities.append(self._calculate_similarity(t1, t2))
+            for j in range(i + 1, len(normalized_texts)):
+                similarities.append(
+                    self._similarity_from_tokens(t1, normalized_texts[j], tokens[i], tokens[j])
+                )
 
         return sum(similarities) / len(similarities) if similarities else 1.0
 
-    def _select_canonical(self, texts: list[str]) -> str:
+    def _select_canonical(
+        self, texts: list[str], token_counts: list[int] | None = None
+    ) -> str:
         """Select the best/canonical version from a group of similar texts.
 
         Prefers:
         1. Longer text (more complete)
         2. More specific content (has more unique words)
+
+        ``token_counts`` may carry precomputed token-set sizes per text.
         """
         if not texts:
             return ""
@@ -357,14 +487,15 @@ class RepetitionDetector:
 
         # Score each text
         scored = []
-        for text in texts:
+        for idx, text in enumerate(texts):
             # Length score (normalized)
             length_score = len(text)
 
             # Specificity score (unique meaningful words)
-            normalized = self._normalize(text)
-            tokens = self._tokenize(normalized)
-            specificity_score = len(tokens)
+            if token_counts is not None:
+                specificity_score = token_counts[idx]
+            else:
+                specificity_score = len(self._tokenize(self._normalize(text)))
 
             # Combined score
             total_score = length_score + specificity_score * 10
@@ -0,0 +1,354 @@
+"""
+Rendering of a run's DOCX documents.
+
+A run ends with up to four independent documents: the procedure, the
+meta-analysis report, the source analysis and the evidence review. Each is a
+CPU-bound python-docx job, so they are rendered in parallel on a process
+pool. Their inputs are written once to ``docx_inputs.json`` in the run
+directory; workers read them from there, and with lazy rendering the same
+file lets a document be rendered on its first download instead.
+
+Documents rendered with the run are recorded in its manifest. The manifest
+is final once the run completes, so documents rendered later on download
+are recorded in ``docx_artifacts.json`` instead.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import multiprocessing
+import os
+import threading
+import uuid
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any
+
+from procedurewriter.pipeline.hashing import sha256_file
+from procedurewriter.pipeline.io import write_json
+from procedurewriter.pipeline.manifest import update_manifest_artifact
+from procedurewriter.pipeline.sources import to_jsonl_record
+from procedurewriter.pipeline.types import SourceRecord
+from procedurewriter.settings import settings
+
+logger = logging.getLogger(__name__)
+
+DOCX_INPUTS_FILENAME = "docx_inputs.json"
+LAZY_ARTIFACTS_FILENAME = "docx_artifacts.json"
+
+DOCX_PROCEDURE = "procedure"
+DOCX_META_ANALYSIS = "meta_analysis"
+DOCX_SOURCE_ANALYSIS = "source_analysis"
+DOCX_EVIDENCE_REVIEW = "evidence_review"
+
+DOCX_FILENAMES = {
+    DOCX_PROCEDURE: "Procedure.docx",
+    DOCX_META_ANALYSIS: "Procedure_MetaAnalysis.docx",
+    DOCX_SOURCE_ANALYSIS: "source_analysis.docx",
+    DOCX_EVIDENCE_REVIEW: "evidence_review.docx",
+}
+
+# Manifest artifact keys; the procedure document is not a manifest artifact
+# because it embeds the manifest hash
+_MANIFEST_ARTIFACT_KEYS = {
+    DOCX_META_ANALYSIS: "meta_analysis_docx",
+    DOCX_SOURCE_ANALYSIS: "source_analysis_docx",
+    DOCX_EVIDENCE_REVIEW: "evidence_review_docx",
+}
+
+_MANIFEST_FILENAME = "run_manifest.json"
+_SYNTHESIS_REPORT_FILENAME = "synthesis_report.json"
+
+
+def write_docx_inputs(
+    run_dir: Path,
+    *,
+    run_id: str,
+    procedure: str,
+    markdown_text: str,
+    sources: list[SourceRecord],
+    evidence_report: dict[str, Any],
+    manifest_hash: str,
+    quality_score: int | None,
+    template_path: Path | None,
+    meta_analysis: bool,
+) -> list[str]:
+    """Persist everything the run's documents are rendered from.
+
+    The meta-analysis report is rendered from ``synthesis_report.json``,
+    which must already be in the run directory when meta_analysis is set.
+
+    Returns:
+        The kinds of document the run has
+    """
+    kinds = [DOCX_PROCEDURE, DOCX_SOURCE_ANALYSIS, DOCX_EVIDENCE_REVIEW]
+    if meta_analysis:
+        kinds.append(DOCX_META_ANALYSIS)
+    write_json(
+        run_dir / DOCX_INPUTS_FILENAME,
+        {
+            "run_id": run_id,
+            "procedure": procedure,
+            "markdown_text": markdown_text,
+            "sources": [to_jsonl_record(s) for s in sources],
+            "evidence_report": evidence_report,
+            "manifest_hash": manifest_hash,
+            "quality_score": quality_score,
+            "template_path": str(template_path) if template_path else None,
+            "kinds": kinds,
+        },
+    )
+    return kinds
+
+
+def _load_meta_analysis_output(run_dir: Path) -> Any:
+    from procedurewriter.agents.meta_analysis.orchestrator import OrchestratorOutput
+    from procedurewriter.agents.meta_analysis.synthesizer_agent import SynthesisOutput
+
+    data = json.loads((run_dir / _SYNTHESIS_REPORT_FILENAME).read_text(encoding="utf-8"))
+    data["synthesis"] = SynthesisOutput.model_validate(data["synthesis"])
+    return OrchestratorOutput.model_validate(data)
+
+
+def render_docx(run_dir: Path, kind: str) -> Path:
+    """Render one document of a run from its docx_inputs.json.
+
+    This is the unit of work for the pool. The file is written under a
+    temporary name and moved into place, so a concurrent download never
+    sees a partial document.
+
+    Args:
+        run_dir: Run directory holding docx_inputs.json
+        kind: One of the DOCX_* kinds
+
+    Returns:
+        Path of the rendered document
+    """
+    from procedurewriter.pipeline.docx_writer import (
+        write_evidence_review_docx,
+        write_meta_analysis_docx,
+        write_procedure_docx,
+        write_source_analysis_docx,
+    )
+
+    inputs = json.loads((run_dir / DOCX_INPUTS_FILENAME).read_text(encoding="utf-8"))
+    sources = [SourceRecord(**record) for record in inputs["sources"]]
+    output_path = run_dir / DOCX_FILENAMES[kind]
+    tmp_path = output_path.with_name(f".{output_path.stem}.{uuid.uuid4().hex}.tmp")
+
+    try:
+        if kind == DOCX_PROCEDURE:
+            template_path = inputs.get("template_path")
+            write_procedure_docx(
+                markdown_text=inputs["markdown_text"],
+                sources=sources,
+                output_path=tmp_path,
+                run_id=inputs["run_id"],
+                manifest_hash=inputs["manifest_hash"],
+                template_path=Path(template_path) if template_path else None,
+                quality_score=inputs.get("quality_score"),
+            )
+        elif kind == DOCX_META_ANALYSIS:
+            write_meta_analysis_docx(
+                output=_load_meta_analysis_output(run_dir),
+                output_path=tmp_path,
+                run_id=inputs["run_id"],
+            )
+        elif kind == DOCX_SOURCE_ANALYSIS:
+            write_source_analysis_docx(
+                sources=sources,
+                procedure=inputs["procedure"],
+                run_id=inputs["run_id"],
+                output_path=tmp_path,
+                search_terms=None,  # Terms not preserved in scope - sources contain metadata
+            )
+        elif kind == DOCX_EVIDENCE_REVIEW:
+            write_evidence_review_docx(
+                evidence_report=inputs["evidence_report"],
+                sources=sources,
+                procedure=inputs["procedure"],
+                run_id=inputs["run_id"],
+                output_path=tmp_path,
+            )
+        else:
+            raise ValueError(f"Unknown DOCX kind: {kind}")
+        os.replace(tmp_path, output_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return output_path
+
+
+# Artifact records are read-modify-write; serialize them within the process
+_manifest_lock = threading.Lock()
+
+
+def _record_artifact(run_dir: Path, kind: str, path: Path) -> None:
+    artifact_key = _MANIFEST_ARTIFACT_KEYS.get(kind)
+    manifest_path = run_dir / _MANIFEST_FILENAME
+    if artifact_key is None or not manifest_path.exists():
+        return
+    with _manifest_lock:
+        update_manifest_artifact(manifest_path=manifest_path, artifact_key=artifact_key, artifact_path=path)
+
+
+def _record_lazy_artifact(run_dir: Path, kind: str, path: Path) -> None:
+    artifact_key = _MANIFEST_ARTIFACT_KEYS.get(kind)
+    if artifact_key is None:
+        return
+    record_path = run_dir / LAZY_ARTIFACTS_FILENAME
+    with _manifest_lock:
+        artifacts = json.loads(record_path.read_text(encoding="utf-8")) if record_path.exists() else {}
+        artifacts[artifact_key] = {"path": str(path), "sha256": sha256_file(path)}
+        write_json(record_path, artifacts)
+
+
+class DocxRenderService:
+    """Renders run documents on a pool of worker processes."""
+
+    def __init__(self, *, max_workers: int = 4) -> None:
+        """Initialize the service.
+
+        Args:
+            max_workers: Worker processes; 0 or 1 renders in the calling process
+        """
+        self.max_workers = max_workers
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def _pool(self) -> Executor | None:
+        if self.max_workers <= 1:
+            return None
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def shutdown(self) -> None:
+        """Stop the worker processes (a later call starts a new pool)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _discard_broken_pool(self) -> None:
+        logger.warning("DOCX render pool broke; rendering in-process")
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def render_all(
+        self, run_dir: Path, kinds: list[str], *, optional: frozenset[str] = frozenset()
+    ) -> dict[str, Path]:
+        """Render several documents of a run at once.
+
+        Args:
+            run_dir: Run directory holding docx_inputs.json
+            kinds: Documents to render
+            optional: Kinds whose failure is logged and left out of the result
+
+        Returns:
+            Rendered document path by kind
+
+        Raises:
+            Exception: The first error of a non-optional kind, once all renders finished
+        """
+        pool = self._pool()
+        outcomes: dict[str, Path | Exception] = {}
+        if pool is not None and len(kinds) > 1:
+            try:
+                futures: dict[str, Future[Path]] = {
+                    kind: pool.submit(render_docx, run_dir, kind) for kind in kinds
+                }
+                for kind, future in futures.items():
+                    try:
+                        outcomes[kind] = future.result()
+                    except BrokenProcessPool:
+                        raise
+                    except Exception as e:  # noqa: BLE001 - sorted out below
+                        outcomes[kind] = e
+            except BrokenProcessPool:
+                self._discard_broken_pool()
+                outcomes.clear()
+        for kind in kinds:
+            if kind not in outcomes:
+                try:
+                    outcomes[kind] = render_docx(run_dir, kind)
+                except Exception as e:  # noqa: BLE001 - sorted out below
+                    outcomes[kind] = e
+
+        rendered: dict[str, Path] = {}
+        for kind, outcome in outcomes.items():
+            if isinstance(outcome, Exception):
+                if kind not in optional:
+                    raise outcome
+                logger.warning("Rendering %s DOCX failed: %s", kind, outcome)
+                continue
+            _record_artifact(run_dir, kind, outcome)
+            rendered[kind] = outcome
+        return rendered
+
+
+# Global instance (lazy loaded)
+_service: DocxRenderService | None = None
+_service_lock = threading.Lock()
+
+
+def get_docx_render_service() -> DocxRenderService:
+    """Get or create the shared render service."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = DocxRenderService(max_workers=settings.docx_render_max_workers)
+        return _service
+
+
+def shutdown_docx_render_service() -> None:
+    """Stop the shared service's worker processes, if started."""
+    with _service_lock:
+        service = _service
+    if service is not None:
+        service.shutdown()
+
+
+# Lazy renders of the same file wait for each other instead of rendering
+# twice; a fixed set of striped locks keeps this from growing per run
+_lazy_locks = tuple(threading.Lock() for _ in range(16))
+
+
+def ensure_docx(run_dir: Path, kind: str) -> Path | None:
+    """Return a run's document, rendering it first if the run deferred it.
+
+    A document rendered here is recorded in ``docx_artifacts.json``; the run
+    manifest is left as the run wrote it.
+
+    Returns:
+        The document path, or None if the run has no such document
+    """
+    output_path = run_dir / DOCX_FILENAMES[kind]
+    if output_path.exists():
+        return output_path
+    if kind not in pending_docx_kinds(run_dir):
+        return None
+
+    with _lazy_locks[hash(output_path) % len(_lazy_locks)]:
+        if not output_path.exists():
+            render_docx(run_dir, kind)
+            _record_lazy_artifact(run_dir, kind, output_path)
+    return output_path
+
+
+def pending_docx_kinds(run_dir: Path) -> list[str]:
+    """Kinds of document the run has that are not rendered yet."""
+    inputs_path = run_dir / DOCX_INPUTS_FILENAME
+    if not inputs_path.exists():
+        return []
+    try:
+        kinds = json.loads(inputs_path.read_text(encoding="utf-8")).get("kinds", [])
+    except (json.JSONDecodeError, OSError):
+        return []
+    return [k for k in kinds if k in DOCX_FILENAMES and not (run_dir / DOCX_FILENAMES[k]).exists()]
@@ -36,16 +36,20 @@ def format_grade_badge(certainty_level: str) -> str:
 def load_docx_template(template_path: Path | None = None) -> dict[str, Any]:
     """Load DOCX template configuration.
 
+    The template is parsed once per file version by the config registry;
+    callers get their own copy.
+
     Args:
         template_path: Path to docx_template.yaml. If None, uses defaults.
 
     Returns:
         Template configuration dictionary
     """
-    if template_path and template_path.exists():
-        config = load_yaml(template_path)
-        if isinstance(config, dict):
-            return config
+    if template_path:
+        try:
+            return load_yaml(template_path)
+        except FileNotFoundError:
+            pass
 
     # Return default configuration
     return {
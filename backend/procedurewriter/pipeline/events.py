@@ -9,12 +9,21 @@ NO MOCKS - This integrates with real pipeline execution.
 from __future__ import annotations
 
 import contextlib
+import json
+import logging
+import threading
 import time
 from dataclasses import dataclass, field
 from enum import Enum
+from pathlib import Path
 from queue import Full, Queue
 from typing import Any
 
+logger = logging.getLogger(__name__)
+
+# Per-run event log written next to the other run artifacts
+EVENT_LOG_FILENAME = "events.jsonl"
+
 
 class EventType(Enum):
     """Event types for pipeline progress tracking."""
@@ -49,16 +58,108 @@ class PipelineEvent:
     event_type: EventType
     data: dict[str, Any]
     timestamp: float = field(default_factory=time.time)
+    seq: int | None = None
 
     def to_sse(self) -> str:
-        """Format as Server-Sent Event."""
-        import json
-        payload = {
+        """Format as Server-Sent Event.
+
+        Logged events carry an ``id:`` field so browsers resend it as
+        ``Last-Event-ID`` when they reconnect.
+        """
+        payload: dict[str, Any] = {
             "event": self.event_type.value,
             "data": self.data,
             "timestamp": self.timestamp,
         }
-        return f"data: {json.dumps(payload)}\n\n"
+        if self.seq is None:
+            return f"data: {json.dumps(payload)}\n\n"
+        payload["seq"] = self.seq
+        return f"id: {self.seq}\ndata: {json.dumps(payload)}\n\n"
+
+
+class EventLog:
+    """
+    Append-only JSONL log of the events of a single run.
+
+    Every record gets a monotonic sequence number, so readers in any
+    process (another API worker, or the same one after a restart) can
+    tail the file and resume from the last sequence number they saw.
+    Sequence numbers continue across re-opens, e.g. when a stale run is
+    requeued and executed again.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._next_seq: int | None = None
+
+    def _last_seq(self) -> int:
+        last = 0
+        events, _ = self.read_from(0)
+        if events:
+            last = events[-1].seq or 0
+        return last
+
+    def append(self, event: PipelineEvent) -> int:
+        """Append an event and return its sequence number."""
+        with self._lock:
+            if self._next_seq is None:
+                self._next_seq = self._last_seq() + 1
+            seq = self._next_seq
+            record = {
+                "seq": seq,
+                "event": event.event_type.value,
+                "data": event.data,
+                "timestamp": event.timestamp,
+            }
+            line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(line)
+            self._next_seq = seq + 1
+        return seq
+
+    def read_from(self, offset: int = 0) -> tuple[list[PipelineEvent], int]:
+        """
+        Read complete records starting at byte ``offset``.
+
+        Returns the parsed events and the offset to continue from. A
+        trailing line without a newline (a write in progress) is left
+        for the next call.
+        """
+        try:
+            with self.path.open("rb") as f:
+                f.seek(offset)
+                chunk = f.read()
+        except FileNotFoundError:
+            return [], offset
+
+        end = chunk.rfind(b"\n")
+        if end < 0:
+            return [], offset
+
+        events: list[PipelineEvent] = []
+        for raw in chunk[: end + 1].splitlines():
+            if not raw.strip():
+                continue
+            try:
+                record = json.loads(raw)
+                events.append(
+                    PipelineEvent(
+                        event_type=EventType(record["event"]),
+                        data=record.get("data") or {},
+                        timestamp=float(record.get("timestamp") or 0),
+                        seq=int(record["seq"]),
+                    )
+                )
+            except (ValueError, KeyError, TypeError):
+                logger.warning("Skipping malformed event record in %s", self.path)
+        return events, offset + end + 1
+
+    def read_since(self, after_seq: int = 0) -> list[PipelineEvent]:
+        """Return all logged events with a sequence number above ``after_seq``."""
+        events, _ = self.read_from(0)
+        return [e for e in events if (e.seq or 0) > after_seq]
 
 
 class EventEmitter:
@@ -68,6 +169,10 @@ class EventEmitter:
     Supports multiple subscribers (SSE connections) per run.
     Thread-safe for use from sync pipeline code.
 
+    When constructed with an ``EventLog`` every event is also appended to
+    the run's log, which is what the SSE endpoint tails. In-process
+    subscribers still receive events directly.
+
     Usage in pipeline:
         emitter = get_emitter(run_id)
         emitter.emit(EventType.AGENT_START, {"agent": "WriterAgent"})
@@ -75,9 +180,15 @@ class EventEmitter:
         emitter.emit(EventType.AGENT_COMPLETE, {"agent": "WriterAgent"})
     """
 
-    def __init__(self) -> None:
+    def __init__(self, log: EventLog | None = None) -> None:
         self._subscribers: list[Queue[PipelineEvent | None]] = []
         self._closed = False
+        self._log = log
+
+    @property
+    def log(self) -> EventLog | None:
+        """The persistent log events are written to, if any."""
+        return self._log
 
     def subscribe(self) -> Queue[PipelineEvent | None]:
         """Create a new subscriber queue for SSE connection."""
@@ -100,6 +211,12 @@ class EventEmitter:
             return
 
         event = PipelineEvent(event_type=event_type, data=data)
+        if self._log is not None:
+            # Never let a logging failure break the pipeline
+            try:
+                event.seq = self._log.append(event)
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning("Failed to append event to %s: %s", self._log.path, e)
 
         for queue in self._subscribers:
             with contextlib.suppress(Full):
@@ -122,14 +239,17 @@ class EventEmitter:
 _active_emitters: dict[str, EventEmitter] = {}
 
 
-def get_emitter(run_id: str) -> EventEmitter:
+def get_emitter(run_id: str, log_path: Path | None = None) -> EventEmitter:
     """
     Get or create emitter for a run.
 
     Called at pipeline start to get emitter for event broadcasting.
+    If ``log_path`` is given, a newly created emitter also persists its
+    events there (see ``EventLog``).
     """
     if run_id not in _active_emitters:
-        _active_emitters[run_id] = EventEmitter()
+        log = EventLog(log_path) if log_path is not None else None
+        _active_emitters[run_id] = EventEmitter(log=log)
     return _active_emitters[run_id]
 
 
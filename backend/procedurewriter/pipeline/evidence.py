@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import math
 import re
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
 from procedurewriter.pipeline.gps import SentenceType, classify_sentence_type
+from procedurewriter.pipeline.snippet_table import SnippetTable
 from procedurewriter.pipeline.text_units import CitedSentence, iter_cited_sentences
-from procedurewriter.pipeline.types import Snippet
+from procedurewriter.pipeline.types import SnippetLike
 
 _token_re = re.compile(r"[A-Za-zÀ-ÖØ-öø-ÿ0-9]+", re.UNICODE)
 _citation_tag_re = re.compile(r"\[S:[^\]]+\]")
@@ -69,7 +71,7 @@ DEFAULT_MIN_OVERLAP_RATIO = 0.15  # Minimum overlap ratio (overlap/query_tokens)
 def build_evidence_report(
     markdown_text: str,
     *,
-    snippets: list[Snippet],
+    snippets: Sequence[SnippetLike],
     min_overlap: int = DEFAULT_MIN_OVERLAP,
     min_bm25_score: float = DEFAULT_MIN_BM25_SCORE,
     min_overlap_ratio: float = DEFAULT_MIN_OVERLAP_RATIO,
@@ -329,15 +331,19 @@ def _tokenize(text: str) -> list[str]:
 @dataclass(frozen=True)
 class _Match:
     score: float
-    snippet: Snippet | None
+    snippet: SnippetLike | None
     snippet_tokens: list[str] | None
     supported: bool
 
 
 class _Bm25Index:
-    def __init__(self, snippets: list[Snippet]) -> None:
+    def __init__(self, snippets: Sequence[SnippetLike]) -> None:
         self._snippets = snippets
-        self._tokens = [_tokenize(s.text) for s in snippets]
+        if isinstance(snippets, SnippetTable):
+            # Read the text buffer directly instead of creating a view per row
+            self._tokens = [_tokenize(text) for text in snippets.texts()]
+        else:
+            self._tokens = [_tokenize(s.text) for s in snippets]
 
         self._doc_lens = [len(t) for t in self._tokens]
         self._avgdl = (sum(self._doc_lens) / len(self._doc_lens)) if self._doc_lens else 0.0
@@ -352,9 +358,13 @@ class _Bm25Index:
         for term, freq in df.items():
             self._idf[term] = math.log((n_docs - freq + 0.5) / (freq + 0.5) + 1.0)
 
-        self._by_source: dict[str, list[int]] = {}
-        for idx, s in enumerate(snippets):
-            self._by_source.setdefault(s.source_id, []).append(idx)
+        self._by_source: dict[str, list[int]]
+        if isinstance(snippets, SnippetTable):
+            self._by_source = snippets.rows_by_source()
+        else:
+            self._by_source = {}
+            for idx, s in enumerate(snippets):
+                self._by_source.setdefault(s.source_id, []).append(idx)
 
     def best_match(self, query: str, *, source_id: str | None) -> _Match:
         q_tokens = _tokenize(query)
@@ -11,7 +11,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from procedurewriter.config_store import load_yaml
+from procedurewriter.config_store import config_registry
 
 
 @dataclass(frozen=True)
@@ -97,14 +97,19 @@ class EvidenceHierarchy:
 
     @classmethod
     def from_config(cls, config_path: Path | str | None) -> EvidenceHierarchy:
-        """Load hierarchy from YAML config file."""
+        """Load hierarchy from YAML config file.
+
+        The hierarchy only reads its config, so one instance is shared per
+        version of the file.
+        """
         if config_path is None:
             return cls(None)
         path = Path(config_path) if isinstance(config_path, str) else config_path
-        if not path.exists():
+        try:
+            snapshot = config_registry.snapshot(path)
+        except FileNotFoundError:
             return cls(None)
-        config = load_yaml(path)
-        return cls(config if isinstance(config, dict) else None)
+        return config_registry.derive(snapshot, cls.__qualname__, lambda s: cls(s.to_dict()))
 
     def classify_source(
         self,
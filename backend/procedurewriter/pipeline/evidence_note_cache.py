@@ -0,0 +1,172 @@
+"""Cross-run cache for evidence-chunk clinical notes.
+
+The same guideline chunks (library PDFs, common PubMed abstracts) are
+summarised on every run of every related procedure. Notes are cached in
+SQLite keyed by the chunk text hash, the normalised procedure title, the
+prompt version and the model, so re-runs and related procedures reuse them.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+from datetime import UTC, datetime
+from pathlib import Path
+
+from procedurewriter.db import normalize_procedure_name
+from procedurewriter.metrics import record_cache_lookup
+
+logger = logging.getLogger(__name__)
+
+_DB_FILENAME = "evidence_notes.sqlite3"
+
+
+def chunk_text_sha256(text: str) -> str:
+    """SHA-256 of a chunk's text, the content part of the cache key."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EvidenceNoteCache:
+    """SQLite cache of evidence-note summaries shared across runs.
+
+    Features:
+    - Keyed by (chunk sha256, normalised procedure title, prompt version, model)
+    - Hit/miss statistics, also exported as the ``evidence_notes`` cache metric
+    - Targeted invalidation by model, prompt version or procedure
+
+    The database is created on first use, so constructing a cache is free.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        """Initialize cache.
+
+        Args:
+            cache_dir: Directory for the cache database.
+        """
+        self.cache_dir = cache_dir
+        self._db_path = cache_dir / _DB_FILENAME
+        self._initialized = False
+        self._hits = 0
+        self._misses = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with sqlite3.connect(self._db_path) as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS evidence_notes (
+                        chunk_sha256 TEXT NOT NULL,
+                        procedure_key TEXT NOT NULL,
+                        prompt_version TEXT NOT NULL,
+                        model TEXT NOT NULL,
+                        summary TEXT NOT NULL,
+                        created_at_utc TEXT NOT NULL,
+                        PRIMARY KEY (chunk_sha256, procedure_key, prompt_version, model)
+                    )
+                """)
+                conn.commit()
+            self._initialized = True
+        return sqlite3.connect(self._db_path)
+
+    def get(
+        self, chunk_text: str, procedure_title: str, prompt_version: str, model: str
+    ) -> str | None:
+        """Return the cached summary for a chunk, or None on a miss."""
+        key = (
+            chunk_text_sha256(chunk_text),
+            normalize_procedure_name(procedure_title),
+            prompt_version,
+            model,
+        )
+        with self._connect() as conn:
+            row = conn.execute(
+                """
+                SELECT summary FROM evidence_notes
+                WHERE chunk_sha256 = ? AND procedure_key = ? AND prompt_version = ? AND model = ?
+                """,
+                key,
+            ).fetchone()
+
+        hit = row is not None
+        if hit:
+            self._hits += 1
+        else:
+            self._misses += 1
+        record_cache_lookup("evidence_notes", hit=hit)
+        return row[0] if hit else None
+
+    def set(
+        self,
+        chunk_text: str,
+        procedure_title: str,
+        prompt_version: str,
+        model: str,
+        summary: str,
+    ) -> None:
+        """Store a generated summary, replacing any previous entry."""
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO evidence_notes
+                    (chunk_sha256, procedure_key, prompt_version, model, summary, created_at_utc)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    chunk_text_sha256(chunk_text),
+                    normalize_procedure_name(procedure_title),
+                    prompt_version,
+                    model,
+                    summary,
+                    datetime.now(UTC).isoformat(),
+                ),
+            )
+            conn.commit()
+
+    def invalidate(
+        self,
+        *,
+        procedure_title: str | None = None,
+        prompt_version: str | None = None,
+        model: str | None = None,
+    ) -> int:
+        """Delete cached notes matching every given filter (all notes if none).
+
+        Returns:
+            Number of notes deleted.
+        """
+        clauses: list[str] = []
+        params: list[str] = []
+        if procedure_title is not None:
+            clauses.append("procedure_key = ?")
+            params.append(normalize_procedure_name(procedure_title))
+        if prompt_version is not None:
+            clauses.append("prompt_version = ?")
+            params.append(prompt_version)
+        if model is not None:
+            clauses.append("model = ?")
+            params.append(model)
+
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._connect() as conn:
+            deleted = conn.execute(f"DELETE FROM evidence_notes{where}", params).rowcount
+            conn.commit()
+
+        logger.info(f"Invalidated {deleted} cached evidence notes")
+        return deleted
+
+    def get_stats(self) -> dict[str, int | float]:
+        """Get cache statistics for this instance.
+
+        Returns:
+            Dict with hits, misses, hit_rate (percent) and stored entries.
+        """
+        with self._connect() as conn:
+            entries = conn.execute("SELECT COUNT(*) FROM evidence_notes").fetchone()[0]
+
+        total = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / total * 100, 1) if total else 0.0,
+            "entries": entries,
+        }
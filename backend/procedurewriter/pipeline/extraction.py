@@ -0,0 +1,382 @@
+"""PDF/DOCX text extraction with a process pool and a content-addressed cache.
+
+pypdf and python-docx are pure Python and CPU-bound, so extracting a long
+guideline on a request thread holds the GIL and the worker for the whole
+parse. ExtractionService splits large PDFs into page ranges (and bulk
+requests into documents) and runs them in a process pool. Results are cached
+in SQLite by the raw file's sha256, so a re-uploaded or re-downloaded file is
+never parsed twice.
+
+Module-level extract_pdf_pages/extract_docx_blocks mirror the functions in
+normalize.py and go through the shared service.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import multiprocessing
+import sqlite3
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from procedurewriter.metrics import record_cache_lookup
+from procedurewriter.pipeline import normalize
+from procedurewriter.pipeline.hashing import sha256_file
+from procedurewriter.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_DB_FILENAME = "extractions.sqlite3"
+
+# Bump when normalize's extraction or text cleaning changes output
+EXTRACTOR_VERSION = "1"
+
+KIND_PDF = "pdf"
+KIND_DOCX = "docx"
+
+
+def extraction_kind(path: Path) -> str:
+    """Extraction kind for a file, from its suffix.
+
+    Raises:
+        ValueError: If the file is neither a PDF nor a DOCX
+    """
+    suffix = path.suffix.lower()
+    if suffix == ".pdf":
+        return KIND_PDF
+    if suffix == ".docx":
+        return KIND_DOCX
+    raise ValueError(f"Unsupported file type for extraction: {path.name}")
+
+
+class ExtractionCache:
+    """SQLite cache of extracted PDF pages and DOCX blocks.
+
+    Keyed by (raw sha256, kind, extractor version). The database is created
+    on first use, so constructing a cache is free.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        """Initialize cache.
+
+        Args:
+            cache_dir: Directory for the cache database.
+        """
+        self.cache_dir = cache_dir
+        self._db_path = cache_dir / _DB_FILENAME
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with sqlite3.connect(self._db_path) as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS extractions (
+                        raw_sha256 TEXT NOT NULL,
+                        kind TEXT NOT NULL,
+                        extractor_version TEXT NOT NULL,
+                        payload_json TEXT NOT NULL,
+                        created_at_utc TEXT NOT NULL,
+                        PRIMARY KEY (raw_sha256, kind, extractor_version)
+                    )
+                """)
+                conn.commit()
+            self._initialized = True
+        return sqlite3.connect(self._db_path, timeout=30)
+
+    def get(self, raw_sha256: str, kind: str) -> Any | None:
+        """Return cached pages (PDF) or blocks (DOCX), or None on a miss."""
+        with self._connect() as conn:
+            row = conn.execute(
+                """
+                SELECT payload_json FROM extractions
+                WHERE raw_sha256 = ? AND kind = ? AND extractor_version = ?
+                """,
+                (raw_sha256, kind, EXTRACTOR_VERSION),
+            ).fetchone()
+        record_cache_lookup("extraction", hit=row is not None)
+        return json.loads(row[0]) if row else None
+
+    def set(self, raw_sha256: str, kind: str, payload: Any) -> None:
+        """Store extracted pages or blocks, replacing any previous entry."""
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO extractions
+                    (raw_sha256, kind, extractor_version, payload_json, created_at_utc)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (
+                    raw_sha256,
+                    kind,
+                    EXTRACTOR_VERSION,
+                    json.dumps(payload, ensure_ascii=False),
+                    datetime.now(UTC).isoformat(),
+                ),
+            )
+            conn.commit()
+
+
+@dataclass
+class ExtractionResult:
+    """Outcome of extracting one file in a bulk request."""
+
+    path: Path
+    kind: str
+    raw_sha256: str
+    pages: list[str] = field(default_factory=list)  # PDF only
+    blocks: list[dict[str, Any]] = field(default_factory=list)  # DOCX only
+    cached: bool = False
+    error: str | None = None
+
+
+class ExtractionService:
+    """Extracts PDFs and DOCX files in a process pool, with caching.
+
+    Features:
+    - Large PDFs are split into page ranges extracted in parallel
+    - extract_many() fans whole documents out to the pool for bulk ingestion
+    - Results are cached by raw sha256; cached files are never re-parsed
+    - With max_workers <= 1, or if the pool breaks, extraction runs in-process
+
+    The pool is started on first use and uses the spawn start method, since
+    forking a process with running threads is unsafe.
+    """
+
+    def __init__(
+        self,
+        cache: ExtractionCache | None = None,
+        *,
+        max_workers: int = 2,
+        pages_per_task: int = 20,
+    ) -> None:
+        """Initialize the service.
+
+        Args:
+            cache: Extraction cache; None disables caching
+            max_workers: Worker processes; 0 or 1 extracts in the calling process
+            pages_per_task: PDF pages per pool task; shorter PDFs are one task
+        """
+        self.cache = cache
+        self.max_workers = max_workers
+        self.pages_per_task = max(1, pages_per_task)
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def _pool(self) -> Executor | None:
+        if self.max_workers <= 1:
+            return None
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def shutdown(self) -> None:
+        """Stop the worker processes (a later call starts a new pool)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _discard_broken_pool(self) -> None:
+        logger.warning("Extraction worker pool broke; extracting in-process")
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _cached(self, raw_sha256: str, kind: str) -> Any | None:
+        if self.cache is None:
+            return None
+        return self.cache.get(raw_sha256, kind)
+
+    def _store(self, raw_sha256: str, kind: str, payload: Any) -> None:
+        if self.cache is None:
+            return
+        try:
+            self.cache.set(raw_sha256, kind, payload)
+        except sqlite3.Error as e:
+            # Non-fatal - the extraction itself succeeded
+            logger.warning(f"Failed to cache extraction {raw_sha256[:12]}: {e}")
+
+    def _submit_pdf(self, pool: Executor, pdf_path: Path) -> list[Future[list[str]]]:
+        """Submit one task per page range of a PDF."""
+        page_count = normalize.count_pdf_pages(pdf_path)
+        return [
+            pool.submit(normalize.extract_pdf_page_range, pdf_path, start, start + self.pages_per_task)
+            for start in range(0, page_count, self.pages_per_task)
+        ]
+
+    def _extract_pdf_uncached(self, pdf_path: Path) -> list[str]:
+        pool = self._pool()
+        if pool is None or normalize.count_pdf_pages(pdf_path) <= self.pages_per_task:
+            return normalize.extract_pdf_pages(pdf_path)
+        try:
+            futures = self._submit_pdf(pool, pdf_path)
+            return [page for future in futures for page in future.result()]
+        except BrokenProcessPool:
+            self._discard_broken_pool()
+            return normalize.extract_pdf_pages(pdf_path)
+
+    def extract_pdf_pages(self, pdf_path: Path, raw_sha256: str | None = None) -> list[str]:
+        """Extract the cleaned text of each page of a PDF.
+
+        Args:
+            pdf_path: PDF file
+            raw_sha256: sha256 of the file if already known (saves re-hashing)
+
+        Returns:
+            One string per page, as normalize.extract_pdf_pages
+        """
+        sha = raw_sha256 or sha256_file(pdf_path)
+        cached = self._cached(sha, KIND_PDF)
+        if cached is not None:
+            return list(cached)
+        pages = self._extract_pdf_uncached(pdf_path)
+        self._store(sha, KIND_PDF, pages)
+        return pages
+
+    def extract_docx_blocks(self, docx_path: Path, raw_sha256: str | None = None) -> list[dict[str, Any]]:
+        """Extract paragraph blocks of a DOCX, as normalize.extract_docx_blocks.
+
+        A single DOCX cannot be split, so it is extracted in the calling
+        process; extract_many() parallelizes across documents.
+        """
+        sha = raw_sha256 or sha256_file(docx_path)
+        cached = self._cached(sha, KIND_DOCX)
+        if cached is not None:
+            return list(cached)
+        blocks = normalize.extract_docx_blocks(docx_path)
+        self._store(sha, KIND_DOCX, blocks)
+        return blocks
+
+    def extract_many(
+        self, paths: list[Path], raw_sha256s: list[str] | None = None
+    ) -> list[ExtractionResult]:
+        """Extract many PDF/DOCX files, in parallel across and within documents.
+
+        Failures are reported per file in ExtractionResult.error rather than
+        raised, so one bad file does not abort a bulk ingestion.
+
+        Args:
+            paths: Files to extract (.pdf or .docx)
+            raw_sha256s: sha256 of each file if already known (saves re-hashing)
+
+        Returns:
+            One result per path, in input order
+        """
+        results: list[ExtractionResult] = []
+        pending: list[tuple[ExtractionResult, list[Future[Any]]]] = []
+        pool = self._pool()
+
+        for i, path in enumerate(paths):
+            try:
+                kind = extraction_kind(path)
+                sha = raw_sha256s[i] if raw_sha256s is not None else sha256_file(path)
+            except (ValueError, OSError) as e:
+                results.append(ExtractionResult(path=path, kind="", raw_sha256="", error=str(e)))
+                continue
+            result = ExtractionResult(path=path, kind=kind, raw_sha256=sha)
+            results.append(result)
+
+            cached = self._cached(sha, kind)
+            if cached is not None:
+                result.cached = True
+                if kind == KIND_PDF:
+                    result.pages = list(cached)
+                else:
+                    result.blocks = list(cached)
+                continue
+
+            if pool is None:
+                self._extract_into(result)
+                continue
+            try:
+                if kind == KIND_PDF:
+                    futures: list[Future[Any]] = list(self._submit_pdf(pool, path))
+                else:
+                    futures = [pool.submit(normalize.extract_docx_blocks, path)]
+            except BrokenProcessPool:
+                self._discard_broken_pool()
+                pool = None
+                self._extract_into(result)
+                continue
+            except Exception as e:  # noqa: BLE001 - report per file (pypdf raises many types)
+                result.error = str(e)
+                continue
+            pending.append((result, futures))
+
+        for result, futures in pending:
+            try:
+                parts = [future.result() for future in futures]
+            except BrokenProcessPool:
+                self._discard_broken_pool()
+                self._extract_into(result)
+                continue
+            except Exception as e:  # noqa: BLE001 - report per file
+                result.error = str(e)
+                continue
+            if result.kind == KIND_PDF:
+                result.pages = [page for part in parts for page in part]
+                self._store(result.raw_sha256, KIND_PDF, result.pages)
+            else:
+                result.blocks = parts[0]
+                self._store(result.raw_sha256, KIND_DOCX, result.blocks)
+
+        return results
+
+    def _extract_into(self, result: ExtractionResult) -> None:
+        """Extract one file in-process into a bulk result."""
+        try:
+            if result.kind == KIND_PDF:
+                result.pages = normalize.extract_pdf_pages(result.path)
+                self._store(result.raw_sha256, KIND_PDF, result.pages)
+            else:
+                result.blocks = normalize.extract_docx_blocks(result.path)
+                self._store(result.raw_sha256, KIND_DOCX, result.blocks)
+        except Exception as e:  # noqa: BLE001 - report per file
+            result.error = str(e)
+
+
+# Global instance (lazy loaded)
+_service: ExtractionService | None = None
+_service_lock = threading.Lock()
+
+
+def get_extraction_service() -> ExtractionService:
+    """Get or create the shared extraction service."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = ExtractionService(
+                ExtractionCache(settings.cache_dir),
+                max_workers=settings.extraction_max_workers,
+                pages_per_task=settings.extraction_pages_per_task,
+            )
+        return _service
+
+
+def shutdown_extraction_service() -> None:
+    """Stop the shared service's worker processes, if started."""
+    with _service_lock:
+        service = _service
+    if service is not None:
+        service.shutdown()
+
+
+def extract_pdf_pages(pdf_path: Path, raw_sha256: str | None = None) -> list[str]:
+    """normalize.extract_pdf_pages through the shared, cached service."""
+    return get_extraction_service().extract_pdf_pages(pdf_path, raw_sha256)
+
+
+def extract_docx_blocks(docx_path: Path, raw_sha256: str | None = None) -> list[dict[str, Any]]:
+    """normalize.extract_docx_blocks through the shared, cached service."""
+    return get_extraction_service().extract_docx_blocks(docx_path, raw_sha256)
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import re
+import shutil
+import threading
 import time
+import uuid
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime
@@ -13,8 +18,10 @@ from xml.etree import ElementTree as ET
 
 import httpx
 
+from procedurewriter.metrics import HTTP_FETCH_DURATION, record_cache_lookup
 from procedurewriter.pipeline.hashing import sha256_text
 from procedurewriter.pipeline.io import write_bytes, write_json
+from procedurewriter.pipeline.profiler import profile_section
 
 
 def utc_now_iso() -> str:
@@ -31,6 +38,19 @@ class CachedResponse:
     cache_path: str
 
 
+@dataclass(frozen=True)
+class CachedDownload:
+    """A response body streamed to disk instead of held in memory."""
+
+    url: str
+    status_code: int
+    path: Path
+    sha256: str
+    size: int
+    fetched_at_utc: str
+    cache_path: str
+
+
 @dataclass(frozen=True)
 class PmcFullText:
     pmc_id: str
@@ -60,15 +80,21 @@ class CachedHttpClient:
         sleep_fn: Callable[[float], None] = time.sleep,
         user_agent: str = DEFAULT_USER_AGENT,
         strict_mode: bool = False,
+        offline: bool = False,
+        transport: httpx.BaseTransport | None = None,
     ) -> None:
         self._cache_dir = cache_dir
         self._timeout_s = timeout_s
         self._user_agent = user_agent
         self._strict_mode = strict_mode
+        # Offline clients serve only cached responses (replayed fixtures); a miss
+        # raises httpx.ConnectError instead of touching the network.
+        self._offline = offline
         self._client = httpx.Client(
             timeout=timeout_s,
             follow_redirects=True,
             headers={"User-Agent": user_agent},
+            transport=transport,
         )
         self._max_retries = max_retries
         self._backoff_s = backoff_s
@@ -87,7 +113,9 @@ class CachedHttpClient:
             "api.wiley.com": 1.0,
         }
         self._sleep_fn = sleep_fn
-        self._last_request_at_by_host: dict[str, float] = {}
+        # Next free request slot per host; shared by all threads using this client
+        self._next_slot_by_host: dict[str, float] = {}
+        self._throttle_lock = threading.Lock()
 
     def close(self) -> None:
         self._client.close()
@@ -100,12 +128,27 @@ class CachedHttpClient:
 
     def get(
         self, url: str, *, params: dict[str, Any] | None = None, headers: dict[str, str] | None = None
+    ) -> CachedResponse:
+        with profile_section("http:get", host=urlparse(url).netloc.lower()) as span:
+            resp = self._get(url, params=params, headers=headers, span=span)
+            span.update(status_code=resp.status_code, bytes=len(resp.content))
+            return resp
+
+    def _get(
+        self,
+        url: str,
+        *,
+        params: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+        span: dict[str, Any],
     ) -> CachedResponse:
         key = self._cache_key(url, params)
         content_path = self._cache_dir / "http" / f"{key}.bin"
         meta_path = self._cache_dir / "http" / f"{key}.json"
 
         if content_path.exists() and meta_path.exists():
+            record_cache_lookup("http", hit=True)
+            span["cache_hit"] = True
             meta = json.loads(meta_path.read_text(encoding="utf-8"))
             return CachedResponse(
                 url=meta["url"],
@@ -116,9 +159,14 @@ class CachedHttpClient:
                 cache_path=str(content_path),
             )
 
+        record_cache_lookup("http", hit=False)
+        span["cache_hit"] = False
+        if self._offline:
+            raise httpx.ConnectError(f"Offline: no cached response for {url}")
         host = urlparse(url).netloc.lower()
         last_err: Exception | None = None
         resp: httpx.Response | None = None
+        fetch_start = time.perf_counter()
         for attempt in range(self._max_retries + 1):
             self._throttle(host)
             try:
@@ -150,6 +198,7 @@ class CachedHttpClient:
             if last_err is not None:
                 raise last_err
             raise RuntimeError("HTTP request failed unexpectedly.")
+        HTTP_FETCH_DURATION.observe(time.perf_counter() - fetch_start, host=host)
 
         fetched_at = utc_now_iso()
         meta = {
@@ -170,17 +219,129 @@ class CachedHttpClient:
             cache_path=str(content_path),
         )
 
+    def download(
+        self,
+        url: str,
+        dest: Path,
+        *,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> CachedDownload:
+        """Stream a response body to ``dest`` without holding it in memory.
+
+        Shares the cache and per-host throttle with get(), so concurrent
+        downloads from several threads still respect host rate limits.
+        """
+        with profile_section("http:download", host=urlparse(url).netloc.lower()) as span:
+            result = self._download(url, dest, params=params, headers=headers, span=span)
+            span.update(status_code=result.status_code, bytes=result.size)
+            return result
+
+    def _download(
+        self,
+        url: str,
+        dest: Path,
+        *,
+        params: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+        span: dict[str, Any],
+    ) -> CachedDownload:
+        key = self._cache_key(url, params)
+        content_path = self._cache_dir / "http" / f"{key}.bin"
+        meta_path = self._cache_dir / "http" / f"{key}.json"
+        dest.parent.mkdir(parents=True, exist_ok=True)
+
+        if content_path.exists() and meta_path.exists():
+            record_cache_lookup("http", hit=True)
+            span["cache_hit"] = True
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            shutil.copyfile(content_path, dest)
+            digest, size = _sha256_and_size(dest)
+            return CachedDownload(
+                url=meta["url"],
+                status_code=int(meta["status_code"]),
+                path=dest,
+                sha256=digest,
+                size=size,
+                fetched_at_utc=str(meta["fetched_at_utc"]),
+                cache_path=str(content_path),
+            )
+
+        record_cache_lookup("http", hit=False)
+        span["cache_hit"] = False
+        if self._offline:
+            raise httpx.ConnectError(f"Offline: no cached response for {url}")
+        host = urlparse(url).netloc.lower()
+        content_path.parent.mkdir(parents=True, exist_ok=True)
+        part_path = content_path.with_name(f"{content_path.name}.{uuid.uuid4().hex}.part")
+        fetch_start = time.perf_counter()
+        try:
+            for attempt in range(self._max_retries + 1):
+                self._throttle(host)
+                try:
+                    with self._client.stream("GET", url, params=params, headers=headers) as resp:
+                        if resp.status_code in {429, 500, 502, 503, 504} and attempt < self._max_retries:
+                            delay = _retry_after_seconds(resp) or self._backoff_delay(attempt)
+                            self._sleep_fn(delay)
+                            continue
+                        resp.raise_for_status()
+                        hasher = hashlib.sha256()
+                        size = 0
+                        with part_path.open("wb") as out:
+                            for chunk in resp.iter_bytes():
+                                hasher.update(chunk)
+                                size += len(chunk)
+                                out.write(chunk)
+                        final_url = str(resp.url)
+                        status_code = resp.status_code
+                        resp_headers = dict(resp.headers)
+                except httpx.RequestError:
+                    if attempt >= self._max_retries:
+                        raise
+                    self._sleep_fn(self._backoff_delay(attempt))
+                    continue
+                break
+            else:
+                raise RuntimeError("HTTP request failed unexpectedly.")
+
+            HTTP_FETCH_DURATION.observe(time.perf_counter() - fetch_start, host=host)
+            os.replace(part_path, content_path)
+        finally:
+            part_path.unlink(missing_ok=True)
+
+        fetched_at = utc_now_iso()
+        write_json(
+            meta_path,
+            {
+                "url": final_url,
+                "status_code": status_code,
+                "headers": resp_headers,
+                "fetched_at_utc": fetched_at,
+            },
+        )
+        shutil.copyfile(content_path, dest)
+        return CachedDownload(
+            url=final_url,
+            status_code=status_code,
+            path=dest,
+            sha256=hasher.hexdigest(),
+            size=size,
+            fetched_at_utc=fetched_at,
+            cache_path=str(content_path),
+        )
+
     def _throttle(self, host: str) -> None:
         min_interval = self._per_host_min_interval_s.get(host)
         if not min_interval:
             return
-        now = time.monotonic()
-        last = self._last_request_at_by_host.get(host)
-        if last is not None:
-            sleep_s = min_interval - (now - last)
-            if sleep_s > 0:
-                self._sleep_fn(sleep_s)
-        self._last_request_at_by_host[host] = time.monotonic()
+        # Reserve the next slot under the lock, sleep outside it, so threads
+        # queue up one interval apart instead of all firing together
+        with self._throttle_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot_by_host.get(host, now))
+            self._next_slot_by_host[host] = slot + min_interval
+        if slot > now:
+            self._sleep_fn(slot - now)
 
     def _backoff_delay(self, attempt: int) -> float:
         # 0.6, 1.2, 2.4, 4.8... (capped)
@@ -188,6 +349,16 @@ class CachedHttpClient:
         return min(20.0, delay)
 
 
+def _sha256_and_size(path: Path) -> tuple[str, int]:
+    hasher = hashlib.sha256()
+    size = 0
+    with path.open("rb") as f:
+        while chunk := f.read(1024 * 1024):
+            hasher.update(chunk)
+            size += len(chunk)
+    return hasher.hexdigest(), size
+
+
 def _retry_after_seconds(resp: httpx.Response) -> float | None:
     raw = resp.headers.get("Retry-After")
     if not raw:
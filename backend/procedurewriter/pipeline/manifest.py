@@ -4,6 +4,7 @@ import json
 from pathlib import Path
 from typing import Any
 
+from procedurewriter.config_store import config_registry
 from procedurewriter.pipeline.hashing import sha256_bytes, sha256_file
 from procedurewriter.pipeline.io import write_text
 from procedurewriter.pipeline.types import SourceRecord
@@ -23,9 +24,13 @@ def write_manifest(
     evidence_report_path: Path | None = None,
     sources: list[SourceRecord],
     runtime: dict[str, Any],
+    author_guide_sha256: str | None = None,
+    allowlist_sha256: str | None = None,
 ) -> str:
-    author_guide_sha = sha256_file(author_guide_path)
-    allowlist_sha = sha256_file(allowlist_path)
+    # Runs pass the hashes of the config snapshots they used; otherwise the
+    # registry hashes the files, at most once per file version
+    author_guide_sha = author_guide_sha256 or config_registry.snapshot(author_guide_path).sha256
+    allowlist_sha = allowlist_sha256 or config_registry.snapshot(allowlist_path).sha256
 
     artifacts: dict[str, Any] = {
         "sources_jsonl": {"path": str(sources_jsonl_path), "sha256": sha256_file(sources_jsonl_path)},
@@ -103,3 +108,24 @@ def update_manifest_artifact(
     serialized = json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True) + "\n"
     write_text(manifest_path, serialized)
     return sha256_bytes(serialized.encode("utf-8"))
+
+
+def add_manifest_warning(manifest_path: Path, warning: str) -> str:
+    """Append a warning to an existing manifest.
+
+    Args:
+        manifest_path: Path to the existing manifest JSON file.
+        warning: Human-readable description of what the run could not produce.
+
+    Returns:
+        Updated manifest SHA256 hash.
+    """
+    if not manifest_path.exists():
+        raise FileNotFoundError(f"Manifest not found: {manifest_path}")
+
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    manifest.setdefault("warnings", []).append(warning)
+
+    serialized = json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True) + "\n"
+    write_text(manifest_path, serialized)
+    return sha256_bytes(serialized.encode("utf-8"))
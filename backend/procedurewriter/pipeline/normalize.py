@@ -4,10 +4,6 @@ import re
 from pathlib import Path
 from typing import Any
 
-from bs4 import BeautifulSoup
-from docx import Document
-from pypdf import PdfReader
-
 _whitespace_re = re.compile(r"[ \t]+")
 _many_newlines_re = re.compile(r"\n{3,}")
 
@@ -20,6 +16,8 @@ def _clean_text(text: str) -> str:
 
 
 def normalize_html(raw_html: bytes) -> str:
+    from bs4 import BeautifulSoup
+
     soup = BeautifulSoup(raw_html, "html.parser")
     for tag in soup(["script", "style", "noscript"]):
         tag.decompose()
@@ -30,6 +28,8 @@ def normalize_html(raw_html: bytes) -> str:
 
 
 def extract_pdf_pages(pdf_path: Path) -> list[str]:
+    from pypdf import PdfReader
+
     reader = PdfReader(str(pdf_path))
     pages: list[str] = []
     for page in reader.pages:
@@ -38,11 +38,31 @@ def extract_pdf_pages(pdf_path: Path) -> list[str]:
     return pages
 
 
+def count_pdf_pages(pdf_path: Path) -> int:
+    from pypdf import PdfReader
+
+    return len(PdfReader(str(pdf_path)).pages)
+
+
+def extract_pdf_page_range(pdf_path: Path, start: int, stop: int) -> list[str]:
+    """Extract pages [start, stop) of a PDF; the unit of work for extraction workers."""
+    from pypdf import PdfReader
+
+    reader = PdfReader(str(pdf_path))
+    pages: list[str] = []
+    for i in range(start, min(stop, len(reader.pages))):
+        t = reader.pages[i].extract_text() or ""
+        pages.append(_clean_text(t))
+    return pages
+
+
 def normalize_pdf_pages(pages: list[str]) -> str:
     return _clean_text("\n\n".join(p for p in pages if p))
 
 
 def extract_docx_blocks(docx_path: Path) -> list[dict[str, Any]]:
+    from docx import Document
+
     doc = Document(str(docx_path))
     blocks: list[dict[str, Any]] = []
     for i, p in enumerate(doc.paragraphs):
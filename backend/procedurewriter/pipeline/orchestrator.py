@@ -5,20 +5,30 @@ The orchestrator manages the execution of the full pipeline:
 04: EvidenceNotes → 05: Draft → 06: ClaimExtract → 07: Bind →
 08: Evals → 09: ReviseLoop → 10: PackageRelease
 
-Supports checkpoint/resume for crash recovery (R4-002).
+Supports checkpoint/resume for crash recovery (R4-002), and reuses stage
+outputs from earlier runs whose stage fingerprints match (see stage_store).
 """
 
 from __future__ import annotations
 
 import logging
-import pickle
+import time
 import uuid
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from procedurewriter.db import save_claim_system_records
+from procedurewriter.metrics import STAGE_DURATION
+from procedurewriter.pipeline.checkpoint_format import (
+    CheckpointError,
+    read_checkpoint,
+    write_checkpoint,
+)
 from procedurewriter.pipeline.events import EventType
+from procedurewriter.pipeline.evidence_note_cache import EvidenceNoteCache
+from procedurewriter.pipeline.profiler import profile_section
+from procedurewriter.pipeline.stage_store import StageResultStore
 from procedurewriter.pipeline.stages import (
     BindStage,
     BootstrapInput,
@@ -41,6 +51,14 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Claim-system records each stage produces, persisted when db_path is set
+_CLAIM_RECORD_FIELDS: dict[str, tuple[str, ...]] = {
+    "chunk": ("chunks",),
+    "claimextract": ("claims",),
+    "bind": ("links",),
+    "evals": ("issues", "gates"),
+}
+
 
 class PipelineError(Exception):
     """Exception raised when a pipeline stage fails."""
@@ -86,6 +104,9 @@ class PipelineOrchestrator:
     3. Handles revision loops
     4. Manages event emission
     5. Supports checkpoint/resume for crash recovery (R4-002)
+    6. Reuses outputs of fingerprinted stages from earlier runs
+    7. Persists the run's chunks, claims, links, issues and gates to the
+       database as their stages complete (when db_path is set)
     """
 
     def __init__(
@@ -93,6 +114,9 @@ class PipelineOrchestrator:
         base_dir: Path | None = None,
         emitter: "EventEmitter | None" = None,
         run_dir: Path | None = None,
+        stage_store: StageResultStore | None = None,
+        reuse_stage_results: bool = True,
+        db_path: Path | None = None,
     ) -> None:
         """Initialize the orchestrator.
 
@@ -100,10 +124,22 @@ class PipelineOrchestrator:
             base_dir: Base directory for run outputs
             emitter: Event emitter for progress updates
             run_dir: Existing run directory for resume (optional)
+            stage_store: Store for reusable stage outputs. Defaults to
+                         base_dir/stage_cache.
+            reuse_stage_results: Set False to execute every stage
+            db_path: Database to persist claim-system records into. Runs
+                     must then be given the run_id of their runs row.
         """
         self.base_dir = base_dir or Path("data")
         self.emitter = emitter
         self._run_dir = run_dir
+        self.db_path = db_path
+        # Config hashes recorded by bootstrap, for the fingerprints of the
+        # stages that depend on those configs
+        self._config_sha256: dict[str, str] = {}
+        self.stage_store: StageResultStore | None = None
+        if reuse_stage_results:
+            self.stage_store = stage_store or StageResultStore(self.base_dir / "stage_cache")
 
         # Initialize all 11 stages in order
         self.stages: list[PipelineStage[Any, Any]] = [
@@ -111,7 +147,8 @@ class PipelineOrchestrator:
             TermExpandStage(),
             RetrieveStage(),
             ChunkStage(),
-            EvidenceNotesStage(),
+            # Notes are shared across runs; the cache DB is created on first use
+            EvidenceNotesStage(note_cache=EvidenceNoteCache(self.base_dir / "cache")),
             DraftStage(),
             ClaimExtractStage(),
             BindStage(),
@@ -128,7 +165,7 @@ class PipelineOrchestrator:
 
     def _checkpoint_path(self, run_dir: Path, stage_name: str) -> Path:
         """Get path to checkpoint file for a stage."""
-        return self._get_checkpoint_dir(run_dir) / f"{stage_name}.pkl"
+        return self._get_checkpoint_dir(run_dir) / f"{stage_name}.ckpt"
 
     def _save_checkpoint(self, run_dir: Path, stage_name: str, output: Any) -> None:
         """Save stage output to disk for crash recovery.
@@ -140,17 +177,9 @@ class PipelineOrchestrator:
         """
         path = self._checkpoint_path(run_dir, stage_name)
         try:
-            with open(path, "wb") as f:
-                pickle.dump(
-                    {
-                        "output": output,
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                        "stage": stage_name,
-                    },
-                    f,
-                )
+            write_checkpoint(path, stage_name, output)
             logger.info(f"Checkpoint saved: {stage_name}")
-        except (OSError, pickle.PicklingError) as e:
+        except (OSError, CheckpointError) as e:
             logger.warning(f"Failed to save checkpoint for {stage_name}: {e}")
             # Non-fatal - continue without checkpoint
 
@@ -169,18 +198,17 @@ class PipelineOrchestrator:
             return None
 
         try:
-            with open(path, "rb") as f:
-                data = pickle.load(f)
-                # Validate checkpoint data
-                if data.get("stage") != stage_name:
-                    logger.warning(
-                        f"Checkpoint mismatch: expected {stage_name}, "
-                        f"got {data.get('stage')}"
-                    )
-                    return None
-                logger.info(f"Checkpoint loaded: {stage_name}")
-                return data["output"]
-        except (OSError, pickle.UnpicklingError, KeyError) as e:
+            checkpoint = read_checkpoint(path)
+            # Validate checkpoint data
+            if checkpoint.stage != stage_name:
+                logger.warning(
+                    f"Checkpoint mismatch: expected {stage_name}, got {checkpoint.stage}"
+                )
+                return None
+            output = checkpoint.output()
+            logger.info(f"Checkpoint loaded: {stage_name}")
+            return output
+        except CheckpointError as e:
             logger.warning(f"Corrupted checkpoint {stage_name}: {e}")
             # Delete corrupted file
             try:
@@ -193,6 +221,7 @@ class PipelineOrchestrator:
         self,
         procedure_title: str,
         resume_from: str | None = None,
+        run_id: str | None = None,
     ) -> "PackageReleaseOutput":
         """Run the full pipeline with optional checkpoint resume.
 
@@ -200,6 +229,8 @@ class PipelineOrchestrator:
             procedure_title: The title of the procedure to generate
             resume_from: Optional stage name to resume from (R4-002).
                         Requires run_dir to be set in constructor.
+            run_id: ID for the run (random by default). Required with
+                    db_path, as the stored records reference the runs table.
 
         Returns:
             The final PackageReleaseOutput
@@ -210,6 +241,8 @@ class PipelineOrchestrator:
         """
         if not procedure_title:
             raise ValueError("procedure_title is required")
+        if self.db_path is not None and run_id is None and resume_from is None:
+            raise ValueError("run_id is required to persist claim records")
 
         # Emit start event
         if self.emitter:
@@ -223,18 +256,20 @@ class PipelineOrchestrator:
         else:
             logger.info(f"Starting pipeline for: {procedure_title}")
 
-        return self._execute_stages(procedure_title, resume_from=resume_from)
+        return self._execute_stages(procedure_title, resume_from=resume_from, run_id=run_id)
 
     def _execute_stages(
         self,
         procedure_title: str,
         resume_from: str | None = None,
+        run_id: str | None = None,
     ) -> "PackageReleaseOutput":
         """Execute all stages in sequence with checkpoint support.
 
         Args:
             procedure_title: The procedure title
             resume_from: Optional stage name to resume from (R4-002)
+            run_id: ID for the run (random if None)
 
         Returns:
             The final output from PackageRelease stage
@@ -244,10 +279,11 @@ class PipelineOrchestrator:
             ValueError: If resume_from stage has no checkpoint
         """
         # Generate run ID or use existing from resume
-        run_id = uuid.uuid4().hex
+        run_id = run_id or uuid.uuid4().hex
 
         # Track procedure_title across stages (not part of all outputs)
         self._current_procedure_title = procedure_title
+        self._config_sha256 = {}
 
         # Start with Bootstrap input
         runs_dir = self.base_dir / "runs"
@@ -295,7 +331,36 @@ class PipelineOrchestrator:
                 if hasattr(current_input, "emitter"):
                     object.__setattr__(current_input, "emitter", self.emitter)
 
-                current_output = stage.execute(current_input)
+                stage_start = time.perf_counter()
+                fingerprint = (
+                    stage.fingerprint(current_input) if self.stage_store is not None else None
+                )
+                reused = self._reuse_stage_output(stage, fingerprint, current_input)
+                if reused is not None:
+                    current_output = reused
+                    STAGE_DURATION.observe(
+                        time.perf_counter() - stage_start, stage=stage.name, outcome="reused"
+                    )
+                else:
+                    try:
+                        with profile_section(f"stage:{stage.name}"):
+                            current_output = stage.execute(current_input)
+                    except Exception:
+                        STAGE_DURATION.observe(
+                            time.perf_counter() - stage_start, stage=stage.name, outcome="error"
+                        )
+                        raise
+                    STAGE_DURATION.observe(
+                        time.perf_counter() - stage_start, stage=stage.name, outcome="ok"
+                    )
+                    if (
+                        self.stage_store is not None
+                        and fingerprint is not None
+                        and stage.should_memoize(current_output)
+                    ):
+                        self.stage_store.put(stage.name, fingerprint, current_output)
+
+                self._save_claim_records(stage.name, current_output)
 
                 # Get run_dir from output if available
                 if hasattr(current_output, "run_dir"):
@@ -325,6 +390,44 @@ class PipelineOrchestrator:
         # Return the final PackageRelease output
         return current_output
 
+    def _save_claim_records(self, stage_name: str, output: Any) -> None:
+        """Persist the claim-system records a stage produced, in one batch."""
+        fields = _CLAIM_RECORD_FIELDS.get(stage_name)
+        if self.db_path is None or fields is None:
+            return
+        counts = save_claim_system_records(
+            self.db_path, **{name: getattr(output, name) for name in fields}
+        )
+        logger.info(f"Stored claim records for {stage_name}: {counts}")
+
+    def _reuse_stage_output(
+        self,
+        stage: PipelineStage[Any, Any],
+        fingerprint: str | None,
+        stage_input: Any,
+    ) -> Any | None:
+        """Return an earlier run's output for this stage input, or None to execute."""
+        if fingerprint is None or self.stage_store is None:
+            return None
+        stored = self.stage_store.get(stage.name, fingerprint)
+        if stored is None:
+            return None
+        try:
+            reused = stage.reuse(stored, stage_input)
+        except OSError as e:
+            logger.warning(f"Could not reuse stored output for {stage.name}: {e}")
+            return None
+        if reused is None:
+            return None
+
+        logger.info(f"Reusing stored output for stage {stage.name} ({fingerprint[:12]})")
+        if self.emitter:
+            self.emitter.emit(
+                EventType.PROGRESS,
+                {"message": f"Reusing unchanged {stage.name} output", "stage": stage.name},
+            )
+        return reused
+
     def _transform_output_to_input(
         self,
         stage_name: str,
@@ -360,6 +463,7 @@ class PipelineOrchestrator:
 
         # Map stage outputs to next stage inputs
         if stage_name == "bootstrap":
+            self._config_sha256 = dict(output.config_sha256)
             return TermExpandInput(
                 run_id=output.run_id,
                 run_dir=output.run_dir,
@@ -372,6 +476,7 @@ class PipelineOrchestrator:
                 run_dir=output.run_dir,
                 procedure_title=procedure_title,
                 search_terms=output.search_terms,
+                allowlist_sha256=self._config_sha256.get("allowlist"),
                 emitter=self.emitter,
             )
         elif stage_name == "retrieve":
@@ -396,6 +501,7 @@ class PipelineOrchestrator:
                 run_dir=output.run_dir,
                 procedure_title=procedure_title,
                 evidence_notes=output.evidence_notes,
+                author_guide_sha256=self._config_sha256.get("author_guide"),
                 emitter=self.emitter,
             )
         elif stage_name == "draft":
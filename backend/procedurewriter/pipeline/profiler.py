@@ -1,19 +1,48 @@
-"""Performance profiling utilities for the pipeline."""
+"""Performance profiling utilities for the pipeline.
+
+Timed sections form a span tree: each PipelineProfile.time() block records
+its parent span, start offset and thread, so a profile can be exported as a
+Chrome trace (chrome://tracing, Perfetto) via to_chrome_trace().
+
+The active profile is context-local, so concurrent runs in different worker
+threads each record into their own profile. run_trace() binds a profile for
+one run and writes ``trace.json`` when the run finishes.
+"""
 from __future__ import annotations
 
+import itertools
+import json
+import logging
+import os
+import threading
 import time
 from collections.abc import Generator
 from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any
 
+logger = logging.getLogger(__name__)
+
+TRACE_FILENAME = "trace.json"
+
 
 @dataclass
 class TimingEntry:
-    """A single timing measurement."""
+    """A single timing measurement (one span of the trace)."""
     name: str
     duration_ms: float
     metadata: dict[str, Any] = field(default_factory=dict)
+    start_ms: float = 0.0
+    span_id: int = 0
+    parent_id: int | None = None
+    thread_id: int = 0
+
+
+# Innermost open span in the current context (parent for new spans)
+_current_span: ContextVar[int | None] = ContextVar("profiler_current_span", default=None)
 
 
 @dataclass
@@ -21,20 +50,56 @@ class PipelineProfile:
     """Collects timing data for a pipeline run."""
     entries: list[TimingEntry] = field(default_factory=list)
     start_time: float = field(default_factory=time.time)
+    attributes: dict[str, Any] = field(default_factory=dict)
+    _origin: float = field(default_factory=time.perf_counter, repr=False)
+    _ids: itertools.count[int] = field(default_factory=lambda: itertools.count(1), repr=False)
+
+    def _offset_ms(self) -> float:
+        return (time.perf_counter() - self._origin) * 1000
 
     @contextmanager
-    def time(self, name: str, **metadata: Any) -> Generator[None, None, None]:
-        """Context manager to time a block of code."""
-        start = time.perf_counter()
+    def time(self, name: str, **metadata: Any) -> Generator[dict[str, Any], None, None]:
+        """Context manager to time a block of code.
+
+        Yields the span's metadata dict so callers can attach results
+        (token counts, bytes, cache hits) before the block ends.
+        """
+        span_id = next(self._ids)
+        parent_id = _current_span.get()
+        token = _current_span.set(span_id)
+        start_ms = self._offset_ms()
         try:
-            yield
+            yield metadata
+        except BaseException as e:
+            metadata.setdefault("error", type(e).__name__)
+            raise
         finally:
-            duration_ms = (time.perf_counter() - start) * 1000
-            self.entries.append(TimingEntry(name=name, duration_ms=duration_ms, metadata=metadata))
+            _current_span.reset(token)
+            self.entries.append(
+                TimingEntry(
+                    name=name,
+                    duration_ms=self._offset_ms() - start_ms,
+                    metadata=metadata,
+                    start_ms=start_ms,
+                    span_id=span_id,
+                    parent_id=parent_id,
+                    thread_id=threading.get_ident(),
+                )
+            )
 
     def add(self, name: str, duration_ms: float, **metadata: Any) -> None:
-        """Add a timing entry directly."""
-        self.entries.append(TimingEntry(name=name, duration_ms=duration_ms, metadata=metadata))
+        """Add a timing entry directly (ending now)."""
+        self.entries.append(
+            TimingEntry(
+                name=name,
+                duration_ms=duration_ms,
+                metadata=metadata,
+                start_ms=max(0.0, self._offset_ms() - duration_ms),
+                span_id=next(self._ids),
+                parent_id=_current_span.get(),
+                thread_id=threading.get_ident(),
+            )
+        )
 
     @property
     def total_ms(self) -> float:
@@ -70,6 +135,44 @@ class PipelineProfile:
             "by_category": {k: round(v, 2) for k, v in sorted(by_category.items(), key=lambda x: -x[1])},
         }
 
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Export spans in the Chrome Trace Event format ("X" complete events).
+
+        Timestamps are microseconds from the start of the profile. Span and
+        parent ids are kept in ``args`` so the tree survives thread hops.
+        """
+        pid = os.getpid()
+        events: list[dict[str, Any]] = []
+        for e in sorted(self.entries, key=lambda x: (x.start_ms, x.span_id)):
+            events.append(
+                {
+                    "name": e.name,
+                    "cat": e.name.split(":")[0],
+                    "ph": "X",
+                    "ts": round(e.start_ms * 1000, 1),
+                    "dur": round(e.duration_ms * 1000, 1),
+                    "pid": pid,
+                    "tid": e.thread_id,
+                    "args": {"span_id": e.span_id, "parent_id": e.parent_id, **e.metadata},
+                }
+            )
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "started_at_utc": datetime.fromtimestamp(self.start_time, UTC).isoformat(),
+                **self.attributes,
+            },
+        }
+
+    def write_trace(self, path: Path) -> None:
+        """Write the Chrome trace JSON to ``path``."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps(self.to_chrome_trace(), ensure_ascii=False, default=str),
+            encoding="utf-8",
+        )
+
     def print_summary(self) -> None:
         """Print a formatted summary to stdout."""
         summary = self.summary()
@@ -87,36 +190,68 @@ class PipelineProfile:
         print(f"{'='*60}\n")
 
 
-# Global profiler instance (can be None when profiling is disabled)
-_profiler: PipelineProfile | None = None
+# Context-local profiler instance (None when profiling is disabled)
+_profiler: ContextVar[PipelineProfile | None] = ContextVar("pipeline_profiler", default=None)
 
 
 def get_profiler() -> PipelineProfile | None:
     """Get the current profiler instance."""
-    return _profiler
+    return _profiler.get()
 
 
 def start_profiling() -> PipelineProfile:
     """Start a new profiling session."""
-    global _profiler
-    _profiler = PipelineProfile()
-    return _profiler
+    profile = PipelineProfile()
+    _profiler.set(profile)
+    return profile
 
 
 def stop_profiling() -> PipelineProfile | None:
     """Stop profiling and return the profile data."""
-    global _profiler
-    profile = _profiler
-    _profiler = None
+    profile = _profiler.get()
+    _profiler.set(None)
     return profile
 
 
 @contextmanager
-def profile_section(name: str, **metadata: Any) -> Generator[None, None, None]:
-    """Context manager to profile a section (no-op if profiling is disabled)."""
+def profile_section(name: str, **metadata: Any) -> Generator[dict[str, Any], None, None]:
+    """Context manager to profile a section (no-op if profiling is disabled).
+
+    Yields a metadata dict for attaching results; it is discarded when
+    profiling is disabled.
+    """
     profiler = get_profiler()
     if profiler is None:
-        yield
+        yield metadata
     else:
-        with profiler.time(name, **metadata):
-            yield
+        with profiler.time(name, **metadata) as span:
+            yield span
+
+
+@contextmanager
+def run_trace(path: Path, name: str = "run", **attributes: Any) -> Generator[PipelineProfile, None, None]:
+    """Profile one run and write its Chrome trace to ``path`` on exit.
+
+    All spans recorded in this context (including threads started with
+    asyncio.to_thread) nest under a root span called ``name``. The trace
+    is written even if the run fails.
+
+    Args:
+        path: Destination for the trace JSON (usually run_dir / TRACE_FILENAME)
+        name: Name of the root span
+        **attributes: Extra fields stored in the trace's ``otherData``
+
+    Yields:
+        The run's PipelineProfile
+    """
+    profile = PipelineProfile(attributes=attributes)
+    token = _profiler.set(profile)
+    try:
+        with profile.time(name):
+            yield profile
+    finally:
+        _profiler.reset(token)
+        try:
+            profile.write_trace(path)
+        except OSError as e:
+            logger.warning("Failed to write trace %s: %s", path, e)
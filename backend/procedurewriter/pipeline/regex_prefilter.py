@@ -0,0 +1,134 @@
+"""Literal prefilters for keyword regexes.
+
+Most classifier and validator patterns have the shape ``\\b(word|word|...)\\b``
+and match nowhere in a given text, yet a ``re.I`` pattern starting with
+``\\b`` makes the regex engine attempt a match at every position. A substring
+check on the casefolded text is an order of magnitude cheaper, so each
+pattern gets the literals at least one of which any match must contain; the
+regex only runs when one of them is present.
+
+The prefilter is a necessary condition, never a sufficient one: results are
+identical to running every pattern. Patterns whose required literals cannot
+be derived safely get no prefilter and always run.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+_META = frozenset("\\.^$*+?{}[]()|")
+_OPTIONAL = frozenset("*?{")
+
+
+def _class_end(source: str, start: int) -> int:
+    """Index of the ``]`` closing the character class opened at ``start``."""
+    i = start + 1
+    if i < len(source) and source[i] == "^":
+        i += 1
+    if i < len(source) and source[i] == "]":
+        i += 1
+    while i < len(source):
+        if source[i] == "\\":
+            i += 2
+            continue
+        if source[i] == "]":
+            return i
+        i += 1
+    return len(source)
+
+
+def _top_level(source: str) -> tuple[list[str], int]:
+    """Split ``source`` on top-level ``|`` and find where its first group closes."""
+    parts: list[str] = []
+    depth = 0
+    start = 0
+    first_group_end = -1
+    i = 0
+    while i < len(source):
+        ch = source[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if ch == "[":
+            i = _class_end(source, i) + 1
+            continue
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+            if depth == 0 and first_group_end < 0:
+                first_group_end = i
+        elif ch == "|" and depth == 0:
+            parts.append(source[start:i])
+            start = i + 1
+        i += 1
+    parts.append(source[start:])
+    return parts, first_group_end
+
+
+def _literal_prefix(alternative: str) -> str:
+    """Leading characters every match of ``alternative`` must start with."""
+    out: list[str] = []
+    i = 0
+    while i < len(alternative):
+        ch = alternative[i]
+        if ch == "\\":
+            # Escaped punctuation is a literal; \d, \s, \b etc. end the prefix
+            if i + 1 >= len(alternative) or alternative[i + 1].isalnum():
+                break
+            ch = alternative[i + 1]
+            i += 1
+        elif ch in _META:
+            break
+        if i + 1 < len(alternative) and alternative[i + 1] in _OPTIONAL:
+            break  # this character may occur zero times
+        out.append(ch)
+        i += 1
+    return "".join(out)
+
+
+def required_literals(pattern: re.Pattern[str]) -> tuple[str, ...] | None:
+    """
+    Casefolded literals at least one of which every match contains.
+
+    Returns:
+        The literals, or None if they cannot be derived (always run the regex)
+    """
+    if pattern.flags & re.VERBOSE:
+        return None
+    source = pattern.pattern
+    if source.startswith(r"\b"):
+        source = source[2:]
+    if source.endswith(r"\b") and not source.endswith(r"\\b"):
+        source = source[:-2]
+
+    alternatives, first_group_end = _top_level(source)
+    if (
+        len(alternatives) == 1
+        and source.startswith("(")
+        and not source.startswith("(?")
+        and first_group_end == len(source) - 1
+    ):
+        alternatives, _ = _top_level(source[1:-1])
+
+    literals = [_literal_prefix(alt).casefold() for alt in alternatives]
+    if not all(literals):
+        return None
+    return tuple(literals)
+
+
+@dataclass(frozen=True)
+class PrefilteredPattern:
+    """A regex paired with its literal prefilter."""
+
+    pattern: re.Pattern[str]
+    literals: tuple[str, ...] | None
+
+    @classmethod
+    def of(cls, pattern: re.Pattern[str]) -> PrefilteredPattern:
+        return cls(pattern, required_literals(pattern))
+
+    def may_match(self, folded_text: str) -> bool:
+        """False only if the pattern cannot match; ``folded_text`` is text.casefold()."""
+        return self.literals is None or any(lit in folded_text for lit in self.literals)
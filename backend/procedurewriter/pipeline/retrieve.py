@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 import math
 import re
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -10,7 +11,8 @@ from typing import Any
 logger = logging.getLogger(__name__)
 
 from procedurewriter.pipeline.io import write_json
-from procedurewriter.pipeline.types import Snippet, SourceRecord
+from procedurewriter.pipeline.snippet_table import SnippetTable
+from procedurewriter.pipeline.types import SnippetLike, SourceRecord
 
 _token_re = re.compile(r"[A-Za-zÀ-ÖØ-öø-ÿ0-9]+", re.UNICODE)
 
@@ -36,8 +38,14 @@ def chunk_text(text: str, *, max_chars: int = 900, overlap: int = 120) -> list[s
     return chunks
 
 
-def build_snippets(sources: list[SourceRecord]) -> list[Snippet]:
-    snippets: list[Snippet] = []
+def _snippet_texts(snippets: Sequence[SnippetLike]) -> Iterable[str]:
+    if isinstance(snippets, SnippetTable):
+        return snippets.texts()
+    return (s.text for s in snippets)
+
+
+def build_snippets(sources: list[SourceRecord]) -> SnippetTable:
+    snippets = SnippetTable()
     for src in sources:
         extra = src.extra or {}
         pages_json = extra.get("pages_json")
@@ -48,13 +56,7 @@ def build_snippets(sources: list[SourceRecord]) -> list[Snippet]:
                 t = str(p.get("text", "")).strip()
                 if not t:
                     continue
-                snippets.append(
-                    Snippet(
-                        source_id=src.source_id,
-                        text=t,
-                        location={"page": int(p.get("page", 0))},
-                    )
-                )
+                snippets.append(src.source_id, t, {"page": int(p.get("page", 0))})
             continue
 
         blocks_json = extra.get("blocks_json")
@@ -75,25 +77,25 @@ def build_snippets(sources: list[SourceRecord]) -> list[Snippet]:
                         loc["level"] = int(level)
                     except (ValueError, TypeError) as e:
                         logger.debug(f"Could not parse level '{level}': {e}")
-                snippets.append(Snippet(source_id=src.source_id, text=t, location=loc))
+                snippets.append(src.source_id, t, loc)
             continue
 
         normalized_text = Path(src.normalized_path).read_text(encoding="utf-8")
         for i, chunk in enumerate(chunk_text(normalized_text)):
-            snippets.append(Snippet(source_id=src.source_id, text=chunk, location={"chunk": i}))
+            snippets.append(src.source_id, chunk, {"chunk": i})
     return snippets
 
 
 def retrieve(
     query: str,
-    snippets: list[Snippet],
+    snippets: Sequence[SnippetLike],
     *,
     top_k: int = 8,
     prefer_embeddings: bool = False,
     embeddings_model: str = "text-embedding-3-small",
     run_index_dir: Path | None = None,
     openai_api_key: str | None = None,
-) -> list[Snippet]:
+) -> list[SnippetLike]:
     query = query.strip()
     if not query or not snippets:
         return []
@@ -115,11 +117,11 @@ def retrieve(
     return _retrieve_bm25(query, snippets, top_k=top_k)
 
 
-def _retrieve_bm25(query: str, snippets: list[Snippet], *, top_k: int) -> list[Snippet]:
-    docs_tokens = [_tokenize(s.text) for s in snippets]
+def _retrieve_bm25(query: str, snippets: Sequence[SnippetLike], *, top_k: int) -> list[SnippetLike]:
+    docs_tokens = [_tokenize(text) for text in _snippet_texts(snippets)]
     query_tokens = _tokenize(query)
     if not query_tokens:
-        return snippets[:top_k]
+        return list(snippets[:top_k])
 
     n_docs = len(docs_tokens)
     doc_lens = [len(toks) for toks in docs_tokens]
@@ -155,7 +157,7 @@ def _retrieve_bm25(query: str, snippets: list[Snippet], *, top_k: int) -> list[S
 
     scores.sort(key=lambda x: x[0], reverse=True)
     top = [snippets[i] for score, i in scores if score > 0.0][:top_k]
-    return top or snippets[:top_k]
+    return top or list(snippets[:top_k])
 
 
 @dataclass(frozen=True)
@@ -178,18 +180,18 @@ def _cosine(a: list[float], b: list[float]) -> float:
 
 def _retrieve_embeddings(
     query: str,
-    snippets: list[Snippet],
+    snippets: Sequence[SnippetLike],
     *,
     top_k: int,
     embeddings_model: str,
     run_index_dir: Path | None,
     openai_api_key: str,
-) -> list[Snippet]:
+) -> list[SnippetLike]:
     from openai import OpenAI
 
     client = OpenAI(api_key=openai_api_key, timeout=15.0, max_retries=0)
 
-    texts = [query] + [s.text[:2000] for s in snippets]
+    texts = [query] + [text[:2000] for text in _snippet_texts(snippets)]
     resp = client.embeddings.create(model=embeddings_model, input=texts)
     vectors = [d.embedding for d in resp.data]
     query_vec = vectors[0]
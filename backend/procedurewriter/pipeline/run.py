@@ -1,9 +1,16 @@
 from __future__ import annotations
 
 import contextlib
+import contextvars
 import logging
 import os
 import re
+import sqlite3
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -17,18 +24,25 @@ from procedurewriter.agents.meta_analysis.orchestrator import (
 from procedurewriter.agents.meta_analysis.screener_agent import PICOQuery
 from procedurewriter.agents.models import PipelineInput as AgentPipelineInput
 from procedurewriter.agents.models import SourceReference
-from procedurewriter.config_store import load_yaml
+from procedurewriter.config_store import UrlPrefixTrie, config_registry
 from procedurewriter.db import LibrarySourceRow
-from procedurewriter.llm import get_session_tracker, reset_session_tracker
+from procedurewriter.llm import get_session_tracker, reset_session_tracker, run_cost_scope, set_cost_stage
 from procedurewriter.llm.providers import get_llm_client
+from procedurewriter.metrics import STAGE_DURATION, record_cache_lookup
 from procedurewriter.pipeline.citations import validate_citations
-from procedurewriter.pipeline.docx_writer import (
-    write_evidence_review_docx,
-    write_meta_analysis_docx,
-    write_procedure_docx,
-    write_source_analysis_docx,
+from procedurewriter.pipeline.docx_render import (
+    DOCX_FILENAMES,
+    DOCX_META_ANALYSIS,
+    DOCX_PROCEDURE,
+    get_docx_render_service,
+    write_docx_inputs,
+)
+from procedurewriter.pipeline.events import (
+    EVENT_LOG_FILENAME,
+    EventType,
+    get_emitter,
+    remove_emitter,
 )
-from procedurewriter.pipeline.events import EventType, get_emitter, remove_emitter
 from procedurewriter.pipeline.evidence import (
     EvidenceGapAcknowledgementRequired,
     EvidencePolicyError,
@@ -39,20 +53,33 @@ from procedurewriter.pipeline.evidence_hierarchy import EvidenceHierarchy
 from procedurewriter.pipeline.fetcher import CachedHttpClient, fetch_pmc_full_text
 from procedurewriter.pipeline.io import write_json, write_jsonl, write_text
 from procedurewriter.pipeline.library_search import LibrarySearchProvider
-from procedurewriter.pipeline.manifest import update_manifest_artifact, write_manifest
-from procedurewriter.pipeline.normalize import normalize_html, normalize_pdf_pages, normalize_pubmed, extract_pdf_pages
+from procedurewriter.pipeline.manifest import (
+    add_manifest_warning,
+    update_manifest_artifact,
+    write_manifest,
+)
+from procedurewriter.pipeline.extraction import extract_pdf_pages
+from procedurewriter.pipeline.normalize import normalize_html, normalize_pdf_pages, normalize_pubmed
+from procedurewriter.pipeline.profiler import TRACE_FILENAME, profile_section, run_trace
 from procedurewriter.pipeline.international_sources import InternationalSourceAggregator
 from procedurewriter.pipeline.pubmed import PubMedClient
 from procedurewriter.pipeline.retrieve import build_snippets, retrieve
 from procedurewriter.pipeline.source_scoring import SourceScore, rank_sources
 from procedurewriter.pipeline.scopus_search import ScopusClient, ScopusArticle
-from procedurewriter.pipeline.sources import make_source_id, to_jsonl_record, write_source_files
+from procedurewriter.pipeline.sources import (
+    WrittenFiles,
+    make_source_id,
+    to_jsonl_record,
+    write_source_files,
+    write_source_files_from_path,
+)
 from procedurewriter.pipeline.structure_validator import (
     StructureValidationError,
     validate_required_sections,
 )
-from procedurewriter.pipeline.types import Snippet, SourceRecord
+from procedurewriter.pipeline.types import SnippetLike, SourceRecord
 from procedurewriter.pipeline.writer import write_procedure_markdown
+from procedurewriter.query_plans import lookup_query_plan, save_query_plan
 from procedurewriter.settings import Settings
 
 # Style profile imports
@@ -189,6 +216,36 @@ def _source_record_to_scoring_dict(source: SourceRecord) -> dict[str, Any]:
     }
 
 
+class _StageClock:
+    """Moves a run through its phases.
+
+    Starting a phase ends the previous one; whichever phase is open when the
+    run ends is closed by finish() with the run's outcome. Each phase is
+    timed into the stage-duration histogram, gets the LLM costs recorded
+    while it is open, and is a ``stage:<name>`` span in the run's trace.
+    """
+
+    def __init__(self) -> None:
+        self._stage: str | None = None
+        self._start = 0.0
+        self._span = contextlib.ExitStack()
+        self._span_metadata: dict[str, Any] = {}
+
+    def start(self, stage: str) -> None:
+        self.finish("ok")
+        self._stage = stage
+        self._start = time.perf_counter()
+        set_cost_stage(stage)
+        self._span_metadata = self._span.enter_context(profile_section(f"stage:{stage}"))
+
+    def finish(self, outcome: str) -> None:
+        if self._stage is not None:
+            STAGE_DURATION.observe(time.perf_counter() - self._start, stage=self._stage, outcome=outcome)
+            self._span_metadata["outcome"] = outcome
+            self._span.close()
+            self._stage = None
+
+
 def run_pipeline(
     *,
     run_id: str,
@@ -203,20 +260,71 @@ def run_pipeline(
     ncbi_api_key: str | None = None,
     serpapi_api_key: str | None = None,
 ) -> dict[str, str]:
+    # Costs and spans are tracked per run (context-local), so concurrent
+    # worker jobs never reset or pollute each other's totals or traces.
+    stage_clock = _StageClock()
+    with (
+        run_trace(settings.runs_dir / run_id / TRACE_FILENAME, run_id=run_id, procedure=procedure),
+        run_cost_scope(run_id, db_path=settings.db_path),
+    ):
+        try:
+            result = _run_pipeline(
+                run_id=run_id,
+                created_at_utc=created_at_utc,
+                procedure=procedure,
+                context=context,
+                settings=settings,
+                library_sources=library_sources,
+                openai_api_key=openai_api_key,
+                anthropic_api_key=anthropic_api_key,
+                ollama_base_url=ollama_base_url,
+                ncbi_api_key=ncbi_api_key,
+                serpapi_api_key=serpapi_api_key,
+                stage_clock=stage_clock,
+            )
+        except BaseException:
+            stage_clock.finish("error")
+            raise
+        stage_clock.finish("ok")
+        return result
+
+
+def _run_pipeline(
+    *,
+    run_id: str,
+    created_at_utc: str,
+    procedure: str,
+    context: str | None,
+    settings: Settings,
+    library_sources: list[LibrarySourceRow],
+    openai_api_key: str | None = None,
+    anthropic_api_key: str | None = None,
+    ollama_base_url: str | None = None,
+    ncbi_api_key: str | None = None,
+    serpapi_api_key: str | None = None,
+    stage_clock: _StageClock | None = None,
+) -> dict[str, str]:
+    stage_clock = stage_clock or _StageClock()
     run_dir = settings.runs_dir / run_id
     (run_dir / "raw").mkdir(parents=True, exist_ok=True)
     (run_dir / "normalized").mkdir(parents=True, exist_ok=True)
     (run_dir / "index").mkdir(parents=True, exist_ok=True)
 
-    # Get event emitter for SSE streaming
-    emitter = get_emitter(run_id)
+    # Get event emitter for SSE streaming; events are persisted to the run dir
+    # so any API process can stream them
+    emitter = get_emitter(run_id, log_path=run_dir / EVENT_LOG_FILENAME)
     emitter.emit(EventType.PROGRESS, {"message": "Pipeline starting", "stage": "init"})
 
     # Reset session cost tracker for this pipeline run
     reset_session_tracker()
-
-    author_guide = load_yaml(settings.author_guide_path)
-    allowlist = load_yaml(settings.allowlist_path)
+    stage_clock.start("retrieval")
+
+    # The run works from the config versions it started with; the manifest
+    # records their hashes
+    author_guide_snapshot = config_registry.snapshot(settings.author_guide_path)
+    allowlist_snapshot = config_registry.snapshot(settings.allowlist_path)
+    author_guide = author_guide_snapshot.to_dict()
+    allowlist = allowlist_snapshot.to_dict()
     evidence_hierarchy = EvidenceHierarchy.from_config(settings.evidence_hierarchy_path)
 
     # Compute evidence_policy EARLY - before _enforce_source_requirements is called
@@ -242,6 +350,7 @@ def run_pipeline(
         orchestrator_cost = 0.0
         orchestrator_stop_reason: str | None = None
         post_manifest_artifacts: list[tuple[str, Path]] = []
+        has_meta_analysis_report = False
         availability_stats: dict[str, int] = {
             "nice_candidates": 0,
             "cochrane_candidates": 0,
@@ -411,22 +520,33 @@ def run_pipeline(
                 evidence_hierarchy=evidence_hierarchy,
             )
 
+        # One query plan per run feeds both the PubMed and EMBASE searches
+        expanded_terms: list[str] = []
+        plan_queries: dict[str, list[str]] = {}
+        if not settings.dummy_mode:
+            expanded_terms, plan_queries = _resolve_query_plan(
+                settings=settings,
+                procedure=procedure,
+                context=context,
+                openai_api_key=openai_api_key,
+                anthropic_api_key=anthropic_api_key,
+                ollama_base_url=ollama_base_url,
+            )
+
         # Search PubMed (priority 100 - fallback for international research)
         if not settings.dummy_mode:
             emitter.emit(EventType.PROGRESS, {"message": "Searching PubMed for evidence", "stage": "pubmed_search"})
             source_n = _append_pubmed_search_results(
                 settings=settings,
                 procedure=procedure,
-                context=context,
                 run_dir=run_dir,
                 source_n=source_n,
                 sources=sources,
                 warnings=warnings,
                 evidence_hierarchy=evidence_hierarchy,
                 http=http,
-                openai_api_key=openai_api_key,
-                anthropic_api_key=anthropic_api_key,
-                ollama_base_url=ollama_base_url,
+                expanded_terms=expanded_terms,
+                queries=plan_queries["pubmed"],
                 ncbi_api_key=ncbi_api_key,
                 availability_stats=availability_stats,
             )
@@ -437,7 +557,6 @@ def run_pipeline(
             source_n = _append_scopus_search_results(
                 settings=settings,
                 procedure=procedure,
-                context=context,
                 run_dir=run_dir,
                 source_n=source_n,
                 sources=sources,
@@ -445,9 +564,7 @@ def run_pipeline(
                 evidence_hierarchy=evidence_hierarchy,
                 http=http,
                 availability_stats=availability_stats,
-                openai_api_key=openai_api_key,
-                anthropic_api_key=anthropic_api_key,
-                ollama_base_url=ollama_base_url,
+                queries=plan_queries["embase"],
             )
 
         if not sources:
@@ -506,6 +623,7 @@ def run_pipeline(
                         allow_non_wiley_doi=settings.wiley_tdm_allow_non_wiley_doi,
                         strict_mode=evidence_policy == "strict",
                         use_client=settings.wiley_tdm_use_client,
+                        max_concurrency=settings.wiley_tdm_max_concurrency,
                     )
                     if wiley_tdm_stats.get("failed"):
                         warnings.append(
@@ -606,6 +724,7 @@ def run_pipeline(
                 "message": f"Running automated meta-analysis on {len(quantitative_candidates)} studies",
                 "stage": "meta_analysis",
             })
+            stage_clock.start("meta_analysis")
 
             try:
                 ma_pico = PICOQuery(
@@ -637,14 +756,8 @@ def run_pipeline(
                 )
                 write_json(ma_report_path, synthesis_dict)
 
-                ma_docx_path = run_dir / "Procedure_MetaAnalysis.docx"
-                write_meta_analysis_docx(
-                    output=ma_result.output,
-                    output_path=ma_docx_path,
-                    run_id=run_id,
-                )
-
-                post_manifest_artifacts.append(("meta_analysis_docx", ma_docx_path))
+                # The report DOCX is rendered with the run's other documents
+                has_meta_analysis_report = True
                 post_manifest_artifacts.append(("synthesis_report", ma_report_path))
 
                 orchestrator_cost += ma_result.stats.cost_usd
@@ -676,6 +789,7 @@ def run_pipeline(
         )
 
         # Use multi-agent orchestrator when LLM is enabled
+        stage_clock.start("write")
         if settings.use_llm and not settings.dummy_mode:
             # Emit scored sources info (scoring already done above)
             emitter.emit(EventType.SOURCES_FOUND, {
@@ -789,6 +903,7 @@ def run_pipeline(
             style_profile = StyleProfile.from_db_dict(style_profile_data)
 
         if style_profile and settings.use_llm and not settings.dummy_mode:
+            stage_clock.start("style")
             style_outline = _author_guide_outline(author_guide) if isinstance(author_guide, dict) else None
             style_strict_mode = evidence_policy == "strict"
             try:
@@ -875,6 +990,7 @@ def run_pipeline(
                 )
 
                 emitter.emit(EventType.PROGRESS, {"message": "Verifying evidence", "stage": "verification"})
+                stage_clock.start("verification")
 
                 source_contents: dict[str, str] = {}
                 for src in sources:
@@ -965,6 +1081,7 @@ def run_pipeline(
                     "Fix evidence gaps or lower min_verification_score in author_guide.yaml."
                 )
 
+        stage_clock.start("manifest")
         runtime: dict[str, Any] = {
             "dummy_mode": settings.dummy_mode,
             "use_llm": settings.use_llm,
@@ -999,6 +1116,8 @@ def run_pipeline(
             evidence_report_path=evidence_report_path,
             sources=sources,
             runtime=runtime,
+            author_guide_sha256=author_guide_snapshot.sha256,
+            allowlist_sha256=allowlist_snapshot.sha256,
         )
 
         for artifact_key, artifact_path in post_manifest_artifacts:
@@ -1022,49 +1141,36 @@ def run_pipeline(
             else:
                 quality_score = 5
 
-        docx_path = run_dir / "Procedure.docx"
-        write_procedure_docx(
-            markdown_text=final_md,
-            sources=sources,
-            output_path=docx_path,
-            run_id=run_id,
-            manifest_hash=manifest_hash,
-            template_path=settings.docx_template_path,
-            quality_score=quality_score,
-        )
-
         # ---------------------------------------------------------------------
-        # VERBOSE DOCUMENTATION: Source Analysis & Evidence Review
+        # DOCUMENTS: procedure, meta-analysis report, source analysis and
+        # evidence review, rendered in parallel (or on first download if lazy)
         # ---------------------------------------------------------------------
-        # Generate source analysis DOCX (explains how sources were found/scored)
-        source_analysis_path = run_dir / "source_analysis.docx"
-        write_source_analysis_docx(
-            sources=sources,
-            procedure=procedure,
+        stage_clock.start("documents")
+        docx_path = run_dir / DOCX_FILENAMES[DOCX_PROCEDURE]
+        docx_kinds = write_docx_inputs(
+            run_dir,
             run_id=run_id,
-            output_path=source_analysis_path,
-            search_terms=None,  # Terms not preserved in scope - sources contain metadata
-        )
-        update_manifest_artifact(
-            manifest_path=manifest_path,
-            artifact_key="source_analysis_docx",
-            artifact_path=source_analysis_path,
-        )
-
-        # Generate evidence review DOCX (explains claim verification)
-        evidence_review_path = run_dir / "evidence_review.docx"
-        write_evidence_review_docx(
-            evidence_report=evidence,
-            sources=sources,
             procedure=procedure,
-            run_id=run_id,
-            output_path=evidence_review_path,
-        )
-        update_manifest_artifact(
-            manifest_path=manifest_path,
-            artifact_key="evidence_review_docx",
-            artifact_path=evidence_review_path,
+            markdown_text=final_md,
+            sources=sources,
+            evidence_report=evidence,
+            manifest_hash=manifest_hash,
+            quality_score=quality_score,
+            template_path=settings.docx_template_path,
+            meta_analysis=has_meta_analysis_report,
         )
+        if not settings.docx_render_lazy:
+            rendered = get_docx_render_service().render_all(
+                run_dir, docx_kinds, optional=frozenset({DOCX_META_ANALYSIS})
+            )
+            if has_meta_analysis_report and DOCX_META_ANALYSIS not in rendered:
+                # The run still succeeds without the optional report
+                docx_warning = "Meta-analysis report DOCX could not be rendered"
+                add_manifest_warning(manifest_path, docx_warning)
+                emitter.emit(
+                    EventType.PROGRESS,
+                    {"message": docx_warning, "stage": "documents", "warning": True},
+                )
 
         write_json(
             run_dir / "run_summary.json",
@@ -1107,12 +1213,12 @@ def _utc_now_iso() -> str:
 
 def _ensure_source_diversity(
     *,
-    retrieved: list[Snippet],
-    all_snippets: list[Snippet],
+    retrieved: list[SnippetLike],
+    all_snippets: Sequence[SnippetLike],
     sources: list[SourceRecord],
     min_international_ratio: float = 0.15,
     max_total: int = 80,
-) -> list[Snippet]:
+) -> list[SnippetLike]:
     """Ensure retrieved snippets include international sources.
 
     If international sources (PubMed, NICE, Cochrane) are underrepresented,
@@ -1520,10 +1626,6 @@ def _matches_procedure_keywords(
     return any(kw in search_text for kw in entry.keywords)
 
 
-def _is_allowed_url(url: str, *, prefixes: list[str]) -> bool:
-    return any(url.startswith(p) for p in prefixes)
-
-
 def _extract_html_title(raw_html: bytes) -> str | None:
     try:
         from bs4 import BeautifulSoup
@@ -1550,7 +1652,7 @@ def _append_seed_url_sources(
     context: str | None,
     stats: dict[str, int] | None = None,
 ) -> int:
-    prefixes = _allowlist_prefixes(allowlist)
+    prefixes = UrlPrefixTrie(_allowlist_prefixes(allowlist))
     all_entries = _seed_urls(allowlist)
     if not all_entries:
         return source_n
@@ -1580,7 +1682,7 @@ def _append_seed_url_sources(
     max_per_run = 8
     urls = [e.url for e in matching_entries]
     for url in urls[:max_per_run]:
-        if not _is_allowed_url(url, prefixes=prefixes):
+        if not prefixes.matches(url):
             warnings.append(f"Seed URL not allowed by allowlist: {url}")
             if stats is not None:
                 stats["blocked_urls"] += 1
@@ -2022,6 +2124,7 @@ def _expand_procedure_terms(
     context: str | None,
     llm: Any | None = None,
     model: str = "gpt-5.2",  # Gold-standard model for accurate term expansion
+    llm_terms: list[str] | None = None,
 ) -> list[str]:
     """Expand Danish procedure terms to include English equivalents.
 
@@ -2030,6 +2133,7 @@ def _expand_procedure_terms(
         context: Optional context
         llm: Optional LLM provider for live translation (recommended)
         model: Model name to use for LLM completion
+        llm_terms: English terms already suggested by the LLM; skips the call
 
     Returns:
         List of search terms including Danish original and English translations.
@@ -2047,11 +2151,11 @@ def _expand_procedure_terms(
     lowered = base.lower().strip()
 
     # Strategy 1: LLM-based translation (most accurate for medical terms)
-    if llm is not None:
+    if llm_terms is None and llm is not None:
         llm_terms = _get_llm_english_terms(procedure, context, llm, model)
-        if llm_terms:
-            logger.info("LLM suggested English terms: %s", llm_terms)
-            terms.extend(llm_terms)
+    if llm_terms:
+        logger.info("LLM suggested English terms: %s", llm_terms)
+        terms.extend(llm_terms)
 
     # Strategy 2: Static dictionary lookup (fallback)
     if lowered in _DA_EN_PHRASES:
@@ -2105,6 +2209,113 @@ def _build_pubmed_queries(*, expanded_terms: list[str]) -> list[str]:
     return out
 
 
+def _build_embase_queries(*, procedure: str, expanded_terms: list[str]) -> list[str]:
+    """Build Google Scholar (EMBASE-style) queries from the English expanded terms."""
+    # Use English terms for international search (skip Danish-only terms)
+    english_terms = [t for t in expanded_terms if not _is_danish_only(t)]
+    if not english_terms:
+        # Fallback: use all terms if no English detected
+        english_terms = expanded_terms[:2] if expanded_terms else [procedure]
+
+    # Build queries using English terms for better international coverage
+    queries: list[str] = []
+    for term in english_terms[:3]:  # Limit to top 3 terms
+        queries.extend([
+            f'"{term}" systematic review OR meta-analysis',
+            f'"{term}" clinical guidelines OR treatment protocol',
+            f'"{term}" randomized controlled trial',
+        ])
+    return queries
+
+
+def _term_expansion_llm(
+    settings: Settings,
+    openai_api_key: str | None,
+    anthropic_api_key: str | None,
+    ollama_base_url: str | None,
+) -> Any | None:
+    """Get an LLM for term expansion if available (improves search quality)."""
+    if not (settings.use_llm and (openai_api_key or anthropic_api_key)):
+        return None
+    try:
+        return get_llm_client(
+            provider=settings.llm_provider,
+            openai_api_key=openai_api_key,
+            anthropic_api_key=anthropic_api_key,
+            ollama_base_url=ollama_base_url or settings.ollama_base_url,
+        )
+    except Exception as e:
+        logger.warning("Could not create LLM for term expansion: %s", e)
+        return None
+
+
+def _resolve_query_plan(
+    *,
+    settings: Settings,
+    procedure: str,
+    context: str | None,
+    openai_api_key: str | None = None,
+    anthropic_api_key: str | None = None,
+    ollama_base_url: str | None = None,
+) -> tuple[list[str], dict[str, list[str]]]:
+    """Get expanded terms and per-provider queries, reusing a stored query plan.
+
+    A stored plan (see procedurewriter.query_plans) skips the LLM term
+    expansion that otherwise precedes every search. Plans are only stored when
+    the LLM contributed terms; static expansion is free to rebuild. Providers
+    missing from an admin-edited plan get queries built from its terms.
+
+    Returns:
+        (expanded_terms, {"pubmed": [...], "embase": [...]})
+    """
+    try:
+        plan = lookup_query_plan(settings.db_path, procedure, context)
+    except sqlite3.Error as e:
+        logger.warning("Query plan lookup failed: %s", e)
+        plan = None
+    record_cache_lookup("query_plan", hit=plan is not None)
+
+    if plan is not None:
+        logger.info("Reusing %s query plan %s for %s", plan.source, plan.plan_id, procedure)
+        expanded_terms = plan.expanded_terms
+        stored_queries = plan.queries
+        llm_terms: list[str] = []
+    else:
+        llm = _term_expansion_llm(settings, openai_api_key, anthropic_api_key, ollama_base_url)
+        llm_terms = (
+            _get_llm_english_terms(procedure, context, llm, settings.llm_model)
+            if llm is not None and procedure.strip()
+            else []
+        )
+        expanded_terms = _expand_procedure_terms(
+            procedure=procedure, context=context, llm_terms=llm_terms
+        )
+        stored_queries = {}
+
+    queries = {
+        "pubmed": stored_queries.get("pubmed")
+        or _build_pubmed_queries(expanded_terms=expanded_terms),
+        "embase": stored_queries.get("embase")
+        or _build_embase_queries(procedure=procedure, expanded_terms=expanded_terms),
+    }
+
+    if llm_terms:
+        try:
+            save_query_plan(
+                settings.db_path,
+                procedure=procedure,
+                context=context,
+                expanded_terms=expanded_terms,
+                queries=queries,
+                model=settings.llm_model,
+                ttl_s=settings.query_plan_ttl_s,
+            )
+        except sqlite3.Error as e:
+            logger.warning("Could not store query plan: %s", e)
+
+    return expanded_terms, queries
+
+
 def _collect_quantitative_candidates(sources: list[SourceRecord]) -> list[dict[str, Any]]:
     """Collect quantitative candidates for meta-analysis and evidence context."""
     candidates: list[dict[str, Any]] = []
@@ -2213,6 +2424,147 @@ def _looks_like_wiley_source(url: str | None, doi: str | None) -> bool:
     return False
 
 
+@dataclass(frozen=True)
+class _TdmFetched:
+    """A full-text PDF downloaded, extracted and written on a TDM worker thread."""
+
+    idx: int
+    doi: str
+    tdm_url: str
+    written: WrittenFiles
+
+
+def _tdm_candidates(
+    sources: list[SourceRecord], *, allow_non_wiley_doi: bool, stats: dict[str, int]
+) -> list[tuple[int, str]]:
+    """Pick (index, DOI) of the sources eligible for a TDM download, in order."""
+    candidates: list[tuple[int, str]] = []
+    seen_dois: set[str] = set()
+    for idx, src in enumerate(sources):
+        doi = (src.doi or _extract_doi_from_url(src.url) or "").strip()
+        if not doi:
+            stats["skipped_no_doi"] += 1
+            continue
+        if doi in seen_dois:
+            continue
+        if not allow_non_wiley_doi and not _looks_like_wiley_source(src.url, doi):
+            stats["skipped_non_wiley"] += 1
+            continue
+        if src.extra.get("tdm_fulltext"):
+            stats["skipped_already_tdm"] += 1
+            continue
+        seen_dois.add(doi)
+        candidates.append((idx, doi))
+    return candidates
+
+
+def _tdm_source_record(src: SourceRecord, *, doi: str, tdm_url: str, written: WrittenFiles) -> SourceRecord:
+    new_extra = dict(src.extra)
+    new_extra.update(
+        {
+            "tdm_fulltext": True,
+            "tdm_doi": doi,
+            "tdm_url": tdm_url,
+            "tdm_downloaded_at_utc": _utc_now_iso(),
+            "tdm_original_raw_path": src.raw_path,
+            "tdm_original_normalized_path": src.normalized_path,
+            "tdm_original_raw_sha256": src.raw_sha256,
+            "tdm_original_normalized_sha256": src.normalized_sha256,
+            "full_text_available": True,
+        }
+    )
+
+    tdm_note = "Wiley TDM full-text accessed under text-and-data mining terms. Do not redistribute full text."
+    terms_note = (src.terms_licence_note or "").strip()
+    if terms_note:
+        terms_note = f"{terms_note} {tdm_note}"
+    else:
+        terms_note = tdm_note
+
+    extraction_notes = (src.extraction_notes or "").strip()
+    if extraction_notes:
+        extraction_notes = f"{extraction_notes} | Wiley TDM full-text applied."
+    else:
+        extraction_notes = "Wiley TDM full-text applied."
+
+    return SourceRecord(
+        source_id=src.source_id,
+        fetched_at_utc=_utc_now_iso(),
+        kind=src.kind,
+        title=src.title,
+        year=src.year,
+        url=src.url,
+        doi=doi,
+        pmid=src.pmid,
+        raw_path=str(written.raw_path),
+        normalized_path=str(written.normalized_path),
+        raw_sha256=written.raw_sha256,
+        normalized_sha256=written.normalized_sha256,
+        extraction_notes=extraction_notes,
+        terms_licence_note=terms_note,
+        extra=new_extra,
+    )
+
+
+def _run_tdm_fetches(
+    *,
+    sources: list[SourceRecord],
+    candidates: list[tuple[int, str]],
+    fetch: Callable[[int, str], _TdmFetched],
+    max_downloads: int,
+    max_concurrency: int,
+    strict_mode: bool,
+    failure_message: str,
+    stats: dict[str, int],
+) -> None:
+    """Run TDM fetches on a bounded thread pool and update sources in place.
+
+    While one worker extracts a PDF the next ones are already downloading,
+    so the host's rate limit, not extraction, sets the pace. No more fetches
+    are started than could still fit under max_downloads; candidates left
+    over once it is reached are counted as truncated.
+    """
+    max_concurrency = max(1, max_concurrency)
+    pending = deque(candidates)
+    in_flight: dict[Future[_TdmFetched], str] = {}
+    with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="wiley-tdm") as pool:
+        try:
+            while pending or in_flight:
+                while (
+                    pending
+                    and len(in_flight) < max_concurrency
+                    and stats["downloaded"] + len(in_flight) < max_downloads
+                ):
+                    idx, doi = pending.popleft()
+                    stats["attempted"] += 1
+                    # Each task runs in its own copy of the caller's context so
+                    # the profiler's spans for it land in the run's trace
+                    ctx = contextvars.copy_context()
+                    in_flight[pool.submit(ctx.run, fetch, idx, doi)] = doi
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    doi = in_flight.pop(future)
+                    try:
+                        fetched = future.result()
+                    except Exception as e:
+                        stats["failed"] += 1
+                        logger.warning("%s for DOI %s: %s", failure_message, doi, e)
+                        if strict_mode:
+                            raise EvidencePolicyError(f"{failure_message} for DOI {doi}: {e}") from e
+                        continue
+                    sources[fetched.idx] = _tdm_source_record(
+                        sources[fetched.idx], doi=doi, tdm_url=fetched.tdm_url, written=fetched.written
+                    )
+                    stats["downloaded"] += 1
+        finally:
+            for future in in_flight:
+                future.cancel()
+    stats["truncated"] += len(pending)
+
+
 def _apply_wiley_tdm_fulltext(
     *,
     sources: list[SourceRecord],
@@ -2224,8 +2576,13 @@ def _apply_wiley_tdm_fulltext(
     allow_non_wiley_doi: bool,
     strict_mode: bool,
     use_client: bool = False,
+    max_concurrency: int = 4,
 ) -> dict[str, int]:
-    """Download full-text PDFs via Wiley TDM API and update sources in place."""
+    """Download full-text PDFs via Wiley TDM API and update sources in place.
+
+    PDFs are streamed to disk with several downloads in flight; the shared
+    HTTP client keeps requests to the Wiley host at its 1 req/sec limit.
+    """
     if use_client:
         return _apply_wiley_tdm_fulltext_client(
             sources=sources,
@@ -2234,6 +2591,7 @@ def _apply_wiley_tdm_fulltext(
             max_downloads=max_downloads,
             allow_non_wiley_doi=allow_non_wiley_doi,
             strict_mode=strict_mode,
+            max_concurrency=max_concurrency,
         )
 
     stats = {
@@ -2245,110 +2603,51 @@ def _apply_wiley_tdm_fulltext(
         "failed": 0,
         "truncated": 0,
     }
-    seen_dois: set[str] = set()
-    for idx, src in enumerate(sources):
-        if stats["downloaded"] >= max_downloads:
-            stats["truncated"] += 1
-            continue
-
-        doi = (src.doi or _extract_doi_from_url(src.url) or "").strip()
-        if not doi:
-            stats["skipped_no_doi"] += 1
-            continue
-        if doi in seen_dois:
-            continue
-        if not allow_non_wiley_doi and not _looks_like_wiley_source(src.url, doi):
-            stats["skipped_non_wiley"] += 1
-            continue
-        if src.extra.get("tdm_fulltext"):
-            stats["skipped_already_tdm"] += 1
-            continue
+    candidates = _tdm_candidates(sources, allow_non_wiley_doi=allow_non_wiley_doi, stats=stats)
 
-        stats["attempted"] += 1
+    def fetch(idx: int, doi: str) -> _TdmFetched:
+        src = sources[idx]
         tdm_url = f"{base_url.rstrip('/')}/articles/{quote(doi)}"
+        tmp_pdf_path = run_dir / "raw" / f"{src.source_id}_tdm.pdf"
         try:
-            resp = http.get(
+            download = http.download(
                 tdm_url,
+                tmp_pdf_path,
                 headers={
                     "Wiley-TDM-Client-Token": token,
                     "Accept": "application/pdf",
                 },
             )
-            status = int(getattr(resp, "status_code", 200))
-            if status != 200:
-                raise RuntimeError(f"Wiley TDM returned status {status}")
-            pdf_bytes = resp.content or b""
-            if not pdf_bytes:
+            if download.status_code != 200:
+                raise RuntimeError(f"Wiley TDM returned status {download.status_code}")
+            if not download.size:
                 raise RuntimeError("Wiley TDM returned empty PDF content.")
 
-            tmp_pdf_path = run_dir / "raw" / f"{src.source_id}_tdm.pdf"
-            tmp_pdf_path.parent.mkdir(parents=True, exist_ok=True)
-            tmp_pdf_path.write_bytes(pdf_bytes)
             pages = extract_pdf_pages(tmp_pdf_path)
-            normalized_text = normalize_pdf_pages(pages)
-            with contextlib.suppress(FileNotFoundError):
-                tmp_pdf_path.unlink()
-
-            written = write_source_files(
+            written = write_source_files_from_path(
                 run_dir=run_dir,
                 source_id=src.source_id,
-                raw_bytes=pdf_bytes,
+                raw_file=tmp_pdf_path,
                 raw_suffix=".pdf",
-                normalized_text=normalized_text,
-            )
-
-            new_extra = dict(src.extra)
-            new_extra.update(
-                {
-                    "tdm_fulltext": True,
-                    "tdm_doi": doi,
-                    "tdm_url": tdm_url,
-                    "tdm_downloaded_at_utc": _utc_now_iso(),
-                    "tdm_original_raw_path": src.raw_path,
-                    "tdm_original_normalized_path": src.normalized_path,
-                    "tdm_original_raw_sha256": src.raw_sha256,
-                    "tdm_original_normalized_sha256": src.normalized_sha256,
-                    "full_text_available": True,
-                }
+                normalized_text=normalize_pdf_pages(pages),
+                move=True,
+                raw_sha256=download.sha256,
             )
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                tmp_pdf_path.unlink()
+        return _TdmFetched(idx=idx, doi=doi, tdm_url=tdm_url, written=written)
 
-            tdm_note = "Wiley TDM full-text accessed under text-and-data mining terms. Do not redistribute full text."
-            terms_note = (src.terms_licence_note or "").strip()
-            if terms_note:
-                terms_note = f"{terms_note} {tdm_note}"
-            else:
-                terms_note = tdm_note
-
-            extraction_notes = (src.extraction_notes or "").strip()
-            if extraction_notes:
-                extraction_notes = f"{extraction_notes} | Wiley TDM full-text applied."
-            else:
-                extraction_notes = "Wiley TDM full-text applied."
-
-            sources[idx] = SourceRecord(
-                source_id=src.source_id,
-                fetched_at_utc=_utc_now_iso(),
-                kind=src.kind,
-                title=src.title,
-                year=src.year,
-                url=src.url,
-                doi=doi,
-                pmid=src.pmid,
-                raw_path=str(written.raw_path),
-                normalized_path=str(written.normalized_path),
-                raw_sha256=written.raw_sha256,
-                normalized_sha256=written.normalized_sha256,
-                extraction_notes=extraction_notes,
-                terms_licence_note=terms_note,
-                extra=new_extra,
-            )
-            stats["downloaded"] += 1
-            seen_dois.add(doi)
-        except Exception as e:
-            stats["failed"] += 1
-            if strict_mode:
-                raise EvidencePolicyError(f"Wiley TDM download failed for DOI {doi}: {e}") from e
-
+    _run_tdm_fetches(
+        sources=sources,
+        candidates=candidates,
+        fetch=fetch,
+        max_downloads=max_downloads,
+        max_concurrency=max_concurrency,
+        strict_mode=strict_mode,
+        failure_message="Wiley TDM download failed",
+        stats=stats,
+    )
     return stats
 
 
@@ -2360,8 +2659,13 @@ def _apply_wiley_tdm_fulltext_client(
     max_downloads: int,
     allow_non_wiley_doi: bool,
     strict_mode: bool,
+    max_concurrency: int = 4,
 ) -> dict[str, int]:
-    """Download full-text PDFs via the Wiley TDM client when available."""
+    """Download full-text PDFs via the Wiley TDM client when available.
+
+    The client is not known to be thread-safe, so its downloads run one at
+    a time; extraction of finished PDFs overlaps with the next download.
+    """
     stats = {
         "attempted": 0,
         "downloaded": 0,
@@ -2380,111 +2684,38 @@ def _apply_wiley_tdm_fulltext_client(
 
     download_dir = run_dir / "tdm_downloads"
     tdm = TDMClient(api_token=token, download_dir=download_dir)
-    seen_dois: set[str] = set()
-
-    for idx, src in enumerate(sources):
-        if stats["downloaded"] >= max_downloads:
-            stats["truncated"] += 1
-            continue
+    client_lock = threading.Lock()
+    candidates = _tdm_candidates(sources, allow_non_wiley_doi=allow_non_wiley_doi, stats=stats)
 
-        doi = (src.doi or _extract_doi_from_url(src.url) or "").strip()
-        if not doi:
-            stats["skipped_no_doi"] += 1
-            continue
-        if doi in seen_dois:
-            continue
-        if not allow_non_wiley_doi and not _looks_like_wiley_source(src.url, doi):
-            stats["skipped_non_wiley"] += 1
-            continue
-        if src.extra.get("tdm_fulltext"):
-            stats["skipped_already_tdm"] += 1
-            continue
-
-        stats["attempted"] += 1
-        result = tdm.download_pdf(doi)
+    def fetch(idx: int, doi: str) -> _TdmFetched:
+        with client_lock:
+            result = tdm.download_pdf(doi)
         status = getattr(result, "status", None)
         pdf_path = getattr(result, "path", None)
+        if status not in {DownloadStatus.SUCCESS, DownloadStatus.EXISTING_FILE} or not pdf_path:
+            detail = getattr(result, "comment", None)
+            raise RuntimeError(f"{status} {detail or ''}".strip())
 
-        if status in {DownloadStatus.SUCCESS, DownloadStatus.EXISTING_FILE} and pdf_path:
-            try:
-                pdf_bytes = Path(pdf_path).read_bytes()
-            except Exception as e:  # noqa: BLE001
-                stats["failed"] += 1
-                if strict_mode:
-                    raise EvidencePolicyError(
-                        f"Wiley TDM client failed to read PDF for DOI {doi}: {e}"
-                    ) from e
-                continue
-
-            pages = extract_pdf_pages(Path(pdf_path))
-            normalized_text = normalize_pdf_pages(pages)
-
-            written = write_source_files(
-                run_dir=run_dir,
-                source_id=src.source_id,
-                raw_bytes=pdf_bytes,
-                raw_suffix=".pdf",
-                normalized_text=normalized_text,
-            )
-
-            new_extra = dict(src.extra)
-            new_extra.update(
-                {
-                    "tdm_fulltext": True,
-                    "tdm_doi": doi,
-                    "tdm_url": str(pdf_path),
-                    "tdm_downloaded_at_utc": _utc_now_iso(),
-                    "tdm_original_raw_path": src.raw_path,
-                    "tdm_original_normalized_path": src.normalized_path,
-                    "tdm_original_raw_sha256": src.raw_sha256,
-                    "tdm_original_normalized_sha256": src.normalized_sha256,
-                    "full_text_available": True,
-                }
-            )
-
-            tdm_note = (
-                "Wiley TDM full-text accessed under text-and-data mining terms. "
-                "Do not redistribute full text."
-            )
-            terms_note = (src.terms_licence_note or "").strip()
-            if terms_note:
-                terms_note = f"{terms_note} {tdm_note}"
-            else:
-                terms_note = tdm_note
-
-            extraction_notes = (src.extraction_notes or "").strip()
-            if extraction_notes:
-                extraction_notes = f"{extraction_notes} | Wiley TDM full-text applied."
-            else:
-                extraction_notes = "Wiley TDM full-text applied."
-
-            sources[idx] = SourceRecord(
-                source_id=src.source_id,
-                fetched_at_utc=_utc_now_iso(),
-                kind=src.kind,
-                title=src.title,
-                year=src.year,
-                url=src.url,
-                doi=doi,
-                pmid=src.pmid,
-                raw_path=str(written.raw_path),
-                normalized_path=str(written.normalized_path),
-                raw_sha256=written.raw_sha256,
-                normalized_sha256=written.normalized_sha256,
-                extraction_notes=extraction_notes,
-                terms_licence_note=terms_note,
-                extra=new_extra,
-            )
-            stats["downloaded"] += 1
-            seen_dois.add(doi)
-        else:
-            stats["failed"] += 1
-            if strict_mode:
-                detail = getattr(result, "comment", None)
-                raise EvidencePolicyError(
-                    f"Wiley TDM client failed for DOI {doi}: {status} {detail or ''}".strip()
-                )
+        pages = extract_pdf_pages(Path(pdf_path))
+        written = write_source_files_from_path(
+            run_dir=run_dir,
+            source_id=sources[idx].source_id,
+            raw_file=Path(pdf_path),
+            raw_suffix=".pdf",
+            normalized_text=normalize_pdf_pages(pages),
+        )
+        return _TdmFetched(idx=idx, doi=doi, tdm_url=str(pdf_path), written=written)
 
+    _run_tdm_fetches(
+        sources=sources,
+        candidates=candidates,
+        fetch=fetch,
+        max_downloads=max_downloads,
+        max_concurrency=max_concurrency,
+        strict_mode=strict_mode,
+        failure_message="Wiley TDM client failed",
+        stats=stats,
+    )
     return stats
 
 
@@ -2604,20 +2835,18 @@ def _append_pubmed_search_results(
     *,
     settings: Settings,
     procedure: str,
-    context: str | None,
     run_dir: Path,
     source_n: int,
     sources: list[SourceRecord],
     warnings: list[str],
     evidence_hierarchy: EvidenceHierarchy,
     http: CachedHttpClient,
-    openai_api_key: str | None,
-    anthropic_api_key: str | None,
-    ollama_base_url: str | None,
+    expanded_terms: list[str],
+    queries: list[str],
     ncbi_api_key: str | None,
     availability_stats: dict[str, int] | None,
 ) -> int:
-    """Search PubMed and append results to sources."""
+    """Search PubMed with the run's query plan and append results to sources."""
     pubmed = PubMedClient(
         http,
         tool=settings.ncbi_tool,
@@ -2625,26 +2854,6 @@ def _append_pubmed_search_results(
         api_key=ncbi_api_key or settings.ncbi_api_key,
     )
 
-    # Get LLM for term expansion if available (improves search quality)
-    term_expansion_llm = None
-    if settings.use_llm and (openai_api_key or anthropic_api_key):
-        try:
-            term_expansion_llm = get_llm_client(
-                provider=settings.llm_provider,
-                openai_api_key=openai_api_key,
-                anthropic_api_key=anthropic_api_key,
-                ollama_base_url=ollama_base_url or settings.ollama_base_url,
-            )
-        except Exception as e:
-            logger.warning("Could not create LLM for term expansion: %s", e)
-
-    expanded_terms = _expand_procedure_terms(
-        procedure=procedure,
-        context=context,
-        llm=term_expansion_llm,
-        model=settings.llm_model,
-    )
-    queries = _build_pubmed_queries(expanded_terms=expanded_terms)
     candidates: list[dict[str, Any]] = []
     seen_pmids: set[str] = set()
     pubmed_warnings: list[str] = []
@@ -2813,7 +3022,6 @@ def _append_scopus_search_results(
     *,
     settings: Settings,
     procedure: str,
-    context: str | None,
     run_dir: Path,
     source_n: int,
     sources: list[SourceRecord],
@@ -2821,9 +3029,7 @@ def _append_scopus_search_results(
     evidence_hierarchy: EvidenceHierarchy,
     http: CachedHttpClient,
     availability_stats: dict[str, int] | None,
-    openai_api_key: str | None = None,
-    anthropic_api_key: str | None = None,
-    ollama_base_url: str | None = None,
+    queries: list[str],
 ) -> int:
     """Search for EMBASE-like content via SerpAPI Google Scholar.
 
@@ -2851,42 +3057,7 @@ def _append_scopus_search_results(
     embase_warnings: list[str] = []
     seen_urls: set[str] = set()
 
-    # Expand Danish procedure terms to English for international search
-    term_expansion_llm = None
-    if settings.use_llm and (openai_api_key or anthropic_api_key):
-        try:
-            term_expansion_llm = get_llm_client(
-                provider=settings.llm_provider,
-                openai_api_key=openai_api_key,
-                anthropic_api_key=anthropic_api_key,
-                ollama_base_url=ollama_base_url or settings.ollama_base_url,
-            )
-        except Exception as e:
-            logger.warning("Could not create LLM for EMBASE term expansion: %s", e)
-
-    expanded_terms = _expand_procedure_terms(
-        procedure=procedure,
-        context=context,
-        llm=term_expansion_llm,
-        model=settings.llm_model,
-    )
-
-    # Use English terms for international search (skip Danish-only terms)
-    english_terms = [t for t in expanded_terms if not _is_danish_only(t)]
-    if not english_terms:
-        # Fallback: use all terms if no English detected
-        english_terms = expanded_terms[:2] if expanded_terms else [procedure]
-
-    logger.info("EMBASE search using terms: %s", english_terms)
-
-    # Build queries using English terms for better international coverage
-    queries: list[str] = []
-    for term in english_terms[:3]:  # Limit to top 3 terms
-        queries.extend([
-            f'"{term}" systematic review OR meta-analysis',
-            f'"{term}" clinical guidelines OR treatment protocol',
-            f'"{term}" randomized controlled trial',
-        ])
+    logger.info("EMBASE search using queries: %s", queries)
     
     results: list[dict[str, Any]] = []
     
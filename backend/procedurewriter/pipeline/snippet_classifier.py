@@ -11,6 +11,8 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Pattern
 
+from procedurewriter.pipeline.regex_prefilter import PrefilteredPattern
+
 
 class SnippetType(Enum):
     """Classification types for medical procedure content."""
@@ -108,6 +110,12 @@ class SnippetClassifier:
             SnippetType.EQUIPMENT: EQUIPMENT_PATTERNS,
             SnippetType.EVIDENCE: EVIDENCE_PATTERNS,
         }
+        # Most patterns match nowhere in a snippet; a substring check on the
+        # casefolded text skips them without running the regex
+        self._prefiltered: dict[SnippetType, list[PrefilteredPattern]] = {
+            snippet_type: [PrefilteredPattern.of(p) for p in patterns]
+            for snippet_type, patterns in self._pattern_map.items()
+        }
 
     def classify(self, text: str, source_id: str | None = None) -> ClassifiedSnippet:
         """Classify a single snippet.
@@ -120,12 +128,13 @@ class SnippetClassifier:
             ClassifiedSnippet with type and confidence
         """
         scores: dict[SnippetType, int] = {}
+        folded = text.casefold()
 
-        for snippet_type, patterns in self._pattern_map.items():
+        for snippet_type, patterns in self._prefiltered.items():
             score = 0
-            for pattern in patterns:
-                matches = pattern.findall(text)
-                score += len(matches)
+            for prefiltered in patterns:
+                if prefiltered.may_match(folded):
+                    score += len(prefiltered.pattern.findall(text))
             scores[snippet_type] = score
 
         # Find the type with highest score
@@ -0,0 +1,263 @@
+"""Columnar snippet storage.
+
+A run over a large library produces hundreds of thousands of snippets. As
+Snippet objects each one costs a dataclass, a text string and a location
+dict; with several runs in parallel that dominates worker memory.
+SnippetTable keeps the same data in parallel arrays: one shared text buffer
+with start/end offsets, a source index into a list of distinct source IDs,
+and the location packed into integer columns. Rows are materialized as
+SnippetView objects only when accessed, so retrieval and evidence
+reporting create views for the handful of snippets they return.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, overload
+
+from procedurewriter.pipeline.types import Snippet, SnippetLike
+
+# Location shapes produced by build_snippets; anything else is kept as a dict
+_LOC_KEYS = ("page", "block", "chunk")
+_LOC_OTHER = -1
+_NO_KIND = -1
+_NO_LEVEL = -(2**31)
+
+
+class _Columns:
+    """Column storage shared by a table and every slice and view of it."""
+
+    __slots__ = (
+        "source_ids",
+        "source_index",
+        "source_idx",
+        "starts",
+        "ends",
+        "loc_key",
+        "loc_value",
+        "kinds",
+        "kind_index",
+        "kind_idx",
+        "level",
+        "other_locations",
+        "buffer",
+        "pending",
+        "length",
+    )
+
+    def __init__(self) -> None:
+        self.source_ids: list[str] = []
+        self.source_index: dict[str, int] = {}
+        self.source_idx = array("i")
+        self.starts = array("q")
+        self.ends = array("q")
+        self.loc_key = array("b")
+        self.loc_value = array("q")
+        self.kinds: list[str] = []
+        self.kind_index: dict[str, int] = {}
+        self.kind_idx = array("i")
+        self.level = array("i")
+        self.other_locations: dict[int, dict[str, Any]] = {}
+        self.buffer = ""
+        self.pending: list[str] = []
+        self.length = 0
+
+    def text_buffer(self) -> str:
+        # Appends are collected and joined on first read, so building a
+        # table never re-copies the buffer per row
+        if self.pending:
+            self.buffer += "".join(self.pending)
+            self.pending.clear()
+        return self.buffer
+
+    def location(self, row: int) -> dict[str, Any]:
+        key = self.loc_key[row]
+        if key == _LOC_OTHER:
+            return dict(self.other_locations[row])
+        loc: dict[str, Any] = {_LOC_KEYS[key]: self.loc_value[row]}
+        kind = self.kind_idx[row]
+        if kind != _NO_KIND:
+            loc["kind"] = self.kinds[kind]
+        level = self.level[row]
+        if level != _NO_LEVEL:
+            loc["level"] = level
+        return loc
+
+
+def _pack_location(location: dict[str, Any]) -> tuple[int, int, str | None, int] | None:
+    """Pack a build_snippets location into (key, value, kind, level), or None."""
+    for key_idx, key in enumerate(_LOC_KEYS):
+        if key not in location:
+            continue
+        value = location[key]
+        kind = location.get("kind")
+        level = location.get("level")
+        allowed = {key} | ({"kind", "level"} if key == "block" else set())
+        if (
+            set(location) <= allowed
+            and type(value) is int
+            and -(2**63) <= value < 2**63
+            and (kind is None or type(kind) is str)
+            and (level is None or (type(level) is int and _NO_LEVEL < level < 2**31))
+        ):
+            return key_idx, value, kind, _NO_LEVEL if level is None else level
+        return None
+    return None
+
+
+class SnippetView:
+    """Read-only view of one table row; duck-types Snippet."""
+
+    __slots__ = ("_cols", "_row")
+
+    def __init__(self, cols: _Columns, row: int) -> None:
+        self._cols = cols
+        self._row = row
+
+    @property
+    def source_id(self) -> str:
+        return self._cols.source_ids[self._cols.source_idx[self._row]]
+
+    @property
+    def text(self) -> str:
+        cols = self._cols
+        return cols.text_buffer()[cols.starts[self._row] : cols.ends[self._row]]
+
+    @property
+    def location(self) -> dict[str, Any]:
+        return self._cols.location(self._row)
+
+    def to_snippet(self) -> Snippet:
+        """Copy the row out as a standalone Snippet."""
+        return Snippet(source_id=self.source_id, text=self.text, location=self.location)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (SnippetView, Snippet)):
+            return NotImplemented
+        return (self.source_id, self.text, self.location) == (
+            other.source_id,
+            other.text,
+            other.location,
+        )
+
+    __hash__ = None  # type: ignore[assignment]  # Matches Snippet, whose location is a dict
+
+    def __repr__(self) -> str:
+        return f"SnippetView(source_id={self.source_id!r}, location={self.location!r})"
+
+
+class SnippetTable(Sequence[SnippetView]):
+    """Append-only columnar table of snippets.
+
+    Indexing returns a SnippetView; slicing returns a table sharing the same
+    columns (no row data is copied).
+    """
+
+    def __init__(self, snippets: Iterable[SnippetLike] = ()) -> None:
+        """Create a table, optionally filled from existing snippets."""
+        self._cols = _Columns()
+        self._start = 0
+        self._stop: int | None = None  # None: tracks the end of the columns
+        for s in snippets:
+            self.append(s.source_id, s.text, s.location)
+
+    @classmethod
+    def _slice_of(cls, cols: _Columns, start: int, stop: int) -> SnippetTable:
+        table = cls.__new__(cls)
+        table._cols = cols
+        table._start = start
+        table._stop = stop
+        return table
+
+    def append(self, source_id: str, text: str, location: dict[str, Any]) -> None:
+        """Add a row.
+
+        Raises:
+            ValueError: If the table is a slice of another table
+        """
+        if self._stop is not None:
+            raise ValueError("Cannot append to a slice of a SnippetTable")
+        cols = self._cols
+        row = len(cols.starts)
+
+        source = cols.source_index.get(source_id)
+        if source is None:
+            source = cols.source_index[source_id] = len(cols.source_ids)
+            cols.source_ids.append(source_id)
+        cols.source_idx.append(source)
+
+        cols.starts.append(cols.length)
+        cols.pending.append(text)
+        cols.length += len(text)
+        cols.ends.append(cols.length)
+
+        packed = _pack_location(location)
+        if packed is None:
+            cols.loc_key.append(_LOC_OTHER)
+            cols.loc_value.append(0)
+            cols.kind_idx.append(_NO_KIND)
+            cols.level.append(_NO_LEVEL)
+            cols.other_locations[row] = dict(location)
+            return
+
+        key, value, kind, level = packed
+        cols.loc_key.append(key)
+        cols.loc_value.append(value)
+        if kind is None:
+            cols.kind_idx.append(_NO_KIND)
+        else:
+            kind_pos = cols.kind_index.get(kind)
+            if kind_pos is None:
+                kind_pos = cols.kind_index[kind] = len(cols.kinds)
+                cols.kinds.append(kind)
+            cols.kind_idx.append(kind_pos)
+        cols.level.append(level)
+
+    def _bounds(self) -> tuple[int, int]:
+        return self._start, len(self._cols.starts) if self._stop is None else self._stop
+
+    def __len__(self) -> int:
+        start, stop = self._bounds()
+        return stop - start
+
+    @overload
+    def __getitem__(self, index: int) -> SnippetView: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> SnippetTable: ...
+
+    def __getitem__(self, index: int | slice) -> SnippetView | SnippetTable:
+        start, stop = self._bounds()
+        if isinstance(index, slice):
+            sub_start, sub_stop, step = index.indices(stop - start)
+            if step != 1:
+                raise ValueError("SnippetTable slices must be contiguous")
+            return SnippetTable._slice_of(self._cols, start + sub_start, start + max(sub_start, sub_stop))
+        if index < 0:
+            index += stop - start
+        if not 0 <= index < stop - start:
+            raise IndexError("SnippetTable index out of range")
+        return SnippetView(self._cols, start + index)
+
+    def __iter__(self) -> Iterator[SnippetView]:
+        cols = self._cols
+        start, stop = self._bounds()
+        return (SnippetView(cols, row) for row in range(start, stop))
+
+    def texts(self) -> Iterator[str]:
+        """Iterate row texts without creating views."""
+        cols = self._cols
+        buffer = cols.text_buffer()
+        start, stop = self._bounds()
+        for row in range(start, stop):
+            yield buffer[cols.starts[row] : cols.ends[row]]
+
+    def rows_by_source(self) -> dict[str, list[int]]:
+        """Row positions (relative to this table) grouped by source ID."""
+        cols = self._cols
+        start, stop = self._bounds()
+        grouped: dict[str, list[int]] = {}
+        for pos, source in enumerate(cols.source_idx[start:stop]):
+            grouped.setdefault(cols.source_ids[source], []).append(pos)
+        return grouped
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import shutil
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from procedurewriter.pipeline.hashing import sha256_bytes, sha256_text
+from procedurewriter.pipeline.hashing import sha256_bytes, sha256_file, sha256_text
 from procedurewriter.pipeline.io import write_bytes, write_text
 from procedurewriter.pipeline.types import SourceRecord
 
@@ -41,6 +42,38 @@ def write_source_files(
     )
 
 
+def write_source_files_from_path(
+    *,
+    run_dir: Path,
+    source_id: str,
+    raw_file: Path,
+    raw_suffix: str,
+    normalized_text: str,
+    move: bool = False,
+    raw_sha256: str | None = None,
+) -> WrittenFiles:
+    """Like write_source_files, for a raw file already on disk (e.g. a streamed PDF).
+
+    The raw file is copied (or moved) into place without being read into memory.
+    Pass raw_sha256 when it is already known (e.g. hashed while streaming) to
+    skip reading the file again.
+    """
+    raw_path = run_dir / "raw" / f"{source_id}{raw_suffix}"
+    norm_path = run_dir / "normalized" / f"{source_id}.txt"
+    raw_path.parent.mkdir(parents=True, exist_ok=True)
+    if move:
+        raw_file.replace(raw_path)
+    else:
+        shutil.copyfile(raw_file, raw_path)
+    write_text(norm_path, normalized_text)
+    return WrittenFiles(
+        raw_path=raw_path,
+        normalized_path=norm_path,
+        raw_sha256=raw_sha256 or sha256_file(raw_path),
+        normalized_sha256=sha256_text(normalized_text),
+    )
+
+
 def to_jsonl_record(src: SourceRecord) -> dict[str, Any]:
     return {
         "source_id": src.source_id,
@@ -0,0 +1,90 @@
+"""Shared store of stage outputs keyed by stage fingerprint.
+
+Checkpoints are per run and only serve explicit resume. The stage store is
+shared by all runs under a base directory: when a stage declares a
+fingerprint (see PipelineStage.fingerprint) and an earlier run produced an
+output under the same fingerprint, the orchestrator reuses it instead of
+executing the stage. Regenerating a procedure after a template tweak then
+reruns only the stages whose inputs changed.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from pathlib import Path
+from typing import Any
+
+from procedurewriter.pipeline.checkpoint_format import (
+    CheckpointError,
+    read_checkpoint,
+    write_checkpoint,
+)
+
+logger = logging.getLogger(__name__)
+
+# Retrieved literature changes over time; stored outputs older than this are
+# ignored so regular regeneration still picks up new sources
+DEFAULT_MAX_AGE_S = 7 * 24 * 3600
+
+
+class StageResultStore:
+    """File-backed store of stage outputs, one file per (stage, fingerprint)."""
+
+    def __init__(self, root: Path, max_age_s: float | None = DEFAULT_MAX_AGE_S) -> None:
+        """Initialize the store.
+
+        Args:
+            root: Directory for stored outputs (created on first write)
+            max_age_s: Ignore outputs stored longer ago than this; None keeps them forever
+        """
+        self.root = root
+        self.max_age_s = max_age_s
+
+    def _path(self, stage_name: str, fingerprint: str) -> Path:
+        return self.root / stage_name / f"{fingerprint}.ckpt"
+
+    def get(self, stage_name: str, fingerprint: str) -> Any | None:
+        """Return the stored output for a fingerprint, or None if absent or stale."""
+        path = self._path(stage_name, fingerprint)
+        try:
+            if self.max_age_s is not None and time.time() - path.stat().st_mtime > self.max_age_s:
+                return None
+            checkpoint = read_checkpoint(path)
+            if (
+                checkpoint.stage != stage_name
+                or checkpoint.metadata.get("fingerprint") != fingerprint
+            ):
+                return None
+            return checkpoint.output()
+        except FileNotFoundError:
+            return None
+        except (OSError, CheckpointError) as e:
+            logger.warning(f"Ignoring unreadable stored output for {stage_name}: {e}")
+            return None
+
+    def put(self, stage_name: str, fingerprint: str, output: Any) -> None:
+        """Store an output; failures are logged and otherwise ignored."""
+        try:
+            # Written atomically so concurrent runs never read a partial file
+            write_checkpoint(
+                self._path(stage_name, fingerprint),
+                stage_name,
+                output,
+                metadata={"fingerprint": fingerprint},
+            )
+        except (OSError, CheckpointError) as e:
+            logger.warning(f"Failed to store output for {stage_name}: {e}")
+
+    def invalidate(self, stage_name: str | None = None) -> int:
+        """Delete stored outputs for one stage (or all stages).
+
+        Returns:
+            Number of outputs deleted
+        """
+        pattern = f"{stage_name}/*.ckpt" if stage_name else "*/*.ckpt"
+        deleted = 0
+        for path in self.root.glob(pattern):
+            path.unlink(missing_ok=True)
+            deleted += 1
+        return deleted
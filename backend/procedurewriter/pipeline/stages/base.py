@@ -3,18 +3,30 @@
 Each stage in the pipeline inherits from PipelineStage and implements:
 - name: A string identifier for logging and events
 - execute(): The stage's main logic
+
+Stages whose work is expensive and deterministic in their inputs can also
+override fingerprint() so the orchestrator reuses an earlier run's output.
 """
 
 from __future__ import annotations
 
+import dataclasses
+import hashlib
+import json
 from abc import ABC, abstractmethod
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, TypeVar, cast
 
 # Input and Output type variables for type-safe stage composition
 InputT = TypeVar("InputT")
 OutputT = TypeVar("OutputT")
 
 
+def compute_fingerprint(*parts: Any) -> str:
+    """Hash JSON-serializable parts (Paths and other objects via str) into a fingerprint."""
+    serialized = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
 class PipelineStage(ABC, Generic[InputT, OutputT]):
     """Abstract base class for all pipeline stages.
 
@@ -43,3 +55,46 @@ class PipelineStage(ABC, Generic[InputT, OutputT]):
             The stage output
         """
         ...
+
+    def fingerprint(self, input_data: InputT) -> str | None:
+        """Fingerprint of everything the output depends on.
+
+        Stages returning a fingerprint have their output stored and reused by
+        later runs with the same fingerprint. Run-specific values (run_id,
+        run_dir, emitter) must be left out. The default, None, always executes.
+
+        Args:
+            input_data: The stage input
+
+        Returns:
+            A fingerprint from compute_fingerprint(), or None
+        """
+        return None
+
+    def should_memoize(self, output: OutputT) -> bool:
+        """Whether an output is complete enough to reuse in later runs."""
+        return True
+
+    def reuse(self, output: OutputT, input_data: InputT) -> OutputT | None:
+        """Adapt an output stored by an earlier run to this run.
+
+        The default points run_id/run_dir at the current run. Stages that
+        write files into the run directory must override this to carry them
+        over.
+
+        Args:
+            output: Output stored under a matching fingerprint
+            input_data: The current stage input
+
+        Returns:
+            The output to use, or None to execute the stage instead
+        """
+        if not dataclasses.is_dataclass(output) or isinstance(output, type):
+            return output
+        names = {f.name for f in dataclasses.fields(output)}
+        changes = {
+            name: getattr(input_data, name)
+            for name in ("run_id", "run_dir")
+            if name in names and hasattr(input_data, name)
+        }
+        return cast(OutputT, dataclasses.replace(output, **changes))
@@ -9,10 +9,11 @@ The Bootstrap stage prepares the run environment by:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from procedurewriter.config_store import config_registry
 from procedurewriter.llm.cost_tracker import reset_session_tracker
 from procedurewriter.pipeline.events import EventType
 from procedurewriter.pipeline.stages.base import PipelineStage
@@ -32,11 +33,7 @@ def load_yaml(path: Path | None) -> dict[str, Any] | None:
     """
     if path is None:
         return None
-
-    import yaml
-
-    with open(path, encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    return config_registry.snapshot(path).to_dict()
 
 
 @dataclass
@@ -60,6 +57,9 @@ class BootstrapOutput:
     author_guide: dict[str, Any] | None
     allowlist: dict[str, Any] | None
     evidence_hierarchy: Any  # EvidenceHierarchy or None
+    # sha256 of each config file loaded ("author_guide", "allowlist"), for
+    # the fingerprints of stages that depend on them
+    config_sha256: dict[str, str] = field(default_factory=dict)
 
 
 class BootstrapStage(PipelineStage[BootstrapInput, BootstrapOutput]):
@@ -119,6 +119,14 @@ class BootstrapStage(PipelineStage[BootstrapInput, BootstrapOutput]):
         # Load configuration files
         author_guide = load_yaml(input_data.author_guide_path)
         allowlist = load_yaml(input_data.allowlist_path)
+        config_sha256 = {
+            name: config_registry.snapshot(path).sha256
+            for name, path in (
+                ("author_guide", input_data.author_guide_path),
+                ("allowlist", input_data.allowlist_path),
+            )
+            if path is not None
+        }
 
         # Evidence hierarchy is loaded differently (from its own class)
         evidence_hierarchy = None
@@ -135,4 +143,5 @@ class BootstrapStage(PipelineStage[BootstrapInput, BootstrapOutput]):
             author_guide=author_guide,
             allowlist=allowlist,
             evidence_hierarchy=evidence_hierarchy,
+            config_sha256=config_sha256,
         )
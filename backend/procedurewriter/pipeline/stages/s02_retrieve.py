@@ -11,14 +11,16 @@ Sources are downloaded to run_dir/raw/ for subsequent chunking.
 
 from __future__ import annotations
 
+import dataclasses
 import hashlib
 import logging
+import shutil
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from procedurewriter.pipeline.events import EventType
-from procedurewriter.pipeline.stages.base import PipelineStage
+from procedurewriter.pipeline.stages.base import PipelineStage, compute_fingerprint
 
 if TYPE_CHECKING:
     from procedurewriter.pipeline.events import EventEmitter
@@ -57,6 +59,7 @@ class RetrieveInput:
     search_terms: list[str]
     max_sources: int = 20
     timeout_seconds: int = 30  # R4-005: Configurable network timeout
+    allowlist_sha256: str | None = None  # Allowlist the sources are checked against
     emitter: EventEmitter | None = None
 
 
@@ -140,6 +143,45 @@ class RetrieveStage(PipelineStage[RetrieveInput, RetrieveOutput]):
             failed_sources=failed_sources,
         )
 
+    def fingerprint(self, input_data: RetrieveInput) -> str | None:
+        """Retrieval depends only on the title, search terms, source limit and allowlist."""
+        return compute_fingerprint(
+            self.name,
+            input_data.procedure_title,
+            input_data.search_terms,
+            input_data.max_sources,
+            input_data.allowlist_sha256,
+        )
+
+    def should_memoize(self, output: RetrieveOutput) -> bool:
+        """Empty retrievals are usually transient network failures."""
+        return bool(output.sources)
+
+    def reuse(self, output: RetrieveOutput, input_data: RetrieveInput) -> RetrieveOutput | None:
+        """Copy the earlier run's raw source files into this run."""
+        if not output.raw_content_dir.is_dir():
+            return None
+        raw_content_dir = input_data.run_dir / "raw"
+        shutil.copytree(output.raw_content_dir, raw_content_dir, dirs_exist_ok=True)
+        sources = [
+            dataclasses.replace(
+                source,
+                raw_content_path=(
+                    raw_content_dir / source.raw_content_path.name
+                    if source.raw_content_path is not None
+                    else None
+                ),
+            )
+            for source in output.sources
+        ]
+        return dataclasses.replace(
+            output,
+            run_id=input_data.run_id,
+            run_dir=input_data.run_dir,
+            sources=sources,
+            raw_content_dir=raw_content_dir,
+        )
+
     def _fetch_sources(
         self,
         search_terms: list[str],
@@ -9,6 +9,7 @@ The EvidenceNotes stage processes chunks using LLM:
 
 from __future__ import annotations
 
+import dataclasses
 import logging
 import time
 from dataclasses import dataclass, field
@@ -21,11 +22,13 @@ from pydantic import BaseModel, Field
 
 from procedurewriter.models.evidence import EvidenceChunk
 from procedurewriter.pipeline.events import EventType
-from procedurewriter.pipeline.stages.base import PipelineStage
+from procedurewriter.pipeline.evidence_note_cache import chunk_text_sha256
+from procedurewriter.pipeline.stages.base import PipelineStage, compute_fingerprint
 
 if TYPE_CHECKING:
     from procedurewriter.llm.providers import LLMProvider
     from procedurewriter.pipeline.events import EventEmitter
+    from procedurewriter.pipeline.evidence_note_cache import EvidenceNoteCache
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +47,10 @@ For each evidence chunk, create a concise clinical note that:
 Output a single, focused summary paragraph (2-4 sentences).
 Use professional medical terminology appropriate for Danish emergency medicine documentation."""
 
+# Part of the evidence-note cache key: bump whenever SYSTEM_PROMPT or the
+# user prompt in _generate_note changes so stale cached notes are not reused
+NOTE_PROMPT_VERSION = "1"
+
 
 @dataclass
 class EvidenceNote:
@@ -90,19 +97,27 @@ class EvidenceNotesOutput:
     chunks_processed: int = 0
     chunks_failed: int = 0
     failed_chunks: list[str] = field(default_factory=list)  # R4-009: Track which chunks failed
+    cache_hits: int = 0  # Notes reused from the cross-run note cache
 
 
 class EvidenceNotesStage(PipelineStage[EvidenceNotesInput, EvidenceNotesOutput]):
     """Stage 04: EvidenceNotes - Generate clinical notes from evidence chunks."""
 
-    def __init__(self, llm_client: "LLMProvider | None" = None) -> None:
+    def __init__(
+        self,
+        llm_client: LLMProvider | None = None,
+        note_cache: EvidenceNoteCache | None = None,
+    ) -> None:
         """Initialize the EvidenceNotes stage.
 
         Args:
             llm_client: Optional LLM client to use. If not provided,
                         will be created on first use.
+            note_cache: Optional cross-run note cache. Without one, every
+                        chunk is summarised by the LLM.
         """
         self._llm_client = llm_client
+        self._note_cache = note_cache
 
     @property
     def name(self) -> str:
@@ -143,42 +158,57 @@ class EvidenceNotesStage(PipelineStage[EvidenceNotesInput, EvidenceNotesOutput])
         chunks_processed = 0
         chunks_failed = 0
         failed_chunks: list[str] = []  # R4-009: Track failed chunk IDs
+        cache_hits = 0
 
         for i, chunk in enumerate(input_data.chunks):
-            # R4-008: Retry with exponential backoff for LLM timeout/failures
-            max_retries = 3
-            retry_delay = 1.0  # seconds
-
-            for attempt in range(max_retries):
-                try:
-                    # Generate note for this chunk
-                    note = self._generate_note(
-                        chunk=chunk,
-                        procedure_title=input_data.procedure_title,
-                        model=input_data.model,
-                    )
-                    notes.append(note)
-                    chunks_processed += 1
-                    break  # Success, exit retry loop
-
-                except (TimeoutError, ConnectionError) as e:
-                    # R4-008: Retryable errors - use exponential backoff
-                    if attempt < max_retries - 1:
-                        logger.warning(
-                            f"Retry {attempt + 1}/{max_retries} for chunk {chunk.id}: {e}"
+            cached = self._cached_note(chunk, input_data)
+            if cached is not None:
+                notes.append(cached)
+                chunks_processed += 1
+                cache_hits += 1
+            else:
+                # R4-008: Retry with exponential backoff for LLM timeout/failures
+                max_retries = 3
+                retry_delay = 1.0  # seconds
+
+                for attempt in range(max_retries):
+                    try:
+                        # Generate note for this chunk
+                        note = self._generate_note(
+                            chunk=chunk,
+                            procedure_title=input_data.procedure_title,
+                            model=input_data.model,
                         )
-                        time.sleep(retry_delay * (2 ** attempt))  # Exponential backoff
-                    else:
-                        logger.error(f"Failed after {max_retries} retries for chunk {chunk.id}: {e}")
+                        if self._note_cache is not None and note.summary:
+                            self._note_cache.set(
+                                chunk.text,
+                                input_data.procedure_title,
+                                NOTE_PROMPT_VERSION,
+                                input_data.model,
+                                note.summary,
+                            )
+                        notes.append(note)
+                        chunks_processed += 1
+                        break  # Success, exit retry loop
+
+                    except (TimeoutError, ConnectionError) as e:
+                        # R4-008: Retryable errors - use exponential backoff
+                        if attempt < max_retries - 1:
+                            logger.warning(
+                                f"Retry {attempt + 1}/{max_retries} for chunk {chunk.id}: {e}"
+                            )
+                            time.sleep(retry_delay * (2 ** attempt))  # Exponential backoff
+                        else:
+                            logger.error(f"Failed after {max_retries} retries for chunk {chunk.id}: {e}")
+                            chunks_failed += 1
+                            failed_chunks.append(str(chunk.id))  # R4-009
+
+                    except Exception as e:
+                        # Non-retryable error
+                        logger.warning(f"Error generating note for chunk {chunk.id}: {e}")
                         chunks_failed += 1
                         failed_chunks.append(str(chunk.id))  # R4-009
-
-                except Exception as e:
-                    # Non-retryable error
-                    logger.warning(f"Error generating note for chunk {chunk.id}: {e}")
-                    chunks_failed += 1
-                    failed_chunks.append(str(chunk.id))  # R4-009
-                    break
+                        break
 
             # Emit progress update
             if input_data.emitter is not None and (i + 1) % 5 == 0:
@@ -192,7 +222,7 @@ class EvidenceNotesStage(PipelineStage[EvidenceNotesInput, EvidenceNotesOutput])
 
         logger.info(
             f"Generated {len(notes)} notes from {chunks_processed} chunks "
-            f"({chunks_failed} failed)"
+            f"({chunks_failed} failed, {cache_hits} from cache)"
         )
 
         return EvidenceNotesOutput(
@@ -204,6 +234,60 @@ class EvidenceNotesStage(PipelineStage[EvidenceNotesInput, EvidenceNotesOutput])
             chunks_processed=chunks_processed,
             chunks_failed=chunks_failed,
             failed_chunks=failed_chunks,  # R4-009
+            cache_hits=cache_hits,
+        )
+
+    def fingerprint(self, input_data: EvidenceNotesInput) -> str | None:
+        """Notes depend on the chunk texts and sources, the title, model and prompt."""
+        return compute_fingerprint(
+            self.name,
+            input_data.procedure_title,
+            input_data.model,
+            NOTE_PROMPT_VERSION,
+            [
+                (
+                    chunk_text_sha256(chunk.text),
+                    chunk.metadata.get("source_title"),
+                    chunk.metadata.get("source_type"),
+                )
+                for chunk in input_data.chunks
+            ],
+        )
+
+    def should_memoize(self, output: EvidenceNotesOutput) -> bool:
+        """Only complete outputs: reuse maps notes to chunks by position."""
+        return output.chunks_failed == 0
+
+    def reuse(
+        self, output: EvidenceNotesOutput, input_data: EvidenceNotesInput
+    ) -> EvidenceNotesOutput | None:
+        """Point the stored notes at this run's chunks (same texts, new IDs)."""
+        if len(output.notes) != len(input_data.chunks):
+            return None
+        notes = [
+            dataclasses.replace(note, chunk_id=chunk.id)
+            for note, chunk in zip(output.notes, input_data.chunks, strict=True)
+        ]
+        return dataclasses.replace(
+            output, run_id=input_data.run_id, run_dir=input_data.run_dir, notes=notes
+        )
+
+    def _cached_note(
+        self, chunk: EvidenceChunk, input_data: EvidenceNotesInput
+    ) -> EvidenceNote | None:
+        """Return a note built from the cross-run cache, or None on a miss."""
+        if self._note_cache is None:
+            return None
+        summary = self._note_cache.get(
+            chunk.text, input_data.procedure_title, NOTE_PROMPT_VERSION, input_data.model
+        )
+        if summary is None:
+            return None
+        return EvidenceNote(
+            chunk_id=chunk.id,
+            summary=summary,
+            source_title=chunk.metadata.get("source_title", "Unknown source"),
+            source_type=chunk.metadata.get("source_type", "unclassified"),
         )
 
     def _generate_note(
@@ -9,6 +9,7 @@ The Draft stage produces structured procedure content:
 
 from __future__ import annotations
 
+import dataclasses
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -17,7 +18,7 @@ from uuid import UUID
 
 from procedurewriter.agents.models import SourceReference, WriterInput
 from procedurewriter.pipeline.events import EventType
-from procedurewriter.pipeline.stages.base import PipelineStage
+from procedurewriter.pipeline.stages.base import PipelineStage, compute_fingerprint
 
 if TYPE_CHECKING:
     from procedurewriter.agents.writer import WriterAgent
@@ -37,6 +38,10 @@ DEFAULT_OUTLINE = [
     "Dokumentation",
 ]
 
+# Part of the stage fingerprint: bump when the WriterAgent prompts change so
+# drafts stored by earlier runs are not reused
+DRAFT_PROMPT_VERSION = "1"
+
 
 @dataclass
 class EvidenceNoteRef:
@@ -69,6 +74,7 @@ class DraftInput:
     notes: list[EvidenceNoteRef]
     outline: list[str] | None = None
     style_guide: str | None = None
+    author_guide_sha256: str | None = None  # Author guide the outline/style come from
     emitter: "EventEmitter | None" = None
 
 
@@ -118,7 +124,7 @@ class DraftStage(PipelineStage[DraftInput, DraftOutput]):
             from procedurewriter.llm import get_llm_client
 
             llm_client = get_llm_client()
-            self._writer_agent = WriterAgent(llm_client=llm_client)
+            self._writer_agent = WriterAgent(llm=llm_client)
         return self._writer_agent
 
     def execute(self, input_data: DraftInput) -> DraftOutput:
@@ -217,6 +223,42 @@ class DraftStage(PipelineStage[DraftInput, DraftOutput]):
                 error=str(e),
             )
 
+    def fingerprint(self, input_data: DraftInput) -> str | None:
+        """The draft depends on the notes, title, outline, style guide and writer model.
+
+        Chunk IDs are run-specific and left out; the notes' content is what
+        the writer sees. Without a writer there is nothing to key on, so the
+        draft is not reused.
+        """
+        try:
+            writer = self._get_writer_agent()
+        except Exception as e:  # noqa: BLE001 - execute() reports it
+            logger.warning(f"No writer for draft fingerprint: {e}")
+            return None
+        return compute_fingerprint(
+            self.name,
+            DRAFT_PROMPT_VERSION,
+            writer.provider,
+            writer.model,
+            input_data.procedure_title,
+            input_data.outline or DEFAULT_OUTLINE,
+            input_data.style_guide,
+            input_data.author_guide_sha256,
+            [
+                (note.source_id, note.summary, note.source_title, note.source_type)
+                for note in input_data.notes
+            ],
+        )
+
+    def should_memoize(self, output: DraftOutput) -> bool:
+        """Failed drafts are retried by the next run."""
+        return output.success
+
+    def reuse(self, output: DraftOutput, input_data: DraftInput) -> DraftOutput | None:
+        """Write the stored draft into this run's directory."""
+        self._save_draft(input_data.run_dir, output.content_markdown)
+        return dataclasses.replace(output, run_id=input_data.run_id, run_dir=input_data.run_dir)
+
     def _notes_to_sources(
         self, notes: list[EvidenceNoteRef]
     ) -> list[SourceReference]:
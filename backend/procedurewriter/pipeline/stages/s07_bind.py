@@ -3,7 +3,8 @@
 The Bind stage creates traceability between claims and evidence:
 1. Receives claims from Stage 06 (ClaimExtract)
 2. Receives evidence chunks (from pipeline context)
-3. Uses keyword matching to find links (source_ref → source_id)
+3. Uses keyword matching to find links (source_ref → source_id), scoring
+   only chunks that share a keyword with the claim via an inverted index
 4. Creates ClaimEvidenceLink objects
 5. Outputs bound claims for Evals stage
 """
@@ -16,6 +17,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from procedurewriter.claims.binder import ChunkKeywordIndex
 from procedurewriter.models.claims import Claim
 from procedurewriter.models.evidence import (
     BindingType,
@@ -26,6 +28,8 @@ from procedurewriter.pipeline.events import EventType
 from procedurewriter.pipeline.stages.base import PipelineStage
 
 if TYPE_CHECKING:
+    from uuid import UUID
+
     from procedurewriter.pipeline.events import EventEmitter
 
 logger = logging.getLogger(__name__)
@@ -33,6 +37,27 @@ logger = logging.getLogger(__name__)
 # Minimum keyword overlap ratio for binding
 MIN_KEYWORD_OVERLAP = 0.2
 
+_WORD_PATTERN = re.compile(r"\b[a-zA-Z0-9æøåÆØÅ]+\b")
+
+_STOPWORDS: frozenset[str] = frozenset({
+    "a", "an", "the", "is", "are", "was", "were", "be", "been",
+    "being", "have", "has", "had", "do", "does", "did", "will",
+    "would", "could", "should", "may", "might", "must", "shall",
+    "can", "to", "of", "in", "for", "on", "with", "at", "by",
+    "from", "as", "or", "and", "but", "if", "not", "no", "so",
+    "than", "too", "very", "just", "about", "into", "through",
+    "during", "before", "after", "above", "below", "between",
+    "under", "again", "further", "then", "once", "here", "there",
+    "when", "where", "why", "how", "all", "each", "few", "more",
+    "most", "other", "some", "such", "only", "own", "same",
+    "this", "that", "these", "those", "it", "its",
+    # Danish stopwords
+    "og", "i", "at", "er", "en", "af", "til", "på", "med", "som",
+    "det", "de", "den", "for", "ikke", "der", "var", "har", "kan",
+    "fra", "eller", "et", "om", "skal", "ved", "sig", "vil", "være",
+    "efter", "også", "nu", "når", "hans", "selv", "hen",
+})
+
 
 @dataclass
 class BindInput:
@@ -116,12 +141,27 @@ class BindStage(PipelineStage[BindInput, BindOutput]):
         # Build index of chunks by source_id
         chunks_by_source = self._build_chunk_index(input_data.chunks)
 
+        # Extract chunk keywords once and index them by keyword
+        keyword_index = ChunkKeywordIndex(
+            [self._extract_keywords(chunk.text) for chunk in input_data.chunks]
+        )
+        keywords_by_chunk_id = {
+            chunk.id: keywords
+            for chunk, keywords in zip(input_data.chunks, keyword_index.chunk_keywords, strict=True)
+        }
+
         # Bind each claim
         all_links: list[ClaimEvidenceLink] = []
         unbound_claims: list[Claim] = []
 
         for claim in input_data.claims:
-            links = self._bind_claim(claim, input_data.chunks, chunks_by_source)
+            links = self._bind_claim(
+                claim,
+                input_data.chunks,
+                chunks_by_source,
+                keyword_index,
+                keywords_by_chunk_id,
+            )
 
             if links:
                 all_links.extend(links)
@@ -167,30 +207,48 @@ class BindStage(PipelineStage[BindInput, BindOutput]):
         claim: Claim,
         all_chunks: list[EvidenceChunk],
         chunks_by_source: dict[str, list[EvidenceChunk]],
+        keyword_index: ChunkKeywordIndex | None = None,
+        keywords_by_chunk_id: dict[UUID, set[str]] | None = None,
     ) -> list[ClaimEvidenceLink]:
         """Bind a single claim to relevant evidence chunks.
 
         Uses two strategies:
         1. Source reference matching: claim.source_refs → chunk.source_id
-        2. Keyword overlap: find chunks with significant text overlap
+        2. Keyword overlap: score chunks sharing a keyword with the claim
 
         Args:
             claim: Claim to bind
             all_chunks: All available chunks
             chunks_by_source: Index of chunks by source_id
+            keyword_index: Keyword index over all_chunks (built on demand if omitted)
+            keywords_by_chunk_id: Precomputed chunk keywords by chunk id
 
         Returns:
             List of ClaimEvidenceLink objects for this claim
         """
+        if keyword_index is None:
+            keyword_index = ChunkKeywordIndex(
+                [self._extract_keywords(chunk.text) for chunk in all_chunks]
+            )
+        if keywords_by_chunk_id is None:
+            keywords_by_chunk_id = {
+                chunk.id: keywords
+                for chunk, keywords in zip(all_chunks, keyword_index.chunk_keywords, strict=True)
+            }
+
         links: list[ClaimEvidenceLink] = []
         linked_chunk_ids: set = set()
+        claim_keywords = self._extract_keywords(claim.text)
 
         # Strategy 1: Match by source reference
         for source_ref in claim.source_refs:
             if source_ref in chunks_by_source:
                 for chunk in chunks_by_source[source_ref]:
                     if chunk.id not in linked_chunk_ids:
-                        score = self._calculate_keyword_score(claim.text, chunk.text)
+                        chunk_keywords = keywords_by_chunk_id.get(chunk.id)
+                        if chunk_keywords is None:
+                            chunk_keywords = self._extract_keywords(chunk.text)
+                        score = self._score_keywords(claim_keywords, chunk_keywords)
                         links.append(
                             ClaimEvidenceLink(
                                 claim_id=claim.id,
@@ -203,17 +261,18 @@ class BindStage(PipelineStage[BindInput, BindOutput]):
 
         # Strategy 2: Keyword matching for chunks not already linked
         if not links:  # Only if no source refs matched
-            claim_keywords = self._extract_keywords(claim.text)
-
-            for chunk in all_chunks:
+            # Chunks without a shared keyword have zero overlap, so only
+            # index candidates can reach MIN_KEYWORD_OVERLAP
+            for position in keyword_index.candidates(claim_keywords):
+                chunk = all_chunks[position]
                 if chunk.id in linked_chunk_ids:
                     continue
 
-                chunk_keywords = self._extract_keywords(chunk.text)
+                chunk_keywords = keyword_index.chunk_keywords[position]
                 overlap = self._calculate_overlap(claim_keywords, chunk_keywords)
 
                 if overlap >= MIN_KEYWORD_OVERLAP:
-                    score = self._calculate_keyword_score(claim.text, chunk.text)
+                    score = self._score_keywords(claim_keywords, chunk_keywords)
                     links.append(
                         ClaimEvidenceLink(
                             claim_id=claim.id,
@@ -238,31 +297,12 @@ class BindStage(PipelineStage[BindInput, BindOutput]):
             Set of lowercase keywords
         """
         # Simple word extraction (alphanumeric)
-        words = re.findall(r"\b[a-zA-Z0-9æøåÆØÅ]+\b", text.lower())
+        words = _WORD_PATTERN.findall(text.lower())
 
         # Filter out short words and common stopwords
-        stopwords = {
-            "a", "an", "the", "is", "are", "was", "were", "be", "been",
-            "being", "have", "has", "had", "do", "does", "did", "will",
-            "would", "could", "should", "may", "might", "must", "shall",
-            "can", "to", "of", "in", "for", "on", "with", "at", "by",
-            "from", "as", "or", "and", "but", "if", "not", "no", "so",
-            "than", "too", "very", "just", "about", "into", "through",
-            "during", "before", "after", "above", "below", "between",
-            "under", "again", "further", "then", "once", "here", "there",
-            "when", "where", "why", "how", "all", "each", "few", "more",
-            "most", "other", "some", "such", "only", "own", "same",
-            "this", "that", "these", "those", "it", "its",
-            # Danish stopwords
-            "og", "i", "at", "er", "en", "af", "til", "på", "med", "som",
-            "det", "de", "den", "for", "ikke", "der", "var", "har", "kan",
-            "fra", "eller", "et", "om", "skal", "ved", "sig", "vil", "være",
-            "efter", "også", "nu", "når", "hans", "hans", "selv", "hen",
-        }
-
         keywords = {
             word for word in words
-            if len(word) >= 3 and word not in stopwords
+            if len(word) >= 3 and word not in _STOPWORDS
         }
 
         return keywords
@@ -297,9 +337,23 @@ class BindStage(PipelineStage[BindInput, BindOutput]):
         Returns:
             Score between 0.0 and 1.0
         """
-        claim_keywords = self._extract_keywords(claim_text)
-        chunk_keywords = self._extract_keywords(chunk_text)
+        return self._score_keywords(
+            self._extract_keywords(claim_text),
+            self._extract_keywords(chunk_text),
+        )
 
+    def _score_keywords(
+        self, claim_keywords: set[str], chunk_keywords: set[str]
+    ) -> float:
+        """Calculate binding score from pre-extracted keyword sets.
+
+        Args:
+            claim_keywords: Claim keywords
+            chunk_keywords: Evidence chunk keywords
+
+        Returns:
+            Score between 0.0 and 1.0
+        """
         if not claim_keywords:
             return 0.3  # Low default score for empty claims
 
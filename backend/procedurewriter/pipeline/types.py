@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Protocol
 
 
 @dataclass(frozen=True)
@@ -28,3 +28,16 @@ class Snippet:
     source_id: str
     text: str
     location: dict[str, Any]
+
+
+class SnippetLike(Protocol):
+    """Anything readable as a snippet: Snippet or a SnippetTable row view."""
+
+    @property
+    def source_id(self) -> str: ...
+
+    @property
+    def text(self) -> str: ...
+
+    @property
+    def location(self) -> dict[str, Any]: ...
@@ -2,10 +2,15 @@ from __future__ import annotations
 
 import logging
 import re
+import time
+from collections.abc import Sequence
 from typing import Any
 
+from procedurewriter.llm.providers import get_llm_client_override
+from procedurewriter.metrics import observe_llm_call
+from procedurewriter.pipeline.profiler import profile_section
 from procedurewriter.pipeline.text_units import CitationValidationError
-from procedurewriter.pipeline.types import Snippet, SourceRecord
+from procedurewriter.pipeline.types import SnippetLike, SourceRecord
 
 logger = logging.getLogger(__name__)
 
@@ -60,7 +65,7 @@ def write_procedure_markdown(
     procedure: str,
     context: str | None,
     author_guide: dict[str, Any],
-    snippets: list[Snippet],
+    snippets: Sequence[SnippetLike],
     sources: list[SourceRecord],
     dummy_mode: bool,
     use_llm: bool,
@@ -121,7 +126,9 @@ def write_procedure_markdown(
 
     # Check if we should skip LLM
     provider = llm_provider or "openai"
-    has_api_key = bool(openai_api_key or anthropic_api_key or provider == "ollama")
+    has_api_key = bool(
+        openai_api_key or anthropic_api_key or provider == "ollama" or get_llm_client_override()
+    )
 
     if dummy_mode or not use_llm or not has_api_key:
         return _write_template(procedure=procedure, context=context, author_guide=author_guide, citations=citation_pool, sources=sources)
@@ -167,7 +174,7 @@ def write_procedure_markdown(
             return _write_template(procedure=procedure, context=context, author_guide=author_guide, citations=citation_pool, sources=sources)
 
 
-def _citation_pool(snippets: list[Snippet], sources: list[SourceRecord]) -> list[str]:
+def _citation_pool(snippets: Sequence[SnippetLike], sources: list[SourceRecord]) -> list[str]:
     ids: list[str] = []
     for s in snippets:
         if s.source_id not in ids:
@@ -229,7 +236,7 @@ def _write_llm_sectioned(
     procedure: str,
     context: str | None,
     author_guide: dict[str, Any],
-    snippets: list[Snippet],
+    snippets: Sequence[SnippetLike],
     sources: list[SourceRecord],
     citations: list[str],
     llm_model: str,
@@ -321,7 +328,7 @@ def _write_llm_section_body(
     heading: str,
     fmt: str,
     bundle: str,
-    section_snippets: list[Snippet],
+    section_snippets: Sequence[SnippetLike],
     allowed_source_ids: list[str],
     source_by_id: dict[str, SourceRecord],
     citation_strict_mode: bool = False,
@@ -408,7 +415,8 @@ def _write_llm_section_body(
 
     from procedurewriter.llm import get_session_tracker
 
-    resp = client.chat_completion(
+    resp = _timed_chat_completion(
+        client,
         messages=[{"role": "system", "content": system}, {"role": "user", "content": user}],
         model=llm_model,
         temperature=0.15,
@@ -579,7 +587,7 @@ def _write_llm(
     procedure: str,
     context: str | None,
     author_guide: dict[str, Any],
-    snippets: list[Snippet],
+    snippets: Sequence[SnippetLike],
     sources: list[SourceRecord],
     citations: list[str],
     llm_model: str,
@@ -670,7 +678,8 @@ def _write_llm(
         "- Ingen forord, ingen forklaring af regler, ingen kilde-URLs i brødteksten (kun i referencer senere).\n"
     )
 
-    resp = client.chat_completion(
+    resp = _timed_chat_completion(
+        client,
         messages=[{"role": "system", "content": system}, {"role": "user", "content": user}],
         model=llm_model,
         temperature=0.2,
@@ -683,6 +692,27 @@ def _write_llm(
     return resp.content.strip() + "\n"
 
 
+def _timed_chat_completion(client: Any, **kwargs: Any) -> Any:
+    """Call client.chat_completion and record latency/token metrics."""
+    start = time.perf_counter()
+    with profile_section("llm:call", agent="writer", model=kwargs.get("model")) as span:
+        resp = client.chat_completion(**kwargs)
+        span.update(
+            input_tokens=resp.input_tokens,
+            output_tokens=resp.output_tokens,
+            cost_usd=resp.cost_usd,
+        )
+    observe_llm_call(
+        provider=getattr(client.provider_type, "value", "unknown"),
+        model=resp.model,
+        agent="writer",
+        duration_s=time.perf_counter() - start,
+        input_tokens=resp.input_tokens,
+        output_tokens=resp.output_tokens,
+    )
+    return resp
+
+
 def _yaml_like_compact(obj: Any) -> str:
     import json
 
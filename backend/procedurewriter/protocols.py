@@ -9,6 +9,7 @@ Handles:
 """
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import hashlib
 import json
@@ -16,9 +17,11 @@ import logging
 import re
 import shutil
 import sqlite3
+import threading
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from difflib import SequenceMatcher
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -262,6 +265,7 @@ def upload_protocol(
             ),
         )
 
+    invalidate_protocol_index(db_path)
     return protocol_id
 
 
@@ -316,7 +320,11 @@ def update_protocol(
             f"UPDATE protocols SET {', '.join(updates)} WHERE protocol_id = ?",
             params,
         )
-        return result.rowcount > 0
+        updated = result.rowcount > 0
+
+    if updated:
+        invalidate_protocol_index(db_path)
+    return updated
 
 
 def delete_protocol(db_path: Path, protocol_id: str) -> bool:
@@ -338,12 +346,117 @@ def delete_protocol(db_path: Path, protocol_id: str) -> bool:
         # Also delete related validation results
         conn.execute("DELETE FROM validation_results WHERE protocol_id = ?", (protocol_id,))
 
+    invalidate_protocol_index(db_path)
     return True
 
 
 # --- Similarity Search ---
 
 
+# Queries shorter than this can match without sharing a trigram; scan them
+_MIN_INDEXED_QUERY_LEN = 4
+_QUERY_CACHE_SIZE = 256
+
+
+def name_trigrams(normalized_name: str) -> set[str]:
+    """
+    Character trigrams of a normalized name.
+
+    Each word is padded like pg_trgm (two leading spaces, one trailing) so
+    short words and word starts still produce trigrams.
+    """
+    grams: set[str] = set()
+    for word in normalized_name.split():
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+@dataclass
+class _ProtocolNameIndex:
+    """In-memory trigram index over the active protocols of one database."""
+
+    signature: tuple[int, str | None]
+    protocols: list[Protocol]
+    postings: dict[str, list[int]]
+    query_cache: dict[tuple[str, float], list[tuple[int, float]]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, protocols: list[Protocol], signature: tuple[int, str | None]) -> _ProtocolNameIndex:
+        postings: dict[str, list[int]] = {}
+        for i, protocol in enumerate(protocols):
+            for gram in name_trigrams(protocol.name_normalized):
+                postings.setdefault(gram, []).append(i)
+        return cls(signature=signature, protocols=protocols, postings=postings)
+
+    def candidates(self, normalized: str) -> set[int]:
+        """Protocols sharing at least one trigram with the query."""
+        if len(normalized) < _MIN_INDEXED_QUERY_LEN:
+            return set(range(len(self.protocols)))
+        found: set[int] = set()
+        for gram in name_trigrams(normalized):
+            found.update(self.postings.get(gram, ()))
+        return found
+
+    def search(self, normalized: str, threshold: float) -> list[tuple[int, float]]:
+        key = (normalized, threshold)
+        cached = self.query_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # ratio() is not symmetric: keep the query as seq1 like the full scan did
+        matcher = SequenceMatcher(None, normalized, "")
+        results: list[tuple[int, float]] = []
+        for i in self.candidates(normalized):
+            matcher.set_seq2(self.protocols[i].name_normalized)
+            # real_quick_ratio/quick_ratio are upper bounds on ratio()
+            if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+                continue
+            similarity = matcher.ratio()
+            if similarity >= threshold:
+                results.append((i, similarity))
+        results.sort(key=lambda x: (-x[1], x[0]))
+
+        if len(self.query_cache) >= _QUERY_CACHE_SIZE:
+            self.query_cache.pop(next(iter(self.query_cache)))
+        self.query_cache[key] = results
+        return results
+
+
+_name_indexes: dict[str, _ProtocolNameIndex] = {}
+_name_indexes_lock = threading.Lock()
+
+
+def _protocols_signature(db_path: Path) -> tuple[int, str | None]:
+    # Catches writes from other processes (worker, second API instance);
+    # in-process writes invalidate the index directly
+    with _connect(db_path) as conn:
+        row = conn.execute(
+            "SELECT COUNT(*), MAX(updated_at_utc) FROM protocols WHERE status = 'active'"
+        ).fetchone()
+    return (row[0], row[1])
+
+
+def _get_name_index(db_path: Path) -> _ProtocolNameIndex:
+    key = str(db_path)
+    signature = _protocols_signature(db_path)
+    with _name_indexes_lock:
+        index = _name_indexes.get(key)
+        if index is None or index.signature != signature:
+            index = _ProtocolNameIndex.build(list_protocols(db_path), signature)
+            _name_indexes[key] = index
+        return index
+
+
+def invalidate_protocol_index(db_path: Path | None = None) -> None:
+    """Drop the cached name index for ``db_path`` (all databases if None)."""
+    with _name_indexes_lock:
+        if db_path is None:
+            _name_indexes.clear()
+        else:
+            _name_indexes.pop(str(db_path), None)
+
+
 def find_similar_protocols(
     db_path: Path,
     procedure_name: str,
@@ -352,18 +465,20 @@ def find_similar_protocols(
     """
     Find protocols similar to a procedure name.
 
+    Candidates come from an in-memory trigram index over active protocol
+    names (rebuilt after upload/update/delete), then get exact
+    SequenceMatcher scoring. Names sharing no trigram with the query are not
+    scored: they can only reach low thresholds through scattered single
+    characters (e.g. "pleuradræn" vs "blodprøvetagning" = 0.31). Results are
+    cached per query until the index is rebuilt.
+
     Returns list of (protocol, similarity_score) tuples sorted by similarity.
     """
     normalized = normalize_protocol_name(procedure_name)
-    protocols = list_protocols(db_path)
-
-    results = []
-    for protocol in protocols:
-        similarity = SequenceMatcher(None, normalized, protocol.name_normalized).ratio()
-        if similarity >= threshold:
-            results.append((protocol, similarity))
-
-    return sorted(results, key=lambda x: x[1], reverse=True)
+    index = _get_name_index(db_path)
+    with _name_indexes_lock:
+        matches = index.search(normalized, threshold)
+    return [(index.protocols[i], similarity) for i, similarity in matches]
 
 
 # --- Protocol Section Parsing ---
@@ -574,6 +689,26 @@ def _parse_markdown_sections(md_text: str) -> dict[str, str]:
 # --- Validation ---
 
 
+@lru_cache(maxsize=1024)
+def _compare_section(
+    section: str,
+    run_content: str,
+    protocol_content: str,
+) -> tuple[bool, tuple[ConflictItem, ...]]:
+    """
+    Compare one run section with its protocol section.
+
+    Memoized on the section pair: re-validating a run whose sections did not
+    change (or against many protocols sharing sections) skips SequenceMatcher.
+
+    Returns (matched, conflicts); conflicts are only detected when unmatched.
+    """
+    similarity = SequenceMatcher(None, run_content, protocol_content).ratio()
+    if similarity >= 0.7:
+        return True, ()
+    return False, tuple(_detect_conflicts(section, run_content, protocol_content))
+
+
 def validate_run_against_protocol(
     run_markdown: str,
     protocol_text: str,
@@ -607,12 +742,10 @@ def validate_run_against_protocol(
         protocol_content = _find_matching_section(section_name, protocol_sections)
 
         if protocol_content:
-            similarity = SequenceMatcher(None, run_content, protocol_content).ratio()
-            if similarity >= 0.7:
+            matched, section_conflicts = _compare_section(section_name, run_content, protocol_content)
+            if matched:
                 sections_matched += 1
             else:
-                # Check for specific conflicts
-                section_conflicts = _detect_conflicts(section_name, run_content, protocol_content)
                 conflicts.extend(section_conflicts)
 
     # Calculate overall similarity
@@ -835,16 +968,83 @@ IMPORTANT:
 - Write summary and explanations in Danish"""
 
 
+PROTOCOL_VALIDATION_MODEL = "claude-3-haiku-20240307"
+
+
+def _validation_cache_key(model: str, protocol_text: str, run_markdown: str) -> str:
+    protocol_hash = hashlib.sha256(protocol_text.encode("utf-8")).hexdigest()
+    run_hash = hashlib.sha256(run_markdown.encode("utf-8")).hexdigest()
+    return hashlib.sha256(f"{model}\0{protocol_hash}\0{run_hash}".encode()).hexdigest()
+
+
+def _get_cached_validation(db_path: Path, cache_key: str) -> dict[str, Any] | None:
+    with _connect(db_path) as conn:
+        row = conn.execute(
+            "SELECT result_json FROM validation_cache WHERE cache_key = ?",
+            (cache_key,),
+        ).fetchone()
+    return json.loads(row["result_json"]) if row else None
+
+
+def _store_cached_validation(db_path: Path, cache_key: str, model: str, result_data: dict[str, Any]) -> None:
+    with _connect(db_path) as conn:
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO validation_cache (cache_key, model, created_at_utc, result_json)
+            VALUES (?, ?, ?, ?)
+            """,
+            (cache_key, model, utc_now_iso(), json.dumps(result_data, ensure_ascii=False)),
+        )
+
+
+def _llm_validation_result(
+    result_data: dict[str, Any],
+    protocol_id: str,
+    protocol_name: str,
+    cost_usd: float,
+) -> ValidationResult:
+    """Convert the LLM's JSON verdict to a ValidationResult."""
+    conflicts = []
+    for c in result_data.get("conflicts", []):
+        conflicts.append(
+            ConflictItem(
+                section=c.get("section", "ukendt"),
+                conflict_type=c.get("type", "unknown"),
+                generated_text=c.get("generated_text", ""),
+                approved_text=c.get("approved_text", ""),
+                severity=c.get("severity", "info"),
+                explanation=c.get("explanation", ""),
+            )
+        )
+
+    return ValidationResult(
+        protocol_id=protocol_id,
+        protocol_name=protocol_name,
+        similarity_score=result_data.get("compatibility_score", 0) / 100.0,
+        conflicts=conflicts,
+        sections_compared=1,  # LLM compares entire document
+        sections_matched=1 if result_data.get("compatibility_score", 0) >= 70 else 0,
+        compatibility_score=result_data.get("compatibility_score", 0),
+        summary=result_data.get("summary", ""),
+        validation_cost_usd=cost_usd,
+    )
+
+
 async def validate_run_against_protocol_llm(
     run_markdown: str,
     protocol_text: str,
     protocol_id: str,
     protocol_name: str,
     anthropic_client: Any,  # anthropic.AsyncAnthropic
+    db_path: Path | None = None,
+    model: str = PROTOCOL_VALIDATION_MODEL,
 ) -> ValidationResult:
     """
     Validate generated procedure against protocol using LLM semantic comparison.
 
+    With ``db_path``, verdicts are cached by (model, protocol text hash, run
+    text hash): re-validating an unchanged pair makes no LLM call and costs 0.
+
     Returns ValidationResult with LLM-assessed conflicts and compatibility score.
     """
     import anthropic
@@ -856,6 +1056,12 @@ async def validate_run_against_protocol_llm(
     if len(run_markdown) > max_chars:
         run_markdown = run_markdown[:max_chars] + "\n\n[... tekst afkortet ...]"
 
+    cache_key = _validation_cache_key(model, protocol_text, run_markdown)
+    if db_path is not None:
+        cached = _get_cached_validation(db_path, cache_key)
+        if cached is not None:
+            return _llm_validation_result(cached, protocol_id, protocol_name, 0.0)
+
     prompt = _LLM_VALIDATION_PROMPT.format(
         protocol_text=protocol_text,
         procedure_text=run_markdown,
@@ -867,7 +1073,7 @@ async def validate_run_against_protocol_llm(
 
     try:
         response = await anthropic_client.messages.create(
-            model="claude-3-haiku-20240307",
+            model=model,
             max_tokens=2000,
             messages=[{"role": "user", "content": prompt}],
         )
@@ -911,30 +1117,61 @@ async def validate_run_against_protocol_llm(
             validation_cost_usd=_calculate_haiku_cost(input_tokens, output_tokens),
         )
 
-    # Convert LLM conflicts to ConflictItem
-    conflicts = []
-    for c in result_data.get("conflicts", []):
-        conflicts.append(
-            ConflictItem(
-                section=c.get("section", "ukendt"),
-                conflict_type=c.get("type", "unknown"),
-                generated_text=c.get("generated_text", ""),
-                approved_text=c.get("approved_text", ""),
-                severity=c.get("severity", "info"),
-                explanation=c.get("explanation", ""),
+    if db_path is not None:
+        _store_cached_validation(db_path, cache_key, model, result_data)
+
+    return _llm_validation_result(
+        result_data, protocol_id, protocol_name, _calculate_haiku_cost(input_tokens, output_tokens)
+    )
+
+
+async def validate_run_against_protocols(
+    run_markdown: str,
+    protocols: list[Protocol],
+    anthropic_client: Any | None = None,  # anthropic.AsyncAnthropic
+    db_path: Path | None = None,
+    max_concurrency: int = 4,
+) -> list[ValidationResult]:
+    """
+    Validate one run against several protocols concurrently.
+
+    Uses LLM validation when ``anthropic_client`` is given, otherwise pattern
+    matching (in worker threads, so the event loop stays responsive). At most
+    ``max_concurrency`` validations run at once.
+
+    Args:
+        run_markdown: Generated procedure markdown
+        protocols: Protocols with normalized_text loaded; others are skipped
+        anthropic_client: Client for LLM validation, or None
+        db_path: Database for the LLM verdict cache (no caching if None)
+        max_concurrency: Maximum concurrent validations
+
+    Returns:
+        Results in the order of ``protocols`` (skipped protocols omitted)
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def validate_one(protocol: Protocol) -> ValidationResult:
+        async with semaphore:
+            if anthropic_client is not None:
+                return await validate_run_against_protocol_llm(
+                    run_markdown=run_markdown,
+                    protocol_text=protocol.normalized_text or "",
+                    protocol_id=protocol.protocol_id,
+                    protocol_name=protocol.name,
+                    anthropic_client=anthropic_client,
+                    db_path=db_path,
+                )
+            return await asyncio.to_thread(
+                validate_run_against_protocol,
+                run_markdown=run_markdown,
+                protocol_text=protocol.normalized_text or "",
+                protocol_id=protocol.protocol_id,
+                protocol_name=protocol.name,
             )
-        )
 
-    return ValidationResult(
-        protocol_id=protocol_id,
-        protocol_name=protocol_name,
-        similarity_score=result_data.get("compatibility_score", 0) / 100.0,
-        conflicts=conflicts,
-        sections_compared=1,  # LLM compares entire document
-        sections_matched=1 if result_data.get("compatibility_score", 0) >= 70 else 0,
-        compatibility_score=result_data.get("compatibility_score", 0),
-        summary=result_data.get("summary", ""),
-        validation_cost_usd=_calculate_haiku_cost(input_tokens, output_tokens),
+    return list(
+        await asyncio.gather(*(validate_one(p) for p in protocols if p.normalized_text))
     )
 
 
@@ -0,0 +1,177 @@
+"""
+Query plan cache.
+
+Stores the expanded search terms and built provider queries per procedure
+(normalized name + context hash), so runs skip the LLM term-expansion call
+that otherwise starts every run. Generated plans expire after a TTL; plans
+edited by an admin never expire.
+
+NO MOCKS - All operations use real database.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from procedurewriter.db import _connect, normalize_procedure_name, utc_now_iso
+
+SOURCE_GENERATED = "generated"
+SOURCE_ADMIN = "admin"
+
+
+@dataclass
+class QueryPlan:
+    """Expanded terms and provider queries for a procedure."""
+
+    plan_id: str
+    procedure: str
+    procedure_key: str
+    context: str | None
+    context_sha256: str
+    expanded_terms: list[str]
+    queries: dict[str, list[str]]  # provider -> queries, e.g. {"pubmed": [...]}
+    model: str | None
+    source: str  # SOURCE_GENERATED or SOURCE_ADMIN
+    created_at_utc: str
+    updated_at_utc: str
+    expires_at_utc: str | None  # None: never expires (admin edits)
+
+
+def context_sha256(context: str | None) -> str:
+    """Hash of the run context; runs without context share one plan."""
+    return hashlib.sha256((context or "").strip().encode("utf-8")).hexdigest()
+
+
+def query_plan_id(procedure: str, context: str | None) -> str:
+    """Stable plan ID for a procedure and context."""
+    key = f"{normalize_procedure_name(procedure)}\x00{context_sha256(context)}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+
+def _row_to_plan(row: sqlite3.Row) -> QueryPlan:
+    """Convert database row to QueryPlan object."""
+    return QueryPlan(
+        plan_id=row["plan_id"],
+        procedure=row["procedure"],
+        procedure_key=row["procedure_key"],
+        context=row["context"],
+        context_sha256=row["context_sha256"],
+        expanded_terms=json.loads(row["expanded_terms_json"]),
+        queries=json.loads(row["queries_json"]),
+        model=row["model"],
+        source=row["source"],
+        created_at_utc=row["created_at_utc"],
+        updated_at_utc=row["updated_at_utc"],
+        expires_at_utc=row["expires_at_utc"],
+    )
+
+
+def get_query_plan(db_path: Path, plan_id: str) -> QueryPlan | None:
+    """Get a plan by ID, including expired ones (for admin views)."""
+    with _connect(db_path) as conn:
+        row = conn.execute("SELECT * FROM query_plans WHERE plan_id = ?", (plan_id,)).fetchone()
+    return _row_to_plan(row) if row else None
+
+
+def lookup_query_plan(db_path: Path, procedure: str, context: str | None) -> QueryPlan | None:
+    """Get the current plan for a run, or None if missing or expired."""
+    plan = get_query_plan(db_path, query_plan_id(procedure, context))
+    if plan is None:
+        return None
+    if plan.expires_at_utc is not None and plan.expires_at_utc <= utc_now_iso():
+        return None
+    return plan
+
+
+def list_query_plans(db_path: Path) -> list[QueryPlan]:
+    """List all plans, most recently updated first."""
+    with _connect(db_path) as conn:
+        rows = conn.execute("SELECT * FROM query_plans ORDER BY updated_at_utc DESC").fetchall()
+    return [_row_to_plan(row) for row in rows]
+
+
+def save_query_plan(
+    db_path: Path,
+    *,
+    procedure: str,
+    context: str | None,
+    expanded_terms: list[str],
+    queries: dict[str, list[str]],
+    model: str | None = None,
+    ttl_s: int | None = None,
+    source: str = SOURCE_GENERATED,
+) -> QueryPlan:
+    """Insert or replace the plan for a procedure and context.
+
+    Args:
+        db_path: Path to the database file.
+        procedure: Procedure title as entered.
+        context: Optional run context.
+        expanded_terms: Search terms the queries were built from.
+        queries: Provider name -> queries.
+        model: LLM model used for term expansion, if any.
+        ttl_s: Seconds until the plan expires; None never expires.
+        source: SOURCE_GENERATED for pipeline plans, SOURCE_ADMIN for edits.
+
+    Returns:
+        The stored plan.
+    """
+    plan = QueryPlan(
+        plan_id=query_plan_id(procedure, context),
+        procedure=procedure,
+        procedure_key=normalize_procedure_name(procedure),
+        context=context,
+        context_sha256=context_sha256(context),
+        expanded_terms=expanded_terms,
+        queries=queries,
+        model=model,
+        source=source,
+        created_at_utc=utc_now_iso(),
+        updated_at_utc=utc_now_iso(),
+        expires_at_utc=(
+            (datetime.now(UTC) + timedelta(seconds=ttl_s)).replace(microsecond=0).isoformat()
+            if ttl_s is not None
+            else None
+        ),
+    )
+    with _connect(db_path) as conn:
+        existing = conn.execute(
+            "SELECT created_at_utc FROM query_plans WHERE plan_id = ?", (plan.plan_id,)
+        ).fetchone()
+        if existing:
+            plan.created_at_utc = existing["created_at_utc"]
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO query_plans (
+              plan_id, procedure, procedure_key, context, context_sha256,
+              expanded_terms_json, queries_json, model, source,
+              created_at_utc, updated_at_utc, expires_at_utc
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                plan.plan_id,
+                plan.procedure,
+                plan.procedure_key,
+                plan.context,
+                plan.context_sha256,
+                json.dumps(plan.expanded_terms, ensure_ascii=False),
+                json.dumps(plan.queries, ensure_ascii=False),
+                plan.model,
+                plan.source,
+                plan.created_at_utc,
+                plan.updated_at_utc,
+                plan.expires_at_utc,
+            ),
+        )
+    return plan
+
+
+def delete_query_plan(db_path: Path, plan_id: str) -> bool:
+    """Delete a plan. Returns False if it did not exist."""
+    with _connect(db_path) as conn:
+        cursor = conn.execute("DELETE FROM query_plans WHERE plan_id = ?", (plan_id,))
+        return cursor.rowcount > 0
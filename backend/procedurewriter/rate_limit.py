@@ -0,0 +1,12 @@
+"""Shared request rate limiter (R5-001).
+
+Lives outside main so routers can decorate their endpoints without
+importing the app module.
+"""
+
+from __future__ import annotations
+
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+limiter = Limiter(key_func=get_remote_address)
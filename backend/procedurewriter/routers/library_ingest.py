@@ -0,0 +1,173 @@
+"""Bulk library ingestion API router.
+
+Accepts ZIP archives of PDFs, DOCX files and URL lists, queues them as
+ingestion jobs for the background worker, and streams per-file progress.
+Server-side folders are ingested with ``scripts/ingest_library.py`` instead,
+so the API never reads arbitrary paths from the host.
+"""
+
+from __future__ import annotations
+
+import shutil
+import uuid
+import zipfile
+from collections.abc import AsyncIterator
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+import anyio
+from fastapi import APIRouter, Header, HTTPException, Request, UploadFile
+from fastapi import Path as FastAPIPath
+from fastapi.responses import StreamingResponse
+
+from procedurewriter.library_ingest import (
+    TERMINAL_STATUSES,
+    IngestJob,
+    create_ingest_job,
+    get_ingest_job,
+    list_ingest_jobs,
+)
+from procedurewriter.pipeline.events import EVENT_LOG_FILENAME, EventLog, EventType, PipelineEvent
+from procedurewriter.rate_limit import limiter
+from procedurewriter.settings import settings
+
+router = APIRouter(prefix="/api/library/ingest-jobs", tags=["library"])
+
+_UPLOAD_CHUNK_BYTES = 1024 * 1024
+_EVENT_LOG_POLL_INTERVAL_S = 0.5
+
+
+def _terminal_event(job: IngestJob) -> PipelineEvent:
+    """Build the closing event for a job whose log has no final event."""
+    if job.status == "DONE":
+        return PipelineEvent(
+            event_type=EventType.COMPLETE,
+            data={
+                "success": True,
+                "total": job.total,
+                "added": job.added,
+                "duplicates": job.duplicates,
+                "failed": job.failed,
+            },
+            timestamp=0,
+        )
+    return PipelineEvent(
+        event_type=EventType.ERROR,
+        data={"stage": "ingest", "error": job.error or "Unknown error"},
+        timestamp=0,
+    )
+
+
+# --- Ingest Job Endpoints ---
+
+
+@router.post("")
+@limiter.limit("5/minute")
+async def api_create_ingest_job(request: Request, file: UploadFile) -> dict[str, Any]:
+    """Upload a ZIP archive and queue it for bulk ingestion."""
+    job_id = uuid.uuid4().hex
+    job_dir = settings.ingest_jobs_dir / job_id
+    job_dir.mkdir(parents=True, exist_ok=True)
+    archive_path = job_dir / "upload.zip"
+    max_bytes = settings.bulk_ingest_max_archive_mb * 1024 * 1024
+
+    # Stream to disk; archives can be far larger than a single upload
+    size = 0
+    try:
+        with archive_path.open("wb") as out:
+            while chunk := await file.read(_UPLOAD_CHUNK_BYTES):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"Archive too large. Maximum size: {settings.bulk_ingest_max_archive_mb}MB",
+                    )
+                out.write(chunk)
+        if not zipfile.is_zipfile(archive_path):
+            raise HTTPException(status_code=400, detail="Upload must be a ZIP archive")
+    except HTTPException:
+        shutil.rmtree(job_dir, ignore_errors=True)
+        raise
+
+    job = create_ingest_job(settings.db_path, input_path=archive_path, job_dir=job_dir, job_id=job_id)
+    return asdict(job)
+
+
+@router.get("")
+def api_list_ingest_jobs() -> dict[str, Any]:
+    """List ingestion jobs, newest first."""
+    return {"jobs": [asdict(j) for j in list_ingest_jobs(settings.db_path)]}
+
+
+@router.get("/{job_id}")
+def api_get_ingest_job(
+    job_id: str = FastAPIPath(..., pattern=r"^[a-f0-9]{32}$", description="32-char hex ID"),
+) -> dict[str, Any]:
+    """Get a job with its progress counters."""
+    job = get_ingest_job(settings.db_path, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Ingest job not found")
+    return asdict(job)
+
+
+@router.get("/{job_id}/events")
+async def api_ingest_job_events(
+    job_id: str = FastAPIPath(..., pattern=r"^[a-f0-9]{32}$", description="32-char hex ID"),
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
+) -> StreamingResponse:
+    """
+    Server-Sent Events stream of per-file ingestion progress.
+
+    Tails the job's event log like the run event stream, resuming after
+    ``Last-Event-ID``, and ends once the job is DONE or FAILED.
+    """
+    job = get_ingest_job(settings.db_path, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Ingest job not found")
+
+    after_seq = 0
+    if last_event_id is not None and last_event_id.strip().isdigit():
+        after_seq = int(last_event_id.strip())
+
+    log = EventLog(Path(job.job_dir) / EVENT_LOG_FILENAME)
+
+    async def event_stream() -> AsyncIterator[str]:
+        last_seq = after_seq
+        offset = 0
+        finished = False
+        while True:
+            events, offset = await anyio.to_thread.run_sync(log.read_from, offset)
+            for event in events:
+                if (event.seq or 0) <= last_seq:
+                    continue
+                last_seq = event.seq or last_seq
+                finished = finished or event.event_type in (EventType.COMPLETE, EventType.ERROR)
+                yield event.to_sse()
+            if events:
+                continue
+
+            current = await anyio.to_thread.run_sync(get_ingest_job, settings.db_path, job_id)
+            if current is None or current.status in TERMINAL_STATUSES:
+                # The worker logs its final event before the status change
+                events, offset = await anyio.to_thread.run_sync(log.read_from, offset)
+                for event in events:
+                    if (event.seq or 0) > last_seq:
+                        last_seq = event.seq or last_seq
+                        finished = finished or event.event_type in (EventType.COMPLETE, EventType.ERROR)
+                        yield event.to_sse()
+                if current is not None and not finished:
+                    yield _terminal_event(current).to_sse()
+                break
+
+            await anyio.sleep(_EVENT_LOG_POLL_INTERVAL_S)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",  # Disable nginx buffering
+        },
+    )
@@ -0,0 +1,78 @@
+"""Query plans API router.
+
+Admins can inspect, correct or pin the expanded search terms and provider
+queries that runs reuse for a procedure.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel, Field
+
+from procedurewriter.query_plans import (
+    SOURCE_ADMIN,
+    delete_query_plan,
+    get_query_plan,
+    list_query_plans,
+    save_query_plan,
+)
+from procedurewriter.settings import settings
+
+router = APIRouter(prefix="/api/query-plans", tags=["query-plans"])
+
+
+# --- Request/Response Models ---
+
+
+class PutQueryPlanRequest(BaseModel):
+    procedure: str = Field(min_length=1, max_length=200)
+    context: str | None = Field(default=None, max_length=2000)
+    expanded_terms: list[str] = Field(min_length=1, max_length=50)
+    # Provider -> queries; providers left out are built from expanded_terms
+    queries: dict[str, list[str]] = Field(default_factory=dict)
+
+
+# --- Query Plan Endpoints ---
+
+
+@router.get("")
+def api_list_query_plans() -> dict[str, Any]:
+    """List all stored query plans."""
+    return {"query_plans": [asdict(p) for p in list_query_plans(settings.db_path)]}
+
+
+@router.get("/{plan_id}")
+def api_get_query_plan(plan_id: str) -> dict[str, Any]:
+    """Get a specific query plan."""
+    plan = get_query_plan(settings.db_path, plan_id)
+    if not plan:
+        raise HTTPException(status_code=404, detail="Query plan not found")
+    return asdict(plan)
+
+
+@router.put("")
+def api_put_query_plan(request: PutQueryPlanRequest) -> dict[str, Any]:
+    """Create or replace the plan for a procedure and context.
+
+    Admin plans never expire, so runs keep using them until deleted.
+    """
+    plan = save_query_plan(
+        settings.db_path,
+        procedure=request.procedure,
+        context=request.context,
+        expanded_terms=request.expanded_terms,
+        queries=request.queries,
+        source=SOURCE_ADMIN,
+    )
+    return asdict(plan)
+
+
+@router.delete("/{plan_id}", status_code=204)
+def api_delete_query_plan(plan_id: str) -> None:
+    """Delete a query plan; the next run regenerates it."""
+    if not delete_query_plan(settings.db_path, plan_id):
+        raise HTTPException(status_code=404, detail="Query plan not found")
+    return None
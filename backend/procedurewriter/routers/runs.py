@@ -5,15 +5,15 @@ from __future__ import annotations
 import json
 import logging
 import os
-import queue
 import re
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 from urllib.parse import quote
 
 import anyio
-from anthropic import AsyncAnthropic
-from fastapi import APIRouter, HTTPException, Path as FastAPIPath
+from fastapi import APIRouter, Header, HTTPException, Path as FastAPIPath
 from fastapi.responses import FileResponse, StreamingResponse
 
 logger = logging.getLogger(__name__)
@@ -65,8 +65,10 @@ def _safe_read_json(path: Path, description: str = "JSON file") -> dict[str, Any
     return obj
 
 from procedurewriter.db import (
+    RunRow,
     _connect,
     acknowledge_run,
+    get_llm_cost_rollup,
     get_run,
     get_version_chain,
     iter_jsonl,
@@ -77,7 +79,22 @@ from procedurewriter.models.evidence import EvidenceChunk
 from procedurewriter.models.issues import Issue, IssueSeverity
 from procedurewriter.models.gates import Gate, GateStatus, GateType
 from procedurewriter.file_utils import UnsafePathError, safe_path_within
-from procedurewriter.pipeline.events import get_emitter_if_exists
+from procedurewriter.pipeline.docx_render import (
+    DOCX_EVIDENCE_REVIEW,
+    DOCX_FILENAMES,
+    DOCX_META_ANALYSIS,
+    DOCX_PROCEDURE,
+    DOCX_SOURCE_ANALYSIS,
+    ensure_docx,
+    pending_docx_kinds,
+)
+from procedurewriter.pipeline.events import (
+    EVENT_LOG_FILENAME,
+    EventLog,
+    EventType,
+    PipelineEvent,
+)
+from procedurewriter.pipeline.profiler import TRACE_FILENAME
 from procedurewriter.pipeline.versioning import (
     create_version_diff,
     diff_to_dict,
@@ -85,15 +102,22 @@ from procedurewriter.pipeline.versioning import (
     load_source_ids,
 )
 from procedurewriter.protocols import (
+    Protocol,
     get_protocol,
     get_validation_results,
     save_validation_result,
-    validate_run_against_protocol,
-    validate_run_against_protocol_llm,
+    validate_run_against_protocols,
     find_similar_protocols,
 )
 from procedurewriter.run_bundle import build_run_bundle_zip, read_run_manifest
-from procedurewriter.schemas import RunAckRequest, RunDetail, RunSummary, SourceRecord, SourcesResponse
+from procedurewriter.schemas import (
+    RunAckRequest,
+    RunDetail,
+    RunSummary,
+    SourceRecord,
+    SourcesResponse,
+    ValidateBatchRequest,
+)
 from procedurewriter.settings import settings
 
 router = APIRouter(prefix="/api/runs", tags=["runs"])
@@ -244,8 +268,10 @@ def api_run(
     procedure_md = procedure_md_path.read_text(encoding="utf-8") if procedure_md_path.exists() else None
 
     # Check for meta-analysis report
-    meta_analysis_path = Path(run.run_dir) / "Procedure_MetaAnalysis.docx"
-    has_meta_analysis = meta_analysis_path.exists()
+    meta_analysis_path = Path(run.run_dir) / DOCX_FILENAMES[DOCX_META_ANALYSIS]
+    has_meta_analysis = meta_analysis_path.exists() or DOCX_META_ANALYSIS in pending_docx_kinds(
+        Path(run.run_dir)
+    )
 
     source_count: int | None = None
     sources_path = Path(run.run_dir) / "sources.jsonl"
@@ -314,8 +340,8 @@ def api_docx(
     run = get_run(settings.db_path, run_id)
     if run is None:
         raise HTTPException(status_code=404, detail="Run not found")
-    docx = Path(run.run_dir) / "Procedure.docx"
-    if not docx.exists():
+    docx = ensure_docx(Path(run.run_dir), DOCX_PROCEDURE)
+    if docx is None:
         raise HTTPException(status_code=404, detail="DOCX not available")
 
     # Use procedure name for download filename with RFC 5987 encoding
@@ -339,8 +365,8 @@ def api_meta_analysis_docx(
     if run is None:
         raise HTTPException(status_code=404, detail="Run not found")
 
-    docx_path = Path(run.run_dir) / "Procedure_MetaAnalysis.docx"
-    if not docx_path.exists():
+    docx_path = ensure_docx(Path(run.run_dir), DOCX_META_ANALYSIS)
+    if docx_path is None:
         raise HTTPException(status_code=404, detail="Meta-analysis document not found for this run.")
 
     # Use procedure name for download filename with RFC 5987 encoding
@@ -363,8 +389,8 @@ def api_source_analysis_docx(
     if run is None:
         raise HTTPException(status_code=404, detail="Run not found")
 
-    docx_path = Path(run.run_dir) / "source_analysis.docx"
-    if not docx_path.exists():
+    docx_path = ensure_docx(Path(run.run_dir), DOCX_SOURCE_ANALYSIS)
+    if docx_path is None:
         raise HTTPException(status_code=404, detail="Source analysis document not found for this run.")
 
     filename = f"{_sanitize_filename(run.procedure)}_Kildeanalyse.docx"
@@ -386,8 +412,8 @@ def api_evidence_review_docx(
     if run is None:
         raise HTTPException(status_code=404, detail="Run not found")
 
-    docx_path = Path(run.run_dir) / "evidence_review.docx"
-    if not docx_path.exists():
+    docx_path = ensure_docx(Path(run.run_dir), DOCX_EVIDENCE_REVIEW)
+    if docx_path is None:
         raise HTTPException(status_code=404, detail="Evidence review document not found for this run.")
 
     filename = f"{_sanitize_filename(run.procedure)}_Evidensgennemgang.docx"
@@ -415,6 +441,31 @@ def api_manifest(
     return read_run_manifest(run_dir)
 
 
+@router.get("/{run_id}/costs")
+def api_costs(
+    run_id: str = FastAPIPath(..., pattern=r"^[a-f0-9]{32}$", description="32-char hex ID"),
+) -> dict[str, Any]:
+    """Get LLM call totals for a run, rolled up per agent, stage and model."""
+    run = get_run(settings.db_path, run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="Run not found")
+    return get_llm_cost_rollup(settings.db_path, run_id)
+
+
+@router.get("/{run_id}/trace")
+def api_trace(
+    run_id: str = FastAPIPath(..., pattern=r"^[a-f0-9]{32}$", description="32-char hex ID"),
+) -> dict[str, Any]:
+    """Get the span trace for a run in the Chrome Trace Event format.
+
+    The JSON loads directly into chrome://tracing or Perfetto.
+    """
+    run = get_run(settings.db_path, run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="Run not found")
+    return _safe_read_json(Path(run.run_dir) / TRACE_FILENAME, "Trace")
+
+
 @router.get("/{run_id}/evidence")
 def api_evidence(
     run_id: str = FastAPIPath(..., pattern=r"^[a-f0-9]{32}$", description="32-char hex ID"),
@@ -511,6 +562,8 @@ async def api_verify_evidence(
             "message": "No source content available for verification",
         }
 
+    from anthropic import AsyncAnthropic
+
     # Run verification
     client = AsyncAnthropic(api_key=anthropic_key)
     try:
@@ -572,6 +625,9 @@ def api_bundle(
     run_dir = Path(run.run_dir)
     if not run_dir.exists():
         raise HTTPException(status_code=404, detail="Run dir not found")
+    # A bundle holds every document, including those deferred by lazy rendering
+    for kind in pending_docx_kinds(run_dir):
+        ensure_docx(run_dir, kind)
     bundle_path = run_dir / "run_bundle.zip"
     build_run_bundle_zip(run_dir, output_path=bundle_path)
     return FileResponse(path=str(bundle_path), filename=f"{run_id}.zip", media_type="application/zip")
@@ -630,58 +686,126 @@ def api_source_scores(
         ) from e
 
 
+# Run statuses after which no further events will be logged
+_EVENT_STREAM_TERMINAL_STATUSES = {"DONE", "FAILED", "NEEDS_ACK"}
+_EVENT_LOG_POLL_INTERVAL_S = 0.5
+
+
+def _heartbeat_age_s(run: RunRow) -> float | None:
+    """Seconds since the worker holding ``run`` last checked in, if known."""
+    last_seen = run.heartbeat_at_utc or run.locked_at_utc
+    if last_seen is None:
+        return None
+    try:
+        seen = datetime.fromisoformat(last_seen)
+    except ValueError:
+        return None
+    if seen.tzinfo is None:
+        seen = seen.replace(tzinfo=UTC)
+    return (datetime.now(UTC) - seen).total_seconds()
+
+
+def _terminal_event(run: Any) -> PipelineEvent:
+    """Build the closing event for a run that will not log anything more."""
+    if run.status == "DONE":
+        return PipelineEvent(
+            event_type=EventType.COMPLETE,
+            data={"success": True, "quality_score": run.quality_score or 0},
+            timestamp=0,
+        )
+    if run.status == "FAILED":
+        return PipelineEvent(
+            event_type=EventType.ERROR,
+            data={"stage": "pipeline", "error": run.error or "Unknown error"},
+            timestamp=0,
+        )
+    return PipelineEvent(
+        event_type=EventType.PROGRESS,
+        data={"message": "Waiting for evidence gap acknowledgement"},
+        timestamp=0,
+    )
+
+
 @router.get("/{run_id}/events")
 async def api_events(
     run_id: str = FastAPIPath(..., pattern=r"^[a-f0-9]{32}$", description="32-char hex ID"),
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
 ) -> StreamingResponse:
     """
     Server-Sent Events stream for pipeline progress.
 
-    Streams real-time events during procedure generation.
-    Connect when run status is RUNNING, events stop when complete.
+    Tails the run's persistent event log (``events.jsonl`` in the run
+    directory), so the stream works from any API process, regardless of
+    which worker executes the run. Reconnecting clients resume after the
+    sequence number sent in ``Last-Event-ID``. The stream ends once the run
+    reaches a terminal status and the log has been drained (the pipeline
+    logs COMPLETE before its final steps, which can still fail), or with an
+    error event when a RUNNING run's worker has not sent a heartbeat within
+    ``queue_stale_timeout_s``.
     """
-    emitter = get_emitter_if_exists(run_id)
-    if emitter is None:
-        # Run may not be active yet or already complete
-        run = get_run(settings.db_path, run_id)
-        if run is None:
-            raise HTTPException(status_code=404, detail="Run not found")
-        if run.status == "DONE":
-            # Return empty stream with completion event
-            async def done_stream():
-                yield f'data: {{"event": "complete", "data": {{"success": true, "quality_score": {run.quality_score or 0}}}, "timestamp": 0}}\n\n'
-            return StreamingResponse(done_stream(), media_type="text/event-stream")
-        if run.status == "FAILED":
-            async def error_stream():
-                yield f'data: {{"event": "error", "data": {{"stage": "pipeline", "error": "{run.error or "Unknown error"}"}}, "timestamp": 0}}\n\n'
-            return StreamingResponse(error_stream(), media_type="text/event-stream")
-        # Not started yet - return empty stream
-        async def empty_stream():
-            yield 'data: {"event": "progress", "data": {"message": "Waiting for pipeline to start"}, "timestamp": 0}\n\n'
-        return StreamingResponse(empty_stream(), media_type="text/event-stream")
-
-    # Subscribe to event stream
-    event_queue = emitter.subscribe()
-
-    async def event_stream():
-        try:
-            while True:
-                # Poll the queue with a small timeout to allow cancellation
-                try:
-                    event = await anyio.to_thread.run_sync(
-                        lambda: event_queue.get(timeout=0.1)
-                    )
-                except queue.Empty:
-                    # Timeout - continue polling
-                    continue
-
-                if event is None:
-                    # Sentinel - stream ended
-                    break
-
-                yield event.to_sse()
-        finally:
-            emitter.unsubscribe(event_queue)
+    run = get_run(settings.db_path, run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="Run not found")
+
+    after_seq = 0
+    if last_event_id is not None and last_event_id.strip().isdigit():
+        after_seq = int(last_event_id.strip())
+
+    log = EventLog(Path(run.run_dir) / EVENT_LOG_FILENAME)
+
+    async def event_stream() -> AsyncIterator[str]:
+        last_seq = after_seq
+        offset = 0
+        finished: RunRow | None = None
+        if run.status not in _EVENT_STREAM_TERMINAL_STATUSES and not log.path.exists():
+            yield PipelineEvent(
+                event_type=EventType.PROGRESS,
+                data={"message": "Waiting for pipeline to start"},
+                timestamp=0,
+            ).to_sse()
+
+        # COMPLETE is logged before the run's final steps (verification,
+        # manifest, DOCX), so the stream only ends on the DB status
+        completion_logged = False
+        while True:
+            events, offset = await anyio.to_thread.run_sync(log.read_from, offset)
+            for event in events:
+                if event.event_type == EventType.COMPLETE:
+                    completion_logged = True
+                if (event.seq or 0) > last_seq:
+                    last_seq = event.seq or last_seq
+                    yield event.to_sse()
+            if events:
+                continue
+
+            if finished is not None:
+                # Log drained after the status change; don't repeat a
+                # completion the client has already been sent
+                if not (finished.status == "DONE" and completion_logged):
+                    yield _terminal_event(finished).to_sse()
+                return
+
+            current = await anyio.to_thread.run_sync(get_run, settings.db_path, run_id)
+            if current is None:
+                return
+            if current.status in _EVENT_STREAM_TERMINAL_STATUSES:
+                # Read once more for events written before the status change
+                finished = current
+                continue
+            if current.status == "RUNNING":
+                age = _heartbeat_age_s(current)
+                if age is not None and age >= settings.queue_stale_timeout_s:
+                    yield PipelineEvent(
+                        event_type=EventType.ERROR,
+                        data={
+                            "stage": "pipeline",
+                            "error": f"Worker stopped responding (no heartbeat for {int(age)}s)",
+                        },
+                        timestamp=0,
+                    ).to_sse()
+                    return
+
+            await anyio.sleep(_EVENT_LOG_POLL_INTERVAL_S)
 
     return StreamingResponse(
         event_stream(),
@@ -738,23 +862,8 @@ def api_source_raw(
     return FileResponse(path=str(path), filename=path.name, media_type="application/octet-stream")
 
 
-@router.post("/{run_id}/validate")
-async def api_validate_run(
-    run_id: str = FastAPIPath(..., pattern=r"^[a-f0-9]{32}$", description="32-char hex ID"),
-    protocol_id: str | None = None,
-    use_llm: bool = True,
-) -> dict[str, Any]:
-    """
-    Validate a run against protocols using LLM semantic comparison.
-
-    If protocol_id is provided, validates against that protocol.
-    Otherwise, finds similar protocols automatically.
-
-    Args:
-        use_llm: If True (default), uses LLM for semantic comparison. If False, uses legacy pattern matching.
-    """
-    import anthropic
-
+def _load_validation_inputs(run_id: str, use_llm: bool) -> tuple[Any, str, str | None]:
+    """Load the run, its procedure markdown and the Anthropic key for validation."""
     run = get_run(settings.db_path, run_id)
     if not run:
         raise HTTPException(status_code=404, detail="Run not found")
@@ -772,49 +881,37 @@ async def api_validate_run(
             status_code=400,
             detail="LLM validation requires Anthropic API key. Configure in Settings or set use_llm=false."
         )
+    return run, run_markdown, anthropic_key if use_llm else None
 
-    # Find protocols to validate against
-    if protocol_id:
-        protocol = get_protocol(settings.db_path, protocol_id, load_text=True)
-        if not protocol:
-            raise HTTPException(status_code=404, detail="Protocol not found")
-        protocols_to_check = [(protocol, 1.0)]
-    else:
-        # Find similar protocols automatically
-        similar = find_similar_protocols(settings.db_path, run.procedure, threshold=0.3)
-        # Load text for each
-        protocols_to_check = [
-            (get_protocol(settings.db_path, p.protocol_id, load_text=True), score)
-            for p, score in similar[:5]  # Limit to top 5
-        ]
+
+async def _validate_and_save(
+    run_id: str,
+    run_markdown: str,
+    protocols_to_check: list[tuple[Protocol, float]],
+    anthropic_key: str | None,
+) -> dict[str, Any]:
+    """Validate concurrently, store each result and build the response."""
+    checkable = [(p, score) for p, score in protocols_to_check if p.normalized_text]
+
+    client = None
+    if anthropic_key:
+        import anthropic
+
+        client = anthropic.AsyncAnthropic(api_key=anthropic_key)
+
+    validation_results = await validate_run_against_protocols(
+        run_markdown,
+        [p for p, _ in checkable],
+        anthropic_client=client,
+        db_path=settings.db_path,
+        max_concurrency=settings.protocol_validation_max_concurrency,
+    )
 
     results = []
     total_validation_cost = 0.0
-
-    for protocol, name_similarity in protocols_to_check:
-        if not protocol or not protocol.normalized_text:
-            continue
-
-        if use_llm and anthropic_key:
-            # Use LLM-based semantic validation
-            client = anthropic.AsyncAnthropic(api_key=anthropic_key)
-            result = await validate_run_against_protocol_llm(
-                run_markdown=run_markdown,
-                protocol_text=protocol.normalized_text,
-                protocol_id=protocol.protocol_id,
-                protocol_name=protocol.name,
-                anthropic_client=client,
-            )
-            if result.validation_cost_usd:
-                total_validation_cost += result.validation_cost_usd
-        else:
-            # Fallback to legacy pattern matching
-            result = validate_run_against_protocol(
-                run_markdown=run_markdown,
-                protocol_text=protocol.normalized_text,
-                protocol_id=protocol.protocol_id,
-                protocol_name=protocol.name,
-            )
+    for (protocol, name_similarity), result in zip(checkable, validation_results, strict=True):
+        if result.validation_cost_usd:
+            total_validation_cost += result.validation_cost_usd
 
         validation_id = save_validation_result(settings.db_path, run_id, result)
 
@@ -848,6 +945,65 @@ async def api_validate_run(
     }
 
 
+@router.post("/{run_id}/validate")
+async def api_validate_run(
+    run_id: str = FastAPIPath(..., pattern=r"^[a-f0-9]{32}$", description="32-char hex ID"),
+    protocol_id: str | None = None,
+    use_llm: bool = True,
+) -> dict[str, Any]:
+    """
+    Validate a run against protocols using LLM semantic comparison.
+
+    If protocol_id is provided, validates against that protocol.
+    Otherwise, finds similar protocols automatically.
+
+    Args:
+        use_llm: If True (default), uses LLM for semantic comparison. If False, uses legacy pattern matching.
+    """
+    run, run_markdown, anthropic_key = _load_validation_inputs(run_id, use_llm)
+
+    # Find protocols to validate against
+    protocols_to_check: list[tuple[Protocol, float]] = []
+    if protocol_id:
+        protocol = get_protocol(settings.db_path, protocol_id, load_text=True)
+        if not protocol:
+            raise HTTPException(status_code=404, detail="Protocol not found")
+        protocols_to_check.append((protocol, 1.0))
+    else:
+        # Find similar protocols automatically
+        similar = find_similar_protocols(settings.db_path, run.procedure, threshold=0.3)
+        # Load text for each (a protocol deleted since the search is skipped)
+        for p, score in similar[:5]:  # Limit to top 5
+            loaded = get_protocol(settings.db_path, p.protocol_id, load_text=True)
+            if loaded is not None:
+                protocols_to_check.append((loaded, score))
+
+    return await _validate_and_save(run_id, run_markdown, protocols_to_check, anthropic_key)
+
+
+@router.post("/{run_id}/validate/batch")
+async def api_validate_run_batch(
+    req: ValidateBatchRequest,
+    run_id: str = FastAPIPath(..., pattern=r"^[a-f0-9]{32}$", description="32-char hex ID"),
+) -> dict[str, Any]:
+    """
+    Validate a run against several protocols in one request.
+
+    Validations run concurrently (bounded by protocol_validation_max_concurrency)
+    and unchanged run/protocol pairs are served from the validation cache.
+    """
+    _, run_markdown, anthropic_key = _load_validation_inputs(run_id, req.use_llm)
+
+    protocol_ids = list(dict.fromkeys(req.protocol_ids))
+    protocols = [(pid, get_protocol(settings.db_path, pid, load_text=True)) for pid in protocol_ids]
+    missing = [pid for pid, protocol in protocols if protocol is None]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Protocols not found: {', '.join(missing)}")
+
+    protocols_to_check = [(protocol, 1.0) for _, protocol in protocols if protocol is not None]
+    return await _validate_and_save(run_id, run_markdown, protocols_to_check, anthropic_key)
+
+
 @router.get("/{run_id}/validations")
 def api_get_validations(
     run_id: str = FastAPIPath(..., pattern=r"^[a-f0-9]{32}$", description="32-char hex ID"),
@@ -935,22 +1091,57 @@ def api_diff_runs(
     return diff_to_dict(diff)
 
 
+_MAX_PAGE_SIZE = 1000
+
+
+def _pagination_clause(limit: int | None, offset: int) -> tuple[str, list[int]]:
+    """Build a LIMIT/OFFSET clause for list endpoints.
+
+    Args:
+        limit: Maximum number of rows to return (None for all rows).
+        offset: Number of rows to skip.
+
+    Returns:
+        SQL fragment and its parameters.
+
+    Raises:
+        HTTPException: 400 if limit or offset is out of range.
+    """
+    if limit is not None and not 1 <= limit <= _MAX_PAGE_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid limit {limit}. Must be between 1 and {_MAX_PAGE_SIZE}",
+        )
+    if offset < 0:
+        raise HTTPException(status_code=400, detail=f"Invalid offset {offset}. Must be >= 0")
+    if limit is None:
+        if offset == 0:
+            return "", []
+        # SQLite requires a LIMIT before OFFSET; -1 means no limit.
+        return " LIMIT -1 OFFSET ?", [offset]
+    return " LIMIT ? OFFSET ?", [limit, offset]
+
+
 @router.get("/{run_id}/claims", response_model=list[Claim])
 def api_get_claims(
     run_id: str = FastAPIPath(..., pattern=r"^[a-f0-9]{32}$", description="32-char hex ID"),
     type: str | None = None,
+    limit: int | None = None,
+    offset: int = 0,
 ) -> list[Claim]:
-    """Get all claims for a specific run.
+    """Get claims for a specific run.
 
     Args:
         run_id: The procedure run ID.
         type: Optional filter by claim type (e.g., 'dose', 'threshold').
+        limit: Optional page size (1-1000). All claims are returned when omitted.
+        offset: Number of claims to skip.
 
     Returns:
-        List of claims for the run.
+        List of claims for the run, ordered by line number.
 
     Raises:
-        HTTPException: 404 if run not found, 400 if invalid type filter.
+        HTTPException: 404 if run not found, 400 if invalid type filter or page.
     """
     run = get_run(settings.db_path, run_id)
     if run is None:
@@ -964,33 +1155,24 @@ def api_get_claims(
                 status_code=400,
                 detail=f"Invalid claim type '{type}'. Valid types: {valid_types}",
             )
+    page_sql, page_params = _pagination_clause(limit, offset)
 
     # Query claims from database
     with _connect(settings.db_path) as conn:
+        query = """
+            SELECT id, run_id, claim_type, text, normalized_value, unit,
+                   source_refs_json, line_number, confidence, created_at_utc
+            FROM claims
+            WHERE run_id = ?
+        """
+        params: list[str | int] = [run_id]
+
         if type is not None:
-            cursor = conn.execute(
-                """
-                SELECT id, run_id, claim_type, text, normalized_value, unit,
-                       source_refs_json, line_number, confidence, created_at_utc
-                FROM claims
-                WHERE run_id = ? AND claim_type = ?
-                ORDER BY line_number
-                """,
-                (run_id, type),
-            )
-        else:
-            cursor = conn.execute(
-                """
-                SELECT id, run_id, claim_type, text, normalized_value, unit,
-                       source_refs_json, line_number, confidence, created_at_utc
-                FROM claims
-                WHERE run_id = ?
-                ORDER BY line_number
-                """,
-                (run_id,),
-            )
+            query += " AND claim_type = ?"
+            params.append(type)
 
-        rows = cursor.fetchall()
+        query += " ORDER BY line_number, id" + page_sql
+        rows = conn.execute(query, [*params, *page_params]).fetchall()
 
     # Convert to Claim objects
     return [Claim.from_db_row(row) for row in rows]
@@ -1106,7 +1288,7 @@ def api_get_gates(
             FROM gates
             WHERE run_id = ?
         """
-        params: list = [run_id]
+        params: list[str | int] = [run_id]
 
         if status is not None:
             base_query += " AND status = ?"
@@ -1129,49 +1311,52 @@ def api_get_gates(
 def api_get_chunks(
     run_id: str = FastAPIPath(..., pattern=r"^[a-f0-9]{32}$", description="32-char hex ID"),
     source_id: str | None = None,
+    limit: int | None = None,
+    offset: int = 0,
+    include_embeddings: bool = True,
 ) -> list[EvidenceChunk]:
-    """Get all evidence chunks for a specific run.
+    """Get evidence chunks for a specific run.
 
     Args:
         run_id: The procedure run ID.
         source_id: Optional filter by source ID (e.g., 'SRC001').
+        limit: Optional page size (1-1000). All chunks are returned when omitted.
+        offset: Number of chunks to skip.
+        include_embeddings: When False, embedding vectors are neither read
+            nor decoded and are returned as null.
 
     Returns:
         List of evidence chunks for the run, ordered by source_id then chunk_index.
 
     Raises:
-        HTTPException: 404 if run not found.
+        HTTPException: 404 if run not found, 400 if invalid page.
     """
     run = get_run(settings.db_path, run_id)
     if run is None:
         raise HTTPException(status_code=404, detail="Run not found")
+    page_sql, page_params = _pagination_clause(limit, offset)
+
+    # Packed BLOB embeddings take precedence over legacy JSON rows.
+    embedding_column = (
+        "COALESCE(embedding_vector_blob, embedding_vector_json)" if include_embeddings else "NULL"
+    )
 
     # Query chunks from database
     with _connect(settings.db_path) as conn:
+        query = f"""
+            SELECT id, run_id, source_id, text, chunk_index, start_char, end_char,
+                   {embedding_column}, metadata_json, created_at_utc
+            FROM evidence_chunks
+            WHERE run_id = ?
+        """
+        params: list[str | int] = [run_id]
+
         if source_id is not None:
-            cursor = conn.execute(
-                """
-                SELECT id, run_id, source_id, text, chunk_index, start_char, end_char,
-                       embedding_vector_json, metadata_json, created_at_utc
-                FROM evidence_chunks
-                WHERE run_id = ? AND source_id = ?
-                ORDER BY source_id, chunk_index
-                """,
-                (run_id, source_id),
-            )
-        else:
-            cursor = conn.execute(
-                """
-                SELECT id, run_id, source_id, text, chunk_index, start_char, end_char,
-                       embedding_vector_json, metadata_json, created_at_utc
-                FROM evidence_chunks
-                WHERE run_id = ?
-                ORDER BY source_id, chunk_index
-                """,
-                (run_id,),
-            )
+            query += " AND source_id = ?"
+            params.append(source_id)
 
-        rows = cursor.fetchall()
+        query += " ORDER BY source_id, chunk_index, id" + page_sql
+        rows = conn.execute(query, [*params, *page_params]).fetchall()
 
     # Convert to EvidenceChunk objects
     return [EvidenceChunk.from_db_row(row) for row in rows]
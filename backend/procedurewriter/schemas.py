@@ -137,3 +137,10 @@ class CostSummaryResponse(BaseModel):
 
 class RunAckRequest(BaseModel):
     ack_note: str | None = None
+
+
+class ValidateBatchRequest(BaseModel):
+    """Validate one run against several protocols in one request."""
+
+    protocol_ids: list[str] = Field(min_length=1, max_length=50)
+    use_llm: bool = True
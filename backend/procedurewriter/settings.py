@@ -30,6 +30,24 @@ class Settings(BaseSettings):
     # Evidence verification (uses Anthropic Haiku)
     enable_evidence_verification: bool = True
 
+    # Protocol validation: concurrent LLM comparisons per request
+    protocol_validation_max_concurrency: int = 4
+
+    # Query plans (expanded terms + provider queries) are reused for this long
+    query_plan_ttl_s: int = 30 * 24 * 3600
+
+    # PDF/DOCX extraction: worker processes (0/1 = in-process) and PDF pages per task
+    extraction_max_workers: int = 2
+    extraction_pages_per_task: int = 20
+
+    # Run documents (DOCX): render worker processes (0/1 = in-process); lazy
+    # rendering defers them from the end of the run to their first download
+    docx_render_max_workers: int = 4
+    docx_render_lazy: bool = False
+
+    # Bulk library ingestion: largest uncompressed ZIP archive accepted
+    bulk_ingest_max_archive_mb: int = 2048
+
     # Evidence source requirements
     require_international_sources: bool = True
     require_danish_guidelines: bool = True
@@ -42,6 +60,10 @@ class Settings(BaseSettings):
     queue_max_attempts: int = 3
     queue_max_concurrency: int = 2
     queue_start_worker_on_startup: bool = True
+    # A standalone worker writes its metrics here every interval for /metrics;
+    # snapshots older than the max age belong to stopped workers
+    metrics_export_interval_s: float = 15.0
+    metrics_snapshot_max_age_s: float = 300.0
 
     # LLM Provider Configuration
     llm_provider: LLMProviderEnum = LLMProviderEnum.OPENAI
@@ -79,6 +101,8 @@ class Settings(BaseSettings):
     wiley_tdm_token: str | None = None
     wiley_tdm_base_url: str = "https://api.wiley.com/onlinelibrary/tdm/v1"
     wiley_tdm_max_downloads: int = 5
+    # Concurrent TDM fetches; requests still go out at the host's 1 req/sec limit
+    wiley_tdm_max_concurrency: int = 4
     wiley_tdm_allow_non_wiley_doi: bool = False
     wiley_tdm_use_client: bool = True
 
@@ -115,6 +139,14 @@ class Settings(BaseSettings):
     def uploads_dir(self) -> Path:
         return self.resolved_data_dir / "uploads"
 
+    @property
+    def ingest_jobs_dir(self) -> Path:
+        return self.resolved_data_dir / "ingest_jobs"
+
+    @property
+    def metrics_dir(self) -> Path:
+        return self.resolved_data_dir / "metrics"
+
     @property
     def author_guide_path(self) -> Path:
         return self.resolved_config_dir / "author_guide.yaml"
@@ -5,16 +5,21 @@ import asyncio
 import contextlib
 import logging
 import os
+import signal
+import time
 import uuid
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 import anyio
 
+from procedurewriter.crypto import get_or_create_key
 from procedurewriter.db import (
     claim_next_run,
     get_run,
     get_secret,
+    init_db,
     list_library_sources,
     mark_stale_runs,
     release_run_lock,
@@ -22,9 +27,15 @@ from procedurewriter.db import (
     update_run_heartbeat,
     update_run_status,
 )
+from procedurewriter.library_ingest import (
+    IngestJob,
+    claim_next_ingest_job,
+    run_ingest_job,
+    update_ingest_job_heartbeat,
+)
+from procedurewriter.metrics import QUEUE_CLAIM_DURATION, QUEUE_WAIT, write_metrics_snapshot
 from procedurewriter.pipeline.evidence import EvidenceGapAcknowledgementRequired
 from procedurewriter.pipeline.io import write_json
-from procedurewriter.pipeline.run import run_pipeline
 from procedurewriter.settings import Settings
 
 logger = logging.getLogger(__name__)
@@ -56,6 +67,16 @@ def _effective_serpapi_api_key(settings: Settings) -> str | None:
     )
 
 
+def _observe_queue_wait(created_at_utc: str) -> None:
+    try:
+        created = datetime.fromisoformat(created_at_utc.replace("Z", "+00:00"))
+    except ValueError:
+        return
+    if created.tzinfo is None:
+        created = created.replace(tzinfo=UTC)
+    QUEUE_WAIT.observe(max(0.0, (datetime.now(UTC) - created).total_seconds()))
+
+
 async def _heartbeat_loop(
     *,
     run_id: str,
@@ -75,6 +96,9 @@ async def _run_job(
     settings: Settings,
     semaphore: asyncio.Semaphore,
 ) -> None:
+    # run.py imports every stage, agent and LLM SDK; defer that to the first job
+    from procedurewriter.pipeline.run import run_pipeline
+
     async with semaphore:
         stop_hb = asyncio.Event()
         hb_task = asyncio.create_task(
@@ -142,6 +166,32 @@ async def _run_job(
                 await hb_task
 
 
+async def _run_ingest_job(
+    *,
+    job: IngestJob,
+    worker_id: str,
+    settings: Settings,
+    semaphore: asyncio.Semaphore,
+) -> None:
+    async with semaphore:
+        stop_hb = asyncio.Event()
+
+        async def heartbeat() -> None:
+            while not stop_hb.is_set():
+                await asyncio.sleep(settings.queue_heartbeat_interval_s)
+                update_ingest_job_heartbeat(settings.db_path, job_id=job.job_id, worker_id=worker_id)
+
+        hb_task = asyncio.create_task(heartbeat())
+        try:
+            # run_ingest_job records its own failures on the job
+            await anyio.to_thread.run_sync(run_ingest_job, settings, job)
+        finally:
+            stop_hb.set()
+            hb_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await hb_task
+
+
 async def run_worker(
     *,
     settings: Settings,
@@ -170,15 +220,35 @@ async def run_worker(
             await asyncio.sleep(settings.queue_poll_interval_s)
             continue
 
+        claim_start = time.perf_counter()
         claimed = claim_next_run(
             settings.db_path,
             worker_id=worker_id,
             max_attempts=settings.queue_max_attempts,
         )
+        QUEUE_CLAIM_DURATION.observe(
+            time.perf_counter() - claim_start,
+            outcome="empty" if claimed is None else "claimed",
+        )
         if claimed is None:
+            # Runs take priority; bulk ingestion uses otherwise idle slots
+            ingest_job = claim_next_ingest_job(
+                settings.db_path,
+                worker_id=worker_id,
+                max_attempts=settings.queue_max_attempts,
+                stale_after_s=settings.queue_stale_timeout_s,
+            )
+            if ingest_job is not None:
+                tasks.add(
+                    asyncio.create_task(
+                        _run_ingest_job(job=ingest_job, worker_id=worker_id, settings=settings, semaphore=semaphore)
+                    )
+                )
+                continue
             await asyncio.sleep(settings.queue_poll_interval_s)
             continue
 
+        _observe_queue_wait(claimed.created_at_utc)
         task = asyncio.create_task(
             _run_job(run_id=claimed.run_id, worker_id=worker_id, settings=settings, semaphore=semaphore)
         )
@@ -188,3 +258,62 @@ async def run_worker(
         task.cancel()
         with contextlib.suppress(asyncio.CancelledError):
             await task
+
+
+def _export_metrics(path: Path) -> None:
+    try:
+        write_metrics_snapshot(path)
+    except OSError as e:
+        logger.warning("Failed to export metrics to %s: %s", path, e)
+
+
+async def _metrics_export_loop(*, path: Path, settings: Settings, stop_event: asyncio.Event) -> None:
+    """Export this process's metrics for the API's /metrics until stopped."""
+    while not stop_event.is_set():
+        _export_metrics(path)
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(stop_event.wait(), timeout=settings.metrics_export_interval_s)
+    _export_metrics(path)
+
+
+async def _serve(settings: Settings) -> None:
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        with contextlib.suppress(NotImplementedError):  # Windows
+            loop.add_signal_handler(sig, stop_event.set)
+    # A worker inside the API process records into the API's registry; a
+    # standalone one has to export its own
+    worker_id = f"worker-{uuid.uuid4().hex[:8]}"
+    export_task = asyncio.create_task(
+        _metrics_export_loop(path=settings.metrics_dir / f"{worker_id}.json", settings=settings, stop_event=stop_event)
+    )
+    try:
+        await run_worker(settings=settings, stop_event=stop_event, worker_id=worker_id)
+    finally:
+        stop_event.set()
+        await export_task
+
+
+def main() -> None:
+    """
+    Run the job worker as a standalone process.
+
+    Does the same startup as the API lifespan (data dirs, database, encryption
+    key) but never imports FastAPI, so a worker container starts in a fraction
+    of the API's import time. Stops cleanly on SIGINT/SIGTERM.
+
+    Usage: ``python -m procedurewriter.worker``
+    """
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    settings = Settings()
+    settings.runs_dir.mkdir(parents=True, exist_ok=True)
+    settings.cache_dir.mkdir(parents=True, exist_ok=True)
+    settings.ingest_jobs_dir.mkdir(parents=True, exist_ok=True)
+    init_db(settings.db_path)
+    get_or_create_key()
+    asyncio.run(_serve(settings))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,17 @@ Benchmark script for profiling pipeline performance.
 
 Usage:
     python scripts/benchmark.py [--iterations N] [--procedure "name"]
+
+    # Offline benchmark over a synthetic library with replayed LLM/HTTP fixtures
+    python scripts/benchmark.py --offline --size medium --iterations 3 --output bench.json
+    python scripts/benchmark.py --offline --size medium --record   # (re)record fixtures
 """
 from __future__ import annotations
 
 import argparse
+import json
 import sys
+import tempfile
 import time
 from datetime import UTC, datetime
 from pathlib import Path
@@ -173,6 +179,60 @@ def profile_components():
     profile.print_summary()
 
 
+def run_offline(args: argparse.Namespace) -> dict:
+    """Record fixtures if needed, then run the offline benchmark in replay mode."""
+    from dataclasses import replace
+
+    from procedurewriter.bench import CORPUS_SIZES, BenchmarkConfig, run_offline_benchmark
+
+    spec = CORPUS_SIZES[args.size]
+    if args.documents:
+        spec = replace(spec, documents=args.documents)
+    if args.paragraphs:
+        spec = replace(spec, paragraphs_per_document=args.paragraphs)
+    spec = replace(spec, seed=args.seed)
+
+    settings = Settings()
+    # LLM prompts depend on the corpus, so each corpus gets its own recording
+    corpus_key = f"{spec.documents}x{spec.paragraphs_per_document}-s{spec.seed}"
+    fixtures_dir = args.fixtures or (settings.resolved_data_dir / "bench" / "fixtures" / corpus_key)
+
+    with tempfile.TemporaryDirectory(prefix="pw-bench-") as tmp:
+        base = BenchmarkConfig(
+            spec=spec,
+            fixtures_dir=fixtures_dir,
+            work_dir=Path(tmp),
+            procedure=args.procedure,
+            context=args.context,
+            settings=settings,
+        )
+        if args.record or not fixtures_dir.exists():
+            upstream = None
+            if args.live:
+                from procedurewriter.llm import get_llm_client
+
+                upstream = get_llm_client(settings.llm_provider.value, enable_cache=False)
+            print(f"Recording fixtures to {fixtures_dir} ({'live' if args.live else 'synthetic'})")
+            run_offline_benchmark(replace(base, record=True, upstream_llm=upstream, live_http=args.live))
+
+        report = run_offline_benchmark(
+            replace(base, iterations=args.iterations, trace_allocations=args.trace_allocations)
+        )
+
+    print(f"\n{'='*60}")
+    print(f"Offline benchmark: {spec.documents} documents, {args.iterations} iteration(s)")
+    print(f"{'='*60}")
+    for name, stats in report["summary"].items():
+        print(f"  {name:<12} median {stats['median_ms']:>10.1f}ms  min {stats['min_ms']:>10.1f}ms")
+    if report["peak_rss_bytes"]:
+        print(f"Peak RSS: {report['peak_rss_bytes'] / 1024 / 1024:.0f} MiB")
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"Report written to {args.output}")
+    return report
+
+
 def main():
     parser = argparse.ArgumentParser(description="Benchmark pipeline performance")
     parser.add_argument("--iterations", "-n", type=int, default=1, help="Number of iterations")
@@ -180,10 +240,24 @@ def main():
     parser.add_argument("--context", "-c", type=str, default="Voksen patient", help="Context")
     parser.add_argument("--live", action="store_true", help="Run with live API calls (not dummy mode)")
     parser.add_argument("--components", action="store_true", help="Profile individual components")
+    parser.add_argument("--offline", action="store_true", help="Offline benchmark with replayed fixtures")
+    parser.add_argument("--size", choices=["tiny", "small", "medium", "large"], default="small",
+                        help="Synthetic library size (offline)")
+    parser.add_argument("--documents", type=int, help="Override the number of library documents (offline)")
+    parser.add_argument("--paragraphs", type=int, help="Override paragraphs per document (offline)")
+    parser.add_argument("--seed", type=int, default=1234, help="Corpus seed (offline)")
+    parser.add_argument("--fixtures", type=Path, help="Fixtures directory (offline)")
+    parser.add_argument("--record", action="store_true",
+                        help="Re-record fixtures before replaying; with --live, from real services")
+    parser.add_argument("--trace-allocations", action="store_true",
+                        help="Also report tracemalloc peaks per stage (slower)")
+    parser.add_argument("--output", "-o", type=Path, help="Write the JSON report here (offline)")
 
     args = parser.parse_args()
 
-    if args.components:
+    if args.offline:
+        run_offline(args)
+    elif args.components:
         profile_components()
     else:
         run_benchmark(
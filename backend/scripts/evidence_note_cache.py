@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Inspect or invalidate the cross-run evidence-note cache.
+
+Usage:
+    # Show the number of cached notes
+    python scripts/evidence_note_cache.py stats
+
+    # Drop notes for one procedure, model and/or prompt version
+    python scripts/evidence_note_cache.py invalidate --procedure "Pleuradræn" --model gpt-4o-mini
+
+    # Drop everything
+    python scripts/evidence_note_cache.py invalidate --all
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from procedurewriter.pipeline.evidence_note_cache import EvidenceNoteCache
+from procedurewriter.settings import settings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Evidence-note cache maintenance")
+    parser.add_argument(
+        "--cache-dir", type=Path, default=None, help="Cache directory (default: data/cache)"
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("stats", help="Show the number of cached notes")
+
+    invalidate = sub.add_parser("invalidate", help="Delete cached notes")
+    invalidate.add_argument("--procedure", help="Only notes for this procedure title")
+    invalidate.add_argument("--model", help="Only notes generated by this model")
+    invalidate.add_argument("--prompt-version", help="Only notes from this prompt version")
+    invalidate.add_argument("--all", action="store_true", help="Delete every cached note")
+
+    args = parser.parse_args()
+    cache = EvidenceNoteCache(args.cache_dir or settings.cache_dir)
+
+    if args.command == "stats":
+        print(f"Cached notes: {cache.get_stats()['entries']}")
+        return 0
+
+    if not (args.all or args.procedure or args.model or args.prompt_version):
+        parser.error("invalidate needs --all or at least one of --procedure/--model/--prompt-version")
+    deleted = cache.invalidate(
+        procedure_title=args.procedure,
+        prompt_version=args.prompt_version,
+        model=args.model,
+    )
+    print(f"Deleted {deleted} cached notes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
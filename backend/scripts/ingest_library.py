@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Bulk-ingest a folder or ZIP archive of PDFs, DOCX files and URL lists into the library.
+
+Files already in the library (same sha256) are skipped. URLs come from
+``.url`` shortcuts and ``urls.txt`` files and must match the source allowlist.
+
+Usage:
+    # Ingest now, in this process
+    python scripts/ingest_library.py ~/guidelines/
+
+    # Queue for the background worker instead (follow progress in the API)
+    python scripts/ingest_library.py ~/guidelines.zip --queue
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import uuid
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from procedurewriter.db import init_db
+from procedurewriter.library_ingest import create_ingest_job, run_ingest_job
+from procedurewriter.pipeline.events import EVENT_LOG_FILENAME, EventLog
+from procedurewriter.pipeline.extraction import shutdown_extraction_service
+from procedurewriter.settings import settings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Bulk library ingestion")
+    parser.add_argument("path", type=Path, help="Folder or ZIP archive to ingest")
+    parser.add_argument("--queue", action="store_true", help="Queue the job for the worker and exit")
+    args = parser.parse_args()
+
+    input_path = args.path.expanduser().resolve()
+    if not input_path.exists():
+        parser.error(f"{input_path} does not exist")
+
+    init_db(settings.db_path)
+    job_id = uuid.uuid4().hex
+    job_dir = settings.ingest_jobs_dir / job_id
+    job_dir.mkdir(parents=True, exist_ok=True)
+
+    if args.queue:
+        create_ingest_job(settings.db_path, input_path=input_path, job_dir=job_dir, job_id=job_id)
+        print(f"Queued ingest job {job_id}")
+        return 0
+
+    job = create_ingest_job(
+        settings.db_path, input_path=input_path, job_dir=job_dir, job_id=job_id, locked_by="cli"
+    )
+    try:
+        job = run_ingest_job(settings, job)
+    finally:
+        shutdown_extraction_service()
+
+    events, _ = EventLog(job_dir / EVENT_LOG_FILENAME).read_from(0)
+    for event in events:
+        if event.data.get("outcome") == "failed":
+            print(f"FAILED {event.data['item']}: {event.data.get('error')}")
+
+    print(
+        f"Job {job.job_id} {job.status}: {job.added} added, {job.duplicates} duplicates, "
+        f"{job.failed} failed of {job.total}"
+    )
+    if job.error:
+        print(f"Error: {job.error}")
+    return 0 if job.status == "DONE" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the text hot paths with regression checks.
+
+The committed baseline, benchmarks/micro_baseline.json, was recorded on a
+Linux x86_64 dev machine. Re-record it on the machine that runs compare
+(e.g. the CI runner) before relying on tight thresholds.
+
+Usage:
+    # Run and store a baseline (e.g. on main, on the CI runner)
+    python scripts/microbench.py run --output benchmarks/micro_baseline.json
+
+    # Run again and fail (exit 1) on >20% slowdowns or super-linear scaling
+    python scripts/microbench.py compare --baseline benchmarks/micro_baseline.json --threshold 20
+
+    # Only check scaling of an existing report (no baseline needed)
+    python scripts/microbench.py check report.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from procedurewriter.bench.micro import (
+    MICRO_BENCHMARKS,
+    Regression,
+    check_scaling,
+    compare_reports,
+    run_micro_benchmarks,
+)
+
+
+def _print_report(report: dict) -> None:
+    for name, entry in report["benchmarks"].items():
+        timings = "  ".join(
+            f"n={size}: {t['median_s'] * 1000:.2f}ms" for size, t in entry["sizes"].items()
+        )
+        print(f"  {name:<36} {timings}")
+
+
+def _print_regressions(regressions: list[Regression]) -> None:
+    for r in regressions:
+        where = f" n={r.size}" if r.size else ""
+        print(f"  REGRESSION {r.name}{where}: {r.detail}")
+
+
+def _run(args: argparse.Namespace) -> dict:
+    report = run_micro_benchmarks(
+        args.names or None,
+        quick=args.quick,
+        repeat=args.repeat,
+        min_time_s=args.min_time,
+    )
+    _print_report(report)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"Report written to {args.output}")
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Micro-benchmarks with regression thresholds")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add_run_args(p: argparse.ArgumentParser) -> None:
+        p.add_argument("--names", nargs="*", choices=sorted(MICRO_BENCHMARKS), help="Benchmarks to run")
+        p.add_argument("--quick", action="store_true", help="Only the two smallest sizes")
+        p.add_argument("--repeat", type=int, default=5, help="Timed repeats per size")
+        p.add_argument("--min-time", type=float, default=0.05, help="Minimum seconds per repeat")
+        p.add_argument("--output", "-o", type=Path, help="Write the JSON report here")
+
+    add_run_args(sub.add_parser("run", help="Run benchmarks"))
+
+    compare = sub.add_parser("compare", help="Run benchmarks and compare against a baseline")
+    add_run_args(compare)
+    compare.add_argument("--baseline", type=Path, required=True, help="Baseline report JSON")
+    compare.add_argument("--threshold", type=float, default=20.0, help="Allowed slowdown in percent")
+
+    check = sub.add_parser("check", help="Check scaling of an existing report")
+    check.add_argument("report", type=Path)
+
+    args = parser.parse_args()
+
+    if args.command == "check":
+        report = json.loads(args.report.read_text(encoding="utf-8"))
+        regressions = check_scaling(report)
+    elif args.command == "compare":
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        report = _run(args)
+        regressions = compare_reports(baseline, report, threshold_pct=args.threshold)
+        regressions += check_scaling(report)
+    else:
+        report = _run(args)
+        regressions = check_scaling(report)
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s):")
+        _print_regressions(regressions)
+        return 1
+    print("\nNo regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -262,3 +262,76 @@ class TestGetEvidenceChunks:
         assert len(data) == 1
         assert "væske" in data[0]["text"]
         assert "intravenøst" in data[0]["text"]
+
+
+class TestChunksPagination:
+    """Tests for paging and embedding projection on the chunks endpoint."""
+
+    def _seed(self, db_path, runs_dir, run_id: str) -> list[EvidenceChunk]:
+        from procedurewriter.db import save_claim_system_records
+
+        with _connect(db_path) as conn:
+            _create_run(conn, run_id, runs_dir)
+            conn.commit()
+        chunks = [
+            EvidenceChunk(
+                run_id=run_id,
+                source_id="SRC001",
+                text=f"Chunk {i}",
+                chunk_index=i,
+                embedding_vector=[0.5, 0.25, 0.125],
+            )
+            for i in range(5)
+        ]
+        save_claim_system_records(db_path, chunks=chunks)
+        return chunks
+
+    def test_limit_and_offset(self, test_client):
+        """Should return the requested page in chunk order."""
+        client, db_path, runs_dir = test_client
+        run_id = uuid4().hex
+        self._seed(db_path, runs_dir, run_id)
+
+        response = client.get(f"/api/runs/{run_id}/chunks?limit=2&offset=1")
+        assert response.status_code == 200
+
+        data = response.json()
+        assert [c["chunk_index"] for c in data] == [1, 2]
+
+    def test_offset_without_limit(self, test_client):
+        """Offset alone should skip rows and return the rest."""
+        client, db_path, runs_dir = test_client
+        run_id = uuid4().hex
+        self._seed(db_path, runs_dir, run_id)
+
+        response = client.get(f"/api/runs/{run_id}/chunks?offset=3")
+        assert response.status_code == 200
+        assert [c["chunk_index"] for c in response.json()] == [3, 4]
+
+    def test_invalid_limit_returns_400(self, test_client):
+        """Out-of-range page sizes should be rejected."""
+        client, db_path, runs_dir = test_client
+        run_id = uuid4().hex
+        self._seed(db_path, runs_dir, run_id)
+
+        assert client.get(f"/api/runs/{run_id}/chunks?limit=0").status_code == 400
+        assert client.get(f"/api/runs/{run_id}/chunks?offset=-1").status_code == 400
+
+    def test_packed_embeddings_are_decoded(self, test_client):
+        """Embeddings stored as BLOBs should be returned as float lists."""
+        client, db_path, runs_dir = test_client
+        run_id = uuid4().hex
+        self._seed(db_path, runs_dir, run_id)
+
+        data = client.get(f"/api/runs/{run_id}/chunks?limit=1").json()
+        assert data[0]["embedding_vector"] == [0.5, 0.25, 0.125]
+
+    def test_exclude_embeddings(self, test_client):
+        """include_embeddings=false should omit embedding vectors."""
+        client, db_path, runs_dir = test_client
+        run_id = uuid4().hex
+        self._seed(db_path, runs_dir, run_id)
+
+        data = client.get(f"/api/runs/{run_id}/chunks?include_embeddings=false").json()
+        assert len(data) == 5
+        assert all(c["embedding_vector"] is None for c in data)
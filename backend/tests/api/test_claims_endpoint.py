@@ -321,3 +321,32 @@ class TestGetClaims:
         assert len(claims) == 1
         assert claims[0]["source_refs"] == ["SRC0001", "SRC0002", "SRC0003"]
         assert isinstance(claims[0]["source_refs"], list)
+
+    def test_get_claims_paginated(self, test_client):
+        """Should honour limit/offset and keep line-number order."""
+        from procedurewriter.db import save_claim_system_records
+
+        client, db_path, runs_dir = test_client
+        run_id = uuid4().hex
+
+        with _connect(db_path) as conn:
+            _create_run(conn, run_id, runs_dir)
+
+        claims = [
+            Claim(
+                run_id=run_id,
+                claim_type=ClaimType.DOSE,
+                text=f"paracetamol {i} g",
+                line_number=i + 1,
+                confidence=0.9,
+            )
+            for i in range(4)
+        ]
+        save_claim_system_records(db_path, claims=claims)
+
+        response = client.get(f"/api/runs/{run_id}/claims?type=dose&limit=2&offset=2")
+        assert response.status_code == 200
+        assert [c["line_number"] for c in response.json()] == [3, 4]
+
+        response = client.get(f"/api/runs/{run_id}/claims?limit=5000")
+        assert response.status_code == 400
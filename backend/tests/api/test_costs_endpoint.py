@@ -0,0 +1,102 @@
+"""Tests for GET /api/runs/{run_id}/costs endpoint.
+
+Run: pytest tests/api/test_costs_endpoint.py -v
+"""
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from procedurewriter.db import _connect, init_db, insert_llm_calls
+from procedurewriter.main import app
+
+
+@pytest.fixture
+def test_client():
+    """Create test client with temporary database."""
+    from procedurewriter.settings import settings
+    original_data_dir = settings.data_dir
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data_dir = Path(tmpdir)
+        (data_dir / "index").mkdir(parents=True, exist_ok=True)
+        runs_dir = data_dir / "runs"
+        runs_dir.mkdir(parents=True, exist_ok=True)
+        db_path = data_dir / "index" / "runs.sqlite3"
+        init_db(db_path)
+
+        settings.data_dir = data_dir
+
+        try:
+            with TestClient(app) as client:
+                yield client, db_path, runs_dir
+        finally:
+            settings.data_dir = original_data_dir
+
+
+def _create_run(conn, run_id: str, runs_dir: Path) -> None:
+    """Helper to create a run with required fields."""
+    run_dir = runs_dir / run_id
+    run_dir.mkdir(parents=True, exist_ok=True)
+    conn.execute(
+        """
+        INSERT INTO runs (run_id, run_dir, created_at_utc, updated_at_utc, procedure, status)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        (run_id, str(run_dir), "2024-12-22T00:00:00Z", "2024-12-22T00:00:00Z", "Test", "DONE"),
+    )
+
+
+class TestGetCosts:
+    """Tests for GET /api/runs/{run_id}/costs endpoint."""
+
+    def test_get_costs_rollup(self, test_client):
+        """Should aggregate persisted LLM calls per agent and stage."""
+        client, db_path, runs_dir = test_client
+        run_id = uuid4().hex
+
+        with _connect(db_path) as conn:
+            _create_run(conn, run_id, runs_dir)
+        ts = "2024-12-22T00:00:00+00:00"
+        insert_llm_calls(
+            db_path,
+            run_id,
+            [
+                (ts, "gpt-4o", "Writer", "Writer", "write", 100, 50, 0.01),
+                (ts, "gpt-4o", "Editor", "Editor", "write", 200, 20, 0.02),
+                (ts, "gpt-4o", "write_section:Intro", None, None, 10, 5, 0.001),
+            ],
+        )
+        insert_llm_calls(db_path, uuid4().hex, [(ts, "gpt-4o", "Writer", "Writer", "write", 1, 1, 1.0)])
+
+        response = client.get(f"/api/runs/{run_id}/costs")
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["totals"]["call_count"] == 3
+        assert data["totals"]["cost_usd"] == pytest.approx(0.031)
+        assert set(data["by_agent"]) == {"Writer", "Editor"}
+        assert data["by_stage"]["write"]["input_tokens"] == 300
+
+    def test_get_costs_empty_run(self, test_client):
+        """Runs without recorded calls return zero totals."""
+        client, db_path, runs_dir = test_client
+        run_id = uuid4().hex
+
+        with _connect(db_path) as conn:
+            _create_run(conn, run_id, runs_dir)
+
+        data = client.get(f"/api/runs/{run_id}/costs").json()
+        assert data["totals"]["call_count"] == 0
+        assert data["by_agent"] == {}
+
+    def test_get_costs_run_not_found(self, test_client):
+        """Should return 404 when run does not exist."""
+        client, _, _ = test_client
+
+        response = client.get(f"/api/runs/{uuid4().hex}/costs")
+        assert response.status_code == 404
@@ -0,0 +1,192 @@
+"""Tests for GET /api/runs/{run_id}/events endpoint.
+
+The endpoint tails the persistent per-run event log, so it must work
+without an in-process emitter.
+
+Run: pytest tests/api/test_events_endpoint.py -v
+"""
+from __future__ import annotations
+
+import json
+import tempfile
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from procedurewriter.db import _connect, init_db
+from procedurewriter.main import app
+from procedurewriter.pipeline.events import (
+    EVENT_LOG_FILENAME,
+    EventLog,
+    EventType,
+    PipelineEvent,
+)
+
+
+@pytest.fixture
+def test_client():
+    """Create test client with temporary database."""
+    from procedurewriter.settings import settings
+    original_data_dir = settings.data_dir
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data_dir = Path(tmpdir)
+        (data_dir / "index").mkdir(parents=True, exist_ok=True)
+        runs_dir = data_dir / "runs"
+        runs_dir.mkdir(parents=True, exist_ok=True)
+        db_path = data_dir / "index" / "runs.sqlite3"
+        init_db(db_path)
+
+        settings.data_dir = data_dir
+
+        try:
+            with TestClient(app) as client:
+                yield client, db_path, runs_dir
+        finally:
+            settings.data_dir = original_data_dir
+
+
+def _create_run(db_path: Path, run_id: str, runs_dir: Path, status: str) -> Path:
+    run_dir = runs_dir / run_id
+    run_dir.mkdir(parents=True, exist_ok=True)
+    with _connect(db_path) as conn:
+        conn.execute(
+            """
+            INSERT INTO runs (run_id, run_dir, created_at_utc, updated_at_utc, procedure, status, quality_score)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (run_id, str(run_dir), "2024-12-22T00:00:00Z", "2024-12-22T00:00:00Z", "Test", status, 8),
+        )
+    return run_dir
+
+
+def _parse_stream(text: str) -> list[dict]:
+    payloads = []
+    for line in text.splitlines():
+        if line.startswith("data: "):
+            payloads.append(json.loads(line[len("data: "):]))
+    return payloads
+
+
+class TestEventsEndpoint:
+    """Tests for the SSE events endpoint."""
+
+    def test_run_not_found(self, test_client):
+        client, _, _ = test_client
+        response = client.get(f"/api/runs/{uuid4().hex}/events")
+        assert response.status_code == 404
+
+    def test_replays_log_for_finished_run(self, test_client):
+        """Logged events are replayed, followed by the completion event."""
+        client, db_path, runs_dir = test_client
+        run_id = uuid4().hex
+        run_dir = _create_run(db_path, run_id, runs_dir, "DONE")
+        log = EventLog(run_dir / EVENT_LOG_FILENAME)
+        log.append(PipelineEvent(event_type=EventType.PROGRESS, data={"message": "a"}))
+        log.append(PipelineEvent(event_type=EventType.AGENT_START, data={"agent": "Writer"}))
+
+        response = client.get(f"/api/runs/{run_id}/events")
+
+        assert response.status_code == 200
+        payloads = _parse_stream(response.text)
+        assert [p["event"] for p in payloads] == ["progress", "agent_start", "complete"]
+        assert [p.get("seq") for p in payloads[:2]] == [1, 2]
+        assert payloads[-1]["data"]["quality_score"] == 8
+        assert "id: 2\n" in response.text
+
+    def test_resumes_after_last_event_id(self, test_client):
+        """Events up to Last-Event-ID are not sent again."""
+        client, db_path, runs_dir = test_client
+        run_id = uuid4().hex
+        run_dir = _create_run(db_path, run_id, runs_dir, "DONE")
+        log = EventLog(run_dir / EVENT_LOG_FILENAME)
+        for i in range(3):
+            log.append(PipelineEvent(event_type=EventType.PROGRESS, data={"n": i}))
+
+        response = client.get(f"/api/runs/{run_id}/events", headers={"Last-Event-ID": "2"})
+
+        payloads = _parse_stream(response.text)
+        assert [p.get("seq") for p in payloads] == [3, None]
+
+    def test_failed_run_without_log(self, test_client):
+        """Runs without a log still get a well-formed error event."""
+        client, db_path, runs_dir = test_client
+        run_id = uuid4().hex
+        _create_run(db_path, run_id, runs_dir, "FAILED")
+        with _connect(db_path) as conn:
+            conn.execute("UPDATE runs SET error = ? WHERE run_id = ?", ('bad "quote"', run_id))
+
+        response = client.get(f"/api/runs/{run_id}/events")
+
+        payloads = _parse_stream(response.text)
+        assert payloads == [
+            {"event": "error", "data": {"stage": "pipeline", "error": 'bad "quote"'}, "timestamp": 0}
+        ]
+
+    def test_logged_completion_is_sent_once(self, test_client):
+        """A finished run's logged completion is not repeated by a synthetic one."""
+        client, db_path, runs_dir = test_client
+        run_id = uuid4().hex
+        run_dir = _create_run(db_path, run_id, runs_dir, "DONE")
+        log = EventLog(run_dir / EVENT_LOG_FILENAME)
+        log.append(PipelineEvent(event_type=EventType.PROGRESS, data={"message": "a"}))
+        log.append(PipelineEvent(event_type=EventType.COMPLETE, data={"success": True, "quality_score": 9}))
+
+        payloads = _parse_stream(client.get(f"/api/runs/{run_id}/events").text)
+        assert [p["event"] for p in payloads] == ["progress", "complete"]
+        assert payloads[-1]["data"]["quality_score"] == 9
+
+        resumed = client.get(f"/api/runs/{run_id}/events", headers={"Last-Event-ID": "2"})
+        assert _parse_stream(resumed.text) == []
+
+    def test_stream_continues_past_logged_completion(self, test_client):
+        """Events after COMPLETE are still sent while the run finishes."""
+        client, db_path, runs_dir = test_client
+        run_id = uuid4().hex
+        run_dir = _create_run(db_path, run_id, runs_dir, "RUNNING")
+        with _connect(db_path) as conn:
+            conn.execute(
+                "UPDATE runs SET locked_by = ?, heartbeat_at_utc = ? WHERE run_id = ?",
+                ("dead-worker", "2024-12-22T00:00:00+00:00", run_id),
+            )
+        log = EventLog(run_dir / EVENT_LOG_FILENAME)
+        log.append(PipelineEvent(event_type=EventType.COMPLETE, data={"success": True}))
+        log.append(PipelineEvent(event_type=EventType.PROGRESS, data={"message": "Writing DOCX"}))
+
+        payloads = _parse_stream(client.get(f"/api/runs/{run_id}/events").text)
+        assert [p["event"] for p in payloads] == ["complete", "progress", "error"]
+
+    def test_failure_after_logged_completion_is_sent(self, test_client):
+        """A run that fails after logging completion ends with its error."""
+        client, db_path, runs_dir = test_client
+        run_id = uuid4().hex
+        run_dir = _create_run(db_path, run_id, runs_dir, "FAILED")
+        with _connect(db_path) as conn:
+            conn.execute("UPDATE runs SET error = ? WHERE run_id = ?", ("manifest failed", run_id))
+        EventLog(run_dir / EVENT_LOG_FILENAME).append(
+            PipelineEvent(event_type=EventType.COMPLETE, data={"success": True})
+        )
+
+        payloads = _parse_stream(client.get(f"/api/runs/{run_id}/events").text)
+        assert [p["event"] for p in payloads] == ["complete", "error"]
+        assert payloads[-1]["data"]["error"] == "manifest failed"
+
+    def test_stale_heartbeat_ends_stream(self, test_client):
+        """A run left RUNNING by a dead worker ends with an error event."""
+        client, db_path, runs_dir = test_client
+        run_id = uuid4().hex
+        run_dir = _create_run(db_path, run_id, runs_dir, "RUNNING")
+        with _connect(db_path) as conn:
+            conn.execute(
+                "UPDATE runs SET locked_by = ?, heartbeat_at_utc = ? WHERE run_id = ?",
+                ("dead-worker", "2024-12-22T00:00:00+00:00", run_id),
+            )
+        EventLog(run_dir / EVENT_LOG_FILENAME).append(
+            PipelineEvent(event_type=EventType.PROGRESS, data={"message": "a"})
+        )
+
+        payloads = _parse_stream(client.get(f"/api/runs/{run_id}/events").text)
+        assert [p["event"] for p in payloads] == ["progress", "error"]
+        assert "heartbeat" in payloads[-1]["data"]["error"]
@@ -0,0 +1,94 @@
+"""Tests for GET /api/runs/{run_id}/trace endpoint.
+
+Run: pytest tests/api/test_trace_endpoint.py -v
+"""
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from procedurewriter.db import _connect, init_db
+from procedurewriter.main import app
+from procedurewriter.pipeline.profiler import TRACE_FILENAME, profile_section, run_trace
+
+
+@pytest.fixture
+def test_client():
+    """Create test client with temporary database."""
+    from procedurewriter.settings import settings
+    original_data_dir = settings.data_dir
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data_dir = Path(tmpdir)
+        (data_dir / "index").mkdir(parents=True, exist_ok=True)
+        runs_dir = data_dir / "runs"
+        runs_dir.mkdir(parents=True, exist_ok=True)
+        db_path = data_dir / "index" / "runs.sqlite3"
+        init_db(db_path)
+
+        settings.data_dir = data_dir
+
+        try:
+            with TestClient(app) as client:
+                yield client, db_path, runs_dir
+        finally:
+            settings.data_dir = original_data_dir
+
+
+def _create_run(conn, run_id: str, runs_dir: Path) -> None:
+    """Helper to create a run with required fields."""
+    run_dir = runs_dir / run_id
+    run_dir.mkdir(parents=True, exist_ok=True)
+    conn.execute(
+        """
+        INSERT INTO runs (run_id, run_dir, created_at_utc, updated_at_utc, procedure, status)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        (run_id, str(run_dir), "2024-12-22T00:00:00Z", "2024-12-22T00:00:00Z", "Test", "DONE"),
+    )
+
+
+class TestGetTrace:
+    """Tests for GET /api/runs/{run_id}/trace endpoint."""
+
+    def test_get_trace(self, test_client):
+        """Should serve the Chrome trace written by run_trace."""
+        client, db_path, runs_dir = test_client
+        run_id = uuid4().hex
+
+        with _connect(db_path) as conn:
+            _create_run(conn, run_id, runs_dir)
+        with (
+            run_trace(runs_dir / run_id / TRACE_FILENAME, run_id=run_id),
+            profile_section("stage:retrieve"),
+        ):
+            pass
+
+        response = client.get(f"/api/runs/{run_id}/trace")
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["otherData"]["run_id"] == run_id
+        assert [e["name"] for e in data["traceEvents"]] == ["run", "stage:retrieve"]
+
+    def test_get_trace_missing_file(self, test_client):
+        """Runs without a trace file return 404."""
+        client, db_path, runs_dir = test_client
+        run_id = uuid4().hex
+
+        with _connect(db_path) as conn:
+            _create_run(conn, run_id, runs_dir)
+
+        response = client.get(f"/api/runs/{run_id}/trace")
+        assert response.status_code == 404
+
+    def test_get_trace_run_not_found(self, test_client):
+        """Should return 404 when run does not exist."""
+        client, _, _ = test_client
+
+        response = client.get(f"/api/runs/{uuid4().hex}/trace")
+        assert response.status_code == 404
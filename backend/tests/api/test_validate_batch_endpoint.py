@@ -0,0 +1,115 @@
+"""Tests for POST /api/runs/{run_id}/validate/batch endpoint.
+
+Run: pytest tests/api/test_validate_batch_endpoint.py -v
+"""
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from procedurewriter.db import _connect, init_db
+from procedurewriter.main import app
+from procedurewriter.protocols import upload_protocol
+
+PROCEDURE_MD = """## Indikationer
+Pleuraeffusion med dyspnø.
+
+## Fremgangsmåde
+Giv lidocain 10 mg subkutant.
+"""
+
+
+@pytest.fixture
+def test_client():
+    """Create test client with temporary database."""
+    from procedurewriter.settings import settings
+    original_data_dir = settings.data_dir
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data_dir = Path(tmpdir)
+        (data_dir / "index").mkdir(parents=True, exist_ok=True)
+        runs_dir = data_dir / "runs"
+        runs_dir.mkdir(parents=True, exist_ok=True)
+        db_path = data_dir / "index" / "runs.sqlite3"
+        init_db(db_path)
+
+        settings.data_dir = data_dir
+
+        try:
+            with TestClient(app) as client:
+                yield client, db_path, runs_dir
+        finally:
+            settings.data_dir = original_data_dir
+
+
+def _create_run(db_path: Path, runs_dir: Path) -> str:
+    run_id = uuid4().hex
+    run_dir = runs_dir / run_id
+    run_dir.mkdir(parents=True, exist_ok=True)
+    (run_dir / "procedure.md").write_text(PROCEDURE_MD, encoding="utf-8")
+    with _connect(db_path) as conn:
+        conn.execute(
+            """
+            INSERT INTO runs (run_id, run_dir, created_at_utc, updated_at_utc, procedure, status)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (run_id, str(run_dir), "2024-12-22T00:00:00Z", "2024-12-22T00:00:00Z", "Pleuradræn", "DONE"),
+        )
+    return run_id
+
+
+def _create_protocol(db_path: Path, tmp_dir: Path, name: str, dose: str) -> str:
+    source = tmp_dir / f"{name}.txt"
+    source.write_text(
+        f"Indikationer\nPleuraeffusion med dyspnø.\n\nFremgangsmåde\nGiv lidocain {dose} subkutant.",
+        encoding="utf-8",
+    )
+    return upload_protocol(db_path, source, name=name, storage_dir=tmp_dir / "protocols")
+
+
+class TestValidateBatch:
+    """Tests for POST /api/runs/{run_id}/validate/batch endpoint."""
+
+    def test_validates_all_protocols_in_order(self, test_client):
+        """Each protocol gets a stored validation, in request order."""
+        client, db_path, runs_dir = test_client
+        run_id = _create_run(db_path, runs_dir)
+        ids = [
+            _create_protocol(db_path, runs_dir.parent, "Region H", "10 mg"),
+            _create_protocol(db_path, runs_dir.parent, "Region Syd", "20 mg"),
+        ]
+
+        response = client.post(
+            f"/api/runs/{run_id}/validate/batch",
+            json={"protocol_ids": [*ids, ids[0]], "use_llm": False},
+        )
+        assert response.status_code == 200
+
+        data = response.json()
+        assert [v["protocol_id"] for v in data["validations"]] == ids
+        assert data["validations"][0]["conflict_count"] == 0
+        assert len(client.get(f"/api/runs/{run_id}/validations").json()["validations"]) == 2
+
+    def test_unknown_protocol_returns_404(self, test_client):
+        """Unknown protocol ids are reported before any validation runs."""
+        client, db_path, runs_dir = test_client
+        run_id = _create_run(db_path, runs_dir)
+
+        response = client.post(
+            f"/api/runs/{run_id}/validate/batch",
+            json={"protocol_ids": ["missing1"], "use_llm": False},
+        )
+        assert response.status_code == 404
+        assert "missing1" in response.json()["detail"]
+
+    def test_empty_protocol_list_rejected(self, test_client):
+        """At least one protocol id is required."""
+        client, db_path, runs_dir = test_client
+        run_id = _create_run(db_path, runs_dir)
+
+        response = client.post(f"/api/runs/{run_id}/validate/batch", json={"protocol_ids": []})
+        assert response.status_code == 422
@@ -531,3 +531,43 @@ class TestSemanticBinding:
         result = binder.bind(claims, chunks)
 
         assert "semantic_bindings" in result.binding_stats or "bound_claims" in result.binding_stats
+
+
+class TestBinderCandidatePruning:
+    """Tests for inverted-index candidate pruning and top-k selection."""
+
+    def test_top_k_keeps_highest_scores(self) -> None:
+        """Only the best max_links_per_claim chunks are linked, best first."""
+        binder = EvidenceBinder(max_links_per_claim=2)
+        claim = make_claim("amoxicillin pneumoni dosis")
+        chunks = [
+            make_chunk("amoxicillin", chunk_index=0),
+            make_chunk("amoxicillin pneumoni dosis", chunk_index=1),
+            make_chunk("unrelated text only", chunk_index=2),
+            make_chunk("amoxicillin pneumoni", chunk_index=3),
+        ]
+
+        result = binder.bind([claim], chunks)
+
+        assert [link.evidence_chunk_id for link in result.links] == [chunks[1].id, chunks[3].id]
+
+    def test_ties_keep_chunk_order(self) -> None:
+        """Equal scores are linked in chunk order."""
+        binder = EvidenceBinder(max_links_per_claim=2)
+        claim = make_claim("amoxicillin")
+        chunks = [make_chunk("amoxicillin tablet", chunk_index=i) for i in range(3)]
+
+        result = binder.bind([claim], chunks)
+
+        assert [link.evidence_chunk_id for link in result.links] == [chunks[0].id, chunks[1].id]
+
+    def test_zero_min_score_still_considers_all_chunks(self) -> None:
+        """With min_score 0 chunks without shared keywords can still bind."""
+        binder = EvidenceBinder(min_score=0.0, max_links_per_claim=5)
+        claim = make_claim("amoxicillin")
+        chunks = [make_chunk("unrelated text", chunk_index=0)]
+
+        result = binder.bind([claim], chunks)
+
+        assert len(result.links) == 1
+        assert result.links[0].binding_score == 0.0
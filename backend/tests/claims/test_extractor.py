@@ -270,3 +270,59 @@ class TestExtractorDefaults:
         result1 = extractor.extract(text)
         result2 = extractor.extract_all(text)
         assert len(result1) == len(result2)
+
+
+class TestExtractMany:
+    """Tests for extract_many() batch API."""
+
+    def test_returns_one_list_per_text(self) -> None:
+        """extract_many() returns results in input order."""
+        extractor = ClaimExtractor(run_id="test")
+        texts = ["amoxicillin 50 mg/kg/d", "", "Patienten bør indlægges"]
+        results = extractor.extract_many(texts)
+        assert len(results) == 3
+        assert results[0][0].claim_type == ClaimType.DOSE
+        assert results[1] == []
+        assert results[2][0].claim_type == ClaimType.RECOMMENDATION
+
+    def test_matches_extract(self) -> None:
+        """Batch results are identical to per-text extraction."""
+        extractor = ClaimExtractor(run_id="test")
+        texts = [
+            "1. Sikr luftveje\nSpO2 < 92% [SRC001]",
+            "OBS: må ikke gives ved nyresvigt",
+        ]
+        batch = extractor.extract_many(texts)
+        single = [extractor.extract(t) for t in texts]
+        assert [[c.text for c in claims] for claims in batch] == [
+            [c.text for c in claims] for claims in single
+        ]
+
+
+class TestPrefilter:
+    """Tests that keyword prefilters do not drop claims."""
+
+    def test_prose_without_candidates_returns_empty(self) -> None:
+        """Lines without any candidate tokens yield no claims."""
+        extractor = ClaimExtractor(run_id="test")
+        assert extractor.extract("Dette er en almindelig beskrivelse.") == []
+
+    def test_numbered_step_after_first_line(self) -> None:
+        """Line-anchored step patterns are found beyond the first line."""
+        extractor = ClaimExtractor(run_id="test")
+        claims = extractor.extract("Indledning\n2. Placer patienten i rygleje")
+        steps = [c for c in claims if c.claim_type == ClaimType.ALGORITHM_STEP]
+        assert len(steps) == 1
+        assert steps[0].line_number == 2
+
+    def test_mixed_families_on_one_line(self) -> None:
+        """Every family still fires on a line that matches several."""
+        extractor = ClaimExtractor(run_id="test")
+        text = "OBS: paracetamol 500 mg p.o. må ikke gives ved temp > 41 [SRC002]"
+        types = {c.claim_type for c in extractor.extract(text)}
+        assert {
+            ClaimType.DOSE,
+            ClaimType.THRESHOLD,
+            ClaimType.CONTRAINDICATION,
+            ClaimType.RED_FLAG,
+        } <= types
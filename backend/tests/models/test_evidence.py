@@ -370,6 +370,50 @@ class TestEvidenceChunkDbConversion:
         assert reconstructed.metadata == original.metadata
 
 
+class TestEmbeddingPacking:
+    """Tests for float32 BLOB embedding storage."""
+
+    def test_pack_roundtrip_preserves_float32_values(self):
+        """Packed embeddings should unpack to the same float32 values."""
+        from procedurewriter.models.evidence import pack_embedding, unpack_embedding
+
+        blob = pack_embedding([0.5, -1.25, 3.0])
+        assert isinstance(blob, bytes)
+        assert len(blob) == 12
+        assert unpack_embedding(blob) == [0.5, -1.25, 3.0]
+
+    def test_pack_empty_vector_returns_none(self):
+        """Missing or empty embeddings should not be stored."""
+        from procedurewriter.models.evidence import pack_embedding
+
+        assert pack_embedding(None) is None
+        assert pack_embedding([]) is None
+
+    def test_unpack_rejects_truncated_blob(self):
+        """A blob that is not a whole number of floats is corrupt."""
+        from procedurewriter.models.evidence import unpack_embedding
+
+        with pytest.raises(ValueError):
+            unpack_embedding(b"\x00\x00\x00")
+
+    def test_packed_db_row_roundtrip(self):
+        """from_db_row() should accept a packed BLOB embedding."""
+        from procedurewriter.models.evidence import EvidenceChunk
+
+        chunk = EvidenceChunk(
+            run_id="test-run",
+            source_id="SRC0001",
+            text="Test",
+            chunk_index=0,
+            embedding_vector=[0.25, 0.5, 0.75],
+        )
+        row = chunk.to_db_row(packed=True)
+
+        assert isinstance(row[7], bytes)
+        reconstructed = EvidenceChunk.from_db_row(row)
+        assert reconstructed.embedding_vector == [0.25, 0.5, 0.75]
+
+
 class TestEvidenceChunkHelpers:
     """Tests for helper methods on EvidenceChunk."""
 
@@ -0,0 +1,88 @@
+"""Tests for bulk library ingestion router."""
+
+import io
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from procedurewriter import db
+from procedurewriter.library_ingest import STATUS_QUEUED, claim_next_ingest_job, run_ingest_job
+from procedurewriter.main import app
+from procedurewriter.pipeline.extraction import ExtractionCache, ExtractionService
+from procedurewriter.rate_limit import limiter
+from procedurewriter.settings import Settings
+from tests.test_extraction import _write_docx
+
+
+@pytest.fixture
+def test_settings(tmp_path: Path) -> Settings:
+    s = Settings(data_dir=tmp_path)
+    db.init_db(s.db_path)
+    return s
+
+
+@pytest.fixture
+def client(test_settings: Settings):
+    """Create test client with temporary database."""
+    with patch("procedurewriter.routers.library_ingest.settings", test_settings), TestClient(app) as client:
+        yield client
+
+
+def _zip(tmp_path: Path) -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr("protokol.docx", _write_docx(tmp_path / "p.docx", ["Brug ultralyd"]).read_bytes())
+    return buf.getvalue()
+
+
+def test_upload_queues_job_and_streams_progress(client, test_settings, tmp_path):
+    """An uploaded archive is queued; its events stream once the worker ran it."""
+    response = client.post("/api/library/ingest-jobs", files={"file": ("lib.zip", _zip(tmp_path))})
+    assert response.status_code == 200
+    job = response.json()
+    assert job["status"] == STATUS_QUEUED
+    assert Path(job["input_path"]).is_file()
+
+    listed = client.get("/api/library/ingest-jobs").json()["jobs"]
+    assert [j["job_id"] for j in listed] == [job["job_id"]]
+
+    claimed = claim_next_ingest_job(test_settings.db_path, worker_id="test")
+    extraction = ExtractionService(ExtractionCache(tmp_path / "cache"), max_workers=0)
+    run_ingest_job(test_settings, claimed, extraction=extraction)
+
+    done = client.get(f"/api/library/ingest-jobs/{job['job_id']}").json()
+    assert (done["status"], done["added"]) == ("DONE", 1)
+
+    body = client.get(f"/api/library/ingest-jobs/{job['job_id']}/events").text
+    assert '"outcome": "added"' in body
+    assert body.count('"event": "complete"') == 1
+
+
+def test_upload_rejects_non_zip(client, test_settings):
+    """Only ZIP archives are accepted, and nothing is left behind."""
+    response = client.post("/api/library/ingest-jobs", files={"file": ("lib.zip", b"not a zip")})
+    assert response.status_code == 400
+    assert client.get("/api/library/ingest-jobs").json()["jobs"] == []
+    assert list(test_settings.ingest_jobs_dir.iterdir()) == []
+
+
+def test_upload_is_rate_limited(client):
+    """Queueing archives is limited per client like the other upload endpoints."""
+    limiter.reset()
+    try:
+        codes = [
+            client.post("/api/library/ingest-jobs", files={"file": ("lib.zip", b"not a zip")}).status_code
+            for _ in range(6)
+        ]
+    finally:
+        limiter.reset()
+    assert codes == [400] * 5 + [429]
+
+
+def test_unknown_job_returns_404(client):
+    """Missing jobs return 404."""
+    assert client.get(f"/api/library/ingest-jobs/{'0' * 32}").status_code == 404
+    assert client.get(f"/api/library/ingest-jobs/{'0' * 32}/events").status_code == 404
@@ -0,0 +1,51 @@
+"""Tests for query plans router."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from procedurewriter import db
+from procedurewriter.main import app
+from procedurewriter.query_plans import query_plan_id
+from procedurewriter.settings import Settings
+
+
+@pytest.fixture
+def client(tmp_path: Path):
+    """Create test client with temporary database."""
+    test_settings = Settings(data_dir=tmp_path)
+    db.init_db(test_settings.db_path)
+
+    with patch("procedurewriter.routers.query_plans.settings", test_settings):
+        with TestClient(app) as client:
+            yield client
+
+
+def test_put_get_list_delete(client):
+    """An admin plan can be stored, read back and deleted."""
+    body = {
+        "procedure": "Lumbalpunktur",
+        "expanded_terms": ["lumbar puncture", "spinal tap"],
+        "queries": {"pubmed": ["lumbar puncture[MeSH]"]},
+    }
+    response = client.put("/api/query-plans", json=body)
+    assert response.status_code == 200
+    plan = response.json()
+    assert plan["plan_id"] == query_plan_id("Lumbalpunktur", None)
+    assert plan["source"] == "admin"
+    assert plan["expires_at_utc"] is None
+
+    assert client.get(f"/api/query-plans/{plan['plan_id']}").json()["expanded_terms"] == body["expanded_terms"]
+    assert len(client.get("/api/query-plans").json()["query_plans"]) == 1
+
+    assert client.delete(f"/api/query-plans/{plan['plan_id']}").status_code == 204
+    assert client.get(f"/api/query-plans/{plan['plan_id']}").status_code == 404
+    assert client.delete(f"/api/query-plans/{plan['plan_id']}").status_code == 404
+
+
+def test_put_requires_terms(client):
+    """A plan needs at least one expanded term."""
+    response = client.put("/api/query-plans", json={"procedure": "X", "expanded_terms": []})
+    assert response.status_code == 422
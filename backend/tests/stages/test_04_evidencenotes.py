@@ -435,3 +435,87 @@ class TestEvidenceNotesStage:
 
         call_args = mock_llm.chat_completion.call_args
         assert call_args.kwargs.get("model") == "gpt-4o-mini"
+
+
+class TestEvidenceNoteCache:
+    """Tests for the cross-run evidence-note cache."""
+
+    @staticmethod
+    def _run(stage, run_dir: Path, title: str, texts: list[str], model: str = "gpt-4o-mini"):
+        from procedurewriter.pipeline.stages.s04_evidencenotes import EvidenceNotesInput
+
+        chunks = [
+            EvidenceChunk(run_id="run", source_id="src", text=text, chunk_index=i)
+            for i, text in enumerate(texts)
+        ]
+        return stage.execute(
+            EvidenceNotesInput(
+                run_id="run", run_dir=run_dir, procedure_title=title, chunks=chunks, model=model
+            )
+        )
+
+    def test_notes_are_reused_across_runs(self, tmp_path: Path) -> None:
+        """A second run of the same procedure reuses notes instead of calling the LLM."""
+        from procedurewriter.pipeline.evidence_note_cache import EvidenceNoteCache
+        from procedurewriter.pipeline.stages.s04_evidencenotes import EvidenceNotesStage
+
+        mock_llm = MagicMock()
+        mock_llm.chat_completion.return_value = MagicMock(content=" Cached summary. ")
+        cache = EvidenceNoteCache(tmp_path / "cache")
+
+        first = self._run(EvidenceNotesStage(mock_llm, cache), tmp_path, "Pleuradræn", ["a", "b"])
+        second = self._run(
+            EvidenceNotesStage(mock_llm, EvidenceNoteCache(tmp_path / "cache")),
+            tmp_path,
+            "pleuradræn!",
+            ["b", "c"],
+        )
+
+        assert mock_llm.chat_completion.call_count == 3
+        assert first.cache_hits == 0
+        assert second.cache_hits == 1
+        assert [n.summary for n in second.notes] == ["Cached summary."] * 2
+        assert second.notes[0].chunk_id != first.notes[1].chunk_id
+
+    def test_key_includes_procedure_and_model(self, tmp_path: Path) -> None:
+        """Other procedures and models do not share notes."""
+        from procedurewriter.pipeline.evidence_note_cache import EvidenceNoteCache
+        from procedurewriter.pipeline.stages.s04_evidencenotes import EvidenceNotesStage
+
+        mock_llm = MagicMock()
+        mock_llm.chat_completion.return_value = MagicMock(content="Summary")
+        stage = EvidenceNotesStage(mock_llm, EvidenceNoteCache(tmp_path / "cache"))
+
+        self._run(stage, tmp_path, "Pleuradræn", ["a"])
+        self._run(stage, tmp_path, "Lumbalpunktur", ["a"])
+        self._run(stage, tmp_path, "Pleuradræn", ["a"], model="gpt-4o")
+
+        assert mock_llm.chat_completion.call_count == 3
+
+    def test_failed_notes_are_not_cached(self, tmp_path: Path) -> None:
+        """Chunks whose note generation failed are retried on the next run."""
+        from procedurewriter.pipeline.evidence_note_cache import EvidenceNoteCache
+        from procedurewriter.pipeline.stages.s04_evidencenotes import EvidenceNotesStage
+
+        mock_llm = MagicMock()
+        mock_llm.chat_completion.side_effect = [ValueError("bad response"), MagicMock(content="OK")]
+        stage = EvidenceNotesStage(mock_llm, EvidenceNoteCache(tmp_path / "cache"))
+
+        assert self._run(stage, tmp_path, "Pleuradræn", ["a"]).chunks_failed == 1
+        assert self._run(stage, tmp_path, "Pleuradræn", ["a"]).cache_hits == 0
+
+    def test_invalidate_and_stats(self, tmp_path: Path) -> None:
+        """Invalidation filters combine; stats report the hit rate."""
+        from procedurewriter.pipeline.evidence_note_cache import EvidenceNoteCache
+
+        cache = EvidenceNoteCache(tmp_path / "cache")
+        cache.set("a", "Pleuradræn", "1", "m1", "A")
+        cache.set("a", "Lumbalpunktur", "1", "m1", "B")
+        cache.set("a", "Pleuradræn", "1", "m2", "C")
+
+        assert cache.get("a", "PLEURADRÆN", "1", "m1") == "A"
+        assert cache.get("a", "Pleuradræn", "2", "m1") is None
+        assert cache.invalidate(procedure_title="Pleuradræn", model="m1") == 1
+        assert cache.get("a", "Pleuradræn", "1", "m1") is None
+        assert cache.get_stats() == {"hits": 1, "misses": 2, "hit_rate": 33.3, "entries": 2}
+        assert cache.invalidate() == 2
@@ -452,3 +452,40 @@ class TestBindStage:
         result = stage.execute(input_data)
 
         assert result.total_links == len(result.links)
+
+    def test_bind_skips_chunks_without_shared_keywords(self, tmp_path: Path) -> None:
+        """Keyword binding should only link chunks that share a keyword."""
+        from procedurewriter.pipeline.stages.s07_bind import (
+            BindInput,
+            BindStage,
+        )
+
+        claim = make_claim(text="amoxicillin pneumoni behandling")
+        matching = make_chunk(source_id="SRC001", text="amoxicillin pneumoni behandling", chunk_index=0)
+        unrelated = make_chunk(source_id="SRC002", text="completely different words", chunk_index=1)
+
+        input_data = BindInput(
+            run_id="test-run",
+            run_dir=tmp_path,
+            procedure_title="Test",
+            claims=[claim],
+            chunks=[unrelated, matching],
+        )
+
+        result = BindStage().execute(input_data)
+
+        assert [link.evidence_chunk_id for link in result.links] == [matching.id]
+
+
+class TestChunkKeywordIndex:
+    """Tests for the inverted keyword index shared with EvidenceBinder."""
+
+    def test_candidates_share_a_keyword(self) -> None:
+        from procedurewriter.claims.binder import ChunkKeywordIndex
+
+        index = ChunkKeywordIndex([{"a", "b"}, {"c"}, {"b", "d"}])
+
+        assert index.candidates({"b"}) == [0, 2]
+        assert index.candidates({"d", "c"}) == [1, 2]
+        assert index.candidates({"x"}) == []
+        assert index.candidates(set()) == []
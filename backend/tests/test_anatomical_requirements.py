@@ -420,3 +420,43 @@ class TestNonInvasiveProcedures:
         if reqs is not None:
             assert reqs.procedure_type == "non_invasive"
             assert len(reqs.landmarks) == 0
+
+
+class TestLandmarkMatcher:
+    """The one-pass matcher must agree with per-alias substring checks."""
+
+    def test_overlapping_and_prefix_aliases(self):
+        from procedurewriter.pipeline.anatomical_requirements import LandmarkMatcher
+
+        matcher = LandmarkMatcher([["L3-L4"], ["L4 niveau"], ["L3"], ["crista"], [""]])
+
+        assert matcher.find("Punktér i L3-L4 niveau") == {0, 1, 2, 4}
+        assert matcher.find("CRISTA iliaca") == {3, 4}
+
+    def test_agrees_with_substring_checks(self):
+        import random
+
+        from procedurewriter.pipeline.anatomical_requirements import (
+            AnatomicalRequirementsRegistry,
+            landmark_matcher,
+        )
+
+        registry = AnatomicalRequirementsRegistry()
+        landmarks = [
+            lm
+            for name in registry.list_invasive_procedures()
+            for lm in registry.get_requirements(name).landmarks
+        ]
+        terms = [t for lm in landmarks for t in (lm.name, *lm.aliases)]
+        rng = random.Random(5)
+        matcher = landmark_matcher(landmarks)
+        for _ in range(100):
+            text = " ".join(
+                rng.choice(terms).upper() if rng.random() < 0.3 else rng.choice(terms)[1:]
+                for _ in range(rng.randrange(0, 6))
+            )
+            expected = {i for i, lm in enumerate(landmarks) if any(
+                t.lower() in text.lower() for t in (lm.name, *lm.aliases)
+            )}
+            assert matcher.find(text) == expected, text
+            assert {i for i, lm in enumerate(landmarks) if lm.matches(text)} == expected
@@ -0,0 +1,103 @@
+"""Tests for the offline benchmark harness (procedurewriter.bench)."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from procedurewriter.bench import (
+    BenchmarkConfig,
+    CorpusSpec,
+    LLMReplayMissError,
+    generate_library,
+    replay_http_client,
+    replay_llm_client,
+    run_offline_benchmark,
+)
+from procedurewriter.llm import get_llm_client, llm_client_override
+
+TINY = CorpusSpec(documents=3, paragraphs_per_document=8)
+MESSAGES = [
+    {"role": "system", "content": "Skriv sektionen."},
+    {"role": "user", "content": "SNIPPETS:\n- [S:SRC0001] (chunk=0) Giv lidocain 10 mg. Observer."},
+]
+
+
+class TestCorpus:
+    def test_generation_is_deterministic(self, tmp_path: Path) -> None:
+        first = generate_library(tmp_path / "a", TINY)
+        second = generate_library(tmp_path / "b", TINY)
+
+        assert [r.normalized_sha256 for r in first] == [r.normalized_sha256 for r in second]
+        assert len(first) == 3
+        assert Path(first[0].normalized_path).read_text(encoding="utf-8").strip()
+
+    def test_seed_changes_text(self, tmp_path: Path) -> None:
+        first = generate_library(tmp_path / "a", TINY)
+        other = generate_library(tmp_path / "b", CorpusSpec(documents=3, paragraphs_per_document=8, seed=7))
+
+        assert first[0].normalized_sha256 != other[0].normalized_sha256
+
+
+class TestReplay:
+    def test_llm_replay_serves_recorded_response(self, tmp_path: Path) -> None:
+        recorder, _ = replay_llm_client(tmp_path, record=True)
+        recorded = recorder.chat_completion(MESSAGES, model="gpt-5.2")
+        assert "[S:SRC0001]" in recorded.content
+
+        replayer, backing = replay_llm_client(tmp_path)
+        assert replayer.chat_completion(MESSAGES, model="gpt-5.2").content == recorded.content
+        assert backing.misses == 0
+
+    def test_llm_replay_miss_raises(self, tmp_path: Path) -> None:
+        client, backing = replay_llm_client(tmp_path)
+
+        with pytest.raises(LLMReplayMissError):
+            client.chat_completion(MESSAGES, model="gpt-5.2")
+        assert backing.misses == 1
+
+    def test_http_replay_is_offline(self, tmp_path: Path) -> None:
+        http = replay_http_client(tmp_path)
+        try:
+            with pytest.raises(httpx.ConnectError):
+                http.get("https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi")
+        finally:
+            http.close()
+
+    def test_client_override_is_scoped(self) -> None:
+        sentinel = object()
+        with llm_client_override(sentinel):  # type: ignore[arg-type]
+            assert get_llm_client() is sentinel
+        with pytest.raises(ValueError):
+            get_llm_client("unknown-provider")
+
+
+class TestOfflineBenchmark:
+    def test_record_then_replay(self, tmp_path: Path) -> None:
+        fixtures = tmp_path / "fixtures"
+        base = BenchmarkConfig(spec=TINY, fixtures_dir=fixtures, work_dir=tmp_path / "work")
+
+        recorded = run_offline_benchmark(
+            BenchmarkConfig(spec=TINY, fixtures_dir=fixtures, work_dir=tmp_path / "work", record=True)
+        )
+        assert recorded["llm"]["recorded"] > 0
+
+        report = run_offline_benchmark(base)
+        json.dumps(report)  # JSON-serialisable
+
+        assert report["mode"] == "replay"
+        assert report["llm"]["cache_misses"] == 0
+        stages = [s["name"] for s in report["iterations"][0]]
+        assert stages == [
+            "ingest", "snippets", "retrieve", "pubmed", "write", "citations", "evidence", "docx",
+        ]
+        assert set(report["summary"]) == set(stages)
+        assert (tmp_path / "work" / "run0" / "trace.json").exists()
+
+    def test_replay_without_fixtures_fails(self, tmp_path: Path) -> None:
+        config = BenchmarkConfig(spec=TINY, fixtures_dir=tmp_path / "empty", work_dir=tmp_path / "work")
+
+        with pytest.raises(httpx.ConnectError):
+            run_offline_benchmark(config)
@@ -0,0 +1,101 @@
+"""Tests for the micro-benchmark suite (procedurewriter.bench.micro)."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from procedurewriter.bench.micro import (
+    MICRO_BENCHMARKS,
+    REPORT_SCHEMA_VERSION,
+    check_scaling,
+    compare_reports,
+    scaling_exponent,
+    time_callable,
+)
+
+
+def _report(name: str, timings: dict[int, float], max_exponent: float = 1.4) -> dict:
+    return {
+        "benchmarks": {
+            name: {
+                "max_exponent": max_exponent,
+                "sizes": {str(n): {"median_s": t, "min_s": t, "loops": 1} for n, t in timings.items()},
+            }
+        }
+    }
+
+
+@pytest.mark.parametrize("name", sorted(MICRO_BENCHMARKS))
+def test_benchmark_runs_at_smallest_size(name: str) -> None:
+    bench = MICRO_BENCHMARKS[name]
+    assert bench.setup(bench.sizes[0])() is not None
+
+
+def test_hot_paths_are_registered() -> None:
+    assert {
+        "retrieve.bm25",
+        "evidence.bm25_index",
+        "text_units.iter_cited_sentences",
+        "gps.classify_sentence_type",
+        "claims.extract",
+        "deduplication.detect_duplicates",
+        "content_generalizer.generalize",
+        "snippet_classifier.classify_batch",
+        "docx_writer.write_procedure_docx",
+    } <= set(MICRO_BENCHMARKS)
+
+
+def test_time_callable_reports_per_call_time() -> None:
+    timing = time_callable(lambda: sum(range(100)), repeat=3, min_time_s=0.001)
+
+    assert timing["loops"] >= 1
+    assert 0 < timing["min_s"] <= timing["median_s"]
+
+
+class TestCompareReports:
+    def test_flags_slowdown_over_threshold(self) -> None:
+        baseline = _report("claims.extract", {100: 0.010, 400: 0.040})
+        current = _report("claims.extract", {100: 0.013, 400: 0.041})
+
+        regressions = compare_reports(baseline, current, threshold_pct=20.0)
+
+        assert [(r.name, r.size) for r in regressions] == [("claims.extract", "100")]
+        assert "+30.0%" in regressions[0].detail
+
+    def test_ignores_new_benchmarks_and_speedups(self) -> None:
+        baseline = _report("claims.extract", {100: 0.010})
+        current = _report("claims.extract", {100: 0.005, 400: 0.5})
+        current["benchmarks"].update(_report("new.bench", {100: 1.0})["benchmarks"])
+
+        assert compare_reports(baseline, current) == []
+
+
+class TestScaling:
+    def test_linear_passes(self) -> None:
+        report = _report("retrieve.bm25", {100: 0.01, 400: 0.041, 1600: 0.165})
+
+        assert scaling_exponent(report["benchmarks"]["retrieve.bm25"]["sizes"]) == pytest.approx(1.02, abs=0.02)
+        assert check_scaling(report) == []
+
+    def test_quadratic_fails(self) -> None:
+        report = _report("retrieve.bm25", {100: 0.01, 400: 0.16, 1600: 2.56})
+
+        regressions = check_scaling(report)
+
+        assert [r.name for r in regressions] == ["retrieve.bm25"]
+        assert "n^2.00" in regressions[0].detail
+
+    def test_single_size_is_skipped(self) -> None:
+        assert check_scaling(_report("retrieve.bm25", {100: 0.01})) == []
+
+
+def test_committed_baseline_covers_every_benchmark() -> None:
+    path = Path(__file__).resolve().parents[1] / "benchmarks" / "micro_baseline.json"
+    baseline = json.loads(path.read_text(encoding="utf-8"))
+
+    assert baseline["schema_version"] == REPORT_SCHEMA_VERSION
+    for name, bench in MICRO_BENCHMARKS.items():
+        assert list(baseline["benchmarks"][name]["sizes"]) == [str(n) for n in bench.sizes]
+    assert check_scaling(baseline) == []
@@ -0,0 +1,205 @@
+"""Tests for the versioned stage checkpoint format."""
+from __future__ import annotations
+
+import json
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from procedurewriter.models.evidence import EvidenceChunk
+from procedurewriter.pipeline.checkpoint_format import (
+    CHECKPOINT_FORMAT_VERSION,
+    CheckpointError,
+    decode_value,
+    read_checkpoint,
+    write_checkpoint,
+)
+from procedurewriter.pipeline.orchestrator import PipelineOrchestrator
+from procedurewriter.pipeline.stages.s03_chunk import ChunkOutput
+from procedurewriter.pipeline.stages.s04_evidencenotes import EvidenceNote, EvidenceNotesOutput
+
+
+def _chunk_output(run_dir: Path) -> ChunkOutput:
+    chunks = [
+        EvidenceChunk(
+            run_id="run-1",
+            source_id=f"SRC{i:04d}",
+            text=f"Pleuradræn anlægges i 5. interkostalrum ({i})",
+            chunk_index=i,
+            metadata={"page": i, "section": "Metode"},
+        )
+        for i in range(3)
+    ]
+    return ChunkOutput(
+        run_id="run-1",
+        run_dir=run_dir,
+        procedure_title="Pleuradræn",
+        chunks=chunks,
+        total_chunks=3,
+        sources_processed=2,
+        failed_sources=["SRC9999"],
+    )
+
+
+def test_round_trip_preserves_models_and_paths(tmp_path: Path) -> None:
+    output = _chunk_output(tmp_path / "run")
+    path = tmp_path / "chunk.ckpt"
+    write_checkpoint(path, "chunk", output, metadata={"fingerprint": "abc"})
+
+    checkpoint = read_checkpoint(path)
+    assert checkpoint.stage == "chunk"
+    assert checkpoint.metadata == {"fingerprint": "abc"}
+    assert checkpoint.table_rows == {"chunks": 3}
+    assert checkpoint.output() == output
+
+
+def test_round_trip_dataclass_records(tmp_path: Path) -> None:
+    notes = [EvidenceNote(summary="Brug ultralyd", source_title="BTS 2023", source_type="guideline")]
+    output = EvidenceNotesOutput(
+        run_id="run-1",
+        run_dir=tmp_path,
+        procedure_title="Pleuradræn",
+        notes=notes,
+        total_notes=1,
+    )
+    path = tmp_path / "evidencenotes.ckpt"
+    write_checkpoint(path, "evidencenotes", output)
+
+    loaded = read_checkpoint(path).output()
+    assert loaded == output
+    assert loaded.notes[0].id == notes[0].id
+
+
+def test_tables_load_lazily(tmp_path: Path) -> None:
+    path = tmp_path / "chunk.ckpt"
+    write_checkpoint(path, "chunk", _chunk_output(tmp_path))
+
+    checkpoint = read_checkpoint(path)
+    with zipfile.ZipFile(path) as zf:
+        assert "tables/chunks.jsonl" in zf.namelist()
+    assert checkpoint._tables == {}
+    assert [c.chunk_index for c in checkpoint.table("chunks")] == [0, 1, 2]
+
+
+def _rewrite_member(path: Path, name: str, transform) -> None:
+    with zipfile.ZipFile(path) as zf:
+        members = {n: zf.read(n) for n in zf.namelist()}
+    members[name] = transform(members[name])
+    with zipfile.ZipFile(path, "w") as zf:
+        for n, data in members.items():
+            zf.writestr(n, data)
+
+
+def test_checksum_mismatch_is_detected(tmp_path: Path) -> None:
+    path = tmp_path / "chunk.ckpt"
+    write_checkpoint(path, "chunk", _chunk_output(tmp_path))
+    _rewrite_member(path, "tables/chunks.jsonl", lambda data: data.replace(b"SRC0001", b"SRC0002"))
+
+    checkpoint = read_checkpoint(path)
+    with pytest.raises(CheckpointError, match="Checksum mismatch"):
+        checkpoint.output()
+
+
+def test_version_mismatch_is_rejected(tmp_path: Path) -> None:
+    path = tmp_path / "chunk.ckpt"
+    write_checkpoint(path, "chunk", _chunk_output(tmp_path))
+
+    def bump(data: bytes) -> bytes:
+        manifest = json.loads(data)
+        manifest["version"] = CHECKPOINT_FORMAT_VERSION + 1
+        return json.dumps(manifest).encode()
+
+    _rewrite_member(path, "manifest.json", bump)
+    with pytest.raises(CheckpointError, match="format version"):
+        read_checkpoint(path)
+
+
+def test_unsupported_values_are_rejected(tmp_path: Path) -> None:
+    @dataclass
+    class Holder:
+        value: object
+
+    with pytest.raises(CheckpointError, match="Cannot checkpoint"):
+        write_checkpoint(tmp_path / "x.ckpt", "x", Holder(object()))
+    assert not list(tmp_path.iterdir())
+
+
+def _retarget_output_class(path: Path, output_class: str) -> None:
+    def retarget(data: bytes) -> bytes:
+        manifest = json.loads(data)
+        manifest["output_class"] = output_class
+        return json.dumps(manifest).encode()
+
+    _rewrite_member(path, "manifest.json", retarget)
+
+
+def test_classes_outside_procedurewriter_are_refused(tmp_path: Path) -> None:
+    path = tmp_path / "chunk.ckpt"
+    write_checkpoint(path, "chunk", _chunk_output(tmp_path))
+
+    _retarget_output_class(path, "subprocess:Popen")
+    with pytest.raises(CheckpointError, match="outside procedurewriter"):
+        read_checkpoint(path).output()
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"$t": "dataclass", "c": "subprocess:Popen", "v": {"args": ["touch", "pwned"]}},
+        {"$t": "enum", "c": "subprocess:Popen", "v": "touch"},
+        {"$t": "dataclass", "c": "procedurewriter.db:_connect", "v": {}},
+        {"$t": "dataclass", "c": "procedurewriter.pipeline.checkpoint_format:Checkpoint", "v": {"path": "x"}},
+        {"$t": "enum", "c": "procedurewriter.pipeline.checkpoint_format:Checkpoint", "v": "x"},
+    ],
+)
+def test_hostile_payloads_are_not_instantiated(payload: dict) -> None:
+    with pytest.raises(CheckpointError):
+        decode_value(payload)
+
+
+def test_malformed_manifest_raises_checkpoint_error(tmp_path: Path) -> None:
+    path = tmp_path / "chunk.ckpt"
+    write_checkpoint(path, "chunk", _chunk_output(tmp_path))
+
+    def drop_fields(data: bytes) -> bytes:
+        manifest = json.loads(data)
+        del manifest["fields"]
+        return json.dumps(manifest).encode()
+
+    _rewrite_member(path, "manifest.json", drop_fields)
+    with pytest.raises(CheckpointError, match="missing"):
+        read_checkpoint(path).output()
+
+
+def test_orchestrator_round_trips_and_discards_corrupt_checkpoints(tmp_path: Path) -> None:
+    orch = PipelineOrchestrator(base_dir=tmp_path)
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    output = _chunk_output(run_dir)
+
+    orch._save_checkpoint(run_dir, "chunk", output)
+    assert orch._load_checkpoint(run_dir, "chunk") == output
+
+    path = orch._checkpoint_path(run_dir, "chunk")
+    path.write_bytes(b"garbage")
+    assert orch._load_checkpoint(run_dir, "chunk") is None
+    assert not path.exists()
+
+
+def test_resume_discards_checkpoints_from_an_older_schema(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    orch = PipelineOrchestrator(base_dir=tmp_path)
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    orch._save_checkpoint(run_dir, "chunk", _chunk_output(run_dir))
+
+    # The chunk model gained a required field since the checkpoint was written
+    class _EvidenceChunkV2(EvidenceChunk):
+        page_count: int
+
+    monkeypatch.setattr("procedurewriter.models.evidence.EvidenceChunk", _EvidenceChunkV2)
+    assert orch._load_checkpoint(run_dir, "chunk") is None
+    assert not orch._checkpoint_path(run_dir, "chunk").exists()
@@ -0,0 +1,116 @@
+"""Tests for the config snapshot registry."""
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+import pytest
+
+from procedurewriter.config_store import (
+    ConfigRegistry,
+    UrlPrefixTrie,
+    config_registry,
+    load_yaml,
+    write_text_validated_yaml,
+)
+from procedurewriter.pipeline.evidence_hierarchy import EvidenceHierarchy
+from procedurewriter.pipeline.manifest import write_manifest
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def test_url_prefix_trie() -> None:
+    trie = UrlPrefixTrie(["https://www.sundhed.dk/", "https://www.sst.dk", "https://www.sst.dk/da/", ""])
+
+    assert len(trie) == 3
+    assert trie.matches("https://www.sundhed.dk/borger")
+    assert trie.matches("https://www.sst.dk")
+    assert trie.matches("https://www.sst.dk.evil.com/")
+    assert not trie.matches("https://www.sundhed.dk")
+    assert not trie.matches("https://example.com/")
+    assert not UrlPrefixTrie([]).matches("https://www.sundhed.dk/")
+
+
+def test_snapshot_is_parsed_once_per_file_version(tmp_path: Path) -> None:
+    path = tmp_path / "source_allowlist.yaml"
+    path.write_text("allowed_url_prefixes:\n  - ' https://a.dk/ '\n", encoding="utf-8")
+    registry = ConfigRegistry()
+
+    first = registry.snapshot(path)
+    assert registry.snapshot(path) is first
+    assert first.sha256 == hashlib.sha256(path.read_bytes()).hexdigest()
+    assert first.url_prefixes.matches("https://a.dk/x")
+    with pytest.raises(TypeError):
+        first.data["allowed_url_prefixes"] = ()  # type: ignore[index]
+
+    copy = first.to_dict()
+    copy["allowed_url_prefixes"].append("https://b.dk/")
+    assert first.to_dict() == {"allowed_url_prefixes": [" https://a.dk/ "]}
+
+    path.write_text("allowed_url_prefixes:\n  - https://b.dk/\n", encoding="utf-8")
+    _bump_mtime(path)
+    second = registry.snapshot(path)
+    assert second is not first and second.sha256 != first.sha256
+    assert second.url_prefixes.matches("https://b.dk/") and not second.url_prefixes.matches("https://a.dk/")
+
+    with pytest.raises(FileNotFoundError):
+        registry.snapshot(tmp_path / "missing.yaml")
+
+
+def test_derived_objects_follow_file_content(tmp_path: Path) -> None:
+    path = tmp_path / "evidence_hierarchy.yaml"
+    path.write_text("evidence_levels:\n  a:\n    priority: 1\n", encoding="utf-8")
+
+    first = EvidenceHierarchy.from_config(path)
+    assert EvidenceHierarchy.from_config(path) is first
+
+    path.write_text("evidence_levels:\n  b:\n    priority: 2\n", encoding="utf-8")
+    _bump_mtime(path)
+    second = EvidenceHierarchy.from_config(path)
+    assert second is not first
+    assert [level.level_id for level in second.get_all_levels()] == ["b"]
+
+
+def test_validated_write_invalidates_snapshot(tmp_path: Path) -> None:
+    path = tmp_path / "author_guide.yaml"
+    write_text_validated_yaml(path, "a: 1\n")
+    assert load_yaml(path) == {"a": 1}
+
+    # Same size and, on coarse filesystems, possibly the same mtime
+    write_text_validated_yaml(path, "a: 2\n")
+    assert load_yaml(path) == {"a": 2}
+    assert config_registry.snapshot(path).sha256 == hashlib.sha256(b"a: 2\n").hexdigest()
+
+
+def test_manifest_records_snapshot_hashes(tmp_path: Path) -> None:
+    guide = tmp_path / "author_guide.yaml"
+    allowlist = tmp_path / "source_allowlist.yaml"
+    guide.write_text("a: 1\n", encoding="utf-8")
+    allowlist.write_text("allowed_url_prefixes: []\n", encoding="utf-8")
+    (tmp_path / "sources.jsonl").write_text("", encoding="utf-8")
+    (tmp_path / "procedure.md").write_text("# P\n", encoding="utf-8")
+    common = dict(
+        run_id="RID",
+        created_at_utc="2026-01-01T00:00:00+00:00",
+        procedure="P",
+        context=None,
+        author_guide_path=guide,
+        allowlist_path=allowlist,
+        sources_jsonl_path=tmp_path / "sources.jsonl",
+        procedure_md_path=tmp_path / "procedure.md",
+        sources=[],
+        runtime={},
+    )
+
+    hashed = write_manifest(manifest_path=tmp_path / "m1.json", **common)
+    passed = write_manifest(
+        manifest_path=tmp_path / "m2.json",
+        author_guide_sha256=hashlib.sha256(b"a: 1\n").hexdigest(),
+        allowlist_sha256=hashlib.sha256(b"allowed_url_prefixes: []\n").hexdigest(),
+        **common,
+    )
+    assert hashed == passed
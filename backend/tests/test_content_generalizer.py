@@ -7,6 +7,7 @@ import pytest
 from procedurewriter.pipeline.content_generalizer import (
     ContentGeneralizer,
     GeneralizationStats,
+    ReplacementPattern,
     generalize_procedure_content,
 )
 
@@ -304,3 +305,45 @@ class TestRealWorldContent:
 
         assert "Skejby" not in result
         assert "thoraxkirurgisk afdeling" in result  # Department type preserved
+
+
+class TestPatternEngine:
+    """Tests for precompiled patterns and literal prefilters."""
+
+    def test_patterns_compiled_once(self) -> None:
+        """compile() returns the same cached pattern object."""
+        generalizer = ContentGeneralizer()
+        pattern_def = generalizer.patterns[0]
+        assert pattern_def.compile() is pattern_def.compile()
+
+    def test_literal_prefilter(self) -> None:
+        """Patterns are skipped only when none of their literals occur."""
+        pattern_def = ReplacementPattern(
+            pattern=r"tlf\s*\d+", replacement="", category="phone_numbers", literals=("tlf",)
+        )
+        assert pattern_def.may_match("ring på tlf 1234")
+        assert not pattern_def.may_match("ingen nummer her")
+
+    def test_pattern_without_literals_always_runs(self) -> None:
+        """Custom patterns without literals are never skipped."""
+        generalizer = ContentGeneralizer()
+        generalizer.add_pattern(r"Afsnit\s+\d+", "afdelingen", "location_references")
+        result, stats = generalizer.generalize("Patienten flyttes til Afsnit 7.")
+
+        assert "afdelingen" in result
+        assert stats.location_references == 1
+
+    def test_case_insensitive_literals(self) -> None:
+        """Upper-case text still triggers lowercase literals."""
+        generalizer = ContentGeneralizer()
+        result, stats = generalizer.generalize("Kontakt vagten på TLF. 5804")
+
+        assert "5804" not in result
+        assert stats.phone_numbers == 1
+
+    def test_counts_match_replacements(self) -> None:
+        """Stats count every replacement of a repeated pattern."""
+        generalizer = ContentGeneralizer()
+        _, stats = generalizer.generalize("tlf. 1234, tlf. 5678 og tlf. 9012")
+
+        assert stats.phone_numbers == 3
@@ -235,6 +235,114 @@ class TestSessionTracker:
         assert summary.total_cost_usd == 0.0
 
 
+class TestRunCostScope:
+    """Tests for context-local run cost tracking."""
+
+    def test_scope_isolates_from_global_tracker(self):
+        """Calls inside a run scope must not touch the global tracker."""
+        from procedurewriter.llm import run_cost_scope
+
+        reset_session_tracker()
+        global_tracker = get_session_tracker()
+
+        with run_cost_scope("run-a") as ledger:
+            tracker = get_session_tracker()
+            assert tracker is not global_tracker
+            tracker.track(MockLLMResponse(), operation="write_section:Intro")
+            reset_session_tracker()
+            assert get_session_tracker() is tracker
+            tracker.track(MockLLMResponse())
+
+        assert get_session_tracker() is global_tracker
+        assert global_tracker.call_count == 0
+        assert tracker.call_count == 1
+        # The ledger keeps every call, including those before the reset
+        assert ledger.totals.call_count == 2
+
+    def test_concurrent_scopes_do_not_share_totals(self):
+        """Runs executing in parallel threads keep independent totals."""
+        import threading
+
+        from procedurewriter.llm import run_cost_scope
+
+        results: dict[str, int] = {}
+        barrier = threading.Barrier(2)
+
+        def run(run_id: str, calls: int) -> None:
+            with run_cost_scope(run_id):
+                barrier.wait()
+                reset_session_tracker()
+                for _ in range(calls):
+                    get_session_tracker().track(MockLLMResponse())
+                barrier.wait()
+                results[run_id] = get_session_tracker().call_count
+
+        threads = [
+            threading.Thread(target=run, args=("run-a", 3)),
+            threading.Thread(target=run, args=("run-b", 5)),
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert results == {"run-a": 3, "run-b": 5}
+
+    def test_scoped_tracker_does_not_retain_entries(self):
+        """Run-scoped trackers keep running totals without per-call entries."""
+        from procedurewriter.llm import run_cost_scope
+
+        with run_cost_scope("run-a"):
+            tracker = get_session_tracker()
+            for _ in range(10):
+                tracker.track(MockLLMResponse())
+            summary = tracker.get_summary()
+
+        assert summary.call_count == 10
+        assert summary.entries == []
+
+    def test_ledger_rollups_by_agent_and_stage(self):
+        """record_llm_call groups totals by agent and current stage."""
+        from procedurewriter.llm import record_llm_call, run_cost_scope, set_cost_stage
+
+        assert record_llm_call(MockLLMResponse()) is None
+
+        with run_cost_scope("run-a") as ledger:
+            set_cost_stage("write")
+            record_llm_call(MockLLMResponse(), agent="Writer")
+            record_llm_call(MockLLMResponse(), agent="Writer")
+            set_cost_stage("style")
+            record_llm_call(MockLLMResponse(cost_usd=0.5), agent="Style")
+
+        rollup = ledger.rollup()
+        assert rollup["totals"]["call_count"] == 3
+        assert rollup["by_agent"]["Writer"]["call_count"] == 2
+        assert rollup["by_stage"]["style"]["cost_usd"] == pytest.approx(0.5)
+
+    def test_ledger_flushes_to_database(self, tmp_path):
+        """Records are written to llm_calls in batches and on scope exit."""
+        from procedurewriter.db import _connect, get_llm_cost_rollup, init_db
+        from procedurewriter.llm import record_llm_call, run_cost_scope, set_cost_stage
+
+        db_path = tmp_path / "test.db"
+        init_db(db_path)
+
+        with run_cost_scope("run-a", db_path=db_path, flush_every=2):
+            set_cost_stage("write")
+            for _ in range(3):
+                record_llm_call(MockLLMResponse(), agent="Writer")
+            with _connect(db_path) as conn:
+                # First batch of two already flushed
+                assert conn.execute("SELECT COUNT(*) FROM llm_calls").fetchone()[0] == 2
+
+        rollup = get_llm_cost_rollup(db_path, "run-a")
+        assert rollup["totals"]["call_count"] == 3
+        assert rollup["totals"]["input_tokens"] == 300
+        assert rollup["by_agent"]["Writer"]["call_count"] == 3
+        assert rollup["by_stage"]["write"]["cost_usd"] == pytest.approx(0.003)
+        assert rollup["by_model"]["gpt-4o-mini"]["call_count"] == 3
+
+
 class TestCostSummarySchema:
     """Tests for CostSummaryResponse Pydantic schema."""
 
@@ -514,3 +514,117 @@ class TestGatesTable:
             ).fetchall()
 
             assert len(results) == 3
+
+
+class TestSaveClaimSystemRecords:
+    """Tests for bulk persistence of claim system records."""
+
+    def _records(self, run_id: str):
+        from procedurewriter.models.claims import Claim, ClaimType
+        from procedurewriter.models.evidence import BindingType, ClaimEvidenceLink, EvidenceChunk
+        from procedurewriter.models.gates import Gate, GateStatus, GateType
+        from procedurewriter.models.issues import Issue, IssueCode, IssueSeverity
+
+        chunks = [
+            EvidenceChunk(
+                run_id=run_id,
+                source_id="SRC001",
+                text=f"evidence {i}",
+                chunk_index=i,
+                embedding_vector=[0.5, 0.25] if i == 0 else None,
+            )
+            for i in range(3)
+        ]
+        claims = [
+            Claim(
+                run_id=run_id,
+                claim_type=ClaimType.DOSE,
+                text="amoxicillin 50 mg/kg",
+                line_number=1,
+                confidence=0.9,
+            )
+        ]
+        links = [
+            ClaimEvidenceLink(
+                claim_id=claims[0].id,
+                evidence_chunk_id=chunks[0].id,
+                binding_type=BindingType.KEYWORD,
+                binding_score=0.8,
+            )
+        ]
+        issues = [
+            Issue(
+                run_id=run_id,
+                code=IssueCode.DOSE_WITHOUT_EVIDENCE,
+                severity=IssueSeverity.S0,
+                message="Dose without evidence",
+                claim_id=claims[0].id,
+            )
+        ]
+        gates = [Gate(run_id=run_id, gate_type=GateType.S0_SAFETY, status=GateStatus.PENDING)]
+        return chunks, claims, links, issues, gates
+
+    def test_embedding_blob_column_exists(self, test_db):
+        """evidence_chunks should have a BLOB column for packed embeddings."""
+        with _connect(test_db) as conn:
+            cursor = conn.execute("PRAGMA table_info(evidence_chunks)")
+            columns = {row[1]: row[2] for row in cursor.fetchall()}
+
+        assert columns["embedding_vector_blob"] == "BLOB"
+
+    def test_saves_all_record_types(self, test_db):
+        """All record types should be written and counted."""
+        from procedurewriter.db import save_claim_system_records
+
+        run_id = uuid4().hex
+        with _connect(test_db) as conn:
+            _create_test_run(conn, run_id)
+            conn.commit()
+
+        chunks, claims, links, issues, gates = self._records(run_id)
+        counts = save_claim_system_records(
+            test_db, chunks=chunks, claims=claims, links=links, issues=issues, gates=gates
+        )
+
+        assert counts == {
+            "evidence_chunks": 3,
+            "claims": 1,
+            "claim_evidence_links": 1,
+            "issues": 1,
+            "gates": 1,
+        }
+        with _connect(test_db) as conn:
+            row = conn.execute(
+                "SELECT embedding_vector_json, embedding_vector_blob FROM evidence_chunks WHERE id = ?",
+                (str(chunks[0].id),),
+            ).fetchone()
+            assert conn.execute("SELECT COUNT(*) FROM claim_evidence_links").fetchone()[0] == 1
+
+        assert row[0] is None
+        assert isinstance(row[1], bytes)
+        assert len(row[1]) == 8
+
+    def test_failure_rolls_back_whole_batch(self, test_db):
+        """A failing insert should leave no partial rows behind."""
+        from procedurewriter.db import save_claim_system_records
+        from procedurewriter.models.evidence import BindingType, ClaimEvidenceLink
+
+        run_id = uuid4().hex
+        with _connect(test_db) as conn:
+            _create_test_run(conn, run_id)
+            conn.commit()
+
+        chunks, claims, _, _, _ = self._records(run_id)
+        dangling = ClaimEvidenceLink(
+            claim_id=uuid4(),
+            evidence_chunk_id=chunks[0].id,
+            binding_type=BindingType.KEYWORD,
+            binding_score=0.5,
+        )
+
+        with pytest.raises(sqlite3.IntegrityError):
+            save_claim_system_records(test_db, chunks=chunks, claims=claims, links=[dangling])
+
+        with _connect(test_db) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM evidence_chunks").fetchone()[0] == 0
+            assert conn.execute("SELECT COUNT(*) FROM claims").fetchone()[0] == 0
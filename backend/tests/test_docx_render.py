@@ -0,0 +1,172 @@
+"""Tests for parallel and lazy rendering of run documents."""
+from __future__ import annotations
+
+import json
+import os
+import re
+from pathlib import Path
+
+import pytest
+from docx import Document
+
+from procedurewriter.pipeline import docx_writer
+from procedurewriter.pipeline.docx_render import (
+    DOCX_EVIDENCE_REVIEW,
+    DOCX_META_ANALYSIS,
+    DOCX_PROCEDURE,
+    DOCX_SOURCE_ANALYSIS,
+    LAZY_ARTIFACTS_FILENAME,
+    DocxRenderService,
+    ensure_docx,
+    pending_docx_kinds,
+    write_docx_inputs,
+)
+from procedurewriter.pipeline.types import SourceRecord
+
+MARKDOWN = "# Procedure: Pleuradræn\n\n## Indikation\nPneumothorax. [S:SRC0001]\n"
+SOURCE = SourceRecord(
+    source_id="SRC0001",
+    fetched_at_utc="2026-01-01T00:00:00+00:00",
+    kind="guideline",
+    title="Pleuradræn vejledning",
+    year=2024,
+    url="https://www.sundhed.dk/",
+    doi=None,
+    pmid=None,
+    raw_path="raw/SRC0001.html",
+    normalized_path="normalized/SRC0001.txt",
+    raw_sha256="x",
+    normalized_sha256="y",
+    extraction_notes=None,
+    terms_licence_note=None,
+    extra={"evidence_level": "danish_guideline"},
+)
+
+
+def _run_dir(tmp_path: Path, *, meta_analysis: bool = False) -> tuple[Path, list[str]]:
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    (run_dir / "run_manifest.json").write_text(json.dumps({"artifacts": {}}), encoding="utf-8")
+    kinds = write_docx_inputs(
+        run_dir,
+        run_id="RID",
+        procedure="Pleuradræn",
+        markdown_text=MARKDOWN,
+        sources=[SOURCE],
+        evidence_report={"supported_count": 1, "unsupported_count": 0, "sentences": []},
+        manifest_hash="H" * 64,
+        quality_score=8,
+        template_path=None,
+        meta_analysis=meta_analysis,
+    )
+    return run_dir, kinds
+
+
+def _texts(path: Path) -> list[str]:
+    return [p.text for p in Document(str(path)).paragraphs]
+
+
+def test_template_follows_file_changes(tmp_path: Path) -> None:
+    template = tmp_path / "docx_template.yaml"
+    template.write_text("styling:\n  margins:\n    top: 1.0\n", encoding="utf-8")
+
+    first = docx_writer.load_docx_template(template)
+    first["styling"]["margins"]["top"] = 9.9  # Callers get their own copy
+    assert docx_writer.load_docx_template(template)["styling"]["margins"]["top"] == 1.0
+
+    template.write_text("styling:\n  margins:\n    top: 2.5\n", encoding="utf-8")
+    os.utime(template, ns=(0, 10**9))
+    assert docx_writer.load_docx_template(template)["styling"]["margins"]["top"] == 2.5
+    assert "structure" in docx_writer.load_docx_template(tmp_path / "missing.yaml")
+
+
+@pytest.mark.parametrize("max_workers", [0, 2])
+def test_render_all_matches_direct_rendering(tmp_path: Path, max_workers: int) -> None:
+    run_dir, kinds = _run_dir(tmp_path)
+    service = DocxRenderService(max_workers=max_workers)
+    try:
+        rendered = service.render_all(run_dir, kinds)
+    finally:
+        service.shutdown()
+
+    assert sorted(rendered) == sorted([DOCX_PROCEDURE, DOCX_SOURCE_ANALYSIS, DOCX_EVIDENCE_REVIEW])
+    direct = tmp_path / "direct.docx"
+    docx_writer.write_procedure_docx(
+        markdown_text=MARKDOWN,
+        sources=[SOURCE],
+        output_path=direct,
+        run_id="RID",
+        manifest_hash="H" * 64,
+        quality_score=8,
+    )
+    assert _texts(rendered[DOCX_PROCEDURE]) == _texts(direct)
+    artifacts = json.loads((run_dir / "run_manifest.json").read_text(encoding="utf-8"))["artifacts"]
+    assert sorted(artifacts) == ["evidence_review_docx", "source_analysis_docx"]
+    assert not list(run_dir.glob("*.tmp"))
+
+
+def test_optional_failures_are_left_out(tmp_path: Path) -> None:
+    # No synthesis_report.json, so the meta-analysis report cannot render
+    run_dir, kinds = _run_dir(tmp_path, meta_analysis=True)
+    service = DocxRenderService(max_workers=0)
+
+    with pytest.raises(FileNotFoundError):
+        service.render_all(run_dir, kinds)
+
+    rendered = service.render_all(run_dir, kinds, optional=frozenset({DOCX_META_ANALYSIS}))
+    assert DOCX_META_ANALYSIS not in rendered and DOCX_PROCEDURE in rendered
+
+
+def test_lazy_rendering_on_first_request(tmp_path: Path) -> None:
+    run_dir, kinds = _run_dir(tmp_path)
+    assert pending_docx_kinds(run_dir) == kinds
+
+    path = ensure_docx(run_dir, DOCX_SOURCE_ANALYSIS)
+    assert path is not None and path.exists()
+    assert ensure_docx(run_dir, DOCX_SOURCE_ANALYSIS) == path
+    assert pending_docx_kinds(run_dir) == [DOCX_PROCEDURE, DOCX_EVIDENCE_REVIEW]
+    assert ensure_docx(run_dir, DOCX_META_ANALYSIS) is None
+    assert ensure_docx(tmp_path, DOCX_PROCEDURE) is None
+
+
+def test_meta_analysis_report_renders_from_synthesis_report(tmp_path: Path) -> None:
+    from procedurewriter.agents.meta_analysis.orchestrator import OrchestratorOutput
+    from procedurewriter.agents.meta_analysis.synthesizer_agent import (
+        HeterogeneityMetrics,
+        PooledEstimate,
+        SynthesisOutput,
+    )
+
+    output = OrchestratorOutput(
+        synthesis=SynthesisOutput(
+            pooled_estimate=PooledEstimate(
+                pooled_effect=0.65, ci_lower=0.45, ci_upper=0.85, effect_size_type="OR", p_value=0.003, se=0.1
+            ),
+            heterogeneity=HeterogeneityMetrics(
+                cochrans_q=8.5, i_squared=52.3, tau_squared=0.05, df=3, p_value=0.037, interpretation="moderate"
+            ),
+            included_studies=2,
+            total_sample_size=1400,
+            grade_summary="Moderate certainty evidence suggests benefit.",
+            forest_plot_data=[],
+        ),
+        included_study_ids=["S1", "S2"],
+        excluded_study_ids=[],
+        exclusion_reasons={},
+        manual_review_needed=[],
+    )
+    run_dir, _ = _run_dir(tmp_path, meta_analysis=True)
+    (run_dir / "synthesis_report.json").write_text(json.dumps(output.model_dump()), encoding="utf-8")
+
+    path = ensure_docx(run_dir, DOCX_META_ANALYSIS)
+
+    direct = tmp_path / "direct.docx"
+    docx_writer.write_meta_analysis_docx(output=output, output_path=direct, run_id="RID")
+    assert path is not None
+    # The report carries its render time, so compare everything else
+    undated = re.compile(r"\d{4}-\d{2}-\d{2}")
+    assert [t for t in _texts(path) if not undated.search(t)] == [t for t in _texts(direct) if not undated.search(t)]
+    manifest = json.loads((run_dir / "run_manifest.json").read_text(encoding="utf-8"))
+    assert manifest == {"artifacts": {}}
+    lazy_artifacts = json.loads((run_dir / LAZY_ARTIFACTS_FILENAME).read_text(encoding="utf-8"))
+    assert list(lazy_artifacts) == ["meta_analysis_docx"]
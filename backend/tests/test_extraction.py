@@ -0,0 +1,122 @@
+"""Tests for the pooled, cached PDF/DOCX extraction service."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from docx import Document
+
+from procedurewriter.pipeline import normalize
+from procedurewriter.pipeline.extraction import (
+    KIND_DOCX,
+    KIND_PDF,
+    ExtractionCache,
+    ExtractionService,
+)
+
+
+def _write_pdf(path: Path, pages: list[str]) -> Path:
+    """Write a minimal PDF with one line of Helvetica text per page."""
+    n = len(pages)
+    font_id = 3 + 2 * n
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids ["
+        + b" ".join(f"{3 + 2 * i} 0 R".encode() for i in range(n))
+        + f"] /Count {n} >>".encode(),
+    ]
+    for i, text in enumerate(pages):
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {4 + 2 * i} 0 R >>".encode()
+        )
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n".encode() + stream + b"\nendstream")
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for num, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{num} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += b"".join(f"{o:010d} 00000 n \n".encode() for o in offsets)
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    path.write_bytes(bytes(out))
+    return path
+
+
+def _write_docx(path: Path, paragraphs: list[str]) -> Path:
+    doc = Document()
+    doc.add_heading("Pleuradræn", level=1)
+    for text in paragraphs:
+        doc.add_paragraph(text)
+    doc.save(str(path))
+    return path
+
+
+PAGES = [f"Side {i} om pleuradraen" for i in range(1, 8)]
+
+
+def test_page_range_extraction_matches_serial(tmp_path: Path) -> None:
+    pdf = _write_pdf(tmp_path / "guide.pdf", PAGES)
+
+    assert normalize.count_pdf_pages(pdf) == len(PAGES)
+    assert normalize.extract_pdf_pages(pdf) == PAGES
+    assert normalize.extract_pdf_page_range(pdf, 2, 5) == PAGES[2:5]
+    assert normalize.extract_pdf_page_range(pdf, 5, 50) == PAGES[5:]
+
+
+def test_cache_skips_reparsing(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    pdf = _write_pdf(tmp_path / "guide.pdf", PAGES)
+    service = ExtractionService(ExtractionCache(tmp_path / "cache"), max_workers=0)
+    assert service.extract_pdf_pages(pdf) == PAGES
+
+    def fail(_path: Path) -> list[str]:
+        raise AssertionError("cached PDF was parsed again")
+
+    monkeypatch.setattr(normalize, "extract_pdf_pages", fail)
+    # A copy under another name has the same content hash
+    copy = tmp_path / "copy.pdf"
+    copy.write_bytes(pdf.read_bytes())
+    assert service.extract_pdf_pages(copy) == PAGES
+
+
+def test_docx_blocks_are_cached(tmp_path: Path) -> None:
+    docx = _write_docx(tmp_path / "protokol.docx", ["Brug ultralyd", "Lokalbedøvelse"])
+    cache = ExtractionCache(tmp_path / "cache")
+    service = ExtractionService(cache, max_workers=0)
+
+    blocks = service.extract_docx_blocks(docx)
+    assert [b["text"] for b in blocks] == ["Pleuradræn", "Brug ultralyd", "Lokalbedøvelse"]
+    assert cache.get(_sha(docx), KIND_DOCX) == blocks
+    assert cache.get(_sha(docx), KIND_PDF) is None
+
+
+def _sha(path: Path) -> str:
+    from procedurewriter.pipeline.hashing import sha256_file
+
+    return sha256_file(path)
+
+
+def test_pool_splits_pdfs_and_reports_bad_files(tmp_path: Path) -> None:
+    pdf = _write_pdf(tmp_path / "guide.pdf", PAGES)
+    docx = _write_docx(tmp_path / "protokol.docx", ["Brug ultralyd"])
+    broken = tmp_path / "broken.pdf"
+    broken.write_bytes(b"%PDF-1.4 not really")
+    other = tmp_path / "notes.txt"
+    other.write_text("tekst")
+
+    service = ExtractionService(ExtractionCache(tmp_path / "cache"), max_workers=2, pages_per_task=3)
+    try:
+        assert service.extract_pdf_pages(pdf) == PAGES
+        results = service.extract_many([docx, pdf, broken, other])
+    finally:
+        service.shutdown()
+
+    assert [r.path for r in results] == [docx, pdf, broken, other]
+    assert [b["text"] for b in results[0].blocks] == ["Pleuradræn", "Brug ultralyd"]
+    assert not results[0].cached
+    assert results[1].pages == PAGES and results[1].cached
+    assert results[2].error and results[3].error
@@ -1,3 +1,6 @@
+import hashlib
+import threading
+
 import httpx
 import respx
 
@@ -29,3 +32,45 @@ def test_cached_http_client_retries_on_429(tmp_path):
     finally:
         http.close()
 
+
+
+@respx.mock
+def test_download_streams_to_file_and_caches(tmp_path):
+    url = "https://api.wiley.com/onlinelibrary/tdm/v1/articles/10.1002%2F1"
+    body = b"%PDF-1.4 " + b"x" * 200_000
+    route = respx.get(url).mock(return_value=httpx.Response(200, content=body))
+
+    http = CachedHttpClient(cache_dir=tmp_path / "cache", per_host_min_interval_s={})
+    try:
+        first = http.download(url, tmp_path / "a.pdf", headers={"Accept": "application/pdf"})
+        second = http.download(url, tmp_path / "b.pdf")
+    finally:
+        http.close()
+
+    assert route.call_count == 1
+    assert (tmp_path / "a.pdf").read_bytes() == body == (tmp_path / "b.pdf").read_bytes()
+    assert first.sha256 == second.sha256 == hashlib.sha256(body).hexdigest()
+    assert first.size == len(body) and first.status_code == 200
+    assert not list((tmp_path / "cache" / "http").glob("*.part"))
+
+
+def test_throttle_spaces_concurrent_requests(tmp_path):
+    """Threads sharing a client queue up one interval apart per host."""
+    sleeps: list[float] = []
+    lock = threading.Lock()
+
+    def record(s: float) -> None:
+        with lock:
+            sleeps.append(s)
+
+    http = CachedHttpClient(
+        cache_dir=tmp_path, per_host_min_interval_s={"api.wiley.com": 1.0}, sleep_fn=record
+    )
+    threads = [threading.Thread(target=http._throttle, args=("api.wiley.com",)) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    http.close()
+
+    assert [round(s) for s in sorted(sleeps)] == [1, 2, 3]
@@ -0,0 +1,73 @@
+"""Import-time guards for the API and worker entry points.
+
+Each check runs in a fresh interpreter so modules already imported by other
+tests do not hide a regression.
+"""
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+# Loaded on first use (an LLM call, a run, a PDF/DOCX/HTML source), never at import
+HEAVY_MODULES = ("anthropic", "openai", "pypdf", "bs4", "procedurewriter.pipeline.run")
+
+# Provider SDKs, imported only when a client for that provider is created
+SDK_MODULES = ("anthropic", "openai")
+
+
+def _import_in_subprocess(module: str) -> set[str]:
+    code = f"import json, sys\nimport {module}\nprint(json.dumps(sorted(sys.modules)))\n"
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=120,
+    )
+    return set(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+
+def test_worker_does_not_import_fastapi_or_heavy_modules() -> None:
+    modules = _import_in_subprocess("procedurewriter.worker")
+
+    assert "fastapi" not in modules
+    assert not modules & set(HEAVY_MODULES)
+
+
+def test_api_does_not_import_heavy_modules() -> None:
+    modules = _import_in_subprocess("procedurewriter.main")
+
+    assert not modules & set(HEAVY_MODULES)
+
+
+def test_pipeline_package_resolves_run_pipeline_lazily() -> None:
+    from procedurewriter import pipeline
+    from procedurewriter.pipeline.run import run_pipeline
+
+    assert pipeline.run_pipeline is run_pipeline
+    with pytest.raises(AttributeError):
+        pipeline.not_a_module  # noqa: B018
+
+
+@pytest.mark.parametrize(
+    "module", ["procedurewriter.agents.orchestrator", "procedurewriter.llm.providers"]
+)
+def test_agents_do_not_import_provider_sdks(module: str) -> None:
+    modules = _import_in_subprocess(module)
+
+    assert not modules & set(SDK_MODULES)
+
+
+def test_provider_api_errors_without_sdks() -> None:
+    from procedurewriter.llm.providers import provider_api_errors
+
+    errors = provider_api_errors(OSError, KeyError)
+    assert errors[-2:] == (OSError, KeyError)
+    assert all(issubclass(error, BaseException) for error in errors)
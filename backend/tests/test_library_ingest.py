@@ -0,0 +1,176 @@
+"""Tests for bulk library ingestion jobs."""
+from __future__ import annotations
+
+import shutil
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from procedurewriter import db
+from procedurewriter.library_ingest import (
+    STATUS_DONE,
+    STATUS_FAILED,
+    STATUS_RUNNING,
+    claim_next_ingest_job,
+    collect_ingest_items,
+    create_ingest_job,
+    get_ingest_job,
+    run_ingest_job,
+)
+from procedurewriter.pipeline.events import EVENT_LOG_FILENAME, EventLog, EventType
+from procedurewriter.pipeline.extraction import ExtractionCache, ExtractionService
+from procedurewriter.settings import Settings
+from tests.test_extraction import _write_docx, _write_pdf
+
+
+@pytest.fixture
+def test_settings(tmp_path: Path) -> Settings:
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    (config_dir / "source_allowlist.yaml").write_text(
+        "allowed_url_prefixes:\n  - https://www.sundhed.dk/\n", encoding="utf-8"
+    )
+    s = Settings(data_dir=tmp_path / "data", config_dir=config_dir)
+    db.init_db(s.db_path)
+    return s
+
+
+@pytest.fixture
+def extraction(tmp_path: Path) -> ExtractionService:
+    return ExtractionService(ExtractionCache(tmp_path / "cache"), max_workers=0)
+
+
+def _library(tmp_path: Path) -> Path:
+    lib = tmp_path / "library"
+    (lib / "nested").mkdir(parents=True)
+    _write_pdf(lib / "guide.pdf", ["Side 1 om pleuradraen", "Side 2"])
+    _write_docx(lib / "nested" / "protokol.docx", ["Brug ultralyd"])
+    (lib / "nested" / "copy.pdf").write_bytes((lib / "guide.pdf").read_bytes())
+    (lib / "broken.docx").write_bytes(b"not a docx")
+    (lib / "notes.txt").write_text("ignored")
+    (lib / ".hidden.pdf").write_bytes(b"ignored")
+    (lib / "urls.txt").write_text("# kilder\nhttps://example.com/blocked\n", encoding="utf-8")
+    return lib
+
+
+def _run(settings: Settings, input_path: Path, extraction: ExtractionService):
+    job = create_ingest_job(
+        settings.db_path,
+        input_path=input_path,
+        job_dir=settings.ingest_jobs_dir / "job",
+        locked_by="test",
+    )
+    return run_ingest_job(settings, job, extraction=extraction)
+
+
+def test_collect_lists_files_and_urls(tmp_path: Path) -> None:
+    items = collect_ingest_items(_library(tmp_path), tmp_path / "work", max_archive_bytes=10**6)
+
+    assert [i.name for i in items] == [
+        "broken.docx",
+        "guide.pdf",
+        "nested/copy.pdf",
+        "nested/protokol.docx",
+        "https://example.com/blocked",
+    ]
+
+
+def test_interrupted_unpack_is_redone(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    archive = tmp_path / "library.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("a.pdf", b"%PDF-a")
+        zf.writestr("b.pdf", b"%PDF-b")
+    work_dir = tmp_path / "work"
+    copy = shutil.copyfileobj
+    written: list[object] = []
+
+    def crash_after_first(src, dst) -> None:
+        if written:
+            raise OSError("worker killed")
+        written.append(dst)
+        copy(src, dst)
+
+    monkeypatch.setattr(shutil, "copyfileobj", crash_after_first)
+    with pytest.raises(OSError):
+        collect_ingest_items(archive, work_dir, max_archive_bytes=10**6)
+    monkeypatch.undo()
+    assert not (work_dir / "files").exists()
+
+    # A partial directory left by a process that died without cleaning up
+    (work_dir / ".files-dead").mkdir()
+    (work_dir / ".files-dead" / "a.pdf").write_bytes(b"%PDF-a")
+
+    items = collect_ingest_items(archive, work_dir, max_archive_bytes=10**6)
+    assert [i.name for i in items] == ["a.pdf", "b.pdf"]
+    assert sorted(p.name for p in work_dir.iterdir()) == ["files"]
+
+
+def test_folder_job_dedupes_and_reports_failures(
+    tmp_path: Path, test_settings: Settings, extraction: ExtractionService
+) -> None:
+    job = _run(test_settings, _library(tmp_path), extraction)
+
+    assert job.status == STATUS_DONE
+    assert (job.total, job.added, job.duplicates, job.failed) == (5, 2, 1, 2)
+    stored = get_ingest_job(test_settings.db_path, job.job_id)
+    assert stored is not None and stored.status == STATUS_DONE and stored.processed == 5
+
+    sources = db.list_library_sources(test_settings.db_path)
+    assert sorted(s.kind for s in sources) == ["docx", "pdf"]
+
+    events, _ = EventLog(Path(job.job_dir) / EVENT_LOG_FILENAME).read_from(0)
+    outcomes = {e.data["item"]: e.data["outcome"] for e in events if "outcome" in e.data}
+    assert outcomes == {
+        "broken.docx": "failed",
+        "guide.pdf": "added",
+        "nested/copy.pdf": "duplicate",
+        "nested/protokol.docx": "added",
+        "https://example.com/blocked": "failed",
+    }
+    assert events[-1].event_type == EventType.COMPLETE
+
+
+def test_zip_job_skips_sources_already_in_library(
+    tmp_path: Path, test_settings: Settings, extraction: ExtractionService
+) -> None:
+    lib = _library(tmp_path)
+    _run(test_settings, lib, extraction)
+
+    archive = tmp_path / "library.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.write(lib / "guide.pdf", "a/guide.pdf")
+        zf.writestr("../escape.pdf", (lib / "guide.pdf").read_bytes())
+        zf.writestr("b/ny.docx", _write_docx(tmp_path / "ny.docx", ["Ny protokol"]).read_bytes())
+
+    job = _run(test_settings, archive, extraction)
+
+    assert (job.total, job.added, job.duplicates, job.failed) == (2, 1, 1, 0)
+    assert not (test_settings.ingest_jobs_dir / "escape.pdf").exists()
+    assert len(db.list_library_sources(test_settings.db_path)) == 3
+
+
+def test_unreadable_input_fails_job(tmp_path: Path, test_settings: Settings, extraction: ExtractionService) -> None:
+    bogus = tmp_path / "bogus.zip"
+    bogus.write_text("not an archive")
+
+    job = _run(test_settings, bogus, extraction)
+
+    assert job.status == STATUS_FAILED and "Not a directory or ZIP archive" in (job.error or "")
+    stored = get_ingest_job(test_settings.db_path, job.job_id)
+    assert stored is not None and stored.status == STATUS_FAILED and stored.locked_by is None
+
+
+def test_claim_takes_queued_jobs_once(tmp_path: Path, test_settings: Settings) -> None:
+    queued = create_ingest_job(test_settings.db_path, input_path=tmp_path, job_dir=tmp_path / "j1")
+    create_ingest_job(test_settings.db_path, input_path=tmp_path, job_dir=tmp_path / "j2", locked_by="cli")
+
+    claimed = claim_next_ingest_job(test_settings.db_path, worker_id="w1")
+    assert claimed is not None
+    assert claimed.job_id == queued.job_id
+    assert (claimed.status, claimed.locked_by, claimed.attempts) == (STATUS_RUNNING, "w1", 1)
+    assert claim_next_ingest_job(test_settings.db_path, worker_id="w2") is None
+
+    # A job whose worker stopped heartbeating is claimed again
+    again = claim_next_ingest_job(test_settings.db_path, worker_id="w2", stale_after_s=0)
+    assert again is not None and again.attempts == 2
@@ -0,0 +1,199 @@
+"""Tests for the Prometheus metrics registry and /metrics endpoint."""
+from __future__ import annotations
+
+import json
+import os
+
+import httpx
+import pytest
+import respx
+from fastapi.testclient import TestClient
+
+from procedurewriter.metrics import (
+    CACHE_REQUESTS,
+    HTTP_FETCH_DURATION,
+    LLM_CALL_DURATION,
+    LLM_TOKENS,
+    STAGE_DURATION,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    load_metrics_snapshots,
+    observe_llm_call,
+)
+
+
+class TestRegistry:
+    def test_counter_render(self):
+        registry = MetricsRegistry()
+        counter = registry.register(Counter("demo_total", "Demo counter.", ("kind",)))
+        counter.inc(kind="a")
+        counter.inc(2, kind="a")
+        counter.inc(kind='quote"d')
+
+        text = registry.render()
+        assert "# TYPE demo_total counter" in text
+        assert 'demo_total{kind="a"} 3' in text
+        assert 'demo_total{kind="quote\\"d"} 1' in text
+
+    def test_counter_rejects_negative_and_wrong_labels(self):
+        counter = Counter("demo_total", "Demo counter.", ("kind",))
+        with pytest.raises(ValueError):
+            counter.inc(-1, kind="a")
+        with pytest.raises(ValueError):
+            counter.inc(other="a")
+
+    def test_gauge_render(self):
+        registry = MetricsRegistry()
+        gauge = registry.register(Gauge("demo_depth", "Demo gauge."))
+        gauge.set(4)
+        gauge.set(2)
+        assert "demo_depth 2" in registry.render()
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry()
+        hist = registry.register(Histogram("demo_seconds", "Demo histogram.", ("stage",), buckets=(0.1, 1.0)))
+        hist.observe(0.05, stage="s")
+        hist.observe(0.5, stage="s")
+        hist.observe(5.0, stage="s")
+
+        text = registry.render()
+        assert 'demo_seconds_bucket{stage="s",le="0.1"} 1' in text
+        assert 'demo_seconds_bucket{stage="s",le="1"} 2' in text
+        assert 'demo_seconds_bucket{stage="s",le="+Inf"} 3' in text
+        assert 'demo_seconds_count{stage="s"} 3' in text
+        assert 'demo_seconds_sum{stage="s"} 5.55' in text
+
+    def test_histogram_time_records_on_error(self):
+        hist = Histogram("demo_seconds", "Demo histogram.", ("stage",))
+        with pytest.raises(RuntimeError), hist.time(stage="s"):
+            raise RuntimeError("boom")
+        assert hist.count(stage="s") == 1
+
+    def test_render_adds_other_process_snapshots(self):
+        def registry_with(n: int) -> MetricsRegistry:
+            registry = MetricsRegistry()
+            registry.register(Counter("demo_total", "Demo counter.", ("kind",))).inc(n, kind="a")
+            registry.register(Histogram("demo_seconds", "Demo histogram.", buckets=(1.0,))).observe(0.5 * n)
+            return registry
+
+        api, worker = registry_with(1), registry_with(4)
+        text = api.render([json.loads(json.dumps(worker.snapshot()))])
+
+        assert text.count("# TYPE demo_total counter") == 1
+        assert 'demo_total{kind="a"} 5' in text
+        assert 'demo_seconds_bucket{le="1"} 1' in text
+        assert 'demo_seconds_bucket{le="+Inf"} 2' in text
+        assert "demo_seconds_sum 2.5" in text
+
+    def test_stale_snapshots_are_dropped(self, tmp_path):
+        (tmp_path / "live.json").write_text('{"demo_total": []}', encoding="utf-8")
+        stale = tmp_path / "stale.json"
+        stale.write_text('{"demo_total": []}', encoding="utf-8")
+        os.utime(stale, (0, 0))
+        (tmp_path / "broken.json").write_text("{", encoding="utf-8")
+
+        assert load_metrics_snapshots(tmp_path, max_age_s=60) == [{"demo_total": []}]
+        assert not stale.exists()
+
+    def test_duplicate_registration_rejected(self):
+        registry = MetricsRegistry()
+        registry.register(Counter("demo_total", "Demo counter."))
+        with pytest.raises(ValueError):
+            registry.register(Counter("demo_total", "Demo counter."))
+
+
+class TestInstrumentation:
+    def test_observe_llm_call(self):
+        labels = {"provider": "openai", "model": "test-model", "agent": "MetricsTest"}
+        before = LLM_CALL_DURATION.count(**labels)
+
+        observe_llm_call(duration_s=0.2, input_tokens=10, output_tokens=4, **labels)
+
+        assert LLM_CALL_DURATION.count(**labels) == before + 1
+        assert LLM_TOKENS.value(direction="output", **labels) >= 4
+
+    @respx.mock
+    def test_http_client_records_cache_and_latency(self, tmp_path):
+        from procedurewriter.pipeline.fetcher import CachedHttpClient
+
+        url = "https://metrics.example.test/doc"
+        respx.get(url).mock(return_value=httpx.Response(200, content=b"ok"))
+        hits = CACHE_REQUESTS.value(cache="http", result="hit")
+        misses = CACHE_REQUESTS.value(cache="http", result="miss")
+        fetches = HTTP_FETCH_DURATION.count(host="metrics.example.test")
+
+        http = CachedHttpClient(cache_dir=tmp_path, per_host_min_interval_s={})
+        try:
+            http.get(url)
+            http.get(url)
+        finally:
+            http.close()
+
+        assert CACHE_REQUESTS.value(cache="http", result="miss") == misses + 1
+        assert CACHE_REQUESTS.value(cache="http", result="hit") == hits + 1
+        assert HTTP_FETCH_DURATION.count(host="metrics.example.test") == fetches + 1
+
+    def test_run_pipeline_stage_clock(self):
+        from procedurewriter.pipeline.run import _StageClock
+
+        before_ok = STAGE_DURATION.count(stage="metrics-test-a", outcome="ok")
+        before_error = STAGE_DURATION.count(stage="metrics-test-b", outcome="error")
+
+        clock = _StageClock()
+        clock.start("metrics-test-a")
+        clock.start("metrics-test-b")
+        clock.finish("error")
+        clock.finish("ok")  # Nothing open any more
+
+        assert STAGE_DURATION.count(stage="metrics-test-a", outcome="ok") == before_ok + 1
+        assert STAGE_DURATION.count(stage="metrics-test-b", outcome="error") == before_error + 1
+        assert STAGE_DURATION.count(stage="metrics-test-b", outcome="ok") == 0
+
+
+def test_metrics_endpoint(tmp_path, monkeypatch):
+    from procedurewriter import main
+    from procedurewriter.main import app, settings
+
+    monkeypatch.setattr(main, "count_queued_runs", lambda _db_path: 3)
+    original_data_dir = settings.data_dir
+    settings.data_dir = tmp_path
+    # A standalone worker's exported snapshot
+    worker_tokens = {"procedurewriter_llm_tokens_total": [[["openai", "worker-model", "Writer", "input"], 7]]}
+    (tmp_path / "metrics").mkdir()
+    (tmp_path / "metrics" / "worker-1.json").write_text(json.dumps(worker_tokens), encoding="utf-8")
+    try:
+        with TestClient(app) as client:
+            response = client.get("/metrics")
+    finally:
+        settings.data_dir = original_data_dir
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "# TYPE procedurewriter_stage_duration_seconds histogram" in response.text
+    assert "procedurewriter_queue_depth 3" in response.text
+    assert (
+        'procedurewriter_llm_tokens_total{provider="openai",model="worker-model",agent="Writer",direction="input"} 7'
+        in response.text
+    )
+
+
+def test_standalone_worker_exports_snapshot(tmp_path):
+    import asyncio
+
+    from procedurewriter.settings import Settings
+    from procedurewriter.worker import _metrics_export_loop
+
+    settings = Settings(data_dir=tmp_path, metrics_export_interval_s=0.01)
+    path = settings.metrics_dir / "worker-x.json"
+
+    async def run() -> None:
+        stop_event = asyncio.Event()
+        task = asyncio.create_task(_metrics_export_loop(path=path, settings=settings, stop_event=stop_event))
+        await asyncio.sleep(0.05)
+        stop_event.set()
+        await task
+
+    asyncio.run(run())
+    assert "procedurewriter_stage_duration_seconds" in json.loads(path.read_text(encoding="utf-8"))
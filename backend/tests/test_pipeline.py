@@ -140,6 +140,26 @@ class TestPipelineOrchestrator:
             with pytest.raises(PipelineError):
                 orchestrator.run(procedure_title="Test")
 
+    def test_orchestrator_records_failed_stage_duration(self, tmp_path: Path) -> None:
+        """Stage durations should be exported even when a stage fails."""
+        from procedurewriter.metrics import STAGE_DURATION
+        from procedurewriter.pipeline.orchestrator import (
+            PipelineError,
+            PipelineOrchestrator,
+        )
+
+        orchestrator = PipelineOrchestrator(base_dir=tmp_path)
+        stage_name = orchestrator.stages[0].name
+        before = STAGE_DURATION.count(stage=stage_name, outcome="error")
+
+        with patch.object(orchestrator.stages[0], "execute") as mock_stage:
+            mock_stage.side_effect = RuntimeError("Stage failed")
+
+            with pytest.raises(PipelineError):
+                orchestrator.run(procedure_title="Test")
+
+        assert STAGE_DURATION.count(stage=stage_name, outcome="error") == before + 1
+
     def test_orchestrator_emits_start_event(self, tmp_path: Path) -> None:
         """Orchestrator should emit a start event."""
         from procedurewriter.pipeline.events import EventType
@@ -276,3 +296,75 @@ class TestPipelineError:
         original = ValueError("Original error")
         error = PipelineError("Wrapper", stage="chunk", cause=original)
         assert error.cause == original
+
+
+class TestClaimRecordPersistence:
+    """Tests for writing claim-system records as their stages complete."""
+
+    @staticmethod
+    def _stage(name: str, **records: list) -> MagicMock:
+        from types import SimpleNamespace
+
+        stage = MagicMock()
+        stage.name = name
+        stage.execute.return_value = SimpleNamespace(**records)
+        return stage
+
+    def test_records_are_stored_per_stage(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Chunks, claims, links, issues and gates land in the run's tables."""
+        from procedurewriter.db import _connect, create_run, init_db
+        from procedurewriter.models.claims import Claim, ClaimType
+        from procedurewriter.models.evidence import BindingType, ClaimEvidenceLink, EvidenceChunk
+        from procedurewriter.models.gates import Gate, GateStatus, GateType
+        from procedurewriter.models.issues import Issue, IssueCode, IssueSeverity
+        from procedurewriter.pipeline.orchestrator import PipelineOrchestrator
+
+        db_path = tmp_path / "index.sqlite3"
+        init_db(db_path)
+        run_id = "a" * 32
+        create_run(db_path, run_id=run_id, procedure="Test", context=None, run_dir=tmp_path / run_id)
+
+        chunk = EvidenceChunk(
+            run_id=run_id, source_id="SRC0001", text="evidence", chunk_index=0, embedding_vector=[0.5, 0.25]
+        )
+        claim = Claim(run_id=run_id, claim_type=ClaimType.DOSE, text="50 mg/kg", line_number=1, confidence=0.9)
+        link = ClaimEvidenceLink(
+            claim_id=claim.id, evidence_chunk_id=chunk.id, binding_type=BindingType.KEYWORD, binding_score=0.8
+        )
+        issue = Issue(
+            run_id=run_id,
+            code=IssueCode.DOSE_WITHOUT_EVIDENCE,
+            severity=IssueSeverity.S0,
+            message="Dose without evidence",
+            claim_id=claim.id,
+        )
+        gate = Gate(run_id=run_id, gate_type=GateType.S0_SAFETY, status=GateStatus.PENDING)
+
+        orchestrator = PipelineOrchestrator(base_dir=tmp_path, reuse_stage_results=False, db_path=db_path)
+        orchestrator.stages = [
+            self._stage("chunk", chunks=[chunk]),
+            self._stage("draft"),
+            self._stage("claimextract", claims=[claim]),
+            self._stage("bind", claims=[claim], links=[link]),
+            self._stage("evals", issues=[issue], gates=[gate]),
+        ]
+        monkeypatch.setattr(orchestrator, "_transform_output_to_input", lambda _name, output: output)
+
+        orchestrator.run(procedure_title="Test", run_id=run_id)
+
+        with _connect(db_path) as conn:
+            counts = {
+                table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("evidence_chunks", "claims", "claim_evidence_links", "issues", "gates")
+            }
+            blob = conn.execute("SELECT embedding_vector_blob FROM evidence_chunks").fetchone()[0]
+        assert counts == {"evidence_chunks": 1, "claims": 1, "claim_evidence_links": 1, "issues": 1, "gates": 1}
+        assert len(blob) == 8
+
+    def test_persisting_requires_run_id(self, tmp_path: Path) -> None:
+        """Records reference the runs table, so a run needs its run_id."""
+        from procedurewriter.pipeline.orchestrator import PipelineOrchestrator
+
+        orchestrator = PipelineOrchestrator(base_dir=tmp_path, db_path=tmp_path / "index.sqlite3")
+        with pytest.raises(ValueError, match="run_id"):
+            orchestrator.run(procedure_title="Test")
@@ -0,0 +1,233 @@
+"""Tests for the pipeline span profiler and Chrome trace export."""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import json
+import shutil
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from procedurewriter.pipeline.profiler import (
+    TRACE_FILENAME,
+    PipelineProfile,
+    get_profiler,
+    profile_section,
+    run_trace,
+    start_profiling,
+    stop_profiling,
+)
+
+
+class TestPipelineProfile:
+    def test_nested_spans_record_parent(self) -> None:
+        profile = PipelineProfile()
+        with profile.time("stage:write"), profile.time("llm:call", agent="Writer"):
+            pass
+
+        by_name = {e.name: e for e in profile.entries}
+        assert by_name["stage:write"].parent_id is None
+        assert by_name["llm:call"].parent_id == by_name["stage:write"].span_id
+        assert by_name["llm:call"].metadata == {"agent": "Writer"}
+
+    def test_span_metadata_can_be_updated(self) -> None:
+        profile = PipelineProfile()
+        with profile.time("http:get", host="example.org") as span:
+            span["status_code"] = 200
+
+        assert profile.entries[0].metadata == {"host": "example.org", "status_code": 200}
+
+    def test_error_is_recorded(self) -> None:
+        profile = PipelineProfile()
+        with pytest.raises(ValueError), profile.time("stage:bad"):
+            raise ValueError("boom")
+
+        assert profile.entries[0].metadata["error"] == "ValueError"
+
+    def test_chrome_trace_format(self) -> None:
+        profile = PipelineProfile(attributes={"run_id": "abc"})
+        with profile.time("run"), profile.time("stage:retrieve"):
+            pass
+
+        trace = profile.to_chrome_trace()
+        events = trace["traceEvents"]
+        assert [e["name"] for e in events] == ["run", "stage:retrieve"]
+        assert all(e["ph"] == "X" for e in events)
+        assert events[1]["cat"] == "stage"
+        assert events[1]["args"]["parent_id"] == events[0]["args"]["span_id"]
+        assert events[0]["ts"] <= events[1]["ts"]
+        assert events[0]["dur"] >= events[1]["dur"]
+        assert trace["otherData"]["run_id"] == "abc"
+
+    def test_summary_unchanged(self) -> None:
+        profile = PipelineProfile()
+        profile.add("llm:write", 30.0)
+        profile.add("http:get", 10.0)
+
+        summary = profile.summary()
+        assert summary["total_ms"] == 40.0
+        assert summary["by_category"] == {"llm": 30.0, "http": 10.0}
+
+
+class TestProfileSection:
+    def test_noop_when_disabled(self) -> None:
+        assert get_profiler() is None
+        with profile_section("stage:x", a=1) as span:
+            span["b"] = 2
+        assert get_profiler() is None
+
+    def test_records_into_active_profile(self) -> None:
+        profile = start_profiling()
+        try:
+            with profile_section("stage:x"):
+                pass
+        finally:
+            assert stop_profiling() is profile
+        assert [e.name for e in profile.entries] == ["stage:x"]
+
+
+class TestRunTrace:
+    def test_writes_trace_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "run" / "trace.json"
+        with run_trace(path, run_id="r1") as profile:
+            with profile_section("stage:write"):
+                pass
+            assert get_profiler() is profile
+        assert get_profiler() is None
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data["otherData"]["run_id"] == "r1"
+        root, stage = data["traceEvents"]
+        assert root["name"] == "run"
+        assert stage["args"]["parent_id"] == root["args"]["span_id"]
+
+    def test_writes_trace_on_failure(self, tmp_path: Path) -> None:
+        path = tmp_path / "trace.json"
+        with pytest.raises(RuntimeError), run_trace(path):
+            raise RuntimeError("failed run")
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data["traceEvents"][0]["args"]["error"] == "RuntimeError"
+
+    def test_spans_from_worker_threads_nest_under_caller(self, tmp_path: Path) -> None:
+        path = tmp_path / "trace.json"
+
+        def work() -> None:
+            with profile_section("llm:call"):
+                pass
+
+        async def main() -> None:
+            with profile_section("stage:write"):
+                await asyncio.to_thread(work)
+
+        with run_trace(path):
+            asyncio.run(main())
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        by_name = {e["name"]: e for e in data["traceEvents"]}
+        assert by_name["llm:call"]["args"]["parent_id"] == by_name["stage:write"]["args"]["span_id"]
+        assert by_name["llm:call"]["tid"] != by_name["stage:write"]["tid"]
+
+    def test_concurrent_runs_are_isolated(self, tmp_path: Path) -> None:
+        def run(name: str) -> None:
+            with run_trace(tmp_path / f"{name}.json", run_id=name), profile_section(f"stage:{name}"):
+                pass
+
+        threads = [
+            threading.Thread(target=contextvars.Context().run, args=(run, name))
+            for name in ("a", "b")
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        for name in ("a", "b"):
+            data = json.loads((tmp_path / f"{name}.json").read_text(encoding="utf-8"))
+            assert [e["name"] for e in data["traceEvents"]] == ["run", f"stage:{name}"]
+
+    def test_db_write_helpers_record_spans(self, tmp_path: Path) -> None:
+        from procedurewriter import db
+
+        db_path = tmp_path / "index.sqlite3"
+        db.init_db(db_path)
+        with run_trace(tmp_path / "trace.json") as profile:
+            db.create_run(db_path, run_id="r1", procedure="P", context=None, run_dir=tmp_path / "r1")
+            db.update_run_status(db_path, run_id="r1", status="RUNNING")
+            db.insert_llm_calls(db_path, "r1", [("2026-01-01T00:00:00+00:00", "m", "op", None, None, 1, 1, 0.0)])
+        assert db.get_run(db_path, "r1") is not None
+
+        writes = [e.metadata for e in profile.entries if e.name == "db:write"]
+        assert [(w["table"], w["op"]) for w in writes] == [
+            ("runs", "create_run"),
+            ("runs", "update_run_status"),
+            ("llm_calls", "insert_llm_calls"),
+        ]
+        assert writes[-1]["rows"] == 1
+
+    @staticmethod
+    def _offline_settings(tmp_path: Path, *, strict: bool) -> Any:
+        import yaml
+
+        from procedurewriter.db import init_db
+        from procedurewriter.settings import Settings
+
+        config_dir = tmp_path / "config"
+        shutil.copytree(Settings().resolved_config_dir, config_dir)
+        if not strict:
+            guide_path = config_dir / "author_guide.yaml"
+            guide = yaml.safe_load(guide_path.read_text(encoding="utf-8"))
+            guide["validation"].update(evidence_policy="warn", require_evidence_verification=False)
+            guide_path.write_text(yaml.safe_dump(guide, allow_unicode=True), encoding="utf-8")
+        settings = Settings(
+            data_dir=tmp_path / "data",
+            config_dir=config_dir,
+            dummy_mode=True,
+            use_llm=False,
+            docx_render_max_workers=0,
+        )
+        settings.runs_dir.mkdir(parents=True)
+        init_db(settings.db_path)
+        return settings
+
+    @staticmethod
+    def _run(settings: Any) -> list[dict[str, Any]]:
+        """Run the pipeline offline and return its trace events."""
+        from procedurewriter.pipeline.run import run_pipeline
+
+        run_id = "a" * 32
+        run_pipeline(
+            run_id=run_id,
+            created_at_utc="2026-01-01T00:00:00+00:00",
+            procedure="Pleuradræn",
+            context=None,
+            settings=settings,
+            library_sources=[],
+        )
+        return json.loads((settings.runs_dir / run_id / TRACE_FILENAME).read_text(encoding="utf-8"))["traceEvents"]
+
+    def test_run_pipeline_traces_each_stage(self, tmp_path: Path) -> None:
+        events = self._run(self._offline_settings(tmp_path, strict=False))
+
+        root = events[0]
+        stages = [e for e in events if e["name"].startswith("stage:")]
+        assert root["name"] == "run"
+        assert [e["name"] for e in stages] == ["stage:retrieval", "stage:write", "stage:manifest", "stage:documents"]
+        assert {e["args"]["parent_id"] for e in stages} == {root["args"]["span_id"]}
+        assert {e["args"]["outcome"] for e in stages} == {"ok"}
+
+    def test_failed_run_marks_its_open_stage(self, tmp_path: Path) -> None:
+        from procedurewriter.pipeline.evidence import EvidencePolicyError
+
+        # Strict evidence policy without an Anthropic key fails the run
+        settings = self._offline_settings(tmp_path, strict=True)
+        with pytest.raises(EvidencePolicyError):
+            self._run(settings)
+
+        trace = json.loads((settings.runs_dir / ("a" * 32) / TRACE_FILENAME).read_text(encoding="utf-8"))
+        stages = [e for e in trace["traceEvents"] if e["name"].startswith("stage:")]
+        assert stages[0]["args"]["outcome"] == "ok"
+        assert stages[-1]["args"]["outcome"] == "error"
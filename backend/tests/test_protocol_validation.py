@@ -0,0 +1,152 @@
+"""Tests for concurrent, cached protocol validation (procedurewriter.protocols)."""
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from procedurewriter.db import init_db
+from procedurewriter.protocols import (
+    Protocol,
+    _compare_section,
+    validate_run_against_protocol,
+    validate_run_against_protocol_llm,
+    validate_run_against_protocols,
+)
+
+RUN_MARKDOWN = """## Indikationer
+Pleuraeffusion med dyspnø.
+
+## Fremgangsmåde
+Giv lidocain 10 mg subkutant. Vent 5 min.
+"""
+
+PROTOCOL_TEXT = """Indikationer
+Pleuraeffusion med dyspnø.
+
+Fremgangsmåde
+Anvend steril teknik og ultralyd. Infiltrer huden med lidocain 20 mg.
+Observer patienten i 2 min efter indgrebet.
+"""
+
+VERDICT = {"has_conflicts": False, "compatibility_score": 90, "summary": "OK", "conflicts": []}
+
+
+class FakeAnthropic:
+    """Minimal AsyncAnthropic stand-in that counts calls and concurrency."""
+
+    def __init__(self, delay_s: float = 0.0) -> None:
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.delay_s = delay_s
+        self.messages = SimpleNamespace(create=self._create)
+
+    async def _create(self, **kwargs: Any) -> Any:
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay_s)
+        finally:
+            self.in_flight -= 1
+        return SimpleNamespace(
+            usage=SimpleNamespace(input_tokens=1000, output_tokens=200),
+            content=[SimpleNamespace(text=json.dumps(VERDICT))],
+        )
+
+
+def _protocol(protocol_id: str, text: str | None = PROTOCOL_TEXT) -> Protocol:
+    return Protocol(
+        protocol_id=protocol_id,
+        name=f"Protokol {protocol_id}",
+        name_normalized=f"protokol {protocol_id}",
+        description=None,
+        status="active",
+        version=None,
+        approved_by=None,
+        approved_at_utc=None,
+        raw_path=None,
+        normalized_path=None,
+        normalized_text=text,
+        raw_sha256=None,
+        created_at_utc="2025-01-01T00:00:00+00:00",
+        updated_at_utc="2025-01-01T00:00:00+00:00",
+    )
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    path = tmp_path / "test.db"
+    init_db(path)
+    return path
+
+
+def test_section_comparison_is_memoized() -> None:
+    _compare_section.cache_clear()
+    first = validate_run_against_protocol(RUN_MARKDOWN, PROTOCOL_TEXT, "p1", "Protokol")
+    hits = _compare_section.cache_info().hits
+
+    second = validate_run_against_protocol(RUN_MARKDOWN, PROTOCOL_TEXT, "p2", "Protokol")
+
+    assert _compare_section.cache_info().hits == hits + first.sections_compared
+    assert [c.generated_text for c in second.conflicts] == [c.generated_text for c in first.conflicts]
+    assert {c.conflict_type for c in first.conflicts} == {"dosing", "timing"}
+
+
+def test_llm_verdict_is_cached(db_path: Path) -> None:
+    client = FakeAnthropic()
+
+    async def validate(protocol_id: str) -> Any:
+        return await validate_run_against_protocol_llm(
+            RUN_MARKDOWN, PROTOCOL_TEXT, protocol_id, "Protokol", client, db_path=db_path
+        )
+
+    first = asyncio.run(validate("p1"))
+    second = asyncio.run(validate("p1"))
+
+    assert client.calls == 1
+    assert first.validation_cost_usd and first.validation_cost_usd > 0
+    assert second.validation_cost_usd == 0.0
+    assert second.compatibility_score == first.compatibility_score == 90
+
+
+def test_llm_cache_key_includes_run_text(db_path: Path) -> None:
+    client = FakeAnthropic()
+
+    for markdown in (RUN_MARKDOWN, RUN_MARKDOWN + "\nNy linje."):
+        asyncio.run(
+            validate_run_against_protocol_llm(
+                markdown, PROTOCOL_TEXT, "p1", "Protokol", client, db_path=db_path
+            )
+        )
+
+    assert client.calls == 2
+
+
+def test_batch_runs_concurrently_with_bound(db_path: Path) -> None:
+    client = FakeAnthropic(delay_s=0.02)
+    protocols = [_protocol(f"p{i}", PROTOCOL_TEXT + f"\nVersion {i}") for i in range(5)]
+    protocols.append(_protocol("empty", None))
+
+    results = asyncio.run(
+        validate_run_against_protocols(
+            RUN_MARKDOWN, protocols, anthropic_client=client, db_path=db_path, max_concurrency=2
+        )
+    )
+
+    assert [r.protocol_id for r in results] == ["p0", "p1", "p2", "p3", "p4"]
+    assert client.calls == 5
+    assert client.max_in_flight == 2
+
+
+def test_batch_without_client_uses_pattern_matching() -> None:
+    results = asyncio.run(validate_run_against_protocols(RUN_MARKDOWN, [_protocol("p1")]))
+
+    assert len(results) == 1
+    assert results[0].compatibility_score is None
+    assert results[0].sections_compared == 2
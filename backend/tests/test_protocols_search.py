@@ -0,0 +1,112 @@
+"""Tests for indexed protocol name search (protocols.find_similar_protocols)."""
+from __future__ import annotations
+
+import random
+import sqlite3
+from collections.abc import Iterator
+from difflib import SequenceMatcher
+from pathlib import Path
+
+import pytest
+
+from procedurewriter.db import init_db
+from procedurewriter.protocols import (
+    delete_protocol,
+    find_similar_protocols,
+    invalidate_protocol_index,
+    list_protocols,
+    name_trigrams,
+    normalize_protocol_name,
+    update_protocol,
+    upload_protocol,
+)
+
+NAMES = [
+    "Anlæggelse af pleuradræn",
+    "Anlæggelse af perifert venekateter",
+    "Lumbalpunktur hos voksne",
+    "Arteriepunktur",
+    "Akut intubation",
+    "Nasogastrisk sonde",
+    "Blodprøvetagning",
+    "Anlæggelse af blærekateter",
+]
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Iterator[Path]:
+    path = tmp_path / "test.db"
+    init_db(path)
+    yield path
+    invalidate_protocol_index()
+
+
+def _upload(db_path: Path, tmp_path: Path, name: str) -> str:
+    source = tmp_path / "protocol.txt"
+    source.write_text(f"{name}\n\nIndikationer\nTekst.", encoding="utf-8")
+    return upload_protocol(db_path, source, name=name, storage_dir=tmp_path / "protocols")
+
+
+def _brute_force(db_path: Path, query: str, threshold: float) -> list[tuple[str, float]]:
+    normalized = normalize_protocol_name(query)
+    scored = [
+        (p.protocol_id, SequenceMatcher(None, normalized, p.name_normalized).ratio())
+        for p in list_protocols(db_path)
+        if len(normalized) < 4 or name_trigrams(normalized) & name_trigrams(p.name_normalized)
+    ]
+    return sorted([x for x in scored if x[1] >= threshold], key=lambda x: x[1], reverse=True)
+
+
+def test_name_trigrams_pad_words() -> None:
+    assert name_trigrams("ab cd") == {"  a", " ab", "ab ", "  c", " cd", "cd "}
+
+
+def test_matches_full_scan(db_path: Path, tmp_path: Path) -> None:
+    for name in NAMES:
+        _upload(db_path, tmp_path, name)
+
+    rng = random.Random(7)
+    queries = ["pleuradræn", "anlæggelse af kateter", "lumbal punktur", "intubation akut", "xyz"]
+    queries += [rng.choice(NAMES)[: rng.randrange(4, 20)] for _ in range(20)]
+    for query in queries:
+        for threshold in (0.3, 0.5):
+            found = [(p.protocol_id, s) for p, s in find_similar_protocols(db_path, query, threshold)]
+            assert found == _brute_force(db_path, query, threshold), query
+
+
+def test_skips_names_without_shared_trigram(db_path: Path, tmp_path: Path) -> None:
+    _upload(db_path, tmp_path, "Blodprøvetagning")
+
+    assert SequenceMatcher(None, "pleuradræn", "blodprøvetagning").ratio() > 0.3
+    assert find_similar_protocols(db_path, "pleuradræn", threshold=0.3) == []
+    assert find_similar_protocols(db_path, "blod", threshold=0.3)
+
+
+def test_index_follows_upload_update_delete(db_path: Path, tmp_path: Path) -> None:
+    protocol_id = _upload(db_path, tmp_path, "Anlæggelse af pleuradræn")
+    assert [p.protocol_id for p, _ in find_similar_protocols(db_path, "pleuradræn", 0.3)] == [protocol_id]
+
+    update_protocol(db_path, protocol_id, name="Lumbalpunktur")
+    assert find_similar_protocols(db_path, "pleuradræn", 0.3) == []
+    assert find_similar_protocols(db_path, "lumbalpunktur")[0][0].name == "Lumbalpunktur"
+
+    update_protocol(db_path, protocol_id, status="archived")
+    assert find_similar_protocols(db_path, "lumbalpunktur") == []
+
+    update_protocol(db_path, protocol_id, status="active")
+    delete_protocol(db_path, protocol_id)
+    assert find_similar_protocols(db_path, "lumbalpunktur") == []
+
+
+def test_sees_writes_from_other_connections(db_path: Path, tmp_path: Path) -> None:
+    _upload(db_path, tmp_path, "Akut intubation")
+    assert find_similar_protocols(db_path, "arteriepunktur") == []
+
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "INSERT INTO protocols (protocol_id, name, name_normalized, created_at_utc, updated_at_utc) "
+            "VALUES ('ext00001', 'Arteriepunktur', 'arteriepunktur', '2030-01-01T00:00:00+00:00', "
+            "'2030-01-01T00:00:00+00:00')"
+        )
+
+    assert [p.protocol_id for p, _ in find_similar_protocols(db_path, "arteriepunktur")] == ["ext00001"]
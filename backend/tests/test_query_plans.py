@@ -0,0 +1,118 @@
+"""Tests for the query plan cache and its use in term expansion."""
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from procedurewriter.db import init_db
+from procedurewriter.pipeline import run as run_module
+from procedurewriter.query_plans import (
+    SOURCE_ADMIN,
+    delete_query_plan,
+    list_query_plans,
+    lookup_query_plan,
+    query_plan_id,
+    save_query_plan,
+)
+from procedurewriter.settings import Settings
+
+
+class FakeLLM:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def chat_completion(self, **kwargs):
+        self.calls += 1
+        return SimpleNamespace(content='["lumbar puncture", "spinal tap"]')
+
+
+@pytest.fixture
+def settings(tmp_path: Path) -> Settings:
+    s = Settings(data_dir=tmp_path)
+    init_db(s.db_path)
+    return s
+
+
+@pytest.fixture
+def fake_llm(monkeypatch: pytest.MonkeyPatch) -> FakeLLM:
+    llm = FakeLLM()
+    monkeypatch.setattr(run_module, "_term_expansion_llm", lambda *args: llm)
+    return llm
+
+
+def test_plan_id_uses_normalized_name_and_context(settings: Settings) -> None:
+    assert query_plan_id("Lumbalpunktur", None) == query_plan_id(" lumbalpunktur! ", "")
+    assert query_plan_id("Lumbalpunktur", None) != query_plan_id("Lumbalpunktur", "børn")
+
+
+def test_expired_plans_are_not_returned(settings: Settings) -> None:
+    save_query_plan(
+        settings.db_path, procedure="Lumbalpunktur", context=None,
+        expanded_terms=["a"], queries={}, ttl_s=-1,
+    )
+    assert lookup_query_plan(settings.db_path, "Lumbalpunktur", None) is None
+
+    save_query_plan(
+        settings.db_path, procedure="Lumbalpunktur", context=None,
+        expanded_terms=["b"], queries={}, source=SOURCE_ADMIN,
+    )
+    plan = lookup_query_plan(settings.db_path, "lumbalpunktur", None)
+    assert plan is not None and plan.expanded_terms == ["b"]
+    assert len(list_query_plans(settings.db_path)) == 1
+    assert delete_query_plan(settings.db_path, plan.plan_id)
+    assert not delete_query_plan(settings.db_path, plan.plan_id)
+
+
+def test_llm_expansion_runs_once_per_procedure(settings: Settings, fake_llm: FakeLLM) -> None:
+    first = run_module._resolve_query_plan(settings=settings, procedure="Lumbalpunktur", context=None)
+    second = run_module._resolve_query_plan(settings=settings, procedure="lumbalpunktur", context=None)
+
+    assert fake_llm.calls == 1
+    assert second == first
+    assert "spinal tap" in first[0]
+    assert first[1]["pubmed"] == run_module._build_pubmed_queries(expanded_terms=first[0])
+
+    run_module._resolve_query_plan(settings=settings, procedure="Lumbalpunktur", context="børn")
+    assert fake_llm.calls == 2
+
+
+def test_static_expansion_is_not_stored(settings: Settings, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(run_module, "_term_expansion_llm", lambda *args: None)
+
+    terms, queries = run_module._resolve_query_plan(
+        settings=settings, procedure="Lumbalpunktur", context=None
+    )
+
+    assert terms[0] == "Lumbalpunktur"
+    assert queries["embase"]
+    assert list_query_plans(settings.db_path) == []
+
+
+def test_admin_plan_overrides_and_fills_missing_providers(
+    settings: Settings, fake_llm: FakeLLM
+) -> None:
+    save_query_plan(
+        settings.db_path, procedure="Lumbalpunktur", context=None,
+        expanded_terms=["lumbar puncture"], queries={"pubmed": ["lumbar puncture[MeSH]"]},
+        source=SOURCE_ADMIN,
+    )
+
+    terms, queries = run_module._resolve_query_plan(
+        settings=settings, procedure="Lumbalpunktur", context=None
+    )
+
+    assert fake_llm.calls == 0
+    assert queries["pubmed"] == ["lumbar puncture[MeSH]"]
+    assert queries["embase"] == run_module._build_embase_queries(
+        procedure="Lumbalpunktur", expanded_terms=terms
+    )
+
+
+def test_missing_table_falls_back_to_expansion(tmp_path: Path, fake_llm: FakeLLM) -> None:
+    settings = Settings(data_dir=tmp_path)  # no init_db
+
+    terms, _ = run_module._resolve_query_plan(settings=settings, procedure="Lumbalpunktur", context=None)
+
+    assert "lumbar puncture" in terms
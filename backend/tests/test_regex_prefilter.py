@@ -0,0 +1,50 @@
+"""Tests for literal regex prefilters (pipeline.regex_prefilter)."""
+from __future__ import annotations
+
+import re
+
+import pytest
+
+from procedurewriter.pipeline.regex_prefilter import PrefilteredPattern, required_literals
+
+
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    [
+        (r"\b(ring|tlf|Telefon)\b", ("ring", "tlf", "telefon")),
+        (r"\b(lokal\s*(retningslinje|instruks))\b", ("lokal",)),
+        (r"\b(bagvagt|anæstesi.*tilkald)\b", ("bagvagt", "anæstesi")),
+        (r"\b(nervus|n\.|m\.)\b", ("nervus", "n.", "m.")),
+        (r"\b(grader?|°)\b", ("grade", "°")),
+        (r"kranial\s*vinkel", ("kranial",)),
+    ],
+)
+def test_required_literals(pattern: str, expected: tuple[str, ...]) -> None:
+    assert required_literals(re.compile(pattern, re.I)) == expected
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        r"\b\d+\s*(cm|mm)\b",
+        r"\b(\d+G|french)\b",
+        r"\b[A-Z][a-z]+\s+et\s+al\.",
+        r"(?:a|b)?c",
+        r"x*y",
+        r"(a)(b)",
+    ],
+)
+def test_required_literals_underivable(pattern: str) -> None:
+    assert required_literals(re.compile(pattern, re.I)) is None
+
+
+def test_verbose_patterns_are_not_prefiltered() -> None:
+    assert required_literals(re.compile(r"a b", re.X)) is None
+
+
+def test_may_match_is_casefold_safe() -> None:
+    prefiltered = PrefilteredPattern.of(re.compile(r"\b(strasse|pneumothorax)\b", re.I))
+
+    for text in ("STRASSE", "Straße", "Pneumothorax"):
+        assert prefiltered.may_match(text.casefold())
+    assert not prefiltered.may_match("blødning")
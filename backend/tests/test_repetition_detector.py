@@ -317,3 +317,72 @@ class TestDeduplicationStats:
 
         assert "duplicate_groups" in stats
         assert stats["duplicate_groups"] >= 2  # "A" and "B" are duplicated
+
+
+class TestCandidatePruning:
+    """Test that prefix-filter candidate generation matches pairwise comparison."""
+
+    @staticmethod
+    def _pairwise_groups(rd, texts, threshold):
+        """Reference grouping that compares every pair."""
+        normalized = [rd._normalize(t) for t in texts]
+        grouped: set[int] = set()
+        groups = []
+        for i in range(len(texts)):
+            if i in grouped:
+                continue
+            members = [i] + [
+                j
+                for j in range(i + 1, len(texts))
+                if j not in grouped
+                and rd._calculate_similarity(normalized[i], normalized[j]) >= threshold
+            ]
+            grouped.update(members)
+            groups.append([texts[m] for m in members])
+        return groups
+
+    @pytest.mark.parametrize("threshold", [0.0, 0.3, 0.5, 0.8, 1.0])
+    def test_matches_pairwise_reference(self, threshold):
+        """Groups are identical to exhaustive pairwise comparison."""
+        from procedurewriter.pipeline.deduplication import RepetitionDetector
+
+        rd = RepetitionDetector()
+        texts = [
+            "Ring til bagvagt ved komplikationer",
+            "Kontakt bagvagten ved problemer",
+            "Tilkald anæstesi ved luftvejsproblemer",
+            "Følg lokal instruks for dosering",
+            "Følg lokale instrukser for dosering",
+            "Anlæg perifert venekateter",
+            "Anlæg perifert venekateter.",
+            "!!!",
+            "???",
+            "Mål blodtryk og puls hvert 15. minut",
+        ]
+
+        groups = rd.detect_duplicates(texts, threshold=threshold)
+
+        assert [g.items for g in groups] == self._pairwise_groups(rd, texts, threshold)
+
+    def test_keyword_boost_pairs_still_found(self):
+        """Pairs that only pass thanks to the keyword boost are candidates."""
+        from procedurewriter.pipeline.deduplication import RepetitionDetector
+
+        rd = RepetitionDetector()
+        texts = ["Ring til bagvagt ved komplikationer", "Kontakt bagvagten ved problemer"]
+
+        groups = rd.detect_duplicates(texts, threshold=0.6)
+
+        assert len(groups) == 1
+        assert len(groups[0].items) == 2
+
+    def test_many_unrelated_texts(self):
+        """Large inputs of distinct texts stay ungrouped."""
+        from procedurewriter.pipeline.deduplication import RepetitionDetector
+
+        rd = RepetitionDetector()
+        texts = [f"emne{i} beskrivelse{i} detalje{i}" for i in range(500)]
+
+        groups = rd.detect_duplicates(texts, threshold=0.8)
+
+        assert len(groups) == 500
@@ -347,3 +347,39 @@ class TestBatchClassification:
         assert len(results) == 2
         for result in results:
             assert isinstance(result, ClassifiedSnippet)
+
+    def test_classify_batch_matches_unfiltered_pattern_counts(self):
+        """Literal prefiltering must not change any match count."""
+        import random
+
+        from procedurewriter.pipeline.snippet_classifier import SnippetClassifier
+
+        classifier = SnippetClassifier()
+        words = [
+            "Lokal retningslinje", "lokalprotokol", "Ring", "bagvagt", "45°", "3 cm",
+            "p < 0.05", "Smith et al. (2020)", "British Thoracic Society", "18G",
+            "PNEUMOTHORAX", "obs", "pas på", "n.", "kateter", "meta-analyse", "OR",
+            "anæstesi skal tilkaldes", "steril", "identificér", "RCT", "12",
+        ]
+        rng = random.Random(3)
+        texts = ["", "p", "12", "ok"] + [
+            " ".join(rng.choice(words) for _ in range(rng.randrange(1, 12)))
+            for _ in range(200)
+        ]
+
+        def unfiltered(text):
+            scores = {
+                snippet_type: sum(len(p.findall(text)) for p in patterns)
+                for snippet_type, patterns in classifier._pattern_map.items()
+            }
+            if not any(scores.values()):
+                return None
+            return max(scores, key=lambda t: scores[t])
+
+        results = classifier.classify_batch(texts)
+        for text, result in zip(texts, results, strict=True):
+            expected = unfiltered(text)
+            if expected is None:
+                assert result.confidence == 0.5, text
+            else:
+                assert result.snippet_type == expected, text
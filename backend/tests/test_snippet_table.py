@@ -0,0 +1,99 @@
+"""Tests for the columnar SnippetTable."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from procedurewriter.pipeline.evidence import build_evidence_report
+from procedurewriter.pipeline.retrieve import build_snippets, retrieve
+from procedurewriter.pipeline.snippet_table import SnippetTable, SnippetView
+from procedurewriter.pipeline.types import Snippet, SourceRecord
+
+SNIPPETS = [
+    Snippet("SRC0001", "Anlæg pleuradræn i 5. interkostalrum", {"page": 1}),
+    Snippet("SRC0001", "Brug ultralyd før indstik", {"block": 3, "kind": "heading", "level": 2}),
+    Snippet("SRC0002", "Lidokain 1% til lokalbedøvelse", {"chunk": 0}),
+    Snippet("SRC0002", "Uventet lokation", {"chunk": 1, "extra": True}),
+    Snippet("SRC0003", "", {"section": "Metode"}),
+]
+
+
+def test_rows_round_trip() -> None:
+    table = SnippetTable(SNIPPETS)
+
+    assert len(table) == len(SNIPPETS)
+    assert [view.to_snippet() for view in table] == SNIPPETS
+    assert table[-1] == SNIPPETS[-1]
+    assert list(table.texts()) == [s.text for s in SNIPPETS]
+    # Only the locations build_snippets never produces fall back to dicts
+    assert sorted(table._cols.other_locations) == [3, 4]
+    with pytest.raises(IndexError):
+        table[len(SNIPPETS)]
+
+
+def test_slices_share_columns() -> None:
+    table = SnippetTable(SNIPPETS)
+    middle = table[1:4]
+
+    assert isinstance(middle, SnippetTable)
+    assert middle._cols is table._cols
+    assert [v.to_snippet() for v in middle] == SNIPPETS[1:4]
+    assert middle[1:][0] == SNIPPETS[2]
+    assert len(table[10:]) == 0
+    assert middle.rows_by_source() == {"SRC0001": [0], "SRC0002": [1, 2]}
+    with pytest.raises(ValueError):
+        middle.append("SRC0004", "tekst", {"page": 1})
+
+
+def test_appends_after_reads_are_visible() -> None:
+    table = SnippetTable(SNIPPETS[:1])
+    assert table[0].text == SNIPPETS[0].text
+
+    table.append("SRC0009", "ny tekst", {"page": 7})
+    assert table[1] == Snippet("SRC0009", "ny tekst", {"page": 7})
+    assert isinstance(table[1], SnippetView)
+
+
+def test_build_snippets_fills_table(tmp_path: Path) -> None:
+    pages = tmp_path / "pages.json"
+    pages.write_text(json.dumps([{"page": 1, "text": "Side et"}, {"page": 2, "text": "  "}]))
+    normalized = tmp_path / "normalized.txt"
+    normalized.write_text("Normaliseret tekst om drænanlæggelse", encoding="utf-8")
+
+    def source(source_id: str, extra: dict[str, str]) -> SourceRecord:
+        return SourceRecord(
+            source_id=source_id,
+            fetched_at_utc="2026-01-01T00:00:00+00:00",
+            kind="guideline",
+            title=None,
+            year=None,
+            url=None,
+            doi=None,
+            pmid=None,
+            raw_path="",
+            normalized_path=str(normalized),
+            raw_sha256="",
+            normalized_sha256="",
+            extraction_notes=None,
+            terms_licence_note=None,
+            extra=extra,
+        )
+
+    table = build_snippets([source("SRC0001", {"pages_json": str(pages)}), source("SRC0002", {})])
+
+    assert [v.to_snippet() for v in table] == [
+        Snippet("SRC0001", "Side et", {"page": 1}),
+        Snippet("SRC0002", "Normaliseret tekst om drænanlæggelse", {"chunk": 0}),
+    ]
+
+
+def test_retrieval_and_evidence_match_list_input() -> None:
+    table = SnippetTable(SNIPPETS)
+    query = "pleuradræn ultralyd lidokain"
+
+    assert retrieve(query, table, top_k=3) == retrieve(query, SNIPPETS, top_k=3)
+
+    md = "Anlæg pleuradræn i 5. interkostalrum [S:SRC0001]\n"
+    assert build_evidence_report(md, snippets=table) == build_evidence_report(md, snippets=SNIPPETS)
@@ -6,6 +6,7 @@ Tests the EventEmitter and event management functions.
 
 from procedurewriter.pipeline.events import (
     EventEmitter,
+    EventLog,
     EventType,
     PipelineEvent,
     get_emitter,
@@ -117,6 +118,76 @@ class TestEventEmitter:
         assert not emitter.has_subscribers
 
 
+class TestEventLog:
+    """Test the persistent per-run event log."""
+
+    def test_append_assigns_monotonic_seq(self, tmp_path):
+        """Appended events get increasing sequence numbers."""
+        log = EventLog(tmp_path / "events.jsonl")
+        seqs = [
+            log.append(PipelineEvent(event_type=EventType.PROGRESS, data={"n": i}))
+            for i in range(3)
+        ]
+        assert seqs == [1, 2, 3]
+
+    def test_seq_continues_after_reopen(self, tmp_path):
+        """A new log instance on the same file continues the sequence."""
+        path = tmp_path / "events.jsonl"
+        EventLog(path).append(PipelineEvent(event_type=EventType.PROGRESS, data={}))
+        seq = EventLog(path).append(PipelineEvent(event_type=EventType.PROGRESS, data={}))
+        assert seq == 2
+
+    def test_read_from_offset(self, tmp_path):
+        """read_from returns only records after the given offset."""
+        log = EventLog(tmp_path / "events.jsonl")
+        log.append(PipelineEvent(event_type=EventType.PROGRESS, data={"n": 1}))
+        events, offset = log.read_from(0)
+        assert [e.data["n"] for e in events] == [1]
+
+        log.append(PipelineEvent(event_type=EventType.AGENT_START, data={"n": 2}))
+        events, _ = log.read_from(offset)
+        assert len(events) == 1
+        assert events[0].event_type == EventType.AGENT_START
+        assert events[0].seq == 2
+
+    def test_read_from_skips_partial_line(self, tmp_path):
+        """A record still being written is left for the next read."""
+        path = tmp_path / "events.jsonl"
+        log = EventLog(path)
+        log.append(PipelineEvent(event_type=EventType.PROGRESS, data={}))
+        with path.open("a", encoding="utf-8") as f:
+            f.write('{"seq": 2, "event": "progr')
+
+        events, offset = log.read_from(0)
+        assert len(events) == 1
+        assert offset < path.stat().st_size
+
+    def test_read_since(self, tmp_path):
+        """read_since filters by sequence number."""
+        log = EventLog(tmp_path / "events.jsonl")
+        for i in range(4):
+            log.append(PipelineEvent(event_type=EventType.PROGRESS, data={"n": i}))
+        assert [e.seq for e in log.read_since(2)] == [3, 4]
+
+    def test_missing_file_reads_empty(self, tmp_path):
+        """Reading a log that does not exist yet returns nothing."""
+        log = EventLog(tmp_path / "missing.jsonl")
+        assert log.read_from(0) == ([], 0)
+
+    def test_emitter_persists_events(self, tmp_path):
+        """Emitter with a log writes events and tags them with seq."""
+        log = EventLog(tmp_path / "events.jsonl")
+        emitter = EventEmitter(log=log)
+        queue = emitter.subscribe()
+
+        emitter.emit(EventType.PROGRESS, {"message": "hello"})
+
+        event = queue.get_nowait()
+        assert event is not None and event.seq == 1
+        assert event.to_sse().startswith("id: 1\n")
+        assert [e.data["message"] for e in log.read_since(0)] == ["hello"]
+
+
 class TestEmitterRegistry:
     """Test global emitter registry functions."""
 
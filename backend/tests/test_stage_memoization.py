@@ -0,0 +1,212 @@
+"""Tests for reusing fingerprinted stage outputs across pipeline runs."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from procedurewriter.models.evidence import EvidenceChunk
+from procedurewriter.pipeline.orchestrator import PipelineOrchestrator
+from procedurewriter.pipeline.stage_store import StageResultStore
+from procedurewriter.pipeline.stages.base import PipelineStage, compute_fingerprint
+from procedurewriter.pipeline.stages.s01_termexpand import TermExpandInput
+from procedurewriter.pipeline.stages.s02_retrieve import (
+    RetrieveInput,
+    RetrieveOutput,
+    RetrieveStage,
+    SourceInfo,
+)
+from procedurewriter.pipeline.stages.s04_evidencenotes import (
+    EvidenceNote,
+    EvidenceNotesInput,
+    EvidenceNotesOutput,
+    EvidenceNotesStage,
+)
+
+# Checkpoints only load procedurewriter classes, so the fake stages pass a
+# real stage dataclass along, carrying their result in procedure_title
+Payload = TermExpandInput
+
+
+class StartStage(PipelineStage[Any, Payload]):
+    """Creates the run directory, like Bootstrap; never memoized."""
+
+    name = "start"
+
+    def __init__(self, title: str) -> None:
+        self.title = title
+
+    def execute(self, input_data: Any) -> Payload:
+        run_dir = input_data.runs_dir / input_data.run_id
+        run_dir.mkdir(parents=True)
+        return Payload(input_data.run_id, run_dir, self.title)
+
+
+class CountingStage(PipelineStage[Payload, Payload]):
+    def __init__(self, name: str, setting: str = "") -> None:
+        self._name = name
+        self.setting = setting
+        self.executions = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def execute(self, input_data: Payload) -> Payload:
+        self.executions += 1
+        value = f"{input_data.procedure_title}>{self.name}{self.setting}"
+        return Payload(input_data.run_id, input_data.run_dir, value)
+
+    def fingerprint(self, input_data: Payload) -> str | None:
+        return compute_fingerprint(self.name, input_data.procedure_title, self.setting)
+
+
+@pytest.fixture
+def orchestrator(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> PipelineOrchestrator:
+    orch = PipelineOrchestrator(base_dir=tmp_path)
+    orch.stages = [StartStage("Pleuradræn"), CountingStage("retrieve"), CountingStage("draft")]
+    monkeypatch.setattr(orch, "_transform_output_to_input", lambda _name, output: output)
+    return orch
+
+
+def test_unchanged_run_reuses_every_fingerprinted_stage(orchestrator: PipelineOrchestrator) -> None:
+    first = orchestrator.run("Pleuradræn")
+    second = orchestrator.run("Pleuradræn")
+
+    assert [s.executions for s in orchestrator.stages[1:]] == [1, 1]
+    assert second.procedure_title == first.procedure_title
+    assert second.run_id != first.run_id
+    assert second.run_dir.parent == first.run_dir.parent
+    assert (second.run_dir / "checkpoints" / "draft.ckpt").exists()
+
+
+def test_changed_setting_reruns_from_that_stage(orchestrator: PipelineOrchestrator) -> None:
+    orchestrator.run("Pleuradræn")
+    orchestrator.stages[2].setting = "-new-template"
+
+    result = orchestrator.run("Pleuradræn")
+
+    assert [s.executions for s in orchestrator.stages[1:]] == [1, 2]
+    assert result.procedure_title.endswith("-new-template")
+
+
+def test_reuse_can_be_disabled(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    orch = PipelineOrchestrator(base_dir=tmp_path, reuse_stage_results=False)
+    orch.stages = [StartStage("X"), CountingStage("retrieve")]
+    monkeypatch.setattr(orch, "_transform_output_to_input", lambda _name, output: output)
+
+    orch.run("X")
+    orch.run("X")
+
+    assert orch.stages[1].executions == 2
+
+
+def test_store_ignores_stale_and_corrupt_entries(tmp_path: Path) -> None:
+    store = StageResultStore(tmp_path, max_age_s=60)
+    payload = Payload("run-1", tmp_path, "x")
+    store.put("draft", "abc", payload)
+    assert store.get("draft", "abc") == payload
+
+    path = tmp_path / "draft" / "abc.ckpt"
+    os.utime(path, (0, 0))
+    assert store.get("draft", "abc") is None
+
+    path.write_bytes(b"not a checkpoint")
+    assert StageResultStore(tmp_path, max_age_s=None).get("draft", "abc") is None
+    assert store.invalidate() == 1
+
+
+def test_retrieve_reuse_copies_raw_files(tmp_path: Path) -> None:
+    old_raw = tmp_path / "old" / "raw"
+    old_raw.mkdir(parents=True)
+    (old_raw / "SRC1.json").write_text("{}", encoding="utf-8")
+    stored = RetrieveOutput(
+        run_id="old",
+        run_dir=tmp_path / "old",
+        procedure_title="X",
+        sources=[SourceInfo("SRC1", "T", "pubmed", raw_content_path=old_raw / "SRC1.json")],
+        raw_content_dir=old_raw,
+        total_sources=1,
+    )
+    new_input = RetrieveInput(run_id="new", run_dir=tmp_path / "new", procedure_title="X", search_terms=["x"])
+
+    reused = RetrieveStage().reuse(stored, new_input)
+
+    assert reused is not None
+    assert reused.sources[0].raw_content_path == tmp_path / "new" / "raw" / "SRC1.json"
+    assert reused.sources[0].raw_content_path.exists()
+    assert stored.sources[0].raw_content_path == old_raw / "SRC1.json"
+
+
+def test_evidence_notes_reuse_maps_notes_to_new_chunks(tmp_path: Path) -> None:
+    def chunks() -> list[EvidenceChunk]:
+        return [EvidenceChunk(run_id="r", source_id="S", text=t, chunk_index=i) for i, t in enumerate("ab")]
+
+    stage = EvidenceNotesStage()
+    old = EvidenceNotesInput(run_id="old", run_dir=tmp_path, procedure_title="X", chunks=chunks())
+    new = EvidenceNotesInput(run_id="new", run_dir=tmp_path, procedure_title="X", chunks=chunks())
+    stored = EvidenceNotesOutput(
+        run_id="old",
+        run_dir=tmp_path,
+        procedure_title="X",
+        notes=[EvidenceNote(chunk_id=c.id, summary=c.text) for c in old.chunks],
+        total_notes=2,
+    )
+
+    assert stage.fingerprint(old) == stage.fingerprint(new)
+    reused = stage.reuse(stored, new)
+    assert reused is not None
+    assert [n.chunk_id for n in reused.notes] == [c.id for c in new.chunks]
+    assert stage.reuse(stored, EvidenceNotesInput("n", tmp_path, "X", new.chunks[:1])) is None
+    assert not stage.should_memoize(
+        EvidenceNotesOutput("o", tmp_path, "X", [], 0, chunks_failed=1, failed_chunks=[str(uuid4())])
+    )
+
+
+def test_draft_fingerprint_covers_writer_model_and_author_guide(tmp_path: Path) -> None:
+    from procedurewriter.agents.writer import WriterAgent
+    from procedurewriter.pipeline.stages.s05_draft import DraftInput, DraftStage
+    from tests.test_agents import MockLLMProvider
+
+    def fingerprint(model: str, author_guide_sha256: str | None = "a") -> str | None:
+        stage = DraftStage(writer_agent=WriterAgent(llm=MockLLMProvider(), model=model))
+        return stage.fingerprint(
+            DraftInput("r", tmp_path, "X", notes=[], author_guide_sha256=author_guide_sha256)
+        )
+
+    assert fingerprint("m1") == fingerprint("m1")
+    assert fingerprint("m1") != fingerprint("m2")
+    assert fingerprint("m1") != fingerprint("m1", author_guide_sha256="b")
+
+
+def test_retrieve_fingerprint_covers_allowlist(tmp_path: Path) -> None:
+    def fingerprint(allowlist_sha256: str | None) -> str | None:
+        return RetrieveStage().fingerprint(
+            RetrieveInput("r", tmp_path, "X", ["x"], allowlist_sha256=allowlist_sha256)
+        )
+
+    assert fingerprint("a") == fingerprint("a")
+    assert fingerprint("a") != fingerprint("b")
+
+
+def test_bootstrap_records_config_hashes(tmp_path: Path) -> None:
+    import hashlib
+
+    from procedurewriter.pipeline.stages.s00_bootstrap import BootstrapInput, BootstrapStage
+
+    guide = tmp_path / "author_guide.yaml"
+    guide.write_text("style: {}\n", encoding="utf-8")
+    output = BootstrapStage().execute(
+        BootstrapInput(
+            run_id="r1",
+            runs_dir=tmp_path / "runs",
+            author_guide_path=guide,
+            allowlist_path=None,
+            evidence_hierarchy_path=None,
+        )
+    )
+
+    assert output.config_sha256 == {"author_guide": hashlib.sha256(b"style: {}\n").hexdigest()}
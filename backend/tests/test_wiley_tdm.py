@@ -2,12 +2,16 @@ from __future__ import annotations
 
 from types import SimpleNamespace
 from enum import Enum
+import hashlib
 import sys
+import threading
 from pathlib import Path
 
 import pytest
 
 from procedurewriter.pipeline import run as run_module
+from procedurewriter.pipeline.evidence import EvidencePolicyError
+from procedurewriter.pipeline.profiler import profile_section, run_trace
 from procedurewriter.pipeline.run import _apply_wiley_tdm_fulltext, _resolve_wiley_tdm_token
 from procedurewriter.pipeline.types import SourceRecord
 from procedurewriter.settings import Settings
@@ -18,14 +22,18 @@ class DummyHttp:
         self.content = content
         self.calls: list[dict[str, object]] = []
 
-    def get(self, url: str, *, params=None, headers=None):
+    def download(self, url: str, dest: Path, *, params=None, headers=None):
         self.calls.append({"url": url, "params": params, "headers": headers})
-        return SimpleNamespace(status_code=200, content=self.content)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.write_bytes(self.content)
+        return SimpleNamespace(
+            status_code=200, path=dest, size=len(self.content), sha256=hashlib.sha256(self.content).hexdigest()
+        )
 
 
-def _make_source(*, url: str | None, doi: str | None = None) -> SourceRecord:
+def _make_source(*, url: str | None, doi: str | None = None, source_id: str = "SRC0001") -> SourceRecord:
     return SourceRecord(
-        source_id="SRC0001",
+        source_id=source_id,
         fetched_at_utc="2024-01-01T00:00:00Z",
         kind="pubmed",
         title="Test source",
@@ -159,3 +167,92 @@ def test_apply_wiley_tdm_fulltext_uses_client(tmp_path, monkeypatch) -> None:
 
     assert stats["downloaded"] == 1
     assert sources[0].extra.get("tdm_fulltext") is True
+
+
+def test_apply_wiley_tdm_fulltext_overlaps_downloads(tmp_path, monkeypatch) -> None:
+    """Several fetches are in flight at once, capped by max_downloads."""
+    barrier = threading.Barrier(3, timeout=5)
+
+    def extract(path: Path) -> list[str]:
+        barrier.wait()  # Only passes once three PDFs are being extracted together
+        return [path.name]
+
+    monkeypatch.setattr(run_module, "extract_pdf_pages", extract)
+    http = DummyHttp(content=b"%PDF-1.4 fake pdf")
+    sources = [
+        _make_source(url=None, doi=f"10.1002/{i}", source_id=f"SRC{i:04d}") for i in range(1, 6)
+    ] + [_make_source(url=None, doi="10.1002/1", source_id="SRC0099")]
+
+    stats = _apply_wiley_tdm_fulltext(
+        sources=sources,
+        http=http,
+        run_dir=tmp_path,
+        token="tdm-token",
+        base_url="https://api.wiley.com/onlinelibrary/tdm/v1",
+        max_downloads=3,
+        allow_non_wiley_doi=False,
+        strict_mode=True,
+        max_concurrency=3,
+    )
+
+    assert (stats["attempted"], stats["downloaded"], stats["truncated"]) == (3, 3, 2)
+    assert [bool(s.extra.get("tdm_fulltext")) for s in sources] == [True] * 3 + [False] * 3
+    assert Path(sources[0].normalized_path).read_text(encoding="utf-8") == "SRC0001_tdm.pdf"
+    assert not list((tmp_path / "raw").glob("*_tdm.pdf"))
+
+
+def test_apply_wiley_tdm_fulltext_keeps_worker_spans_in_trace(tmp_path, monkeypatch) -> None:
+    """Spans recorded on the worker threads nest under the caller's span."""
+
+    def extract(path: Path) -> list[str]:
+        with profile_section("pdf:extract"):
+            return [path.name]
+
+    monkeypatch.setattr(run_module, "extract_pdf_pages", extract)
+    sources = [_make_source(url=None, doi=f"10.1002/{i}", source_id=f"SRC{i:04d}") for i in range(1, 3)]
+
+    with run_trace(tmp_path / "trace.json") as profile:
+        _apply_wiley_tdm_fulltext(
+            sources=sources,
+            http=DummyHttp(content=b"%PDF-1.4 fake pdf"),
+            run_dir=tmp_path,
+            token="tdm-token",
+            base_url="https://api.wiley.com/onlinelibrary/tdm/v1",
+            max_downloads=2,
+            allow_non_wiley_doi=False,
+            strict_mode=True,
+            max_concurrency=2,
+        )
+
+    spans = [e for e in profile.entries if e.name == "pdf:extract"]
+    assert len(spans) == 2
+    assert all(e.parent_id is not None for e in spans)
+    assert sources[0].raw_sha256 == hashlib.sha256(b"%PDF-1.4 fake pdf").hexdigest()
+
+
+def test_apply_wiley_tdm_fulltext_reports_failures(tmp_path, monkeypatch) -> None:
+    def extract(path: Path) -> list[str]:
+        if path.name.startswith("SRC0001"):
+            raise ValueError("broken PDF")
+        return ["PAGE"]
+
+    monkeypatch.setattr(run_module, "extract_pdf_pages", extract)
+    http = DummyHttp(content=b"%PDF-1.4 fake pdf")
+    sources = [_make_source(url=None, doi=f"10.1002/{i}", source_id=f"SRC{i:04d}") for i in (1, 2)]
+    kwargs = dict(
+        http=http,
+        run_dir=tmp_path,
+        token="tdm-token",
+        base_url="https://api.wiley.com/onlinelibrary/tdm/v1",
+        max_downloads=5,
+        allow_non_wiley_doi=False,
+    )
+
+    stats = _apply_wiley_tdm_fulltext(sources=sources, strict_mode=False, **kwargs)
+    assert (stats["downloaded"], stats["failed"]) == (1, 1)
+    assert not (tmp_path / "raw" / "SRC0001_tdm.pdf").exists()
+
+    with pytest.raises(EvidencePolicyError, match="10.1002/1"):
+        _apply_wiley_tdm_fulltext(
+            sources=[_make_source(url=None, doi="10.1002/1")], strict_mode=True, **kwargs
+        )